@@ -30,9 +30,61 @@ class Iface(object):
         """
         pass
 
+    def embed_sents_packed(self, sents, emb_type, dtype, projection):
+        """
+        Parameters:
+         - sents
+         - emb_type
+         - dtype
+         - projection
+        """
+        pass
+
+    def embed_sents_shm(self, sents, emb_type, projection):
+        """
+        Parameters:
+         - sents
+         - emb_type
+         - projection
+        """
+        pass
+
+    def open_session(self, emb_type, projection):
+        """
+        Parameters:
+         - emb_type
+         - projection
+        """
+        pass
+
+    def push_tokens(self, session, tokens, dtype):
+        """
+        Parameters:
+         - session
+         - tokens
+         - dtype
+        """
+        pass
+
+    def close_session(self, session):
+        """
+        Parameters:
+         - session
+        """
+        pass
+
     def quit(self):
         pass
 
+    def attach_client(self):
+        pass
+
+    def detach_client(self):
+        pass
+
+    def get_stats(self):
+        pass
+
 
 class Client(Iface):
     def __init__(self, iprot, oprot=None):
@@ -100,6 +152,187 @@ class Client(Iface):
             raise result.e
         raise TApplicationException(TApplicationException.MISSING_RESULT, "embed_sents failed: unknown result")
 
+    def embed_sents_packed(self, sents, emb_type, dtype, projection):
+        """
+        Parameters:
+         - sents
+         - emb_type
+         - dtype
+         - projection
+        """
+        self.send_embed_sents_packed(sents, emb_type, dtype, projection)
+        return self.recv_embed_sents_packed()
+
+    def send_embed_sents_packed(self, sents, emb_type, dtype, projection):
+        self._oprot.writeMessageBegin('embed_sents_packed', TMessageType.CALL, self._seqid)
+        args = embed_sents_packed_args()
+        args.sents = sents
+        args.emb_type = emb_type
+        args.dtype = dtype
+        args.projection = projection
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_embed_sents_packed(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = embed_sents_packed_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.e is not None:
+            raise result.e
+        if result.b is not None:
+            raise result.b
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "embed_sents_packed failed: unknown result")
+
+    def embed_sents_shm(self, sents, emb_type, projection):
+        """
+        Parameters:
+         - sents
+         - emb_type
+         - projection
+        """
+        self.send_embed_sents_shm(sents, emb_type, projection)
+        return self.recv_embed_sents_shm()
+
+    def send_embed_sents_shm(self, sents, emb_type, projection):
+        self._oprot.writeMessageBegin('embed_sents_shm', TMessageType.CALL, self._seqid)
+        args = embed_sents_shm_args()
+        args.sents = sents
+        args.emb_type = emb_type
+        args.projection = projection
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_embed_sents_shm(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = embed_sents_shm_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.e is not None:
+            raise result.e
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "embed_sents_shm failed: unknown result")
+
+    def open_session(self, emb_type, projection):
+        """
+        Parameters:
+         - emb_type
+         - projection
+        """
+        self.send_open_session(emb_type, projection)
+        return self.recv_open_session()
+
+    def send_open_session(self, emb_type, projection):
+        self._oprot.writeMessageBegin('open_session', TMessageType.CALL, self._seqid)
+        args = open_session_args()
+        args.emb_type = emb_type
+        args.projection = projection
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_open_session(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = open_session_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.e is not None:
+            raise result.e
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "open_session failed: unknown result")
+
+    def push_tokens(self, session, tokens, dtype):
+        """
+        Parameters:
+         - session
+         - tokens
+         - dtype
+        """
+        self.send_push_tokens(session, tokens, dtype)
+        return self.recv_push_tokens()
+
+    def send_push_tokens(self, session, tokens, dtype):
+        self._oprot.writeMessageBegin('push_tokens', TMessageType.CALL, self._seqid)
+        args = push_tokens_args()
+        args.session = session
+        args.tokens = tokens
+        args.dtype = dtype
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_push_tokens(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = push_tokens_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.e is not None:
+            raise result.e
+        if result.b is not None:
+            raise result.b
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "push_tokens failed: unknown result")
+
+    def close_session(self, session):
+        """
+        Parameters:
+         - session
+        """
+        self.send_close_session(session)
+        self.recv_close_session()
+
+    def send_close_session(self, session):
+        self._oprot.writeMessageBegin('close_session', TMessageType.CALL, self._seqid)
+        args = close_session_args()
+        args.session = session
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_close_session(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = close_session_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        return
+
     def quit(self):
         self.send_quit()
         self.recv_quit()
@@ -124,6 +357,80 @@ class Client(Iface):
         iprot.readMessageEnd()
         return
 
+    def attach_client(self):
+        self.send_attach_client()
+        self.recv_attach_client()
+
+    def send_attach_client(self):
+        self._oprot.writeMessageBegin('attach_client', TMessageType.CALL, self._seqid)
+        args = attach_client_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_attach_client(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = attach_client_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        return
+
+    def detach_client(self):
+        self.send_detach_client()
+        self.recv_detach_client()
+
+    def send_detach_client(self):
+        self._oprot.writeMessageBegin('detach_client', TMessageType.CALL, self._seqid)
+        args = detach_client_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_detach_client(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = detach_client_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        return
+
+    def get_stats(self):
+        self.send_get_stats()
+        return self.recv_get_stats()
+
+    def send_get_stats(self):
+        self._oprot.writeMessageBegin('get_stats', TMessageType.CALL, self._seqid)
+        args = get_stats_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_stats(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_stats_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_stats failed: unknown result")
+
 
 class Processor(Iface, TProcessor):
     def __init__(self, handler):
@@ -131,99 +438,1477 @@ class Processor(Iface, TProcessor):
         self._processMap = {}
         self._processMap["start_elmo"] = Processor.process_start_elmo
         self._processMap["embed_sents"] = Processor.process_embed_sents
+        self._processMap["embed_sents_packed"] = Processor.process_embed_sents_packed
+        self._processMap["embed_sents_shm"] = Processor.process_embed_sents_shm
+        self._processMap["open_session"] = Processor.process_open_session
+        self._processMap["push_tokens"] = Processor.process_push_tokens
+        self._processMap["close_session"] = Processor.process_close_session
         self._processMap["quit"] = Processor.process_quit
+        self._processMap["attach_client"] = Processor.process_attach_client
+        self._processMap["detach_client"] = Processor.process_detach_client
+        self._processMap["get_stats"] = Processor.process_get_stats
+
+    def process(self, iprot, oprot):
+        (name, type, seqid) = iprot.readMessageBegin()
+        if name not in self._processMap:
+            iprot.skip(TType.STRUCT)
+            iprot.readMessageEnd()
+            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
+            x.write(oprot)
+            oprot.writeMessageEnd()
+            oprot.trans.flush()
+            return
+        else:
+            self._processMap[name](self, seqid, iprot, oprot)
+        return True
+
+    def process_start_elmo(self, seqid, iprot, oprot):
+        args = start_elmo_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_elmo_result()
+        try:
+            self._handler.start_elmo()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("start_elmo", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_embed_sents(self, seqid, iprot, oprot):
+        args = embed_sents_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = embed_sents_result()
+        try:
+            result.success = self._handler.embed_sents(args.sents, args.emb_type)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except SequenceEmbedderELMo_UnknownEmbType as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("embed_sents", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_embed_sents_packed(self, seqid, iprot, oprot):
+        args = embed_sents_packed_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = embed_sents_packed_result()
+        try:
+            result.success = self._handler.embed_sents_packed(args.sents, args.emb_type, args.dtype, args.projection)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except SequenceEmbedderELMo_UnknownEmbType as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except SequenceEmbedderELMo_BadArgument as b:
+            msg_type = TMessageType.REPLY
+            result.b = b
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("embed_sents_packed", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_embed_sents_shm(self, seqid, iprot, oprot):
+        args = embed_sents_shm_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = embed_sents_shm_result()
+        try:
+            result.success = self._handler.embed_sents_shm(args.sents, args.emb_type, args.projection)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except SequenceEmbedderELMo_UnknownEmbType as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("embed_sents_shm", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_open_session(self, seqid, iprot, oprot):
+        args = open_session_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = open_session_result()
+        try:
+            result.success = self._handler.open_session(args.emb_type, args.projection)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except SequenceEmbedderELMo_UnknownEmbType as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("open_session", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_push_tokens(self, seqid, iprot, oprot):
+        args = push_tokens_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = push_tokens_result()
+        try:
+            result.success = self._handler.push_tokens(args.session, args.tokens, args.dtype)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except SequenceEmbedderELMo_UnknownSession as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except SequenceEmbedderELMo_BadArgument as b:
+            msg_type = TMessageType.REPLY
+            result.b = b
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("push_tokens", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_close_session(self, seqid, iprot, oprot):
+        args = close_session_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = close_session_result()
+        try:
+            self._handler.close_session(args.session)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("close_session", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_quit(self, seqid, iprot, oprot):
+        args = quit_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = quit_result()
+        try:
+            self._handler.quit()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("quit", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_attach_client(self, seqid, iprot, oprot):
+        args = attach_client_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = attach_client_result()
+        try:
+            self._handler.attach_client()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("attach_client", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_detach_client(self, seqid, iprot, oprot):
+        args = detach_client_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = detach_client_result()
+        try:
+            self._handler.detach_client()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("detach_client", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_stats(self, seqid, iprot, oprot):
+        args = get_stats_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_stats_result()
+        try:
+            result.success = self._handler.get_stats()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_stats", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+
+class start_elmo_args(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('start_elmo_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(start_elmo_args)
+start_elmo_args.thrift_spec = (
+)
+
+
+class start_elmo_result(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('start_elmo_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(start_elmo_result)
+start_elmo_result.thrift_spec = (
+)
+
+
+class embed_sents_args(object):
+    """
+    Attributes:
+     - sents
+     - emb_type
+    """
+
+
+    def __init__(self, sents=None, emb_type=None,):
+        self.sents = sents
+        self.emb_type = emb_type
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.sents = []
+                    (_etype3, _size0) = iprot.readListBegin()
+                    for _i4 in range(_size0):
+                        _elem5 = []
+                        (_etype9, _size6) = iprot.readListBegin()
+                        for _i10 in range(_size6):
+                            _elem11 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                            _elem5.append(_elem11)
+                        iprot.readListEnd()
+                        self.sents.append(_elem5)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.emb_type = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('embed_sents_args')
+        if self.sents is not None:
+            oprot.writeFieldBegin('sents', TType.LIST, 1)
+            oprot.writeListBegin(TType.LIST, len(self.sents))
+            for iter12 in self.sents:
+                oprot.writeListBegin(TType.STRING, len(iter12))
+                for iter13 in iter12:
+                    oprot.writeString(iter13.encode('utf-8') if sys.version_info[0] == 2 else iter13)
+                oprot.writeListEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.emb_type is not None:
+            oprot.writeFieldBegin('emb_type', TType.STRING, 2)
+            oprot.writeString(self.emb_type.encode('utf-8') if sys.version_info[0] == 2 else self.emb_type)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(embed_sents_args)
+embed_sents_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'sents', (TType.LIST, (TType.STRING, 'UTF8', False), False), None, ),  # 1
+    (2, TType.STRING, 'emb_type', 'UTF8', None, ),  # 2
+)
+
+
+class embed_sents_result(object):
+    """
+    Attributes:
+     - success
+     - e
+    """
+
+
+    def __init__(self, success=None, e=None,):
+        self.success = success
+        self.e = e
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype17, _size14) = iprot.readListBegin()
+                    for _i18 in range(_size14):
+                        _elem19 = []
+                        (_etype23, _size20) = iprot.readListBegin()
+                        for _i24 in range(_size20):
+                            _elem25 = []
+                            (_etype29, _size26) = iprot.readListBegin()
+                            for _i30 in range(_size26):
+                                _elem31 = iprot.readDouble()
+                                _elem25.append(_elem31)
+                            iprot.readListEnd()
+                            _elem19.append(_elem25)
+                        iprot.readListEnd()
+                        self.success.append(_elem19)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = SequenceEmbedderELMo_UnknownEmbType()
+                    self.e.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('embed_sents_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.LIST, len(self.success))
+            for iter32 in self.success:
+                oprot.writeListBegin(TType.LIST, len(iter32))
+                for iter33 in iter32:
+                    oprot.writeListBegin(TType.DOUBLE, len(iter33))
+                    for iter34 in iter33:
+                        oprot.writeDouble(iter34)
+                    oprot.writeListEnd()
+                oprot.writeListEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin('e', TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(embed_sents_result)
+embed_sents_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.LIST, (TType.LIST, (TType.DOUBLE, None, False), False), False), None, ),  # 0
+    (1, TType.STRUCT, 'e', [SequenceEmbedderELMo_UnknownEmbType, None], None, ),  # 1
+)
+
+
+class embed_sents_packed_args(object):
+    """
+    Attributes:
+     - sents
+     - emb_type
+     - dtype
+     - projection
+    """
+
+
+    def __init__(self, sents=None, emb_type=None, dtype=None, projection=None,):
+        self.sents = sents
+        self.emb_type = emb_type
+        self.dtype = dtype
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.sents = []
+                    (_etype38, _size35) = iprot.readListBegin()
+                    for _i39 in range(_size35):
+                        _elem40 = []
+                        (_etype44, _size41) = iprot.readListBegin()
+                        for _i45 in range(_size41):
+                            _elem46 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                            _elem40.append(_elem46)
+                        iprot.readListEnd()
+                        self.sents.append(_elem40)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.emb_type = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.dtype = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.projection = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('embed_sents_packed_args')
+        if self.sents is not None:
+            oprot.writeFieldBegin('sents', TType.LIST, 1)
+            oprot.writeListBegin(TType.LIST, len(self.sents))
+            for iter47 in self.sents:
+                oprot.writeListBegin(TType.STRING, len(iter47))
+                for iter48 in iter47:
+                    oprot.writeString(iter48.encode('utf-8') if sys.version_info[0] == 2 else iter48)
+                oprot.writeListEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.emb_type is not None:
+            oprot.writeFieldBegin('emb_type', TType.STRING, 2)
+            oprot.writeString(self.emb_type.encode('utf-8') if sys.version_info[0] == 2 else self.emb_type)
+            oprot.writeFieldEnd()
+        if self.dtype is not None:
+            oprot.writeFieldBegin('dtype', TType.STRING, 3)
+            oprot.writeString(self.dtype.encode('utf-8') if sys.version_info[0] == 2 else self.dtype)
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRING, 4)
+            oprot.writeString(self.projection.encode('utf-8') if sys.version_info[0] == 2 else self.projection)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(embed_sents_packed_args)
+embed_sents_packed_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'sents', (TType.LIST, (TType.STRING, 'UTF8', False), False), None, ),  # 1
+    (2, TType.STRING, 'emb_type', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'dtype', 'UTF8', None, ),  # 3
+    (4, TType.STRING, 'projection', 'UTF8', None, ),  # 4
+)
+
+
+class embed_sents_packed_result(object):
+    """
+    Attributes:
+     - success
+     - e
+     - b
+    """
+
+
+    def __init__(self, success=None, e=None, b=None,):
+        self.success = success
+        self.e = e
+        self.b = b
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype52, _size49) = iprot.readListBegin()
+                    for _i53 in range(_size49):
+                        _elem54 = iprot.readBinary()
+                        self.success.append(_elem54)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = SequenceEmbedderELMo_UnknownEmbType()
+                    self.e.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.b = SequenceEmbedderELMo_BadArgument()
+                    self.b.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('embed_sents_packed_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter55 in self.success:
+                oprot.writeBinary(iter55)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin('e', TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.b is not None:
+            oprot.writeFieldBegin('b', TType.STRUCT, 2)
+            self.b.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(embed_sents_packed_result)
+embed_sents_packed_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRING, 'BINARY', False), None, ),  # 0
+    (1, TType.STRUCT, 'e', [SequenceEmbedderELMo_UnknownEmbType, None], None, ),  # 1
+    (2, TType.STRUCT, 'b', [SequenceEmbedderELMo_BadArgument, None], None, ),  # 2
+)
+
+
+class embed_sents_shm_args(object):
+    """
+    Attributes:
+     - sents
+     - emb_type
+     - projection
+    """
+
+
+    def __init__(self, sents=None, emb_type=None, projection=None,):
+        self.sents = sents
+        self.emb_type = emb_type
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.sents = []
+                    (_etype59, _size56) = iprot.readListBegin()
+                    for _i60 in range(_size56):
+                        _elem61 = []
+                        (_etype65, _size62) = iprot.readListBegin()
+                        for _i66 in range(_size62):
+                            _elem67 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                            _elem61.append(_elem67)
+                        iprot.readListEnd()
+                        self.sents.append(_elem61)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.emb_type = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.projection = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('embed_sents_shm_args')
+        if self.sents is not None:
+            oprot.writeFieldBegin('sents', TType.LIST, 1)
+            oprot.writeListBegin(TType.LIST, len(self.sents))
+            for iter68 in self.sents:
+                oprot.writeListBegin(TType.STRING, len(iter68))
+                for iter69 in iter68:
+                    oprot.writeString(iter69.encode('utf-8') if sys.version_info[0] == 2 else iter69)
+                oprot.writeListEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.emb_type is not None:
+            oprot.writeFieldBegin('emb_type', TType.STRING, 2)
+            oprot.writeString(self.emb_type.encode('utf-8') if sys.version_info[0] == 2 else self.emb_type)
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRING, 3)
+            oprot.writeString(self.projection.encode('utf-8') if sys.version_info[0] == 2 else self.projection)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(embed_sents_shm_args)
+embed_sents_shm_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'sents', (TType.LIST, (TType.STRING, 'UTF8', False), False), None, ),  # 1
+    (2, TType.STRING, 'emb_type', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'projection', 'UTF8', None, ),  # 3
+)
+
+
+class embed_sents_shm_result(object):
+    """
+    Attributes:
+     - success
+     - e
+    """
+
+
+    def __init__(self, success=None, e=None,):
+        self.success = success
+        self.e = e
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = SequenceEmbedderELMo_UnknownEmbType()
+                    self.e.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('embed_sents_shm_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeBinary(self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin('e', TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(embed_sents_shm_result)
+embed_sents_shm_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'BINARY', None, ),  # 0
+    (1, TType.STRUCT, 'e', [SequenceEmbedderELMo_UnknownEmbType, None], None, ),  # 1
+)
+
+
+class open_session_args(object):
+    """
+    Attributes:
+     - emb_type
+     - projection
+    """
+
+
+    def __init__(self, emb_type=None, projection=None,):
+        self.emb_type = emb_type
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.emb_type = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.projection = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('open_session_args')
+        if self.emb_type is not None:
+            oprot.writeFieldBegin('emb_type', TType.STRING, 1)
+            oprot.writeString(self.emb_type.encode('utf-8') if sys.version_info[0] == 2 else self.emb_type)
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRING, 2)
+            oprot.writeString(self.projection.encode('utf-8') if sys.version_info[0] == 2 else self.projection)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(open_session_args)
+open_session_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'emb_type', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'projection', 'UTF8', None, ),  # 2
+)
+
+
+class open_session_result(object):
+    """
+    Attributes:
+     - success
+     - e
+    """
+
+
+    def __init__(self, success=None, e=None,):
+        self.success = success
+        self.e = e
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = SequenceEmbedderELMo_UnknownEmbType()
+                    self.e.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('open_session_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin('e', TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(open_session_result)
+open_session_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+    (1, TType.STRUCT, 'e', [SequenceEmbedderELMo_UnknownEmbType, None], None, ),  # 1
+)
+
+
+class push_tokens_args(object):
+    """
+    Attributes:
+     - session
+     - tokens
+     - dtype
+    """
+
+
+    def __init__(self, session=None, tokens=None, dtype=None,):
+        self.session = session
+        self.tokens = tokens
+        self.dtype = dtype
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.session = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.tokens = []
+                    (_etype73, _size70) = iprot.readListBegin()
+                    for _i74 in range(_size70):
+                        _elem75 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.tokens.append(_elem75)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.dtype = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('push_tokens_args')
+        if self.session is not None:
+            oprot.writeFieldBegin('session', TType.STRING, 1)
+            oprot.writeString(self.session.encode('utf-8') if sys.version_info[0] == 2 else self.session)
+            oprot.writeFieldEnd()
+        if self.tokens is not None:
+            oprot.writeFieldBegin('tokens', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.tokens))
+            for iter76 in self.tokens:
+                oprot.writeString(iter76.encode('utf-8') if sys.version_info[0] == 2 else iter76)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.dtype is not None:
+            oprot.writeFieldBegin('dtype', TType.STRING, 3)
+            oprot.writeString(self.dtype.encode('utf-8') if sys.version_info[0] == 2 else self.dtype)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(push_tokens_args)
+push_tokens_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'session', 'UTF8', None, ),  # 1
+    (2, TType.LIST, 'tokens', (TType.STRING, 'UTF8', False), None, ),  # 2
+    (3, TType.STRING, 'dtype', 'UTF8', None, ),  # 3
+)
+
+
+class push_tokens_result(object):
+    """
+    Attributes:
+     - success
+     - e
+     - b
+    """
+
+
+    def __init__(self, success=None, e=None, b=None,):
+        self.success = success
+        self.e = e
+        self.b = b
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = SequenceEmbedderELMo_UnknownSession()
+                    self.e.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.b = SequenceEmbedderELMo_BadArgument()
+                    self.b.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('push_tokens_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeBinary(self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin('e', TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.b is not None:
+            oprot.writeFieldBegin('b', TType.STRUCT, 2)
+            self.b.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(push_tokens_result)
+push_tokens_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'BINARY', None, ),  # 0
+    (1, TType.STRUCT, 'e', [SequenceEmbedderELMo_UnknownSession, None], None, ),  # 1
+    (2, TType.STRUCT, 'b', [SequenceEmbedderELMo_BadArgument, None], None, ),  # 2
+)
+
+
+class close_session_args(object):
+    """
+    Attributes:
+     - session
+    """
+
+
+    def __init__(self, session=None,):
+        self.session = session
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.session = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('close_session_args')
+        if self.session is not None:
+            oprot.writeFieldBegin('session', TType.STRING, 1)
+            oprot.writeString(self.session.encode('utf-8') if sys.version_info[0] == 2 else self.session)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(close_session_args)
+close_session_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'session', 'UTF8', None, ),  # 1
+)
+
+
+class close_session_result(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('close_session_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(close_session_result)
+close_session_result.thrift_spec = (
+)
+
+
+class quit_args(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('quit_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(quit_args)
+quit_args.thrift_spec = (
+)
 
-    def process(self, iprot, oprot):
-        (name, type, seqid) = iprot.readMessageBegin()
-        if name not in self._processMap:
-            iprot.skip(TType.STRUCT)
-            iprot.readMessageEnd()
-            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
-            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
-            x.write(oprot)
-            oprot.writeMessageEnd()
-            oprot.trans.flush()
+
+class quit_result(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
             return
-        else:
-            self._processMap[name](self, seqid, iprot, oprot)
-        return True
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
 
-    def process_start_elmo(self, seqid, iprot, oprot):
-        args = start_elmo_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = start_elmo_result()
-        try:
-            self._handler.start_elmo()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("start_elmo", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('quit_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_embed_sents(self, seqid, iprot, oprot):
-        args = embed_sents_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = embed_sents_result()
-        try:
-            result.success = self._handler.embed_sents(args.sents, args.emb_type)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except SequenceEmbedderELMo_UnknownEmbType as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("embed_sents", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_quit(self, seqid, iprot, oprot):
-        args = quit_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = quit_result()
-        try:
-            self._handler.quit()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("quit", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
 
-# HELPER FUNCTIONS AND STRUCTURES
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(quit_result)
+quit_result.thrift_spec = (
+)
 
-class start_elmo_args(object):
+
+class attach_client_args(object):
 
 
     def read(self, iprot):
@@ -244,7 +1929,7 @@ class start_elmo_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('start_elmo_args')
+        oprot.writeStructBegin('attach_client_args')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -261,12 +1946,12 @@ class start_elmo_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(start_elmo_args)
-start_elmo_args.thrift_spec = (
+all_structs.append(attach_client_args)
+attach_client_args.thrift_spec = (
 )
 
 
-class start_elmo_result(object):
+class attach_client_result(object):
 
 
     def read(self, iprot):
@@ -287,7 +1972,7 @@ class start_elmo_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('start_elmo_result')
+        oprot.writeStructBegin('attach_client_result')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -304,23 +1989,14 @@ class start_elmo_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(start_elmo_result)
-start_elmo_result.thrift_spec = (
+all_structs.append(attach_client_result)
+attach_client_result.thrift_spec = (
 )
 
 
-class embed_sents_args(object):
-    """
-    Attributes:
-     - sents
-     - emb_type
-    """
+class detach_client_args(object):
 
 
-    def __init__(self, sents=None, emb_type=None,):
-        self.sents = sents
-        self.emb_type = emb_type
-
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
@@ -330,26 +2006,6 @@ class embed_sents_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.LIST:
-                    self.sents = []
-                    (_etype3, _size0) = iprot.readListBegin()
-                    for _i4 in range(_size0):
-                        _elem5 = []
-                        (_etype9, _size6) = iprot.readListBegin()
-                        for _i10 in range(_size6):
-                            _elem11 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                            _elem5.append(_elem11)
-                        iprot.readListEnd()
-                        self.sents.append(_elem5)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.emb_type = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -359,21 +2015,7 @@ class embed_sents_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('embed_sents_args')
-        if self.sents is not None:
-            oprot.writeFieldBegin('sents', TType.LIST, 1)
-            oprot.writeListBegin(TType.LIST, len(self.sents))
-            for iter12 in self.sents:
-                oprot.writeListBegin(TType.STRING, len(iter12))
-                for iter13 in iter12:
-                    oprot.writeString(iter13.encode('utf-8') if sys.version_info[0] == 2 else iter13)
-                oprot.writeListEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.emb_type is not None:
-            oprot.writeFieldBegin('emb_type', TType.STRING, 2)
-            oprot.writeString(self.emb_type.encode('utf-8') if sys.version_info[0] == 2 else self.emb_type)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('detach_client_args')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -390,25 +2032,13 @@ class embed_sents_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(embed_sents_args)
-embed_sents_args.thrift_spec = (
-    None,  # 0
-    (1, TType.LIST, 'sents', (TType.LIST, (TType.STRING, 'UTF8', False), False), None, ),  # 1
-    (2, TType.STRING, 'emb_type', 'UTF8', None, ),  # 2
+all_structs.append(detach_client_args)
+detach_client_args.thrift_spec = (
 )
 
 
-class embed_sents_result(object):
-    """
-    Attributes:
-     - success
-     - e
-    """
-
+class detach_client_result(object):
 
-    def __init__(self, success=None, e=None,):
-        self.success = success
-        self.e = e
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -419,32 +2049,6 @@ class embed_sents_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype17, _size14) = iprot.readListBegin()
-                    for _i18 in range(_size14):
-                        _elem19 = []
-                        (_etype23, _size20) = iprot.readListBegin()
-                        for _i24 in range(_size20):
-                            _elem25 = []
-                            (_etype29, _size26) = iprot.readListBegin()
-                            for _i30 in range(_size26):
-                                _elem31 = iprot.readDouble()
-                                _elem25.append(_elem31)
-                            iprot.readListEnd()
-                            _elem19.append(_elem25)
-                        iprot.readListEnd()
-                        self.success.append(_elem19)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = SequenceEmbedderELMo_UnknownEmbType()
-                    self.e.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -454,24 +2058,7 @@ class embed_sents_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('embed_sents_result')
-        if self.success is not None:
-            oprot.writeFieldBegin('success', TType.LIST, 0)
-            oprot.writeListBegin(TType.LIST, len(self.success))
-            for iter32 in self.success:
-                oprot.writeListBegin(TType.LIST, len(iter32))
-                for iter33 in iter32:
-                    oprot.writeListBegin(TType.DOUBLE, len(iter33))
-                    for iter34 in iter33:
-                        oprot.writeDouble(iter34)
-                    oprot.writeListEnd()
-                oprot.writeListEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin('e', TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('detach_client_result')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -488,14 +2075,12 @@ class embed_sents_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(embed_sents_result)
-embed_sents_result.thrift_spec = (
-    (0, TType.LIST, 'success', (TType.LIST, (TType.LIST, (TType.DOUBLE, None, False), False), False), None, ),  # 0
-    (1, TType.STRUCT, 'e', [SequenceEmbedderELMo_UnknownEmbType, None], None, ),  # 1
+all_structs.append(detach_client_result)
+detach_client_result.thrift_spec = (
 )
 
 
-class quit_args(object):
+class get_stats_args(object):
 
 
     def read(self, iprot):
@@ -516,7 +2101,7 @@ class quit_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('quit_args')
+        oprot.writeStructBegin('get_stats_args')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -533,13 +2118,20 @@ class quit_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(quit_args)
-quit_args.thrift_spec = (
+all_structs.append(get_stats_args)
+get_stats_args.thrift_spec = (
 )
 
 
-class quit_result(object):
+class get_stats_result(object):
+    """
+    Attributes:
+     - success
+    """
+
 
+    def __init__(self, success=None,):
+        self.success = success
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -550,6 +2142,11 @@ class quit_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -559,7 +2156,11 @@ class quit_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('quit_result')
+        oprot.writeStructBegin('get_stats_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -576,8 +2177,9 @@ class quit_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(quit_result)
-quit_result.thrift_spec = (
+all_structs.append(get_stats_result)
+get_stats_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
 )
 fix_spec(all_structs)
 del all_structs
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+# merges embedding requests coming from different clients into a single ELMo forward pass
+
+import collections
+import threading
+import time
+from sys import stderr
+
+
+class _Request:
+
+    __slots__ = ("sents", "tokens", "arrival", "started", "finished", "done", "result", "error")
+
+    def __init__(self, sents):
+        self.sents = sents
+        self.tokens = sum(len(sent) for sent in sents)
+        self.arrival = time.time()
+        self.started = None
+        self.finished = None
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class BatchingScheduler:
+
+    """
+    submit() can be called from many threads at the same time
+    requests are queued and a single background thread merges them into batches
+    a batch is closed when it reaches max_tokens or max_sents or when its oldest request waited max_wait_ms
+    a single request is never split, so requests bigger than the budget are embedded on their own
+    """
+
+    def __init__(self, embed_batch, max_tokens, max_sents, max_wait_ms, stats_every=100):
+        self._embed_batch = embed_batch
+        self._max_tokens = max_tokens
+        self._max_sents = max_sents
+        self._max_wait = max_wait_ms/1000.0
+        self._stats_every = stats_every
+
+        self._queue = collections.deque()
+        self._queued_tokens = 0
+        self._queued_sents = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self._batches = 0
+        self._batched_requests = 0
+        self._batched_sents = 0
+        self._batched_tokens = 0
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="elmo-batching")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def submit(self, sents, timing=None):
+        """
+        if timing is a dict it gets the seconds the request spent in the queue and in the forward pass
+        """
+        if len(sents) == 0:
+            return []
+        req = _Request(sents)
+        with self._cond:
+            if self._closed:
+                raise Exception("batching scheduler is closed")
+            self._queue.append(req)
+            self._queued_tokens += req.tokens
+            self._queued_sents += len(req.sents)
+            self._cond.notify()
+        req.done.wait()
+        if req.error is not None:
+            raise req.error
+        if timing is not None:
+            timing["queue"] = req.started - req.arrival
+            timing["forward"] = req.finished - req.started
+        return req.result
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _budget_full(self):
+        return self._queued_tokens >= self._max_tokens or self._queued_sents >= self._max_sents
+
+    def _next_batch(self):
+        with self._cond:
+            while len(self._queue) == 0 and not self._closed:
+                self._cond.wait()
+            if len(self._queue) == 0:
+                return None
+            deadline = self._queue[0].arrival + self._max_wait
+            while not self._budget_full() and not self._closed:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = [self._queue.popleft()]
+            tokens = batch[0].tokens
+            sents = len(batch[0].sents)
+            while len(self._queue) > 0:
+                req = self._queue[0]
+                if tokens+req.tokens > self._max_tokens or sents+len(req.sents) > self._max_sents:
+                    break
+                batch.append(self._queue.popleft())
+                tokens += req.tokens
+                sents += len(req.sents)
+            self._queued_tokens -= tokens
+            self._queued_sents -= sents
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            start = time.time()
+            all_sents = [sent for req in batch for sent in req.sents]
+            try:
+                ress = list(self._embed_batch(all_sents))
+                offset = 0
+                for req in batch:
+                    req.result = ress[offset:offset+len(req.sents)]
+                    offset += len(req.sents)
+            except Exception as e:
+                for req in batch:
+                    req.error = e
+            finished = time.time()
+            for req in batch:
+                req.started = start
+                req.finished = finished
+                req.done.set()
+            self._record(batch, start)
+
+    def _record(self, batch, start):
+        self._batches += 1
+        self._batched_requests += len(batch)
+        for req in batch:
+            self._batched_sents += len(req.sents)
+            self._batched_tokens += req.tokens
+            latency = start - req.arrival
+            self._latency_sum += latency
+            self._latency_max = max(self._latency_max, latency)
+        if self._stats_every > 0 and self._batches % self._stats_every == 0:
+            print(self.stats_line(), file=stderr)
+
+    def stats(self):
+        batches = max(self._batches, 1)
+        requests = max(self._batched_requests, 1)
+        return {
+            "batches"              : self._batches,
+            "requests"             : self._batched_requests,
+            "avg_batch_requests"   : self._batched_requests/batches,
+            "avg_batch_sents"      : self._batched_sents/batches,
+            "avg_batch_tokens"     : self._batched_tokens/batches,
+            "avg_queue_latency_ms" : 1000*self._latency_sum/requests,
+            "max_queue_latency_ms" : 1000*self._latency_max,
+        }
+
+    def stats_line(self):
+        s = self.stats()
+        return ("batches %d requests/batch %.2f sents/batch %.1f tokens/batch %.1f "
+                "queue latency avg %.1fms max %.1fms") % (
+            s["batches"], s["avg_batch_requests"], s["avg_batch_sents"], s["avg_batch_tokens"],
+            s["avg_queue_latency_ms"], s["max_queue_latency_ms"])
+
+
+def plan_batches(sents, max_tokens, max_sents):
+    """
+    groups sentence indices into batches of similar length
+    the cost of a batch is its padded size (number of sentences times the longest sentence)
+    and it is kept under max_tokens ; a single sentence longer than max_tokens gets a batch on its own
+    """
+    order = sorted(range(len(sents)), key=lambda i: len(sents[i]))
+    batches = []
+    batch = []
+    longest = 0
+    for i in order:
+        new_longest = max(longest, len(sents[i]))
+        if len(batch) > 0 and (new_longest*(len(batch)+1) > max_tokens or len(batch) == max_sents):
+            batches.append(batch)
+            batch = []
+            new_longest = len(sents[i])
+        batch.append(i)
+        longest = new_longest
+    if len(batch) > 0:
+        batches.append(batch)
+    return batches
+
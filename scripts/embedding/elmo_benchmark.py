@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+
+# throughput and latency of the embedding paths on synthetic workloads
+#
+#   server  requests to elmo_embed_server.py from one client thread per server worker
+#   corpus  elmo_embed_corpus.py over a generated corpus
+#   scala   SequenceEmbedderELMo.embed_sents through edin.ccg.MainBenchmarkELMo (needs the assembly jar)
+#
+# by default the fake model of elmo_fake.py is used so no weights are needed and the numbers measure the plumbing ;
+# --real runs the same workloads with a model from the local registry of elmo_models.py and skips if it isn't there
+#
+# --nbest N makes the sentences of a server request come in groups of N variants that share a prefix (like the
+# n-best lists of a sampler or an MT system) ; together with --prefix-cache-mb it measures the trie of forward states
+#
+# every workload reports sentences/sec, tokens/sec, p50/p99 request latency, bytes on the wire (output bytes
+# for corpus) and the peak RSS of the embedding processes ; --json writes the records for comparisons between runs
+#
+#   elmo_benchmark.py --targets server,corpus --batch-sizes 1,16,64 --lengths short,long --workers 1,2 --json bench.json
+#   elmo_benchmark.py --targets server --nbest 16 --batch-sizes 64 --fake-ms-per-token 0.5 --prefix-cache-mb 0,256
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from sys import stderr
+import numpy as np
+
+from SequenceEmbedderELMo_Service import SequenceEmbedderELMo_Service
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from elmo_emb_types import EMB_TYPES
+from elmo_models import FAKE_MODEL, default_model, is_local
+from elmo_packing import unpack_matrix
+from elmo_shm import read_descriptor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+
+TARGETS = ["server", "corpus", "scala"]
+# packed-float16 and packed-int8 are embed_sents_packed with a reduced precision dtype
+TRANSPORTS = ["packed", "packed-float16", "packed-int8", "list", "shm"]
+
+# ranges of sentence lengths in tokens ; the same table is in MainBenchmarkELMo
+LENGTHS = {
+    "short"  : (3, 12),
+    "medium" : (12, 35),
+    "long"   : (35, 80),
+}
+
+VOCABULARY_SIZE = 5000
+
+# name, width, format of numbers
+COLUMNS = [
+    ("target", 6, None), ("workers", 7, None), ("transport", 14, None), ("emb_type", 12, None), ("batch_size", 10, None),
+    ("lengths", 7, None), ("nbest", 5, None), ("prefix_cache_mb", 15, "%.0f"), ("sents_per_sec", 13, "%.1f"), ("tokens_per_sec", 14, "%.1f"), ("p50_ms", 8, "%.2f"),
+    ("p99_ms", 8, "%.2f"), ("wire_mb", 9, "%.2f"), ("peak_rss_mb", 11, "%.1f"),
+]
+
+
+def make_sents(rs, count, lengths):
+    low, high = LENGTHS[lengths]
+    return [["w%d" % w for w in rs.randint(VOCABULARY_SIZE, size=rs.randint(low, high+1))] for _ in range(count)]
+
+
+def make_nbest(rs, count, lengths, n):
+    # every variant keeps at least half of the words of its group's sentence and replaces the rest
+    res = []
+    while len(res) < count:
+        base = make_sents(rs, 1, lengths)[0]
+        for _ in range(n):
+            cut = rs.randint(len(base)//2, len(base)+1)
+            res.append(base[:cut] + ["w%d" % w for w in rs.randint(VOCABULARY_SIZE, size=len(base)-cut)])
+    return res[:count]
+
+
+def percentile_ms(latencies, q):
+    return float(np.percentile(latencies, q))*1000 if len(latencies) > 0 else None
+
+
+def tree_peak_rss_mb(pid):
+    # VmHWM of the process and of its children (the workers of the server) ; linux only
+    pids = [pid]
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open("/proc/%s/stat" % entry) as fh:
+                    if int(fh.read().rsplit(")", 1)[1].split()[1]) == pid:
+                        pids.append(int(entry))
+            except (IOError, IndexError, ValueError):
+                pass
+    total = 0
+    for p in pids:
+        try:
+            with open("/proc/%d/status" % p) as fh:
+                for line in fh:
+                    if line.startswith("VmHWM:"):
+                        total += int(line.split()[1])
+        except IOError:
+            pass
+    return total/1024.0
+
+
+def check_status(status, name):
+    # os.wait4 gives the raw wait status ; it is decoded here because waitstatus_to_exitcode needs python 3.9
+    if os.WIFSIGNALED(status):
+        raise Exception("%s was killed by signal %d" % (name, os.WTERMSIG(status)))
+    if os.WEXITSTATUS(status) != 0:
+        raise Exception("%s failed with exit code %d" % (name, os.WEXITSTATUS(status)))
+
+
+class CountingSocket(TSocket.TSocket):
+
+    def __init__(self, *args, **kwargs):
+        TSocket.TSocket.__init__(self, *args, **kwargs)
+        self.bytes = 0
+
+    def read(self, sz):
+        buff = TSocket.TSocket.read(self, sz)
+        self.bytes += len(buff)
+        return buff
+
+    def write(self, buff):
+        TSocket.TSocket.write(self, buff)
+        self.bytes += len(buff)
+
+
+class BenchmarkServer:
+
+    def __init__(self, model, workers, env, extra_args=()):
+        script = os.path.join(SCRIPT_DIR, "elmo_embed_server.py")
+        self.process = subprocess.Popen(
+            [sys.executable, script, "0", "--model", model, "--workers", str(workers)] + list(extra_args),
+            stdout=subprocess.PIPE, env=env, universal_newlines=True)
+        self.port = None
+        for line in self.process.stdout:
+            if line.startswith("READY "):
+                self.port = int(line.split()[1])
+                break
+        if self.port is None:
+            raise Exception("ELMo server exited before it was ready")
+        # the rest of stdout is drained so that the server never blocks on a full pipe
+        drain = threading.Thread(target=lambda: [None for _ in self.process.stdout])
+        drain.daemon = True
+        drain.start()
+
+    def connect(self):
+        socket = CountingSocket('127.0.0.1', self.port)
+        transport = TTransport.TBufferedTransport(socket)
+        client = SequenceEmbedderELMo_Service.Client(TBinaryProtocol.TBinaryProtocol(transport))
+        transport.open()
+        return client, socket, transport
+
+    def stop(self):
+        client, _, transport = self.connect()
+        try:
+            client.quit()
+        except Exception:
+            # the server may stop before the reply is sent
+            pass
+        transport.close()
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+def embed(client, transport, sents, emb_type):
+    if transport == "list":
+        return client.embed_sents(sents, emb_type)
+    elif transport == "shm":
+        mats = read_descriptor(client.embed_sents_shm(sents, emb_type, None))
+        if mats is not None:
+            return mats
+    dtype = transport[len("packed-"):] if transport.startswith("packed-") else "float32"
+    return [unpack_matrix(blob, dtype) for blob in client.embed_sents_packed(sents, emb_type, dtype, None)]
+
+
+def bench_server(server, workers, transport, emb_type, batch_size, lengths, requests, seed, nbest=0):
+    rs = np.random.RandomState(seed)
+    if nbest > 0:
+        batches = [make_nbest(rs, batch_size, lengths, nbest) for _ in range(requests)]
+    else:
+        batches = [make_sents(rs, batch_size, lengths) for _ in range(requests)]
+    latencies = []
+    wire_bytes = [0]
+    lock = threading.Lock()
+
+    def client_loop(my_batches):
+        client, socket, connection = server.connect()
+        mine = []
+        for batch in my_batches:
+            start = time.time()
+            embed(client, transport, batch, emb_type)
+            mine.append(time.time()-start)
+        connection.close()
+        with lock:
+            latencies.extend(mine)
+            wire_bytes[0] += socket.bytes
+
+    threads = [threading.Thread(target=client_loop, args=(batches[i::workers],)) for i in range(min(workers, requests))]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time()-start
+    tokens = sum(len(sent) for batch in batches for sent in batch)
+    return {
+        "sents_per_sec"  : requests*batch_size/elapsed,
+        "tokens_per_sec" : tokens/elapsed,
+        "p50_ms"         : percentile_ms(latencies, 50),
+        "p99_ms"         : percentile_ms(latencies, 99),
+        "wire_mb"        : wire_bytes[0]/1024.0/1024.0,
+        # peak of the server up to the end of this workload
+        "peak_rss_mb"    : tree_peak_rss_mb(server.process.pid),
+    }
+
+
+def bench_corpus(model, emb_type, lengths, sents_count, seed, env, work_dir):
+    rs = np.random.RandomState(seed)
+    sents = make_sents(rs, sents_count, lengths)
+    input_file = os.path.join(work_dir, "elmo-benchmark-%d.txt" % os.getpid())
+    with open(input_file, "w") as fh:
+        for sent in sents:
+            print(" ".join(sent), file=fh)
+    script = os.path.join(SCRIPT_DIR, "elmo_embed_corpus.py")
+    start = time.time()
+    with open(input_file) as fin:
+        process = subprocess.Popen(
+            [sys.executable, script, "--model", model, "--emb_type", emb_type, "--output_format", "binary"],
+            stdin=fin, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+        output_bytes = 0
+        for chunk in iter(lambda: process.stdout.read(1<<20), b""):
+            output_bytes += len(chunk)
+        _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.time()-start
+    os.remove(input_file)
+    check_status(status, "elmo_embed_corpus.py")
+    return {
+        "sents_per_sec"  : sents_count/elapsed,
+        "tokens_per_sec" : sum(len(sent) for sent in sents)/elapsed,
+        "p50_ms"         : None,
+        "p99_ms"         : None,
+        "wire_mb"        : output_bytes/1024.0/1024.0,
+        "peak_rss_mb"    : usage.ru_maxrss/1024.0,
+    }
+
+
+def bench_scala(jar, emb_type, batch_size, lengths, requests, seed, env):
+    process = subprocess.Popen(
+        ["java", "-cp", jar, "edin.ccg.MainBenchmarkELMo",
+         "--emb_type", emb_type, "--batch_size", str(batch_size), "--lengths", lengths,
+         "--requests", str(requests), "--seed", str(seed)],
+        stdout=subprocess.PIPE, env=env, universal_newlines=True)
+    res = None
+    for line in process.stdout:
+        if line.startswith("{"):
+            res = json.loads(line)
+    _, status, usage = os.wait4(process.pid, 0)
+    check_status(status, "MainBenchmarkELMo")
+    if res is None:
+        raise Exception("MainBenchmarkELMo printed no result")
+    # the JVM and the server it started ; ru_maxrss is the largest of the waited children
+    res["peak_rss_mb"] = usage.ru_maxrss/1024.0
+    res["wire_mb"] = None
+    return res
+
+
+def format_row(cells):
+    return "  ".join(("%%%ds" % width) % cell for (_, width, _), cell in zip(COLUMNS, cells))
+
+
+def print_header():
+    print(format_row([name for name, _, _ in COLUMNS]), flush=True)
+
+
+def print_record(record):
+    cells = []
+    for name, _, fmt in COLUMNS:
+        value = record.get(name)
+        if value is None:
+            cells.append("-")
+        elif fmt is None:
+            cells.append(str(value))
+        else:
+            cells.append(fmt % value)
+    print(format_row(cells), flush=True)
+
+
+def comma_list(s, type=str):
+    return [type(x) for x in s.split(",") if x != ""]
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--targets", default="server,corpus", help="comma separated, from %s" % ",".join(TARGETS))
+    parser.add_argument("--real", action="store_true", help="use a model of the local registry instead of the fake one")
+    parser.add_argument("--model", default=None, help="model used with --real (default $ELMO_MODEL or original)")
+    parser.add_argument("--batch-sizes", default="1,16,64", help="sentences per request")
+    parser.add_argument("--lengths", default="short,medium,long", help="sentence length distributions, from %s" % ",".join(sorted(LENGTHS)))
+    parser.add_argument("--emb-types", default="forward-top,concat-top")
+    parser.add_argument("--workers", default="1,2", help="server worker counts ; there is one client thread per worker")
+    parser.add_argument("--transports", default="packed", help="comma separated, from %s" % ",".join(TRANSPORTS))
+    parser.add_argument("--requests", type=int, default=50, help="requests per server and scala workload")
+    parser.add_argument("--corpus-sents", type=int, default=1000, help="sentences of a corpus workload")
+    parser.add_argument("--nbest", type=int, default=0, help="size of the groups of server request sentences that share prefixes (0 for independent sentences)")
+    parser.add_argument("--prefix-cache-mb", default="0", help="comma separated sizes of the server's prefix cache (0 disables it)")
+    parser.add_argument("--fake-ms-per-token", type=float, default=0, help="simulated forward pass cost of the fake model")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--jar", default=None, help="assembly jar for the scala target (default the one in target/scala-2.12)")
+    parser.add_argument("--work-dir", default="/tmp")
+    parser.add_argument("--json", default=None, help="write all records to this file")
+    args = parser.parse_args()
+
+    targets = comma_list(args.targets)
+    batch_sizes = comma_list(args.batch_sizes, int)
+    lengths_list = comma_list(args.lengths)
+    emb_types = comma_list(args.emb_types)
+    worker_counts = comma_list(args.workers, int)
+    transports = comma_list(args.transports)
+    prefix_cache_sizes = comma_list(args.prefix_cache_mb, float)
+    for name, values, allowed in [("target", targets, TARGETS), ("lengths", lengths_list, LENGTHS),
+                                  ("emb_type", emb_types, EMB_TYPES), ("transport", transports, TRANSPORTS)]:
+        for value in values:
+            if value not in allowed:
+                parser.error("unknown %s %s" % (name, value))
+
+    if args.real:
+        model = args.model or default_model()
+        if not is_local(model):
+            print("model %s is not in the local registry ; nothing to benchmark" % model, file=stderr)
+            sys.exit(0)
+    else:
+        model = FAKE_MODEL
+
+    env = dict(os.environ)
+    env["ELMO_MODEL"] = model
+    env["ELMO_FAKE_MS_PER_TOKEN"] = str(args.fake_ms_per_token)
+    env["PYTHONPATH"] = os.pathsep.join([SCRIPT_DIR] + [p for p in [env.get("PYTHONPATH")] if p])
+
+    records = []
+
+    def report(record):
+        records.append(record)
+        print_record(record)
+
+    print_header()
+
+    if "server" in targets:
+        for prefix_cache_mb in prefix_cache_sizes:
+            for workers in worker_counts:
+                server = BenchmarkServer(model, workers, env, ["--prefix-cache-mb", str(prefix_cache_mb)])
+                try:
+                    for transport in transports:
+                        for emb_type in emb_types:
+                            for lengths in lengths_list:
+                                for batch_size in batch_sizes:
+                                    record = {"target": "server", "model": model, "workers": workers, "transport": transport,
+                                              "emb_type": emb_type, "batch_size": batch_size, "lengths": lengths,
+                                              "nbest": args.nbest, "prefix_cache_mb": prefix_cache_mb}
+                                    record.update(bench_server(server, workers, transport, emb_type, batch_size, lengths, args.requests, args.seed, args.nbest))
+                                    report(record)
+                finally:
+                    server.stop()
+
+    if "corpus" in targets:
+        for emb_type in emb_types:
+            for lengths in lengths_list:
+                record = {"target": "corpus", "model": model, "workers": 1, "transport": "stdout",
+                          "emb_type": emb_type, "batch_size": None, "lengths": lengths}
+                record.update(bench_corpus(model, emb_type, lengths, args.corpus_sents, args.seed, env, args.work_dir))
+                report(record)
+
+    if "scala" in targets:
+        from glob import glob
+        jars = [args.jar] if args.jar is not None else glob(os.path.join(PROJECT_DIR, "target", "scala-2.12", "*assembly*.jar"))
+        if len(jars) == 0:
+            print("no assembly jar found ; skipping the scala target", file=stderr)
+        else:
+            for emb_type in emb_types:
+                for lengths in lengths_list:
+                    for batch_size in batch_sizes:
+                        record = {"target": "scala", "model": model, "workers": None, "transport": "auto",
+                                  "emb_type": emb_type, "batch_size": batch_size, "lengths": lengths}
+                        record.update(bench_scala(jars[0], emb_type, batch_size, lengths, args.requests, args.seed, env))
+                        report(record)
+
+    if args.json is not None:
+        with open(args.json, "w") as fh:
+            json.dump(records, fh, indent=2)
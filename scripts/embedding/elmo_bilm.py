@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+# runs parts of allennlp's biLM (ElmoEmbedder.elmo_bilm, allennlp 0.4.2 with torch 0.3.1 as pinned in requirements.txt)
+# on their own instead of the whole network:
+# the character CNN, the forward LSTM, which can be advanced a few tokens at a time from a saved state,
+# and the backward LSTM over whole sentences
+# the fake model of elmo_fake.py provides the same interface
+#
+# a state is the (h, c) of every forward layer after the tokens seen so far ; states are never modified in place
+# so a state can be advanced any number of times
+
+import numpy as np
+
+ALLENNLP_VERSION = "0.4.2"
+
+
+class UnsupportedBiLM(Exception):
+    pass
+
+
+def forward_lm(embedder):
+    if hasattr(embedder, "forward_lm"):
+        return embedder.forward_lm()
+    return ForwardLM(embedder)
+
+
+def check_bilm(embedder):
+    """
+    the parts are private attributes of allennlp's biLM that other versions may lay out differently
+    """
+    missing = []
+    bilm = getattr(embedder, "elmo_bilm", None)
+    if bilm is None:
+        missing.append("ElmoEmbedder.elmo_bilm")
+    else:
+        for name in ["_token_embedder", "_elmo_lstm"]:
+            if not hasattr(bilm, name):
+                missing.append("_ElmoBiLm.%s" % name)
+        lstm = getattr(bilm, "_elmo_lstm", None)
+        if lstm is not None:
+            names = ["num_layers", "hidden_size", "cell_size", "_states"]
+            names += ["%s_layer_%d" % (direction, i) for i in range(getattr(lstm, "num_layers", 0)) for direction in ["forward", "backward"]]
+            missing.extend("ElmoLstm.%s" % name for name in names if not hasattr(lstm, name))
+    if len(missing) > 0:
+        try:
+            import allennlp
+            version = allennlp.__version__
+        except (ImportError, AttributeError):
+            version = "unknown"
+        raise UnsupportedBiLM("word by word embedding needs allennlp %s (installed: %s) ; its biLM has no %s" % (
+            ALLENNLP_VERSION, version, ", ".join(missing)))
+
+
+class ForwardLM:
+
+    def __init__(self, embedder):
+        check_bilm(embedder)
+        bilm = embedder.elmo_bilm
+        self._embedder = embedder
+        self._token_embedder = bilm._token_embedder
+        lstm = bilm._elmo_lstm
+        self._layers = [getattr(lstm, "forward_layer_%d" % i) for i in range(lstm.num_layers)]
+        self._backward_layers = [getattr(lstm, "backward_layer_%d" % i) for i in range(lstm.num_layers)]
+        self.dim = self._token_embedder.get_output_dim()
+        self.layers = len(self._layers)+1
+        # the LSTM of allennlp is stateful and continues every sentence from the states of the previous batch ;
+        # the states it carries now are copied once so that sessions start from a context similar to embed_sents
+        # but don't depend on what is embedded later
+        if lstm._states is None:
+            initial = [None]*len(self._layers)
+            self._backward_initial = [None]*len(self._layers)
+        else:
+            h, c = lstm._states
+            H, C = lstm.hidden_size, lstm.cell_size
+            initial = [(h[i:i+1, :1, :H].clone(), c[i:i+1, :1, :C].clone()) for i in range(len(self._layers))]
+            self._backward_initial = [(h[i:i+1, :1, H:].clone(), c[i:i+1, :1, C:].clone()) for i in range(len(self._layers))]
+        # the embedding of the beginning of sentence token doesn't depend on the words around it
+        bos = self._token_embeddings([["."]])[:, :1]
+        _, self._start = self._run(bos, initial)
+        self.state_bytes = 4*sum(h.data.numel()+c.data.numel() for h, c in self._start)
+
+    def _variable(self, array):
+        import torch
+        from torch.autograd import Variable
+        res = Variable(torch.from_numpy(np.ascontiguousarray(array, dtype=np.float32)), volatile=True)
+        if self._embedder.cuda_device >= 0:
+            res = res.cuda(device=self._embedder.cuda_device)
+        return res
+
+    def _token_embeddings(self, sents):
+        # [sents x words+2 x dim] with the sentence boundary tokens around the words of every sentence
+        ids = self._embedder.batch_to_ids(sents)
+        if self._embedder.cuda_device >= 0:
+            ids = ids.cuda(device=self._embedder.cuda_device)
+        return self._token_embedder(ids)["token_embedding"]
+
+    def _run(self, inputs, states):
+        activations = [inputs]
+        new_states = []
+        for layer, state in zip(self._layers, states):
+            outputs, state = layer(inputs, [inputs.size(1)], state)
+            if len(new_states) > 0:
+                # skip connections between the layers as in ElmoLstm
+                outputs = outputs + inputs
+            activations.append(outputs)
+            new_states.append(state)
+            inputs = outputs
+        return activations, new_states
+
+    def start(self):
+        """
+        state after the beginning of sentence token
+        """
+        return self._start
+
+    def advance(self, state, words):
+        """
+        runs the forward direction over words from state ; returns the new state and the [layers x words x dim] forward
+        activations of the words (layer 0 is the character CNN, the same as the "local" emb_type)
+        """
+        if len(words) == 0:
+            return state, np.zeros((self.layers, 0, self.dim), dtype=np.float32)
+        inputs = self._token_embeddings([words])[:, 1:-1]
+        activations, state = self._run(inputs, state)
+        return state, np.stack([activation[0].data.cpu().numpy() for activation in activations])
+
+    def token_embeddings(self, sents):
+        """
+        the [words+1 x dim] character CNN embeddings of every (non-empty) sentence followed by the end of sentence token
+        """
+        tokens = self._token_embeddings(sents).data.cpu().numpy()
+        return [tokens[i, 1:len(sent)+2] for i, sent in enumerate(sents)]
+
+    def step(self, states, words, inputs):
+        """
+        advances every state by one word whose token embedding is the row of inputs [states x dim] in a single batch ;
+        returns the new states and the [states x layers x dim] forward activations
+        """
+        import torch
+        x = self._variable(inputs).unsqueeze(1)
+        activations = [np.asarray(inputs, dtype=np.float32)]
+        new_states = []
+        for i, layer in enumerate(self._layers):
+            h = torch.cat([state[i][0] for state in states], 1)
+            c = torch.cat([state[i][1] for state in states], 1)
+            outputs, (h, c) = layer(x, [1]*len(states), (h, c))
+            if i > 0:
+                outputs = outputs + x
+            activations.append(outputs[:, 0].data.cpu().numpy())
+            new_states.append((h, c))
+            x = outputs
+        # every state gets its own copy so that it doesn't keep the whole batch alive
+        states = [[(h[:, j:j+1].clone(), c[:, j:j+1].clone()) for h, c in new_states] for j in range(len(states))]
+        return states, np.stack(activations, axis=1)
+
+    def backward(self, sents, embeddings):
+        """
+        runs the backward direction over the token embeddings of sentences (as token_embeddings returns them) in a
+        single batch ; returns the [layers-1 x words x dim] backward activations of every sentence
+        """
+        lengths = [len(emb) for emb in embeddings]
+        # the LSTM of allennlp expects the batch sorted from the longest to the shortest sentence
+        order = sorted(range(len(embeddings)), key=lambda i: -lengths[i])
+        padded = np.zeros((len(embeddings), max(lengths), self.dim), dtype=np.float32)
+        for row, i in enumerate(order):
+            padded[row, :lengths[i]] = embeddings[i]
+        sorted_lengths = [lengths[i] for i in order]
+        res = [np.empty((len(self._layers), length-1, self.dim), dtype=np.float32) for length in lengths]
+        x = self._variable(padded)
+        for l, (layer, state) in enumerate(zip(self._backward_layers, self._backward_initial)):
+            if state is not None:
+                state = (state[0].repeat(1, len(embeddings), 1), state[1].repeat(1, len(embeddings), 1))
+            outputs, _ = layer(x, sorted_lengths, state)
+            if l > 0:
+                outputs = outputs + x
+            outputs_np = outputs.data.cpu().numpy()
+            for row, i in enumerate(order):
+                res[i][l] = outputs_np[row, :lengths[i]-1]
+            x = outputs
+        return res
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# persistent embedding cache shared by all server processes
+# entries are keyed by (model weights id, emb_type, hash of the token sequence) and stored in the packed wire format
+# the least recently used entries are evicted when the cache grows over its size cap
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from elmo_packing import pack_matrix, unpack_matrix
+
+
+def sent_hash(sent):
+    return hashlib.sha1(json.dumps(sent).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+
+    def __init__(self, path, model_id, max_size_mb):
+        self.path = path
+        self.model_id = model_id
+        self.max_size = int(max_size_mb*1024*1024)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+
+    def _connection(self):
+        # sqlite connections can't be shared with forked server workers so each process opens its own
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model_id TEXT, emb_type TEXT, sent_hash TEXT, data BLOB, size INTEGER, last_used REAL, "
+                "PRIMARY KEY (model_id, emb_type, sent_hash))")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def get_many(self, emb_type, sents):
+        """
+        returns a list with a matrix for every cached sentence and None for the rest
+        """
+        res = []
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            for sent in sents:
+                key = (self.model_id, emb_type, sent_hash(sent))
+                row = conn.execute(
+                    "SELECT data FROM embeddings WHERE model_id=? AND emb_type=? AND sent_hash=?", key).fetchone()
+                if row is None:
+                    self.misses += 1
+                    res.append(None)
+                else:
+                    self.hits += 1
+                    conn.execute(
+                        "UPDATE embeddings SET last_used=? WHERE model_id=? AND emb_type=? AND sent_hash=?", (now,)+key)
+                    res.append(unpack_matrix(row[0]))
+            conn.commit()
+        return res
+
+    def put_many(self, emb_type, sents, mats):
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            for sent, mat in zip(sents, mats):
+                blob = pack_matrix(mat)
+                conn.execute(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?, ?)",
+                    (self.model_id, emb_type, sent_hash(sent), sqlite3.Binary(blob), len(blob), now))
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+        if total <= self.max_size:
+            return
+        freed = 0
+        victims = []
+        for rowid, size in conn.execute("SELECT rowid, size FROM embeddings ORDER BY last_used"):
+            if total - freed <= self.max_size:
+                break
+            victims.append((rowid,))
+            freed += size
+        conn.executemany("DELETE FROM embeddings WHERE rowid=?", victims)
+
+    def stats(self):
+        lookups = max(self.hits+self.misses, 1)
+        return {
+            "hits"     : self.hits,
+            "misses"   : self.misses,
+            "hit_rate" : self.hits/lookups,
+        }
+
+    def stats_line(self):
+        s = self.stats()
+        return "cache hits %d misses %d hit rate %.3f" % (s["hits"], s["misses"], s["hit_rate"])
+
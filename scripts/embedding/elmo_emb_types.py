@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# the "all" view keeps everything needed for every emb_type of a sentence:
+# the top layer (forward and backward halves) followed by the forward half of the local layer
+# so a sentence can be embedded once and every emb_type is then derived from its [words x 1536] matrix
+
+import numpy as np
+
+layer=2
+half_dimension=512
+
+EMB_TYPES = ["forward-top", "backward-top", "concat-top", "average-top", "local", "all"]
+
+ALL = "all"
+# depends on the word alone so it has a fast path (elmo_local.py)
+LOCAL = "local"
+ALL_DIMENSION = 3*half_dimension
+
+
+# extractors work on the [layers x words x 1024] output of ElmoEmbedder for one sentence
+# and equally on a padded [sentences x layers x words x 1024] batch
+
+def forward_top(res):
+    return res[..., layer, :, :half_dimension]
+
+def backward_top(res):
+    return res[..., layer, :, half_dimension:]
+
+def concat_top(res):
+    return res[..., layer, :, :]
+
+def average_top(res):
+    return (res[..., layer, :, :half_dimension]+res[..., layer, :, half_dimension:])/2
+
+def local(res):
+    return res[..., 0, :, :half_dimension]
+
+def all_view(res):
+    return np.concatenate((res[..., layer, :, :], res[..., 0, :, :half_dimension]), axis=-1)
+
+EXTRACTORS = {
+    "forward-top"  : forward_top,
+    "backward-top" : backward_top,
+    "concat-top"   : concat_top,
+    "average-top"  : average_top,
+    "local"        : local,
+    ALL            : all_view,
+}
+
+
+def extractor(emb_type):
+    """
+    picks the extraction function once so callers don't dispatch on emb_type for every sentence
+    """
+    if emb_type not in EXTRACTORS:
+        raise ValueError("unknown emb_type %s"%emb_type)
+    return EXTRACTORS[emb_type]
+
+
+def derive(all_mat, emb_type):
+    if emb_type == "forward-top":
+        return all_mat[..., :half_dimension]
+    elif emb_type == "backward-top":
+        return all_mat[..., half_dimension:2*half_dimension]
+    elif emb_type == "concat-top":
+        return all_mat[..., :2*half_dimension]
+    elif emb_type == "average-top":
+        return (all_mat[..., :half_dimension]+all_mat[..., half_dimension:2*half_dimension])/2
+    elif emb_type == "local":
+        return all_mat[..., 2*half_dimension:]
+    elif emb_type == ALL:
+        return all_mat
+    else:
+        raise ValueError("unknown emb_type %s"%emb_type)
+
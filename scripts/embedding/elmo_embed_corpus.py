@@ -1,62 +1,103 @@
 #!/usr/bin/env python3
 
 import argparse
-from sys import stdin, stderr
+import io
+from itertools import islice
+from sys import stdin, stdout, stderr
+from elmo_batching import plan_batches
+from elmo_store import DTYPES, EmbeddingStoreWriter
+from elmo_output import OUTPUT_FORMATS, make_writer
+from elmo_emb_types import LOCAL, extractor
+from elmo_local import local_embedder
+from elmo_models import load_embedder, resolve
 
-layer=2
-half_dimension=512
+MAX_BATCH_SIZE = 124
 
-options_file = "https://s3-us-west-2.amazonaws.com/allennlp/models/elmo/2x4096_512_2048cnn_2xhighway/elmo_2x4096_512_2048cnn_2xhighway_options.json"
-weight_file = "https://s3-us-west-2.amazonaws.com/allennlp/models/elmo/2x4096_512_2048cnn_2xhighway/elmo_2x4096_512_2048cnn_2xhighway_weights.hdf5"
+# EmbeddingStoreWriter or one of the stream writers of elmo_output
+output = None
 
-MAX_BATCH_SIZE = 124
+def main(model, emb_type, window, max_batch_tokens):
 
-def main(emb_type):
+    try:
+        extract = extractor(emb_type)
+    except ValueError as e:
+        print(e, file=stderr)
+        exit()
 
     print("ELMo Loading START", file=stderr)
-    from allennlp.commands.elmo import ElmoEmbedder
-    embedder = ElmoEmbedder(options_file=options_file, weight_file=weight_file)
+    embedder = load_embedder(model)
     print("ELMo Loading END", file=stderr)
 
     print("ELMo Computing START", file=stderr)
-    minibatch = []
-    for i, line in enumerate(stdin):
-        if i%100 == 0:
-            print("processed %d"%i, file=stderr)
-        minibatch.append(line.split())
-        if len(minibatch) == MAX_BATCH_SIZE:
-            process(embedder, emb_type, minibatch)
-            minibatch = []
-    if len(minibatch)>0:
-        process(embedder, emb_type, minibatch)
+    if emb_type == LOCAL:
+        process_local(local_embedder(embedder))
+    elif window > 0:
+        process_sorted(embedder, extract, window, max_batch_tokens)
+    else:
+        minibatch = []
+        for i, line in enumerate(stdin):
+            if i%100 == 0:
+                print("processed %d"%i, file=stderr)
+            minibatch.append(line.split())
+            if len(minibatch) == MAX_BATCH_SIZE:
+                process(embedder, extract, minibatch)
+                minibatch = []
+        if len(minibatch)>0:
+            process(embedder, extract, minibatch)
     print("ELMo Computing END", file=stderr)
 
-def process(embedder, emb_type, sents):
-    ress = embedder.embed_sentences(sents)
+def process_sorted(embedder, extract, window, max_batch_tokens):
+    # reads a window of sentences ahead, embeds them in length sorted batches and writes them in input order
+    processed = 0
+    while True:
+        sents = [line.split() for line in islice(stdin, window)]
+        if len(sents) == 0:
+            break
+        ress = [None]*len(sents)
+        for batch in plan_batches(sents, max_batch_tokens, MAX_BATCH_SIZE):
+            for i, res in zip(batch, embedder.embed_batch([sents[i] for i in batch])):
+                ress[i] = res
+        write(extract, sents, ress)
+        processed += len(sents)
+        print("processed %d"%processed, file=stderr)
+
+def process_local(local):
+    # the token encoder alone with a cache of word vectors ; the order and the length of the sentences don't matter
+    processed = 0
+    while True:
+        sents = [line.split() for line in islice(stdin, MAX_BATCH_SIZE)]
+        if len(sents) == 0:
+            break
+        for mat in local.embed_sents(sents):
+            output.add(mat)
+        processed += len(sents)
+        if processed % (100*MAX_BATCH_SIZE) < MAX_BATCH_SIZE:
+            print("processed %d"%processed, file=stderr)
+    print(local.stats_line(), file=stderr)
+
+def process(embedder, extract, sents):
+    write(extract, sents, embedder.embed_sentences(sents))
+
+def write(extract, sents, ress):
     for sent, res in zip(sents, ress):
-        print("words %d"%len(sent))
-        for word_position in range(len(sent)):
-            if emb_type == "forward-top":
-                vec = res[layer, word_position, :half_dimension]
-            elif emb_type == "backward-top":
-                vec = res[layer, word_position, half_dimension:]
-            elif emb_type == "concat-top":
-                vec = res[layer, word_position, :]
-            elif emb_type == "average-top":
-                fwd_vec = res[layer, word_position, :half_dimension]
-                bck_vec = res[layer, word_position, half_dimension:]
-                vec = (fwd_vec+bck_vec)/2
-            elif emb_type == "local":
-                vec = res[0, word_position, :half_dimension]
-            else:
-                print("unknown emb_type %s"%emb_type, file=stderr)
-                exit()
-            print( str(vec.tolist()).lstrip("[ ").rstrip("] ").replace(",", " ") )
+        output.add(extract(res)[:len(sent)])
 
 if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("--emb_type", required=True, type=str, help="Model output directory")
+    parser.add_argument("--emb_type", required=True, type=str, help="Model output directory ; \"all\" exports everything needed to derive every other emb_type")
+    parser.add_argument("--window", default=0, type=int, help="read ahead this many sentences and batch them sorted by length (0 keeps file order)")
+    parser.add_argument("--max_batch_tokens", default=4096, type=int, help="max padded tokens per batch in the sorted mode")
+    parser.add_argument("--store", default=None, type=str, help="write a memory-mappable embedding store to this path instead of text to stdout")
+    parser.add_argument("--store_dtype", default="float32", choices=sorted(DTYPES), help="dtype of the embedding store ; int8 keeps a scale for every row")
+    parser.add_argument("--output_format", default="text", choices=OUTPUT_FORMATS, help="format of the embeddings written to stdout")
+    parser.add_argument("--precision", default=9, type=int, help="significant digits in the text format")
+    parser.add_argument("--model", default=None, type=str, help="name of the model in the registry of elmo_models.py (default $ELMO_MODEL or original)")
     args = parser.parse_args()
 
-    main(args.emb_type)
+    if args.store is not None:
+        output = EmbeddingStoreWriter(args.store, args.emb_type, args.store_dtype)
+    else:
+        output = make_writer(args.output_format, io.BufferedWriter(stdout.buffer, buffer_size=1<<20), args.precision)
+    main(resolve(args.model), args.emb_type, args.window, args.max_batch_tokens)
+    output.close()
@@ -1,20 +1,27 @@
 #!/usr/bin/env python3
 
-from allennlp.commands.elmo import ElmoEmbedder
-import numpy as np
-from sys import stderr
+import argparse
+from sys import stdout, stderr
+from elmo_emb_types import LOCAL, extractor
+from elmo_local import local_embedder
+from elmo_models import load_embedder, resolve
+from elmo_output import OUTPUT_FORMATS, make_writer
 
-layer=2
-word_position=0
-half_dimension=512
+parser = argparse.ArgumentParser()
+parser.add_argument("--output_format", default="text", choices=OUTPUT_FORMATS, help="format of the printed embeddings")
+parser.add_argument("--precision", default=9, type=int, help="significant digits in the text format")
+parser.add_argument("--model", default=None, type=str, help="name of the model in the registry of elmo_models.py (default $ELMO_MODEL or original)")
+args = parser.parse_args()
 
-options_file = "https://s3-us-west-2.amazonaws.com/allennlp/models/elmo/2x4096_512_2048cnn_2xhighway/elmo_2x4096_512_2048cnn_2xhighway_options.json"
-weight_file = "https://s3-us-west-2.amazonaws.com/allennlp/models/elmo/2x4096_512_2048cnn_2xhighway/elmo_2x4096_512_2048cnn_2xhighway_weights.hdf5"
+writer = make_writer(args.output_format, stdout.buffer, args.precision)
 
-embedder = ElmoEmbedder(options_file=options_file, weight_file=weight_file)
+embedder = load_embedder(resolve(args.model))
+# "local" skips the LSTMs ; created on first use
+local = None
 
 
 emb_type = "forward-top" # "concat-top", "backward", "average-top", "local"
+extract = extractor(emb_type)
 
 
 left_to_batch = 1
@@ -27,43 +34,28 @@ while True:
         left_to_batch = int(s.replace("!!! to batch = ", ""))
     elif s.startswith("!!! emb_type = "):
         emb_type = s.replace("!!! emb_type = ", "")
+        try:
+            extract = extractor(emb_type)
+        except ValueError as e:
+            print(e, file=stderr)
+            exit()
     elif s == "EXIT":
         exit()
     else:
         batch.append(s.split())
         left_to_batch -= 1
         if(left_to_batch == 0):
-            ress = embedder.embed_sentences(batch)
-
-            for sent, res in zip(batch, ress):
-                print("words %d"%len(sent))
-                for word_position in range(len(sent)):
-                    if emb_type == "forward-top":
-                        vec = res[layer, word_position, :half_dimension]
-                    elif emb_type == "backward-top":
-                        vec = res[layer, word_position, half_dimension:]
-                    elif emb_type == "concat-top":
-                        vec = res[layer, word_position, :]
-                    elif emb_type == "average-top":
-                        fwd_vec = res[layer, word_position, :half_dimension]
-                        bck_vec = res[layer, word_position, half_dimension:]
-                        vec = (fwd_vec+bck_vec)/2
-                    elif emb_type == "local":
-                        vec = res[0, word_position, :half_dimension]
-                    else:
-                        print("unknown emb_type %s"%emb_type, file=stderr)
-                        exit()
-
-                    # solution 1
-                    print( str(vec.tolist()).lstrip("[ ").rstrip("] ").replace(",", " ") )
-
-                    # solution 2
-                    # np.set_printoptions(threshold = np.prod(vec.shape))
-                    # print( np.array_str(vec, max_line_width=100000000).lstrip("[ ").rstrip(" ]") )
-
-                    # solution 3
-                    # print( " ".join(str(v) for v in vec) )
-
+            if emb_type == LOCAL:
+                if local is None:
+                    local = local_embedder(embedder)
+                mats = local.embed_sents(batch)
+            else:
+                mats = (extract(res)[:len(sent)] for sent, res in zip(batch, embedder.embed_sentences(batch)))
+
+            stdout.flush()
+            for mat in mats:
+                writer.add(mat)
+                writer.flush()
                 input(">>> ")
             batch = []
             left_to_batch = 1
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+
+# embeds corpora (one tokenized sentence per line) into embedding stores (elmo_store.py) with a pool of worker processes
+#
+# every input is cut into shards of --shard_sents sentences and every finished shard is a small store in the work
+# directory OUTPUT.job ; a run that was interrupted continues with the shards that are still missing
+# once all shards of an input are done they are concatenated into OUTPUT, which appears only when it is complete
+# (see elmo_store.py) like every shard
+#
+# a run continues the shards of an earlier one only if its input has the same contents (the input itself may be
+# another copy, as every parser process writes its own)
+#
+# OUTPUT.lock tells other runs for the same output that the work is in progress ; they wait for the store to appear
+# and take over (resuming from the finished shards) when the lock becomes stale: its owner on this host is dead
+# or it wasn't refreshed for --stale_after seconds
+#
+#   elmo_embed_job.py --emb_type forward-top --workers 4 corpus1.txt corpus2.txt
+#   elmo_embed_job.py --emb_type all --output train.store train.txt
+
+import argparse
+import errno
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import socket
+import threading
+import time
+from sys import stderr
+from elmo_batching import plan_batches
+from elmo_emb_types import LOCAL, extractor
+from elmo_local import local_embedder
+from elmo_models import FAKE_MODEL, load_embedder, resolve
+from elmo_store import DTYPES, EmbeddingStore, EmbeddingStoreWriter, store_exists
+
+MAX_BATCH_SIZE = 124
+
+MANIFEST = "job.json"
+
+
+def default_output(input_file, emb_type):
+    # the name SequenceEmbedderELMo.storeFile uses
+    return "%s.elmo.%s.store" % (input_file, emb_type)
+
+
+def shard_file(work_dir, shard):
+    return os.path.join(work_dir, "shard-%05d.store" % shard)
+
+
+def file_digest(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    return True
+
+
+class JobLock:
+
+    """
+    lock file with the pid and host of its owner ; the owner refreshes its mtime so that runs on other hosts
+    (that can't check the pid) can tell a live owner from a dead one
+    """
+
+    def __init__(self, path, stale_after):
+        self.path = path
+        self.stale_after = stale_after
+        self._stop = None
+
+    def _info(self, path):
+        try:
+            with open(path) as fh:
+                return json.load(fh), os.path.getmtime(path)
+        except ValueError:
+            # the owner is still writing it
+            return None, os.path.getmtime(path)
+
+    def is_stale(self, path=None):
+        info, mtime = self._info(path or self.path)
+        if info is not None and info["host"] == socket.gethostname() and not pid_alive(info["pid"]):
+            return True
+        return time.time()-mtime > self.stale_after
+
+    def try_acquire(self):
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                try:
+                    if not self.is_stale():
+                        return False
+                    self._break_stale()
+                except (IOError, OSError):
+                    # the lock disappeared in the meantime
+                    pass
+                continue
+            with os.fdopen(fd, "w") as fh:
+                json.dump({"pid": os.getpid(), "host": socket.gethostname(), "started": time.time()}, fh)
+            self._stop = threading.Event()
+            refresher = threading.Thread(target=self._refresh, args=(self._stop,))
+            refresher.daemon = True
+            refresher.start()
+            return True
+
+    def _break_stale(self):
+        # the lock is moved away first so that two runs breaking it at the same time can't remove a fresh lock
+        # that one of them has just created ; the one that finds a fresh lock in its hands puts it back, but only
+        # if no other run created a lock in the meantime (a link fails where a rename would overwrite)
+        moved = "%s.stale.%d" % (self.path, os.getpid())
+        os.rename(self.path, moved)
+        if self.is_stale(moved):
+            print("removing stale lock %s" % self.path, file=stderr)
+        else:
+            try:
+                os.link(moved, self.path)
+            except FileExistsError:
+                print("lock %s was taken by another run while it was checked" % self.path, file=stderr)
+        os.remove(moved)
+
+    def _refresh(self, stop):
+        while not stop.wait(self.stale_after/4.0):
+            try:
+                os.utime(self.path, None)
+            except OSError:
+                pass
+
+    def release(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+class Job:
+
+    def __init__(self, input_file, output, args):
+        self.input = input_file
+        self.output = output
+        self.work_dir = output+".job"
+        self.lock = JobLock(output+".lock", args.stale_after)
+        self.settings = {
+            "input_size"  : os.path.getsize(input_file),
+            "input_sha1"  : file_digest(input_file),
+            "emb_type"    : args.emb_type,
+            "dtype"       : args.store_dtype,
+            "model"       : resolve(args.model).model_id,
+            "shard_sents" : args.shard_sents,
+        }
+        self.shards = None
+
+    def prepare(self):
+        """
+        reads the manifest of an interrupted run or plans the shards anew ; returns the shards that are missing
+        """
+        manifest_file = os.path.join(self.work_dir, MANIFEST)
+        manifest = None
+        if os.path.exists(manifest_file):
+            with open(manifest_file) as fh:
+                manifest = json.load(fh)
+            if manifest["settings"] != self.settings:
+                print("%s is from a run with other settings ; starting over" % self.work_dir, file=stderr)
+                shutil.rmtree(self.work_dir)
+                manifest = None
+        if manifest is None:
+            os.makedirs(self.work_dir, exist_ok=True)
+            manifest = {"settings": self.settings, "shards": self._plan()}
+            with open(manifest_file+".tmp", "w") as fh:
+                json.dump(manifest, fh)
+            os.replace(manifest_file+".tmp", manifest_file)
+        # a shard is [byte offset, sentences]
+        self.shards = manifest["shards"]
+        missing = [i for i in range(len(self.shards)) if not store_exists(shard_file(self.work_dir, i))]
+        if len(missing) < len(self.shards):
+            print("%s: resuming with %d of %d shards done" % (self.output, len(self.shards)-len(missing), len(self.shards)), file=stderr)
+        return missing
+
+    def _plan(self):
+        shards = []
+        offset = 0
+        shard_sents = self.settings["shard_sents"]
+        with open(self.input, "rb") as fh:
+            for i, line in enumerate(fh):
+                if i % shard_sents == 0:
+                    shards.append([offset, 0])
+                shards[-1][1] += 1
+                offset += len(line)
+        return shards
+
+    def task(self, shard, max_batch_tokens):
+        offset, count = self.shards[shard]
+        return (self.input, offset, count, shard_file(self.work_dir, shard), self.settings["emb_type"], self.settings["dtype"], max_batch_tokens)
+
+    def shard_sents(self, shard):
+        return self.shards[shard][1]
+
+    def assemble(self):
+        # a store left by a crashed assembly has no index and is simply overwritten
+        writer = EmbeddingStoreWriter(self.output, self.settings["emb_type"], self.settings["dtype"])
+        for shard in range(len(self.shards)):
+            writer.append(EmbeddingStore(shard_file(self.work_dir, shard)))
+        writer.close()
+        shutil.rmtree(self.work_dir)
+
+
+# state of a worker process
+_embedder = None
+_model = None
+# the word cache of "local" lives as long as the worker so it is shared by its shards
+_local = None
+
+
+def init_worker(model_name, threads):
+    global _embedder, _model
+    _model = resolve(model_name)
+    if _model.name != FAKE_MODEL:
+        import torch
+        torch.set_num_threads(threads)
+    _embedder = load_embedder(_model)
+
+
+def embed_shard(task):
+    global _local
+    input_file, offset, count, path, emb_type, dtype, max_batch_tokens = task
+    with open(input_file, "rb") as fh:
+        fh.seek(offset)
+        sents = [fh.readline().decode("utf-8").split() for _ in range(count)]
+    ress = [None]*len(sents)
+    if emb_type == LOCAL:
+        if _local is None:
+            _local = local_embedder(_embedder)
+        for i in range(0, len(sents), MAX_BATCH_SIZE):
+            ress[i:i+MAX_BATCH_SIZE] = _local.embed_sents(sents[i:i+MAX_BATCH_SIZE])
+    else:
+        extract = extractor(emb_type)
+        # empty lines get empty embeddings without a forward pass
+        non_empty = [i for i, sent in enumerate(sents) if len(sent) > 0]
+        for batch in plan_batches([sents[i] for i in non_empty], max_batch_tokens, MAX_BATCH_SIZE):
+            batch = [non_empty[j] for j in batch]
+            for i, res in zip(batch, _embedder.embed_batch([sents[i] for i in batch])):
+                ress[i] = extract(res)[:len(sents[i])]
+    writer = EmbeddingStoreWriter(path, emb_type, dtype)
+    for sent, res in zip(sents, ress):
+        writer.add(res if res is not None else [])
+    writer.close()
+    return path, len(sents), sum(len(sent) for sent in sents)
+
+
+class Progress:
+
+    def __init__(self, total_sents):
+        self.total = total_sents
+        self.done = 0
+        self.tokens = 0
+        self.start = time.time()
+
+    def update(self, sents, tokens):
+        self.done += sents
+        self.tokens += tokens
+        elapsed = time.time()-self.start
+        rate = self.done/elapsed if elapsed > 0 else 0.0
+        eta = (self.total-self.done)/rate if rate > 0 else float("inf")
+        print("embedded %d/%d sentences  %.1f sents/s  %.1f tokens/s  ETA %s" % (
+            self.done, self.total, rate, self.tokens/elapsed if elapsed > 0 else 0.0, format_duration(eta)), file=stderr)
+
+
+def format_duration(seconds):
+    if seconds == float("inf"):
+        return "?"
+    seconds = int(seconds)
+    return "%d:%02d:%02d" % (seconds//3600, seconds//60 % 60, seconds % 60)
+
+
+def run(jobs, pool, max_batch_tokens):
+    """
+    embeds the missing shards of jobs whose locks are held by this process and assembles their stores
+    """
+    missing = {job.output: job.prepare() for job in jobs}
+    progress = Progress(sum(job.shard_sents(shard) for job in jobs for shard in missing[job.output]))
+    owners = {}
+    tasks = []
+    for job in jobs:
+        for shard in missing[job.output]:
+            owners[shard_file(job.work_dir, shard)] = (job, shard)
+            tasks.append(job.task(shard, max_batch_tokens))
+    for job in jobs:
+        if len(missing[job.output]) == 0:
+            job.assemble()
+    for path, sents, tokens in pool.imap_unordered(embed_shard, tasks):
+        progress.update(sents, tokens)
+        job, shard = owners[path]
+        missing[job.output].remove(shard)
+        if len(missing[job.output]) == 0:
+            job.assemble()
+            print("%s is complete" % job.output, file=stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs="+", help="files with one tokenized sentence per line")
+    parser.add_argument("--emb_type", required=True, help="emb_type of the stores ; \"all\" exports everything needed to derive every other emb_type")
+    parser.add_argument("--output", default=None, help="store of a single input (default INPUT.elmo.EMB_TYPE.store)")
+    parser.add_argument("--store_dtype", default="float32", choices=sorted(DTYPES), help="dtype of the stores ; int8 keeps a scale for every row")
+    parser.add_argument("--model", default=None, help="name of the model in the registry of elmo_models.py (default $ELMO_MODEL or original)")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("ELMO_JOB_WORKERS", 1)), help="number of worker processes (default $ELMO_JOB_WORKERS or 1)")
+    parser.add_argument("--shard_sents", type=int, default=2000, help="sentences per shard, the unit of work and of checkpointing")
+    parser.add_argument("--max_batch_tokens", type=int, default=4096, help="max padded tokens per batch")
+    parser.add_argument("--stale_after", type=float, default=600, help="seconds after which a lock that isn't refreshed is considered stale")
+    parser.add_argument("--poll", type=float, default=10, help="seconds between two checks while waiting for another run")
+    args = parser.parse_args()
+
+    extractor(args.emb_type)
+    if args.output is not None and len(args.inputs) > 1:
+        parser.error("--output can be used only with a single input")
+    pending = [Job(input_file, args.output or default_output(input_file, args.emb_type), args) for input_file in args.inputs]
+
+    pool = None
+    waiting_since = None
+    try:
+        while True:
+            pending = [job for job in pending if not store_exists(job.output)]
+            if len(pending) == 0:
+                break
+            mine = []
+            for job in pending:
+                if job.lock.try_acquire():
+                    # the run that held the lock before may have finished in the meantime
+                    if store_exists(job.output):
+                        job.lock.release()
+                    else:
+                        mine.append(job)
+            if len(mine) > 0:
+                if pool is None:
+                    threads = max(1, multiprocessing.cpu_count()//args.workers)
+                    pool = multiprocessing.Pool(args.workers, initializer=init_worker, initargs=(args.model, threads))
+                try:
+                    run(mine, pool, args.max_batch_tokens)
+                finally:
+                    for job in mine:
+                        job.lock.release()
+                waiting_since = None
+            else:
+                if waiting_since is None:
+                    waiting_since = time.time()
+                    print("waiting for other runs to finish %s" % ", ".join(job.output for job in pending), file=stderr)
+                elif time.time()-waiting_since > 300:
+                    waiting_since = time.time()
+                    print("still waiting for %s" % ", ".join(job.output for job in pending), file=stderr)
+                time.sleep(args.poll)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+if __name__ == "__main__":
+    main()
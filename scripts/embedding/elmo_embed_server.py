@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 
 # from os.path import realpath, dirname
+import argparse
 import glob
+import json
+import multiprocessing
+import os
+import socket
 import sys
+import threading
+import time
 from sys import stderr
 # script_dir = dirname(realpath(__file__))
 # sys.path.append(script_dir+'/SequenceEmbedderELMo_Service')
 from SequenceEmbedderELMo_Service import SequenceEmbedderELMo_Service
-from SequenceEmbedderELMo_Service.ttypes import SequenceEmbedderELMo_UnknownEmbType
+from SequenceEmbedderELMo_Service.ttypes import SequenceEmbedderELMo_UnknownEmbType, SequenceEmbedderELMo_UnknownSession, SequenceEmbedderELMo_BadArgument
+from elmo_packing import DTYPES, pack_matrix
+from elmo_prefix_cache import PrefixCache
 
 # don't forget to pip3 install thrift
 
@@ -15,75 +24,487 @@ from thrift.transport import TSocket
 from thrift.transport import TTransport
 from thrift.protocol import TBinaryProtocol
 from thrift.server.TProcessPoolServer import TProcessPoolServer
-
-layer=2
-word_position=0
-half_dimension=512
-
-options_file = "https://s3-us-west-2.amazonaws.com/allennlp/models/elmo/2x4096_512_2048cnn_2xhighway/elmo_2x4096_512_2048cnn_2xhighway_options.json"
-weight_file = "https://s3-us-west-2.amazonaws.com/allennlp/models/elmo/2x4096_512_2048cnn_2xhighway/elmo_2x4096_512_2048cnn_2xhighway_weights.hdf5"
+from thrift.server.TServer import TThreadedServer
+from elmo_batching import BatchingScheduler
+from elmo_bilm import UnsupportedBiLM, forward_lm
+from elmo_cache import EmbeddingCache
+from elmo_emb_types import ALL, EMB_TYPES, LOCAL, derive, extractor
+from elmo_local import LocalEmbedder
+from elmo_models import FAKE_MODEL, load_embedder, resolve, warmup_embedder
+from elmo_projection import Projection
+from elmo_sessions import SESSION_LAYERS, SessionTable
+from elmo_shm import ShmRing, default_shm_dir, remove_rings, ring_prefix
+from elmo_stats import ServiceStats
 
 class ELMo_Service_Handler:
 
-    def __init__(self):
+    def __init__(self, model, stats_slots=1):
+        self.model = model
+        # one slot for every process that serves requests
+        self.stats = ServiceStats(stats_slots)
         self._memo_embedder = None
+        self._embedder_lock = threading.Lock()
+        self.scheduler = None
+        self.cache = None
+        self.clients = None
+        self.shm_dir = default_shm_dir()
+        self.shm_size = 256*1024*1024
+        self._ring = None
+        self._ring_pid = None
+        self._ring_lock = threading.Lock()
+        self._server_pid = os.getpid()
+        self._projections = {}
+        self._projections_lock = threading.Lock()
+        self._forward_lm = None
+        self._forward_lm_pid = None
+        self._forward_lm_lock = threading.Lock()
+        self.sessions = SessionTable(on_evict=self.stats.record_sessions_evicted)
+        self.local_cache_words = 100000
+        self._local = None
+        self._local_pid = None
+        self.prefix_cache_mb = 0
+        self._prefix_cache = None
+        self._prefix_cache_pid = None
 
     def start_elmo(self):
         self.embedder()
 
-    def embedder(self):
-        if self._memo_embedder is None:
-            from allennlp.commands.elmo import ElmoEmbedder
-            self._memo_embedder = ElmoEmbedder(options_file=options_file, weight_file=weight_file)
+    def embedder(self, warmup=True):
+        with self._embedder_lock:
+            if self._memo_embedder is None:
+                self._memo_embedder = load_embedder(self.model, warmup)
         return self._memo_embedder
 
+    def enable_batching(self, max_tokens, max_sents, max_wait_ms, stats_every):
+        self.scheduler = BatchingScheduler(
+            embed_batch = self._forward_batch,
+            max_tokens  = max_tokens,
+            max_sents   = max_sents,
+            max_wait_ms = max_wait_ms,
+            stats_every = stats_every)
+
+    def enable_cache(self, path, max_size_mb):
+        self.cache = EmbeddingCache(path, self.model.model_id, max_size_mb)
+
+    def enable_prefix_cache(self, max_mb):
+        self.prefix_cache_mb = max_mb
+
+    def prefix_cache(self):
+        # every worker process has a trie of its own
+        if self._prefix_cache is None or self._prefix_cache_pid != os.getpid():
+            self._prefix_cache = PrefixCache(self.forward_lm(), self.prefix_cache_mb, on_lookup=self.stats.record_prefix_lookup)
+            self._prefix_cache_pid = os.getpid()
+        return self._prefix_cache
+
+    def local(self):
+        # the "local" emb_type comes from the token encoder alone ; every worker process has a word cache of its own
+        if self._local is None or self._local_pid != os.getpid():
+            self._local = LocalEmbedder(self.forward_lm(), self.local_cache_words, on_lookup=self.stats.record_local_lookup)
+            self._local_pid = os.getpid()
+        return self._local
+
+    def _local_matrices(self, sents):
+        start = time.time()
+        mats = self.local().embed_sents(sents)
+        self.stats.record_forward(len(sents), time.time()-start)
+        return mats
+
+    def _embed_batch(self, sents):
+        if self.prefix_cache_mb > 0:
+            return self.prefix_cache().embed_batch(sents)
+        else:
+            return self.embedder().embed_batch(sents)
+
+    def _forward_batch(self, sents):
+        # a merged batch of the scheduler
+        start = time.time()
+        ress = self._embed_batch(sents)
+        self.stats.record_forward(len(sents), time.time()-start)
+        return ress
+
+    def _embed(self, sents):
+        if self.scheduler is None:
+            start = time.time()
+            if self.prefix_cache_mb > 0:
+                ress = [res for i in range(0, len(sents), 64) for res in self._embed_batch(sents[i:i+64])]
+            else:
+                ress = list(self.embedder().embed_sentences(sents))
+            self.stats.record_forward(len(sents), time.time()-start)
+            return ress
+        else:
+            timing = {}
+            ress = self.scheduler.submit(sents, timing)
+            if "queue" in timing:
+                self.stats.record_latency("queue", timing["queue"])
+            return ress
+
     def quit(self):
+        if self.cache is not None:
+            print(self.cache.stats_line(), file=stderr)
+        if self._local is not None and self._local_pid == os.getpid():
+            print(self._local.stats_line(), file=stderr)
+        if self._prefix_cache is not None and self._prefix_cache_pid == os.getpid():
+            print(self._prefix_cache.stats_line(), file=stderr)
         self.server.stop()
 
+    def enable_daemon(self):
+        # shared with the forked workers so that every worker sees attachments made through the others
+        self.clients = multiprocessing.Value('i', 0)
+
+    def attach_client(self):
+        if self.clients is not None:
+            with self.clients.get_lock():
+                self.clients.value += 1
+
+    def detach_client(self):
+        if self.clients is not None:
+            with self.clients.get_lock():
+                self.clients.value = max(0, self.clients.value-1)
+
     def register_server(self, server):
         self.server = server
 
-    # list<list<list<double>>> embed_sents(1:string emb_type, 2:list<list<string>> sents)
+    def _sent_matrices(self, sents, emb_type):
+        if emb_type == LOCAL:
+            # cheaper than a lookup in the persistent cache
+            return self._local_matrices(sents)
+        if self.cache is None:
+            return self._compute_matrices(sents, emb_type)
+        # the cache keeps the "all" view so a sentence is computed once for every emb_type
+        if emb_type not in EMB_TYPES:
+            raise SequenceEmbedderELMo_UnknownEmbType("unknown emb_type %s"%emb_type)
+        mats = self.cache.get_many(ALL, sents)
+        missing = [i for i, mat in enumerate(mats) if mat is None]
+        self.stats.record_cache(len(sents)-len(missing), len(missing))
+        if len(missing) > 0:
+            missing_sents = [sents[i] for i in missing]
+            computed = self._compute_matrices(missing_sents, ALL)
+            self.cache.put_many(ALL, missing_sents, computed)
+            for i, mat in zip(missing, computed):
+                mats[i] = mat
+        return [derive(mat, emb_type) for mat in mats]
+
+    def _compute_matrices(self, sents, emb_type):
+        try:
+            extract = extractor(emb_type)
+        except ValueError:
+            raise SequenceEmbedderELMo_UnknownEmbType("unknown emb_type %s"%emb_type)
+        ress = self._embed(sents)
+        return [extract(res)[:len(sent)] for sent, res in zip(sents, ress)]
+
+    def projection(self, path):
+        # loaded on first use and kept for the following requests
+        with self._projections_lock:
+            if path not in self._projections:
+                self._projections[path] = Projection(path)
+            return self._projections[path]
+
+    def _checked_projection(self, path, emb_type):
+        projection = self.projection(path)
+        if projection.emb_type != emb_type:
+            raise SequenceEmbedderELMo_UnknownEmbType("projection %s is for %s and not for %s"%(projection.path, projection.emb_type, emb_type))
+        return projection
+
+    def _serialized(self, sents, emb_type, serialize, projection=None):
+        self.stats.record_request(sents)
+        if projection:
+            projection = self._checked_projection(projection, emb_type)
+        mats = self._sent_matrices(sents, emb_type)
+        if projection:
+            mats = projection.apply(mats)
+        start = time.time()
+        res = serialize(mats)
+        self.stats.record_latency("serialization", time.time()-start)
+        return res
+
+    # list<list<list<double>>> embed_sents(1:list<list<string>> sents, 2:string emb_type)
     def embed_sents(self, sents, emb_type):
-        ress = self.embedder().embed_sentences(sents)
-        all_vecs = []
-        for sent, res in zip(sents, ress):
-            vecs = []
-            for word_position in range(len(sent)):
-                if emb_type == "forward-top":
-                    vec = res[layer, word_position, :half_dimension]
-                elif emb_type == "backward-top":
-                    vec = res[layer, word_position, half_dimension:]
-                elif emb_type == "concat-top":
-                    vec = res[layer, word_position, :]
-                elif emb_type == "average-top":
-                    fwd_vec = res[layer, word_position, :half_dimension]
-                    bck_vec = res[layer, word_position, half_dimension:]
-                    vec = (fwd_vec+bck_vec)/2
-                elif emb_type == "local":
-                    vec = res[0, word_position, :half_dimension]
-                else:
-                    raise SequenceEmbedderELMo_UnknownEmbType("unknown emb_type %s"%emb_type)
-                vecs.append(vec.tolist())
-            all_vecs.append(vecs)
-        return all_vecs
+        return self._serialized(sents, emb_type, lambda mats: [mat.tolist() for mat in mats])
+
+    # list<binary> embed_sents_packed(1:list<list<string>> sents, 2:string emb_type, 3:string dtype, 4:string projection)
+    def embed_sents_packed(self, sents, emb_type, dtype=None, projection=None):
+        # clients that don't know about dtype don't set it and get float32
+        dtype = dtype or "float32"
+        if dtype not in DTYPES:
+            raise SequenceEmbedderELMo_BadArgument("unknown dtype %s ; the server supports %s" % (dtype, ", ".join(sorted(DTYPES))))
+        return self._serialized(sents, emb_type, lambda mats: [pack_matrix(mat, dtype) for mat in mats], projection)
+
+    def ring(self):
+        # every worker process writes to a ring of its own
+        if self._ring is None or self._ring_pid != os.getpid():
+            self._ring = ShmRing(ring_prefix(self.shm_dir, self._server_pid), self.shm_size)
+            self._ring_pid = os.getpid()
+        return self._ring
+
+    def _write_ring(self, mats):
+        with self._ring_lock:
+            return self.ring().write(mats)
+
+    # binary embed_sents_shm(1:list<list<string>> sents, 2:string emb_type, 3:string projection)
+    def embed_sents_shm(self, sents, emb_type, projection=None):
+        return self._serialized(sents, emb_type, self._write_ring, projection)
+
+    def forward_lm(self):
+        # made in the worker process so that it starts from the states the worker's own biLM carries
+        embedder = self.embedder()
+        with self._forward_lm_lock:
+            if self._forward_lm is None or self._forward_lm_pid != os.getpid():
+                self._forward_lm = forward_lm(embedder)
+                self._forward_lm_pid = os.getpid()
+            return self._forward_lm
+
+    # string open_session(1:string emb_type, 2:string projection)
+    def open_session(self, emb_type, projection=None):
+        if emb_type not in SESSION_LAYERS:
+            raise SequenceEmbedderELMo_UnknownEmbType("emb_type %s depends on the whole sentence ; sessions support %s"%(emb_type, ", ".join(sorted(SESSION_LAYERS))))
+        if projection:
+            projection = self._checked_projection(projection, emb_type)
+        try:
+            lm = self.forward_lm()
+        except UnsupportedBiLM as e:
+            raise SequenceEmbedderELMo_UnknownEmbType("sessions of emb_type %s are not supported: %s"%(emb_type, e))
+        session_id = self.sessions.open(emb_type, lm.start(), projection or None)
+        self.stats.record_session_opened()
+        return session_id
+
+    # binary push_tokens(1:string session, 2:list<string> tokens, 3:string dtype)
+    def push_tokens(self, session_id, tokens, dtype=None):
+        dtype = dtype or "float32"
+        if dtype not in DTYPES:
+            raise SequenceEmbedderELMo_BadArgument("unknown dtype %s ; the server supports %s" % (dtype, ", ".join(sorted(DTYPES))))
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise SequenceEmbedderELMo_UnknownSession("unknown session %s ; it was closed, evicted after %ds idle or opened through another connection"%(session_id, self.sessions.idle_timeout))
+        self.stats.record_request([tokens])
+        if session.emb_type == LOCAL:
+            mat = self._local_matrices([tokens])[0]
+            session.tokens += len(tokens)
+        else:
+            with session.lock:
+                start = time.time()
+                session.state, activations = self.forward_lm().advance(session.state, tokens)
+                session.tokens += len(tokens)
+                self.stats.record_forward(1, time.time()-start)
+            mat = activations[session.layer]
+        if session.projection is not None:
+            mat = session.projection.apply([mat])[0]
+        start = time.time()
+        res = pack_matrix(mat, dtype)
+        self.stats.record_latency("serialization", time.time()-start)
+        return res
+
+    # void close_session(1:string session)
+    def close_session(self, session_id):
+        self.sessions.close(session_id)
+
+    def stats_snapshot(self):
+        snapshot = self.stats.snapshot()
+        snapshot["model"] = self.model.name
+        if self.scheduler is not None:
+            snapshot["batching"] = self.scheduler.stats()
+        return snapshot
+
+    # string get_stats()
+    def get_stats(self):
+        return json.dumps(self.stats_snapshot())
+
+class ListeningServerSocket(TSocket.TServerSocket):
+
+    """
+    listen() can be called before serve() so clients can already connect (and wait in the backlog)
+    while the model is being loaded
+    """
+
+    def listen(self):
+        if self.handle is None:
+            TSocket.TServerSocket.listen(self)
+
+def announce_ready(port, ready_file):
+    # the client waits for this line (and/or file) instead of guessing how long loading takes
+    if ready_file is not None:
+        with open(ready_file+".tmp", "w") as fh:
+            print(port, file=fh)
+        os.rename(ready_file+".tmp", ready_file)
+    print("READY %s"%port, flush=True)
+
+def watch_clients(handler, server, grace_period):
+    # stops the daemon once it had no attached clients for grace_period seconds
+    idle_since = time.time()
+    while True:
+        time.sleep(1)
+        if handler.clients.value > 0:
+            idle_since = time.time()
+        elif time.time()-idle_since > grace_period:
+            print("no clients for %d seconds ; stopping the daemon"%grace_period, file=stderr)
+            server.stop()
+            return
+
+def detach_from_terminal(log_file):
+    # the daemon outlives the client that started it so its output can't go to the client's pipes
+    fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    os.close(fd)
+
+def remove_ready_file(port, ready_file):
+    # only if it still announces this daemon and not one that replaced it
+    try:
+        with open(ready_file) as fh:
+            if fh.read().strip() == str(port):
+                os.remove(ready_file)
+    except (IOError, ValueError):
+        pass
+
+def dump_stats(handler, stats_file):
+    with open(stats_file+".tmp", "w") as fh:
+        json.dump(handler.stats_snapshot(), fh, indent=2)
+    os.rename(stats_file+".tmp", stats_file)
+
+def write_stats_periodically(handler, stats_file, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            dump_stats(handler, stats_file)
+        except (IOError, OSError) as e:
+            print("writing stats to %s failed: %s"%(stats_file, e), file=stderr)
+
+def prepare_worker(handler, threads):
+    # called in every forked worker so that the workers together don't use more threads than there are cores
+    # the warmup pass is done here and not before the fork so that threads of the parent don't leak into workers
+    if handler.model.name != FAKE_MODEL:
+        import torch
+        torch.set_num_threads(threads)
+    warmup_embedder(handler.embedder())
+
+class StoppableThreadedServer(TThreadedServer):
+
+    """
+    thread per connection server that can be stopped from inside a handler
+    all connections are served by the same process so their requests can be batched together
+    """
+
+    def __init__(self, *args, **kwargs):
+        TThreadedServer.__init__(self, *args, **kwargs)
+        self._running = True
+
+    def serve(self):
+        self.serverTransport.listen()
+        while self._running:
+            try:
+                client = self.serverTransport.accept()
+            except Exception:
+                if self._running:
+                    raise
+                break
+            if not client:
+                continue
+            t = threading.Thread(target=self.handle, args=(client,))
+            t.daemon = self.daemon
+            t.start()
+
+    def stop(self):
+        self._running = False
+        # on linux closing the socket alone doesn't wake the thread blocked in accept
+        try:
+            self.serverTransport.handle.shutdown(socket.SHUT_RDWR)
+        except (AttributeError, OSError):
+            pass
+        self.serverTransport.close()
 
 if __name__ == '__main__':
 
-    if len(sys.argv)!= 2:
-        raise Exception("wrong number of arguments", file=stderr)
-    PORT=int(sys.argv[1])
+    parser = argparse.ArgumentParser()
+    parser.add_argument("port", type=int, help="0 binds any free port ; the real one is reported in the READY line")
+    parser.add_argument("--batching", action="store_true", help="merge requests from all clients into shared forward passes")
+    parser.add_argument("--max-batch-tokens", type=int, default=4096, help="token budget of a merged batch")
+    parser.add_argument("--max-batch-sents", type=int, default=256, help="sentence budget of a merged batch")
+    parser.add_argument("--max-wait-ms", type=float, default=10, help="max time the oldest queued request waits for the batch to fill")
+    parser.add_argument("--stats-every", type=int, default=100, help="print batching statistics every N batches (0 disables)")
+    parser.add_argument("--cache", default=None, help="sqlite file of a persistent embedding cache")
+    parser.add_argument("--cache-size-mb", type=float, default=10240, help="size cap of the cache, least recently used entries are evicted")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("ELMO_SERVER_WORKERS", 1)), help="number of worker processes (default $ELMO_SERVER_WORKERS or 1) ; ignored with --batching")
+    parser.add_argument("--ready-file", default=None, help="file that gets the bound port once the model is loaded")
+    parser.add_argument("--model", default=None, help="name of the model in the registry of elmo_models.py (default $ELMO_MODEL or original)")
+    parser.add_argument("--daemon", action="store_true", help="serve many clients that attach and detach ; exit after the last one is gone (implies --batching)")
+    parser.add_argument("--grace-period", type=float, default=60, help="seconds the daemon waits without clients before exiting")
+    parser.add_argument("--log-file", default=None, help="where the daemon writes its output after it is ready (default READY_FILE.log)")
+    parser.add_argument("--unix-socket", default=None, help="listen on this unix domain socket instead of the tcp port")
+    parser.add_argument("--shm-dir", default=default_shm_dir(), help="directory of the shared-memory rings used by embed_sents_shm")
+    parser.add_argument("--shm-size-mb", type=int, default=256, help="initial size of the ring of every worker")
+    parser.add_argument("--stats-file", default=None, help="periodically write the JSON of get_stats to this file")
+    parser.add_argument("--stats-interval", type=float, default=60, help="seconds between two writes of the stats file")
+    parser.add_argument("--local-cache-words", type=int, default=100000, help="word types whose \"local\" vectors are kept by every worker")
+    parser.add_argument("--prefix-cache-mb", type=float, default=0, help="size of the trie of forward states shared by sentences with common prefixes, per worker (0 disables)")
+    parser.add_argument("--session-timeout", type=float, default=600, help="seconds after which an idle incremental session is closed")
+    parser.add_argument("--max-sessions", type=int, default=1000, help="open incremental sessions per worker ; the least recently used are closed first")
+    args = parser.parse_args()
+
+    if args.daemon:
+        # a worker of the process pool serves one connection for as long as it is open and every client keeps its
+        # connections open for its whole life ; the threaded server isn't limited to --workers clients
+        args.batching = True
+        # a new session so that signals sent to the process group of the starting client don't reach the daemon
+        try:
+            os.setsid()
+        except OSError:
+            pass
 
-    handler = ELMo_Service_Handler()
+    handler = ELMo_Service_Handler(resolve(args.model), stats_slots=1 if args.batching else args.workers)
+    if args.cache is not None:
+        handler.enable_cache(args.cache, args.cache_size_mb)
+    if args.daemon:
+        handler.enable_daemon()
+    if args.prefix_cache_mb > 0:
+        handler.enable_prefix_cache(args.prefix_cache_mb)
+    handler.local_cache_words = args.local_cache_words
+    handler.shm_dir = args.shm_dir
+    handler.shm_size = args.shm_size_mb*1024*1024
+    handler.sessions.idle_timeout = args.session_timeout
+    handler.sessions.max_sessions = args.max_sessions
 
     processor = SequenceEmbedderELMo_Service.Processor(handler)
-    transport = TSocket.TServerSocket(host='127.0.0.1', port=PORT)
+    if args.unix_socket is not None:
+        transport = ListeningServerSocket(unix_socket=args.unix_socket)
+    else:
+        transport = ListeningServerSocket(host='127.0.0.1', port=args.port)
     tfactory = TTransport.TBufferedTransportFactory()
     pfactory = TBinaryProtocol.TBinaryProtocolFactory()
 
-    server = TProcessPoolServer(processor, transport, tfactory, pfactory)
-    server.setNumWorkers(1)
+    # weights are loaded once before the workers are forked so that all of them share the same pages
+    transport.listen()
+    handler.embedder(warmup=args.batching)
+    port = args.unix_socket if args.unix_socket is not None else transport.handle.getsockname()[1]
+    announce_ready(port, args.ready_file)
+    if args.daemon:
+        log_file = args.log_file or (args.ready_file+".log" if args.ready_file is not None else os.devnull)
+        detach_from_terminal(log_file)
+
+    if args.batching:
+        handler.enable_batching(args.max_batch_tokens, args.max_batch_sents, args.max_wait_ms, args.stats_every)
+        server = StoppableThreadedServer(processor, transport, tfactory, pfactory, daemon=True)
+    else:
+        server = TProcessPoolServer(processor, transport, tfactory, pfactory)
+        server.setNumWorkers(args.workers)
+        threads_per_worker = max(1, multiprocessing.cpu_count()//args.workers)
+        server.setPostForkCallback(lambda: prepare_worker(handler, threads_per_worker))
     handler.register_server(server)
+    if args.daemon:
+        watchdog = threading.Thread(target=watch_clients, args=(handler, server, args.grace_period))
+        watchdog.daemon = True
+        watchdog.start()
+    if args.stats_file is not None:
+        stats_writer = threading.Thread(target=write_stats_periodically, args=(handler, args.stats_file, args.stats_interval))
+        stats_writer.daemon = True
+        stats_writer.start()
     server.serve()
-
+    if args.stats_file is not None:
+        dump_stats(handler, args.stats_file)
+    remove_rings(args.shm_dir, os.getpid())
+    if args.daemon and args.ready_file is not None:
+        remove_ready_file(port, args.ready_file)
+    if handler.scheduler is not None:
+        print(handler.scheduler.stats_line(), file=stderr)
+        handler.scheduler.close()
 
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+# stand-in for allennlp's ElmoEmbedder that needs no weights
+# it returns [3 x words x 1024] float32 tensors of random numbers that depend on the same words as in the real biLM:
+# layer 0 on the word alone (the same in both halves), the forward half of the other layers on the words up to it and
+# the backward half on the words from it to the end ; so the same sentence always gets the same embedding, however it is
+# batched, and embedding it word by word (forward_lm) gives the same forward vectors
+# the vectors are rows of a fixed random table picked by hashes of those words
+# ELMO_FAKE_MS_PER_TOKEN adds a delay per token to imitate the cost of a real forward pass
+
+import hashlib
+import os
+import time
+import numpy as np
+
+LAYERS = 3
+DIMENSION = 1024
+HALF = DIMENSION//2
+TABLE_ROWS = 4096
+
+_table = None
+
+
+def _rows(hashes, layer):
+    global _table
+    if _table is None:
+        _table = np.random.RandomState(0).standard_normal((TABLE_ROWS, HALF)).astype(np.float32)
+    return _table[[(h*LAYERS+layer) % TABLE_ROWS for h in hashes]]
+
+
+def _hash(h):
+    return int(h.hexdigest()[:8], 16)
+
+
+def _word_hashes(words):
+    return [_hash(hashlib.sha1(word.encode("utf-8"))) for word in words]
+
+
+def _prefix_hashes(h, words):
+    # h is extended in place with every word ; returns the hash after each of them
+    res = []
+    for word in words:
+        h.update(word.encode("utf-8")+b"\n")
+        res.append(_hash(h))
+    return res
+
+
+class FakeElmoEmbedder:
+
+    def __init__(self, ms_per_token=None):
+        if ms_per_token is None:
+            ms_per_token = float(os.environ.get("ELMO_FAKE_MS_PER_TOKEN", 0))
+        self.ms_per_token = ms_per_token
+
+    def _embed(self, sent):
+        res = np.empty((LAYERS, len(sent), DIMENSION), dtype=np.float32)
+        if len(sent) == 0:
+            return res
+        local = _rows(_word_hashes(sent), 0)
+        res[0, :, :HALF] = local
+        res[0, :, HALF:] = local
+        forward = _prefix_hashes(hashlib.sha1(), sent)
+        backward = _prefix_hashes(hashlib.sha1(b"backward\n"), reversed(sent))[::-1]
+        for layer in range(1, LAYERS):
+            res[layer, :, :HALF] = _rows(forward, layer)
+            res[layer, :, HALF:] = _rows(backward, layer)
+        return res
+
+    def _wait(self, sents):
+        if self.ms_per_token > 0:
+            time.sleep(self.ms_per_token*sum(len(sent) for sent in sents)/1000.0)
+
+    def embed_sentence(self, sent):
+        self._wait([sent])
+        return self._embed(sent)
+
+    def embed_batch(self, sents):
+        self._wait(sents)
+        return [self._embed(sent) for sent in sents]
+
+    def embed_sentences(self, sents, batch_size=64):
+        for i in range(0, len(sents), batch_size):
+            for res in self.embed_batch(sents[i:i+batch_size]):
+                yield res
+
+    def forward_lm(self):
+        return FakeForwardLM(self)
+
+
+class FakeForwardLM:
+
+    """
+    the interface of elmo_bilm.ForwardLM ; a state is the hash of the words seen so far
+    the forward and the backward direction each take half of the delay of ELMO_FAKE_MS_PER_TOKEN
+    """
+
+    dim = HALF
+    layers = LAYERS
+    state_bytes = 100
+
+    def __init__(self, embedder):
+        self._embedder = embedder
+
+    def _wait(self, tokens):
+        if self._embedder.ms_per_token > 0:
+            time.sleep(self._embedder.ms_per_token*tokens/2000.0)
+
+    def start(self):
+        return hashlib.sha1()
+
+    def advance(self, state, words):
+        self._wait(len(words))
+        state = state.copy()
+        res = np.empty((LAYERS, len(words), HALF), dtype=np.float32)
+        if len(words) == 0:
+            return state, res
+        res[0] = _rows(_word_hashes(words), 0)
+        forward = _prefix_hashes(state, words)
+        for layer in range(1, LAYERS):
+            res[layer] = _rows(forward, layer)
+        return state, res
+
+    def token_embeddings(self, sents):
+        return [np.concatenate([_rows(_word_hashes(sent), 0), np.zeros((1, HALF), dtype=np.float32)]) for sent in sents]
+
+    def step(self, states, words, inputs):
+        self._wait(len(states))
+        new_states = [state.copy() for state in states]
+        hashes = [_prefix_hashes(state, [word])[0] for state, word in zip(new_states, words)]
+        activations = np.empty((len(states), LAYERS, HALF), dtype=np.float32)
+        activations[:, 0] = inputs
+        for layer in range(1, LAYERS):
+            activations[:, layer] = _rows(hashes, layer)
+        return new_states, activations
+
+    def backward(self, sents, embeddings):
+        self._wait(sum(len(sent) for sent in sents))
+        res = []
+        for sent in sents:
+            backward = _prefix_hashes(hashlib.sha1(b"backward\n"), reversed(sent))[::-1]
+            res.append(np.stack([_rows(backward, layer) for layer in range(1, LAYERS)]))
+        return res
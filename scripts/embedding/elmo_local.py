@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+# fast path of the "local" emb_type: it is the character CNN layer of the biLM which depends on the word alone
+# so it is computed with the token encoder only, without the LSTMs, and the vectors of the most recently used
+# word types are kept in an LRU cache
+#
+# the script exports the vectors of a whole vocabulary as lines "word v1 v2 ..." (the format of the pretrained
+# embeddings of EmbedderStandard):
+#
+#   elmo_local.py --output TABLE [--model NAME] --vocab FILE                  the first field of every line is a word
+#   elmo_local.py --output TABLE [--model NAME] --corpus FILE [--min_count N]  words of a tokenized corpus
+
+import argparse
+import threading
+from collections import Counter, OrderedDict
+from sys import stderr
+import numpy as np
+from elmo_bilm import forward_lm
+
+# words encoded in a single pass of the token encoder
+ENCODE_BATCH_WORDS = 1024
+
+
+class LocalEmbedder:
+
+    def __init__(self, lm, max_words=100000, on_lookup=None):
+        self.lm = lm
+        self.max_words = max_words
+        # called with the number of tokens found in the cache and the number of word types that were encoded
+        self.on_lookup = on_lookup
+        # ordered from the least to the most recently used
+        self._vectors = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def encode(self, words):
+        """
+        [words x dim] vectors of distinct words without the cache ; the token encoder looks at every word on its own
+        so a batch of words is encoded as if it were one sentence
+        """
+        if len(words) == 0:
+            return np.zeros((0, self.lm.dim), dtype=np.float32)
+        return np.concatenate([self.lm.token_embeddings([words[i:i+ENCODE_BATCH_WORDS]])[0][:-1]
+                               for i in range(0, len(words), ENCODE_BATCH_WORDS)])
+
+    def embed_sents(self, sents):
+        """
+        the [words x dim] "local" embedding of every sentence
+        """
+        vectors = {}
+        tokens = 0
+        with self._lock:
+            for sent in sents:
+                for word in sent:
+                    tokens += 1
+                    if word not in vectors and word in self._vectors:
+                        self._vectors.move_to_end(word)
+                        vectors[word] = self._vectors[word]
+        hits = sum(1 for sent in sents for word in sent if word in vectors)
+        missing = sorted(set(word for sent in sents for word in sent if word not in vectors))
+        if len(missing) > 0:
+            for word, vector in zip(missing, self.encode(missing)):
+                # a copy so that the cache doesn't keep the whole batch alive
+                vectors[word] = vector.copy()
+            with self._lock:
+                for word in missing:
+                    self._vectors[word] = vectors[word]
+                while len(self._vectors) > self.max_words:
+                    self._vectors.popitem(last=False)
+        with self._lock:
+            self.hits += hits
+            self.misses += tokens-hits
+        if self.on_lookup is not None:
+            self.on_lookup(hits, len(missing))
+        return [np.stack([vectors[word] for word in sent]) if len(sent) > 0 else np.zeros((0, self.lm.dim), dtype=np.float32)
+                for sent in sents]
+
+    def stats_line(self):
+        total = self.hits+self.misses
+        return "local cache %d words hits %d misses %d hit rate %.3f" % (
+            len(self._vectors), self.hits, self.misses, self.hits/total if total > 0 else 0.0)
+
+
+def local_embedder(embedder, max_words=100000, on_lookup=None):
+    return LocalEmbedder(forward_lm(embedder), max_words, on_lookup)
+
+
+def read_vocabulary(vocab_file=None, corpus_file=None, min_count=1):
+    if vocab_file is not None:
+        with open(vocab_file, encoding="utf-8") as fh:
+            words = [line.split()[0] for line in fh if line.strip() != ""]
+        return list(OrderedDict.fromkeys(words))
+    counts = Counter()
+    with open(corpus_file, encoding="utf-8") as fh:
+        for line in fh:
+            counts.update(line.split())
+    return [word for word, count in counts.most_common() if count >= min_count]
+
+
+def export_table(local, words, output, precision=9):
+    fmt = "%%.%dg" % precision
+    with open(output, "w", encoding="utf-8") as fh:
+        for i in range(0, len(words), ENCODE_BATCH_WORDS):
+            batch = words[i:i+ENCODE_BATCH_WORDS]
+            for word, vector in zip(batch, local.encode(batch)):
+                fh.write(word + " " + " ".join(fmt % x for x in vector) + "\n")
+            print("exported %d/%d words" % (min(i+ENCODE_BATCH_WORDS, len(words)), len(words)), file=stderr)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", required=True, help="table of lines \"word v1 v2 ...\"")
+    parser.add_argument("--vocab", default=None, help="file whose lines start with the words to export")
+    parser.add_argument("--corpus", default=None, help="tokenized corpus whose words are exported, the most frequent first")
+    parser.add_argument("--min_count", default=1, type=int, help="minimal frequency of a word of --corpus")
+    parser.add_argument("--precision", default=9, type=int, help="significant digits of the values")
+    parser.add_argument("--model", default=None, help="name of the model in the registry of elmo_models.py (default $ELMO_MODEL or original)")
+    args = parser.parse_args()
+
+    if (args.vocab is None) == (args.corpus is None):
+        parser.error("exactly one of --vocab and --corpus is needed")
+
+    from elmo_models import load_embedder, resolve
+    words = read_vocabulary(args.vocab, args.corpus, args.min_count)
+    print("exporting %d words" % len(words), file=stderr)
+    export_table(local_embedder(load_embedder(resolve(args.model))), words, args.output, args.precision)
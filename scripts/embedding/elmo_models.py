@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+# local registry of ELMo models so that embedding doesn't depend on the network
+#
+# the registry is a directory ($ELMO_MODEL_DIR, by default ~/.elmo_models) with one subdirectory per model:
+#   <name>/manifest.json  {"options_file": ..., "weight_file": ..., "sha256": {file name: checksum}}
+#   <name>/<options file>
+#   <name>/<weight file>
+# models that are not in the registry fall back to the remote files
+# the model "fake" is a stand-in without weights (see elmo_fake.py) for benchmarks and tests of the plumbing
+#
+#   elmo_models.py add    [--name NAME] [--options URL_OR_PATH] [--weights URL_OR_PATH]
+#   elmo_models.py verify [--name NAME]
+#   elmo_models.py list
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from sys import stderr
+
+DEFAULT_MODEL = "original"
+FAKE_MODEL = "fake"
+
+REMOTE_MODELS = {
+    "original" : (
+        "https://s3-us-west-2.amazonaws.com/allennlp/models/elmo/2x4096_512_2048cnn_2xhighway/elmo_2x4096_512_2048cnn_2xhighway_options.json",
+        "https://s3-us-west-2.amazonaws.com/allennlp/models/elmo/2x4096_512_2048cnn_2xhighway/elmo_2x4096_512_2048cnn_2xhighway_weights.hdf5"
+    ),
+}
+
+MANIFEST = "manifest.json"
+
+
+def registry_dir():
+    return os.environ.get("ELMO_MODEL_DIR", os.path.join(os.path.expanduser("~"), ".elmo_models"))
+
+
+def default_model():
+    return os.environ.get("ELMO_MODEL", DEFAULT_MODEL)
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1<<20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class Model:
+
+    def __init__(self, name, options_file, weight_file, model_id):
+        self.name = name
+        self.options_file = options_file
+        self.weight_file = weight_file
+        # identifies the weights, for example in the keys of the embedding cache
+        self.model_id = model_id
+
+
+def is_local(name):
+    return os.path.exists(os.path.join(registry_dir(), name, MANIFEST))
+
+
+def resolve(name=None, verify=False):
+    name = name or default_model()
+    model_dir = os.path.join(registry_dir(), name)
+    manifest_file = os.path.join(model_dir, MANIFEST)
+    if name == FAKE_MODEL:
+        return Model(name, None, None, FAKE_MODEL)
+    elif os.path.exists(manifest_file):
+        with open(manifest_file) as fh:
+            manifest = json.load(fh)
+        if verify:
+            verify_model(name)
+        return Model(
+            name         = name,
+            options_file = os.path.join(model_dir, manifest["options_file"]),
+            weight_file  = os.path.join(model_dir, manifest["weight_file"]),
+            model_id     = manifest["sha256"][manifest["weight_file"]])
+    elif name in REMOTE_MODELS:
+        print("model %s is not in %s ; using remote files" % (name, registry_dir()), file=stderr)
+        options_file, weight_file = REMOTE_MODELS[name]
+        model_id = hashlib.sha1(("%s\n%s" % (options_file, weight_file)).encode("utf-8")).hexdigest()
+        return Model(name, options_file, weight_file, model_id)
+    else:
+        raise Exception("unknown ELMo model %s (registry %s)" % (name, registry_dir()))
+
+
+def verify_model(name):
+    model_dir = os.path.join(registry_dir(), name)
+    with open(os.path.join(model_dir, MANIFEST)) as fh:
+        manifest = json.load(fh)
+    for file_name, checksum in manifest["sha256"].items():
+        if _sha256(os.path.join(model_dir, file_name)) != checksum:
+            raise Exception("checksum mismatch for %s of model %s" % (file_name, name))
+
+
+def add_model(name, options, weights):
+    model_dir = os.path.join(registry_dir(), name)
+    os.makedirs(model_dir, exist_ok=True)
+    files = []
+    for source in [options, weights]:
+        file_name = os.path.basename(source)
+        target = os.path.join(model_dir, file_name)
+        if source.startswith("http://") or source.startswith("https://"):
+            from urllib.request import urlopen
+            print("downloading %s" % source, file=stderr)
+            with urlopen(source) as response, open(target+".tmp", "wb") as fh:
+                shutil.copyfileobj(response, fh)
+            os.rename(target+".tmp", target)
+        else:
+            shutil.copyfile(source, target)
+        files.append(file_name)
+    manifest = {
+        "options_file" : files[0],
+        "weight_file"  : files[1],
+        "sha256"       : {file_name: _sha256(os.path.join(model_dir, file_name)) for file_name in files},
+    }
+    with open(os.path.join(model_dir, MANIFEST), "w") as fh:
+        json.dump(manifest, fh, indent=2)
+
+
+class StartupTimer:
+
+    """
+    logs how long each startup phase took so that cold start latency can be tracked
+    """
+
+    def __init__(self):
+        self._start = time.time()
+        self._last = self._start
+
+    def phase(self, name):
+        now = time.time()
+        print("startup %s %.2fs (total %.2fs)" % (name, now-self._last, now-self._start), file=stderr)
+        self._last = now
+
+
+def load_embedder(model, warmup=True):
+    """
+    allennlp is imported only here so that scripts don't pay for it before they need the model
+    """
+    timer = StartupTimer()
+    if model.name == FAKE_MODEL:
+        from elmo_fake import FakeElmoEmbedder
+        return FakeElmoEmbedder()
+    from allennlp.commands.elmo import ElmoEmbedder
+    timer.phase("import")
+    embedder = ElmoEmbedder(options_file=model.options_file, weight_file=model.weight_file)
+    timer.phase("weights load")
+    if warmup:
+        warmup_embedder(embedder, timer)
+    return embedder
+
+
+def warmup_embedder(embedder, timer=None):
+    # the first forward pass is much slower than the following ones
+    timer = timer or StartupTimer()
+    embedder.embed_sentence(["warmup"])
+    timer.phase("warmup")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["add", "verify", "list"])
+    parser.add_argument("--name", default=DEFAULT_MODEL)
+    parser.add_argument("--options", default=None, help="url or path of the options file")
+    parser.add_argument("--weights", default=None, help="url or path of the weights file")
+    args = parser.parse_args()
+
+    if args.command == "add":
+        if args.name in REMOTE_MODELS:
+            remote_options, remote_weights = REMOTE_MODELS[args.name]
+        else:
+            remote_options, remote_weights = None, None
+        options = args.options or remote_options
+        weights = args.weights or remote_weights
+        if options is None or weights is None:
+            raise Exception("--options and --weights are required for model %s" % args.name)
+        add_model(args.name, options, weights)
+    elif args.command == "verify":
+        verify_model(args.name)
+        print("model %s OK" % args.name)
+    else:
+        if os.path.isdir(registry_dir()):
+            for name in sorted(os.listdir(registry_dir())):
+                if is_local(name):
+                    print(name)
+
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# writers for embeddings exported to a stream
+#   text   : "words N" line followed by N lines of values separated by two spaces
+#   binary : the packed format of elmo_packing for every sentence, one after another
+
+import numpy as np
+from elmo_packing import pack_matrix
+
+OUTPUT_FORMATS = ["text", "binary"]
+
+
+class TextWriter:
+
+    def __init__(self, stream, precision):
+        self._stream = stream
+        self._fmt = "%%.%dg" % precision
+
+    def add(self, mat):
+        self._stream.write(b"words %d\n" % len(mat))
+        np.savetxt(self._stream, mat, fmt=self._fmt, delimiter="  ")
+
+    def flush(self):
+        self._stream.flush()
+
+    def close(self):
+        self.flush()
+
+
+class BinaryWriter:
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def add(self, mat):
+        self._stream.write(pack_matrix(mat))
+
+    def flush(self):
+        self._stream.flush()
+
+    def close(self):
+        self.flush()
+
+
+def make_writer(output_format, stream, precision=9):
+    """
+    stream has to be a binary stream, for example sys.stdout.buffer
+    """
+    if output_format == "text":
+        return TextWriter(stream, precision)
+    elif output_format == "binary":
+        return BinaryWriter(stream)
+    else:
+        raise ValueError("unknown output format %s" % output_format)
+
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# packed wire format for a single sentence embedding:
+#   int32 rows, int32 cols (little-endian) followed by the rows in row-major order
+# the encoding of the rows depends on the dtype the client asked for:
+#   float32  cols float32 values per row (the default)
+#   float16  cols float16 values per row
+#   int8     float32 scale followed by cols int8 values per row ; a value is int8*scale
+# the rows of an embedding store (elmo_store.py) are encoded the same way
+
+import struct
+import numpy as np
+
+header_format = "<ii"
+header_size = struct.calcsize(header_format)
+packed_dtype = np.dtype("<f4")
+
+DTYPES = ["float32", "float16", "int8"]
+
+INT8_MAX = 127
+
+
+def row_dtype(dtype, cols):
+    if dtype == "float32":
+        return np.dtype(("<f4", (cols,)))
+    elif dtype == "float16":
+        return np.dtype(("<f2", (cols,)))
+    elif dtype == "int8":
+        return np.dtype([("scale", "<f4"), ("values", "i1", (cols,))])
+    else:
+        raise ValueError("unknown dtype %s" % dtype)
+
+
+def encode_rows(mat, dtype="float32"):
+    """
+    [rows x cols] float matrix -> array of the rows in the encoding of dtype
+    (a [rows x cols] matrix for the float dtypes, a vector of (scale, values) records for int8)
+    """
+    rows, cols = np.shape(mat)
+    if dtype != "int8":
+        return np.ascontiguousarray(mat, dtype=row_dtype(dtype, cols).base)
+    mat = np.asarray(mat, dtype=np.float32)
+    # the scale maps the largest absolute value of the row to INT8_MAX
+    scales = np.abs(mat).max(axis=1)/INT8_MAX if cols > 0 else np.zeros(rows, dtype=np.float32)
+    res = np.empty(rows, dtype=row_dtype(dtype, cols))
+    res["scale"] = scales
+    res["values"] = np.rint(mat/np.where(scales > 0, scales, 1)[:, None])
+    return res
+
+
+def decode_rows(rows, dtype="float32"):
+    """
+    inverse of encode_rows ; float32 rows are returned without a copy
+    """
+    if dtype == "int8":
+        return rows["values"].astype(np.float32)*rows["scale"][:, None]
+    else:
+        return rows.astype(np.float32, copy=False)
+
+
+def quantize(mat, dtype):
+    # what a matrix turns into after a round trip through dtype
+    return decode_rows(encode_rows(mat, dtype), dtype)
+
+
+def pack_matrix(mat, dtype="float32"):
+    rows = encode_rows(mat, dtype)
+    return struct.pack(header_format, rows.shape[0], np.shape(mat)[1]) + rows.tobytes()
+
+
+def unpack_matrix(blob, dtype="float32"):
+    rows, cols = struct.unpack_from(header_format, blob, 0)
+    return decode_rows(np.frombuffer(blob, dtype=row_dtype(dtype, cols), count=rows, offset=header_size), dtype)
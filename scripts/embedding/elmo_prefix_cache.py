@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+# trie of the forward LSTM states of the biLM keyed by token prefix for inputs whose sentences share long prefixes
+# (samples, n-best lists, lattice paths)
+# a node stands for the prefix on the path from the root ; it keeps the forward state after the prefix and the forward
+# activations of its last word so that a sentence is embedded by walking the trie as far as it matches and running
+# the forward direction only over the rest ; the prefixes that are new are computed depth by depth, each one once,
+# in a single batch per depth ; the backward direction is computed in full for every sentence
+# the least recently used nodes are evicted when the trie is above max_mb ; a node is always used after its children
+# so the least recently used node is a leaf
+
+import threading
+from collections import OrderedDict
+import numpy as np
+
+# estimate of the python objects of a node beyond its state and activations
+NODE_OVERHEAD = 400
+
+
+class _Node:
+
+    __slots__ = ["word", "parent", "children", "state", "activations"]
+
+    def __init__(self, word, parent, state=None, activations=None):
+        self.word = word
+        self.parent = parent
+        self.children = {}
+        self.state = state
+        # [layers x dim] forward activations of the word
+        self.activations = activations
+
+
+class PrefixCache:
+
+    def __init__(self, lm, max_mb, on_lookup=None):
+        self.lm = lm
+        self.max_bytes = max_mb*1024*1024
+        self.node_bytes = lm.state_bytes + 4*lm.layers*lm.dim + NODE_OVERHEAD
+        # called with the number of tokens whose forward direction was reused and the number that was computed
+        self.on_lookup = on_lookup
+        self._root = _Node(None, None, lm.start())
+        # ordered from the least to the most recently used
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self.reused_tokens = 0
+        self.computed_tokens = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._lru)
+
+    def _walk(self, sent, pending):
+        """
+        the nodes of the prefixes of sent ; the missing ones are created and added to pending by depth
+        """
+        node = self._root
+        path = []
+        for depth, word in enumerate(sent):
+            child = node.children.get(word)
+            if child is None:
+                child = _Node(word, node)
+                node.children[word] = child
+                pending.setdefault(depth, []).append(child)
+            path.append(child)
+            node = child
+        for node in reversed(path):
+            self._lru[node] = None
+            self._lru.move_to_end(node)
+        return path
+
+    def _compute(self, pending, embeddings):
+        for depth in sorted(pending):
+            nodes = pending[depth]
+            inputs = np.stack([embeddings[node][depth] for node in nodes])
+            states, activations = self.lm.step([node.parent.state for node in nodes], [node.word for node in nodes], inputs)
+            for node, state, activation in zip(nodes, states, activations):
+                node.state = state
+                node.activations = activation
+
+    def _remove(self, node):
+        del node.parent.children[node.word]
+        del self._lru[node]
+
+    def _evict(self):
+        while len(self._lru)*self.node_bytes > self.max_bytes:
+            node = next(iter(self._lru))
+            self._remove(node)
+            self.evicted += 1
+
+    def embed_batch(self, sents):
+        """
+        the [layers x words x 2*dim] embeddings of sents, the same as ElmoEmbedder.embed_batch returns them
+        """
+        ress = [np.zeros((self.lm.layers, 0, 2*self.lm.dim), dtype=np.float32) for _ in sents]
+        non_empty = [i for i, sent in enumerate(sents) if len(sent) > 0]
+        if len(non_empty) == 0:
+            return ress
+        batch = [sents[i] for i in non_empty]
+        embeddings = self.lm.token_embeddings(batch)
+        # one batch at a time so that a node is computed once even if several threads ask for it
+        with self._lock:
+            pending = {}
+            paths = [self._walk(sent, pending) for sent in batch]
+            # the token embeddings of the sentence that created the node
+            node_embeddings = {}
+            for path, emb in zip(paths, embeddings):
+                for node in path:
+                    if node.state is None and node not in node_embeddings:
+                        node_embeddings[node] = emb
+            try:
+                self._compute(pending, node_embeddings)
+            except Exception:
+                for depth in sorted(pending, reverse=True):
+                    for node in pending[depth]:
+                        self._remove(node)
+                raise
+            forward = [np.stack([node.activations for node in path], axis=1) for path in paths]
+            computed = sum(len(nodes) for nodes in pending.values())
+            reused = sum(len(sent) for sent in batch)-computed
+            self.computed_tokens += computed
+            self.reused_tokens += reused
+            self._evict()
+        if self.on_lookup is not None:
+            self.on_lookup(reused, computed)
+        backward = self.lm.backward(batch, embeddings)
+        dim = self.lm.dim
+        for i, fwd, bwd in zip(non_empty, forward, backward):
+            res = np.empty((self.lm.layers, len(sents[i]), 2*dim), dtype=np.float32)
+            res[:, :, :dim] = fwd
+            # the first layer is the same in both halves
+            res[0, :, dim:] = fwd[0]
+            res[1:, :, dim:] = bwd
+            ress[i] = res
+        return ress
+
+    def stats(self):
+        with self._lock:
+            return {
+                "nodes"           : len(self._lru),
+                "size_mb"         : len(self._lru)*self.node_bytes/1024.0/1024,
+                "reused_tokens"   : self.reused_tokens,
+                "computed_tokens" : self.computed_tokens,
+                "evicted_nodes"   : self.evicted,
+            }
+
+    def stats_line(self):
+        s = self.stats()
+        total = s["reused_tokens"]+s["computed_tokens"]
+        return "prefix cache %d nodes %.1fMB reused %d of %d tokens (%.3f)" % (
+            s["nodes"], s["size_mb"], s["reused_tokens"], total, s["reused_tokens"]/total if total > 0 else 0.0)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+# fixed linear projections that the server applies to the embeddings before they are sent
+# so that clients receive out_dim sized vectors instead of the full ELMo ones
+#
+# a projection is a directory:
+#   W.npy      float32 [out_dim x in_dim]
+#   b.npy      float32 [out_dim] (optional)
+#   meta.json  {"emb_type": ..., "in_dim": ..., "out_dim": ..., "normalize": bool, "source": "model" or "pca"}
+# with normalize the rows are l2 normalized before they are projected, the same way as SequenceEmbedderELMo does it
+#
+# projections come either from the compressor of a trained model (edin.ccg.MainExportELMoProjection)
+# or from a PCA of a sample of a corpus:
+#
+#   elmo_projection.py pca  --emb_type TYPE --out_dim K --output DIR [--store PATH] [--model NAME] [--normalize] < sentences
+#   elmo_projection.py info --output DIR
+
+import argparse
+import json
+import os
+from itertools import islice
+from sys import stdin, stderr
+import numpy as np
+from elmo_emb_types import extractor
+from elmo_store import EmbeddingStore
+
+META = "meta.json"
+
+
+class Projection:
+
+    def __init__(self, path):
+        with open(os.path.join(path, META)) as fh:
+            self.meta = json.load(fh)
+        self.path = path
+        self.emb_type = self.meta["emb_type"]
+        self.normalize = self.meta.get("normalize", False)
+        self.W = np.ascontiguousarray(np.load(os.path.join(path, "W.npy")), dtype=np.float32)
+        b_file = os.path.join(path, "b.npy")
+        self.b = np.load(b_file).astype(np.float32) if os.path.exists(b_file) else None
+        self.out_dim, self.in_dim = self.W.shape
+        if self.in_dim != self.meta["in_dim"] or self.out_dim != self.meta["out_dim"]:
+            raise Exception("W.npy of %s is %dx%d but %s says %dx%d" % (
+                path, self.out_dim, self.in_dim, META, self.meta["out_dim"], self.meta["in_dim"]))
+
+    def apply(self, mats):
+        """
+        projects the [words x in_dim] matrices of a whole request with a single matrix product
+        """
+        if len(mats) == 0:
+            return []
+        rows = np.concatenate([np.asarray(mat, dtype=np.float32) for mat in mats])
+        if rows.shape[1] != self.in_dim:
+            raise Exception("projection %s expects dimension %d but got %d" % (self.path, self.in_dim, rows.shape[1]))
+        if self.normalize:
+            rows = rows/(np.linalg.norm(rows, axis=1, keepdims=True)+1e-10)
+        res = rows.dot(self.W.T)
+        if self.b is not None:
+            res += self.b
+        return np.split(res, np.cumsum([len(mat) for mat in mats])[:-1])
+
+
+def save_projection(path, emb_type, W, b=None, normalize=False, source="pca"):
+    # meta.json is removed first and written last (see elmo_store.py)
+    os.makedirs(path, exist_ok=True)
+    if os.path.exists(os.path.join(path, META)):
+        os.remove(os.path.join(path, META))
+    np.save(os.path.join(path, "W.npy"), np.asarray(W, dtype=np.float32))
+    if b is not None:
+        np.save(os.path.join(path, "b.npy"), np.asarray(b, dtype=np.float32))
+    meta = {
+        "emb_type"  : emb_type,
+        "in_dim"    : int(W.shape[1]),
+        "out_dim"   : int(W.shape[0]),
+        "normalize" : normalize,
+        "source"    : source,
+    }
+    with open(os.path.join(path, META+".tmp"), "w") as fh:
+        json.dump(meta, fh, indent=2)
+    os.replace(os.path.join(path, META+".tmp"), os.path.join(path, META))
+
+
+def sample_rows(mats, max_tokens):
+    rows = []
+    count = 0
+    for mat in mats:
+        rows.append(np.asarray(mat, dtype=np.float32))
+        count += len(mat)
+        if count >= max_tokens:
+            break
+    return np.concatenate(rows)[:max_tokens]
+
+
+def pca(rows, out_dim):
+    """
+    returns W [out_dim x in_dim] and b so that W x + b are the coordinates of x in the top out_dim principal components
+    and the fraction of the variance they explain
+    """
+    mean = rows.mean(axis=0)
+    _, singular_values, components = np.linalg.svd(rows-mean, full_matrices=False)
+    W = components[:out_dim]
+    variance = np.square(singular_values)
+    return W, -W.dot(mean), variance[:out_dim].sum()/variance.sum()
+
+
+def store_embeddings(path, emb_type):
+    store = EmbeddingStore(path)
+    for sent_id in range(len(store)):
+        yield store.view(sent_id, emb_type)
+
+
+def computed_embeddings(model, emb_type):
+    from elmo_models import load_embedder, resolve
+    extract = extractor(emb_type)
+    embedder = load_embedder(resolve(model))
+    sents = (line.split() for line in stdin)
+    while True:
+        batch = list(islice(sents, 64))
+        if len(batch) == 0:
+            break
+        for sent, res in zip(batch, embedder.embed_batch(batch)):
+            yield extract(res)[:len(sent)]
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["pca", "info"])
+    parser.add_argument("--output", required=True, help="projection directory")
+    parser.add_argument("--emb_type", default=None, help="emb_type the projection is applied to")
+    parser.add_argument("--out_dim", default=None, type=int, help="number of principal components")
+    parser.add_argument("--store", default=None, help="embedding store to sample (default: embed the sentences on stdin)")
+    parser.add_argument("--model", default=None, help="name of the model in the registry of elmo_models.py (default $ELMO_MODEL or original)")
+    parser.add_argument("--max_tokens", default=100000, type=int, help="size of the sample in tokens")
+    parser.add_argument("--normalize", action="store_true", help="l2 normalize the vectors before projecting (for embedders with normalize: true)")
+    args = parser.parse_args()
+
+    if args.command == "pca":
+        if args.emb_type is None or args.out_dim is None:
+            raise Exception("--emb_type and --out_dim are required for pca")
+        if args.store is not None:
+            mats = store_embeddings(args.store, args.emb_type)
+        else:
+            mats = computed_embeddings(args.model, args.emb_type)
+        rows = sample_rows(mats, args.max_tokens)
+        if args.normalize:
+            rows = rows/(np.linalg.norm(rows, axis=1, keepdims=True)+1e-10)
+        if rows.shape[0] < args.out_dim:
+            raise Exception("the sample has %d tokens but at least %d are needed" % (rows.shape[0], args.out_dim))
+        W, b, explained = pca(rows, args.out_dim)
+        save_projection(args.output, args.emb_type, W, b, args.normalize, "pca")
+        print("PCA of %d tokens: %d components explain %.2f%% of the variance" % (rows.shape[0], args.out_dim, 100*explained), file=stderr)
+    else:
+        projection = Projection(args.output)
+        print(json.dumps(projection.meta, indent=2))
+        print("bias: %s" % ("yes" if projection.b is not None else "no"))
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+# reports the reconstruction error of the reduced-precision dtypes of elmo_packing.py (float16, int8 with a scale per row)
+# the reference embeddings are read from a float32 store (--store) or computed with the model from sentences on stdin
+#
+# for every dtype:
+#   bytes_per_token  size of an encoded row (for int8 including its scale)
+#   rmse             root mean squared error over all values
+#   rel_error        norm of the error relative to the norm of the embeddings
+#   max_abs_error    largest absolute error of any value
+#   mean_cos/min_cos cosine similarity between the original and the reconstructed vector of a token
+
+import argparse
+import json
+from itertools import islice
+from sys import stdin, stderr
+import numpy as np
+from elmo_emb_types import extractor
+from elmo_packing import DTYPES, quantize, row_dtype
+from elmo_store import EmbeddingStore
+
+COLUMNS = [
+    ("dtype", 8, None), ("bytes_per_token", 15, "%d"), ("compression", 11, "%.2fx"), ("rmse", 10, "%.2e"),
+    ("rel_error", 10, "%.2e"), ("max_abs_error", 13, "%.2e"), ("mean_cos", 10, "%.6f"), ("min_cos", 10, "%.6f"),
+]
+
+
+class ErrorAccumulator:
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        self.dim = None
+        self.tokens = 0
+        self.squared_error = 0.0
+        self.squared_norm = 0.0
+        self.max_abs_error = 0.0
+        self.cos_sum = 0.0
+        self.min_cos = 1.0
+
+    def add(self, mat):
+        mat = np.asarray(mat, dtype=np.float32)
+        if mat.shape[0] == 0:
+            return
+        self.dim = mat.shape[1]
+        error = quantize(mat, self.dtype)-mat
+        self.tokens += mat.shape[0]
+        self.squared_error += float(np.square(error, dtype=np.float64).sum())
+        self.squared_norm += float(np.square(mat, dtype=np.float64).sum())
+        self.max_abs_error = max(self.max_abs_error, float(np.abs(error).max()))
+        norms = np.linalg.norm(mat, axis=1)*np.linalg.norm(mat+error, axis=1)
+        cos = np.where(norms > 0, (mat*(mat+error)).sum(axis=1)/np.where(norms > 0, norms, 1), 1)
+        self.cos_sum += float(cos.sum())
+        self.min_cos = min(self.min_cos, float(cos.min()))
+
+    def report(self):
+        bytes_per_token = row_dtype(self.dtype, self.dim or 0).itemsize
+        return {
+            "dtype"           : self.dtype,
+            "tokens"          : self.tokens,
+            "bytes_per_token" : bytes_per_token,
+            "compression"     : 4.0*(self.dim or 0)/bytes_per_token,
+            "rmse"            : np.sqrt(self.squared_error/max(1, self.tokens*(self.dim or 0))),
+            "rel_error"       : np.sqrt(self.squared_error/self.squared_norm) if self.squared_norm > 0 else 0.0,
+            "max_abs_error"   : self.max_abs_error,
+            "mean_cos"        : self.cos_sum/max(1, self.tokens),
+            "min_cos"         : self.min_cos,
+        }
+
+
+def store_embeddings(path, emb_type, max_sents):
+    store = EmbeddingStore(path)
+    if store.dtype != "float32":
+        print("warning: %s is stored as %s so the errors are relative to an already quantized reference" % (path, store.dtype), file=stderr)
+    for sent_id in range(min(len(store), max_sents)):
+        yield store.view(sent_id, emb_type or store.emb_type)
+
+
+def computed_embeddings(model, emb_type, max_sents):
+    from elmo_models import load_embedder, resolve
+    extract = extractor(emb_type)
+    embedder = load_embedder(resolve(model))
+    sents = [line.split() for line in islice(stdin, max_sents)]
+    for sent, res in zip(sents, embedder.embed_sentences(sents)):
+        yield extract(res)[:len(sent)]
+
+
+def print_table(reports):
+    print(" ".join(name.rjust(width) for name, width, _ in COLUMNS))
+    for report in reports:
+        print(" ".join((fmt % report[name] if fmt is not None else str(report[name])).rjust(width) for name, width, fmt in COLUMNS))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--store", default=None, help="float32 embedding store with the reference embeddings (default: compute them from the sentences on stdin)")
+    parser.add_argument("--emb_type", default=None, help="emb_type to evaluate ; required without --store, derived from an \"all\" store otherwise")
+    parser.add_argument("--model", default=None, help="name of the model in the registry of elmo_models.py (default $ELMO_MODEL or original)")
+    parser.add_argument("--dtypes", default="float16,int8", help="comma separated, from %s" % ",".join(DTYPES))
+    parser.add_argument("--max_sents", default=1000, type=int, help="number of sentences to evaluate")
+    parser.add_argument("--json", action="store_true", help="print one JSON line per dtype instead of a table")
+    args = parser.parse_args()
+
+    dtypes = args.dtypes.split(",")
+    for dtype in dtypes:
+        if dtype not in DTYPES:
+            parser.error("unknown dtype %s" % dtype)
+    if args.store is not None:
+        mats = store_embeddings(args.store, args.emb_type, args.max_sents)
+    elif args.emb_type is not None:
+        mats = computed_embeddings(args.model, args.emb_type, args.max_sents)
+    else:
+        parser.error("either --store or --emb_type is needed")
+
+    accumulators = [ErrorAccumulator(dtype) for dtype in dtypes]
+    for mat in mats:
+        for accumulator in accumulators:
+            accumulator.add(mat)
+
+    reports = [accumulator.report() for accumulator in accumulators]
+    if args.json:
+        for report in reports:
+            print(json.dumps(report))
+    else:
+        print_table(reports)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# incremental embedding sessions of the server (open_session, push_tokens, close_session in the thrift file)
+# a session keeps the state of the forward direction of the biLM (elmo_bilm.py) after the tokens pushed so far
+# so the next tokens are embedded without running over the prefix again
+# sessions live in the process that serves the connection that opened them ; sessions idle for longer than
+# idle_timeout are closed and when there are more than max_sessions the least recently used ones are closed
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+# the emb_types that depend only on the prefix and the layer of the forward activations they come from
+SESSION_LAYERS = {
+    "forward-top" : 2,
+    "local"       : 0,
+}
+
+
+class Session:
+
+    def __init__(self, emb_type, state, projection=None):
+        self.emb_type = emb_type
+        self.layer = SESSION_LAYERS[emb_type]
+        self.projection = projection
+        self.state = state
+        self.tokens = 0
+        self.last_used = time.time()
+        # pushes to the same session are applied one after the other
+        self.lock = threading.Lock()
+
+
+class SessionTable:
+
+    def __init__(self, idle_timeout=600, max_sessions=1000, on_evict=None):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        # called with the number of sessions closed by the table
+        self.on_evict = on_evict
+        # ordered from the least to the most recently used
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _evict(self):
+        # the caller holds the lock
+        now = time.time()
+        evicted = 0
+        while len(self._sessions) > 0:
+            session_id, session = next(iter(self._sessions.items()))
+            if len(self._sessions) <= self.max_sessions and now-session.last_used <= self.idle_timeout:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+        if evicted > 0 and self.on_evict is not None:
+            self.on_evict(evicted)
+
+    def open(self, emb_type, state, projection=None):
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._sessions[session_id] = Session(emb_type, state, projection)
+            self._evict()
+        return session_id
+
+    def get(self, session_id):
+        """
+        the session or None if it was closed or evicted
+        """
+        with self._lock:
+            self._evict()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_used = time.time()
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def close(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+# shared-memory ring through which a server process hands embeddings to clients on the same host
+#
+# every batch is one entry of the ring: int64 seq, int64 size, followed by the float32 row-major matrices
+# the descriptor returned to the client (see embed_sents_shm in the thrift file) tells where the matrices are
+# before an entry is overwritten its seq is set to -1 so a client that checks seq before and after copying
+# can detect that it was too slow and fall back to embed_sents_packed
+
+import collections
+import glob
+import mmap
+import os
+import struct
+import numpy as np
+
+ENTRY_HEADER_FORMAT = "<qq"
+ENTRY_HEADER_SIZE = struct.calcsize(ENTRY_HEADER_FORMAT)
+INVALID_SEQ = -1
+
+packed_dtype = np.dtype("<f4")
+
+
+def default_shm_dir():
+    return "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp"
+
+
+def ring_prefix(shm_dir, server_pid):
+    return os.path.join(shm_dir, "elmo-ring-%d-" % server_pid)
+
+
+def remove_rings(shm_dir, server_pid):
+    # workers are terminated without a chance to clean up so the main process removes their rings
+    for path in glob.glob(ring_prefix(shm_dir, server_pid)+"*"):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class ShmRing:
+
+    def __init__(self, prefix, size):
+        self._prefix = prefix
+        self._generation = 0
+        self._seq = 0
+        self._create(size)
+
+    def _create(self, size):
+        self.path = "%s%d-%d" % (self._prefix, os.getpid(), self._generation)
+        self._generation += 1
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.ftruncate(fd, size)
+        self._buf = mmap.mmap(fd, size)
+        os.close(fd)
+        self.size = size
+        self._pos = 0
+        self._live = collections.deque()  # (start, end) of entries that clients may still be reading
+
+    def _grow(self, size):
+        # a client may still open the old ring for a descriptor it got before ; its entries are invalidated
+        # and the file removed so that the client finds either seq -1 or no file and falls back to embed_sents_packed
+        old_path = self.path
+        self._invalidate(0, self.size)
+        self._buf.close()
+        self._create(size)
+        os.remove(old_path)
+
+    def _invalidate(self, start, end):
+        while len(self._live) > 0 and self._live[0][0] < end and start < self._live[0][1]:
+            entry_start, _ = self._live.popleft()
+            struct.pack_into("<q", self._buf, entry_start, INVALID_SEQ)
+
+    def write(self, mats):
+        mats = [np.ascontiguousarray(mat, dtype=packed_dtype) for mat in mats]
+        size = ENTRY_HEADER_SIZE + sum(mat.nbytes for mat in mats)
+        if size > self.size:
+            self._grow(2*size)
+        if self._pos + size > self.size:
+            self._pos = 0
+        start = self._pos
+        end = start + size
+        self._invalidate(start, end)
+
+        self._seq += 1
+        struct.pack_into(ENTRY_HEADER_FORMAT, self._buf, start, INVALID_SEQ, size)
+        locations = []
+        offset = start + ENTRY_HEADER_SIZE
+        for mat in mats:
+            self._buf[offset:offset+mat.nbytes] = mat.tobytes()
+            locations.append((offset, mat.shape[0], mat.shape[1]))
+            offset += mat.nbytes
+        struct.pack_into("<q", self._buf, start, self._seq)
+
+        self._live.append((start, end))
+        self._pos = end
+        return self._descriptor(start, locations)
+
+    def _descriptor(self, start, locations):
+        path = self.path.encode("utf-8")
+        parts = [struct.pack("<qqi", self._seq, start, len(path)), path, struct.pack("<i", len(locations))]
+        for offset, rows, cols in locations:
+            parts.append(struct.pack("<qii", offset, rows, cols))
+        return b"".join(parts)
+
+
+def read_descriptor(descriptor):
+    """
+    client side ; returns the matrices or None if the entry was overwritten before it was copied
+    """
+    seq, start, path_len = struct.unpack_from("<qqi", descriptor, 0)
+    pos = struct.calcsize("<qqi")
+    path = descriptor[pos:pos+path_len].decode("utf-8")
+    pos += path_len
+    n, = struct.unpack_from("<i", descriptor, pos)
+    pos += 4
+    try:
+        with open(path, "rb") as fh:
+            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        # the ring grew and its old file was removed
+        return None
+    try:
+        if struct.unpack_from("<q", buf, start)[0] != seq:
+            return None
+        mats = []
+        for _ in range(n):
+            offset, rows, cols = struct.unpack_from("<qii", descriptor, pos)
+            pos += struct.calcsize("<qii")
+            mats.append(np.frombuffer(buf, dtype=packed_dtype, count=rows*cols, offset=offset).reshape(rows, cols).copy())
+        if struct.unpack_from("<q", buf, start)[0] != seq:
+            return None
+        return mats
+    finally:
+        buf.close()
+
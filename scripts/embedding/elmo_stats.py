@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+# counters and histograms of the embedding server
+# they live in shared memory created before the workers are forked so that any worker (or the main process
+# writing the stats file) can report the numbers of all of them ; every worker process takes a slot of its own
+
+import multiprocessing
+import os
+import time
+
+# upper bounds of the latency buckets in milliseconds ; the last bucket takes everything above
+LATENCY_BUCKETS_MS = [0.1*2**i for i in range(20)]
+# upper bounds of the batch size buckets in sentences
+BATCH_BUCKETS = [2**i for i in range(11)]
+
+LATENCIES = ["queue", "forward", "serialization"]
+COUNTERS = ["pid", "requests", "sents", "tokens", "forward_passes", "cache_hits", "cache_misses", "sessions_opened", "sessions_evicted",
+            "prefix_reused_tokens", "prefix_computed_tokens", "local_cached_tokens", "local_encoded_words"]
+
+# layout of a slot: counters, then for every latency its sum followed by its histogram, then the batch histogram
+_LATENCY_SIZE = 1+len(LATENCY_BUCKETS_MS)+1
+_SLOT_SIZE = len(COUNTERS) + len(LATENCIES)*_LATENCY_SIZE + len(BATCH_BUCKETS)+1
+
+
+def _bucket(bounds, value):
+    for i, bound in enumerate(bounds):
+        if value <= bound:
+            return i
+    return len(bounds)
+
+
+def _rss_mb(pid):
+    try:
+        with open("/proc/%d/status" % pid) as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])/1024.0
+    except (IOError, ValueError):
+        pass
+    return None
+
+
+def _histogram(counts, bounds, total=None):
+    n = sum(counts)
+    res = {
+        "count"   : int(n),
+        "buckets" : bounds + ["inf"],
+        "counts"  : [int(c) for c in counts],
+    }
+    if total is not None:
+        res["mean"] = total/n if n > 0 else None
+    # percentiles are reported as the upper bound of the bucket they fall into
+    for name, q in [("p50", 0.5), ("p90", 0.9), ("p99", 0.99)]:
+        res[name] = None
+        seen = 0
+        for bound, c in zip(bounds+["inf"], counts):
+            seen += c
+            if n > 0 and seen >= q*n:
+                res[name] = bound
+                break
+    return res
+
+
+class ServiceStats:
+
+    def __init__(self, slots):
+        self._slots = slots
+        self._data = multiprocessing.Array('d', slots*_SLOT_SIZE)
+        self._next_slot = multiprocessing.Value('i', 0)
+        self._slot = None
+        self._slot_pid = None
+        self._start = time.time()
+        self._server_pid = os.getpid()
+
+    def _offset(self):
+        # a worker takes its slot on its first request ; the caller holds the lock of the data
+        if self._slot_pid != os.getpid():
+            with self._next_slot.get_lock():
+                self._slot = self._next_slot.value % self._slots
+                self._next_slot.value += 1
+            self._slot_pid = os.getpid()
+            self._data[self._slot*_SLOT_SIZE+COUNTERS.index("pid")] = os.getpid()
+        return self._slot*_SLOT_SIZE
+
+    def _add(self, index, value):
+        with self._data.get_lock():
+            self._data[self._offset()+index] += value
+
+    def record_request(self, sents):
+        with self._data.get_lock():
+            offset = self._offset()
+            self._data[offset+COUNTERS.index("requests")] += 1
+            self._data[offset+COUNTERS.index("sents")] += len(sents)
+            self._data[offset+COUNTERS.index("tokens")] += sum(len(sent) for sent in sents)
+
+    def record_latency(self, name, seconds):
+        index = len(COUNTERS) + LATENCIES.index(name)*_LATENCY_SIZE
+        with self._data.get_lock():
+            offset = self._offset()+index
+            self._data[offset] += seconds*1000
+            self._data[offset+1+_bucket(LATENCY_BUCKETS_MS, seconds*1000)] += 1
+
+    def record_forward(self, batch_sents, seconds):
+        index = len(COUNTERS) + len(LATENCIES)*_LATENCY_SIZE + _bucket(BATCH_BUCKETS, batch_sents)
+        self._add(COUNTERS.index("forward_passes"), 1)
+        self._add(index, 1)
+        self.record_latency("forward", seconds)
+
+    def record_cache(self, hits, misses):
+        self._add(COUNTERS.index("cache_hits"), hits)
+        self._add(COUNTERS.index("cache_misses"), misses)
+
+    def record_prefix_lookup(self, reused, computed):
+        self._add(COUNTERS.index("prefix_reused_tokens"), reused)
+        self._add(COUNTERS.index("prefix_computed_tokens"), computed)
+
+    def record_local_lookup(self, cached_tokens, encoded_words):
+        self._add(COUNTERS.index("local_cached_tokens"), cached_tokens)
+        self._add(COUNTERS.index("local_encoded_words"), encoded_words)
+
+    def record_session_opened(self):
+        self._add(COUNTERS.index("sessions_opened"), 1)
+
+    def record_sessions_evicted(self, count):
+        self._add(COUNTERS.index("sessions_evicted"), count)
+
+    def snapshot(self):
+        with self._data.get_lock():
+            data = list(self._data)
+        workers = []
+        totals = {name: 0 for name in COUNTERS[1:]}
+        latencies = {name: ([0]*(len(LATENCY_BUCKETS_MS)+1), 0.0) for name in LATENCIES}
+        batches = [0]*(len(BATCH_BUCKETS)+1)
+        for slot in range(self._slots):
+            slot_data = data[slot*_SLOT_SIZE:(slot+1)*_SLOT_SIZE]
+            pid = int(slot_data[0])
+            if pid == 0:
+                continue
+            worker = {"pid": pid, "rss_mb": _rss_mb(pid)}
+            for i, name in enumerate(COUNTERS[1:], 1):
+                worker[name] = int(slot_data[i])
+                totals[name] += int(slot_data[i])
+            workers.append(worker)
+            for i, name in enumerate(LATENCIES):
+                start = len(COUNTERS) + i*_LATENCY_SIZE
+                counts, total = latencies[name]
+                latencies[name] = ([c+x for c, x in zip(counts, slot_data[start+1:start+_LATENCY_SIZE])], total+slot_data[start])
+            start = len(COUNTERS) + len(LATENCIES)*_LATENCY_SIZE
+            batches = [c+x for c, x in zip(batches, slot_data[start:])]
+        res = {
+            "time"           : time.time(),
+            "uptime_s"       : time.time()-self._start,
+            "server_pid"     : self._server_pid,
+            "server_rss_mb"  : _rss_mb(self._server_pid),
+            "workers"        : workers,
+            "latency_ms"     : {name: _histogram(counts, LATENCY_BUCKETS_MS, total) for name, (counts, total) in latencies.items()},
+            "batch_sents"    : _histogram(batches, BATCH_BUCKETS),
+        }
+        res.update(totals)
+        return res
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+# on-disk embedding store shared with the Scala trainer (edin.nn.embedder.ELMoEmbeddingStore)
+#
+# data file PATH:
+#   64 byte header, little-endian:
+#     8 bytes  magic "ELMOSTR1"
+#     int32    dtype code (0 float32, 1 float16, 2 int8)
+#     int32    dim
+#     48 bytes emb_type, ascii padded with zeros
+#   followed by the rows of all sentences, each encoded as in the packed wire format (elmo_packing.py)
+# index file PATH.idx:
+#   int64 row offsets, little-endian, one per sentence plus the final row count
+#   rows of sentence i are offsets[i] until offsets[i+1]
+#
+# the index is removed before the data file is (re)written and is written last, to a temporary file that is renamed,
+# so a store whose index exists is complete and readers need no lock ; meta.json of a projection directory
+# (elmo_projection.py) plays the same role for the .npy files next to it
+
+import os
+import shutil
+import struct
+import numpy as np
+from elmo_emb_types import ALL, derive
+from elmo_packing import decode_rows, encode_rows, row_dtype
+
+MAGIC = b"ELMOSTR1"
+HEADER_SIZE = 64
+HEADER_FORMAT = "<8sii48s"
+BLOCK_SIZE = 1<<22
+
+DTYPES = {"float32": 0, "float16": 1, "int8": 2}
+DTYPE_CODES = {code: dtype for dtype, code in DTYPES.items()}
+
+
+def index_file(path):
+    return path + ".idx"
+
+
+def store_exists(path):
+    return os.path.exists(index_file(path))
+
+
+class EmbeddingStoreWriter:
+
+    def __init__(self, path, emb_type, dtype="float32"):
+        if dtype not in DTYPES:
+            raise Exception("unknown store dtype %s" % dtype)
+        self.path = path
+        self.emb_type = emb_type
+        self._dtype_code = DTYPES[dtype]
+        self.dtype = dtype
+        self._dim = None
+        self._offsets = [0]
+        # the store of an earlier run stops counting as complete before its data is overwritten
+        if store_exists(path):
+            os.remove(index_file(path))
+        self._fh = open(path, "wb")
+        self._fh.write(b"\0"*HEADER_SIZE)
+
+    def add(self, mat):
+        if len(mat) == 0:
+            # an empty sentence doesn't fix the dimension
+            self._offsets.append(self._offsets[-1])
+            return
+        if self._dim is None:
+            self._dim = mat.shape[1]
+        elif mat.shape[1] != self._dim:
+            raise Exception("expected dimension %d but got %d" % (self._dim, mat.shape[1]))
+        self._fh.write(encode_rows(mat, self.dtype).tobytes())
+        self._offsets.append(self._offsets[-1]+mat.shape[0])
+
+    def append(self, store):
+        """
+        copies all sentences of another store of the same dtype without decoding them
+        """
+        if store.dtype != self.dtype:
+            raise Exception("can't append a %s store to a %s store" % (store.dtype, self.dtype))
+        if store.offsets[-1] > 0:
+            if self._dim is None:
+                self._dim = store.dim
+            elif store.dim != self._dim:
+                raise Exception("expected dimension %d but got %d" % (self._dim, store.dim))
+            with open(store.path, "rb") as fh:
+                fh.seek(HEADER_SIZE)
+                shutil.copyfileobj(fh, self._fh, BLOCK_SIZE)
+        base = self._offsets[-1]
+        self._offsets.extend(base+int(offset) for offset in store.offsets[1:])
+
+    def close(self):
+        self._fh.seek(0)
+        self._fh.write(struct.pack(HEADER_FORMAT, MAGIC, self._dtype_code, self._dim or 0, self.emb_type.encode("ascii")))
+        self._fh.close()
+        tmp_index = index_file(self.path)+".tmp"
+        np.asarray(self._offsets, dtype="<i8").tofile(tmp_index)
+        os.replace(tmp_index, index_file(self.path))
+
+
+class EmbeddingStore:
+
+    """
+    memory-maps a store ; store[i] is a [words x dim] float matrix of sentence i
+    which is a zero-copy view for float32 stores and dequantized on read for the others
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as fh:
+            magic, dtype_code, dim, emb_type = struct.unpack(HEADER_FORMAT, fh.read(HEADER_SIZE))
+        if magic != MAGIC:
+            raise Exception("%s is not an embedding store" % path)
+        self.path = path
+        self.dim = dim
+        self.dtype = DTYPE_CODES[dtype_code]
+        self.row_dtype = row_dtype(self.dtype, dim)
+        self.emb_type = emb_type.rstrip(b"\0").decode("ascii")
+        self.offsets = np.fromfile(index_file(path), dtype="<i8")
+        rows = int(self.offsets[-1])
+        if rows*dim == 0:
+            self.data = np.zeros(rows, dtype=self.row_dtype)
+        else:
+            self.data = np.memmap(path, dtype=self.row_dtype, mode="r", offset=HEADER_SIZE, shape=(rows,))
+
+    def __len__(self):
+        return len(self.offsets)-1
+
+    def raw(self, sent_id):
+        # the rows of the sentence as they are stored
+        return self.data[self.offsets[sent_id]:self.offsets[sent_id+1]]
+
+    def __getitem__(self, sent_id):
+        return decode_rows(self.raw(sent_id), self.dtype)
+
+    def view(self, sent_id, emb_type):
+        # derives any emb_type from a store of the "all" view
+        if emb_type == self.emb_type:
+            return self[sent_id]
+        if self.emb_type != ALL:
+            raise Exception("store of %s can't provide %s" % (self.emb_type, emb_type))
+        return derive(self[sent_id], emb_type)
+
+    def __iter__(self):
+        for sent_id in range(len(self)):
+            yield self[sent_id]
+
@@ -0,0 +1,113 @@
+import threading
+import time
+import pytest
+
+from elmo_batching import BatchingScheduler, plan_batches
+
+
+def sents_of_lengths(lengths):
+    return [["w%d" % j for j in range(length)] for length in lengths]
+
+
+def test_plan_batches_covers_every_sentence_once():
+    sents = sents_of_lengths([5, 1, 9, 3, 3, 7, 2, 8, 1, 4])
+    batches = plan_batches(sents, 16, 3)
+    assert sorted(i for batch in batches for i in batch) == list(range(len(sents)))
+
+
+def test_plan_batches_groups_similar_lengths():
+    sents = sents_of_lengths([5, 1, 9, 3, 3, 7, 2, 8, 1, 4])
+    lengths = [[len(sents[i]) for i in batch] for batch in plan_batches(sents, 16, 3)]
+    assert lengths == [[1, 1, 2], [3, 3, 4], [5, 7], [8], [9]]
+
+
+def test_plan_batches_respects_the_budgets():
+    sents = sents_of_lengths([i % 13 + 1 for i in range(100)])
+    for batch in plan_batches(sents, 40, 6):
+        assert len(batch) <= 6
+        assert len(batch) == 1 or len(batch)*max(len(sents[i]) for i in batch) <= 40
+
+
+def test_plan_batches_puts_long_sentences_alone():
+    assert plan_batches(sents_of_lengths([2, 50, 2]), 10, 8) == [[0, 2], [1]]
+    assert plan_batches([], 10, 8) == []
+
+
+class BlockingEmbedder:
+
+    # records its batches ; the first one waits for release() so that later requests pile up in the queue
+
+    def __init__(self):
+        self.batches = []
+        self._release = threading.Event()
+
+    def release(self):
+        self._release.set()
+
+    def __call__(self, sents):
+        self.batches.append([" ".join(sent) for sent in sents])
+        self._release.wait()
+        return [" ".join(sent).upper() for sent in sents]
+
+
+def submit_in_background(scheduler, sents, results):
+    thread = threading.Thread(target=lambda: results.append(scheduler.submit(sents)))
+    thread.start()
+    return thread
+
+
+def wait_for(condition):
+    deadline = time.time()+5
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.001)
+
+
+def test_scheduler_merges_waiting_requests_in_arrival_order():
+    embedder = BlockingEmbedder()
+    scheduler = BatchingScheduler(embedder, max_tokens=100, max_sents=3, max_wait_ms=0, stats_every=0)
+    results = []
+    threads = [submit_in_background(scheduler, [["a"]], results)]
+    wait_for(lambda: len(embedder.batches) == 1)
+    for i, sents in enumerate([[["b"], ["c"]], [["d"]], [["e"]]]):
+        threads.append(submit_in_background(scheduler, sents, results))
+        wait_for(lambda: len(scheduler._queue) == i+1)
+    embedder.release()
+    for thread in threads:
+        thread.join()
+    scheduler.close()
+    # a request is never split and the batch stops at the first request that doesn't fit
+    assert embedder.batches == [["a"], ["b", "c", "d"], ["e"]]
+    assert sorted(results) == [["A"], ["B", "C"], ["D"], ["E"]]
+
+
+def test_scheduler_embeds_oversized_requests_alone():
+    embedder = BlockingEmbedder()
+    embedder.release()
+    scheduler = BatchingScheduler(embedder, max_tokens=2, max_sents=8, max_wait_ms=0, stats_every=0)
+    assert scheduler.submit([["a", "b", "c"], ["d"]]) == ["A B C", "D"]
+    scheduler.close()
+    assert embedder.batches == [["a b c", "d"]]
+
+
+def test_scheduler_waits_for_more_requests_until_max_wait():
+    embedder = BlockingEmbedder()
+    embedder.release()
+    scheduler = BatchingScheduler(embedder, max_tokens=100, max_sents=100, max_wait_ms=200, stats_every=0)
+    results = []
+    threads = [submit_in_background(scheduler, [[w]], results) for w in "abc"]
+    for thread in threads:
+        thread.join()
+    scheduler.close()
+    assert len(embedder.batches) == 1 and sorted(embedder.batches[0]) == ["a", "b", "c"]
+
+
+def test_scheduler_passes_errors_to_every_request_of_the_batch():
+    def fail(sents):
+        raise ValueError("broken model")
+    scheduler = BatchingScheduler(fail, max_tokens=100, max_sents=100, max_wait_ms=0, stats_every=0)
+    with pytest.raises(ValueError):
+        scheduler.submit([["a"]])
+    scheduler.close()
+    with pytest.raises(Exception):
+        scheduler.submit([["a"]])
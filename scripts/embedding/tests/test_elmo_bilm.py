@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from elmo_emb_types import extractor
+from elmo_models import default_model, is_local, load_embedder, resolve
+
+# runs only where allennlp and the weights of the default model (see elmo_models.py) are installed
+pytest.importorskip("torch")
+pytest.importorskip("allennlp")
+if not is_local(default_model()):
+    pytest.skip("the weights of ELMo model %s are not in the registry" % default_model(), allow_module_level=True)
+
+SENT = ["The", "parser", "reads", "the", "sentence", "word", "by", "word", "."]
+
+
+@pytest.fixture(scope="module")
+def embedder():
+    return load_embedder(resolve())
+
+
+def test_session_matches_whole_sentence(embedder):
+    from elmo_bilm import forward_lm
+    # made before embed_sentence because both start from the states the biLM carries at that point
+    lm = forward_lm(embedder)
+    state = lm.start()
+    session = []
+    for i in range(0, len(SENT), 4):
+        state, activations = lm.advance(state, SENT[i:i+4])
+        session.append(activations[-1])
+    whole = extractor("forward-top")(embedder.embed_sentence(SENT))
+    np.testing.assert_allclose(np.concatenate(session), whole, atol=1e-4)
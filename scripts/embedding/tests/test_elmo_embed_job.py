@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import time
+import numpy as np
+import pytest
+
+import elmo_embed_job
+from elmo_emb_types import extractor
+from elmo_embed_job import Job, JobLock, run, shard_file
+from elmo_fake import FakeElmoEmbedder
+from elmo_store import EmbeddingStore, store_exists
+
+SENTS = ["the cat sat", "", "a dog", "it rains today", "x", "one more sentence here", "and the last"]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def worker():
+    # the shards are embedded in this process
+    elmo_embed_job.init_worker("fake", 1)
+
+
+def job_args(**kwargs):
+    args = {"emb_type": "forward-top", "store_dtype": "float32", "model": "fake", "shard_sents": 3, "stale_after": 600}
+    args.update(kwargs)
+    return argparse.Namespace(**args)
+
+
+def write_input(path, sents=SENTS):
+    with open(path, "w") as fh:
+        for sent in sents:
+            print(sent, file=fh)
+    return path
+
+
+class Interrupted(Exception):
+    pass
+
+
+class InProcessPool:
+
+    # stops like an interrupted run after it embedded limit shards
+
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.embedded = []
+
+    def imap_unordered(self, func, tasks):
+        for task in tasks:
+            if self.limit is not None and len(self.embedded) == self.limit:
+                raise Interrupted()
+            self.embedded.append(os.path.basename(task[3]))
+            yield func(task)
+
+
+def assert_embeds(store_path, sents=SENTS):
+    extract = extractor("forward-top")
+    store = EmbeddingStore(store_path)
+    assert len(store) == len(sents)
+    for mat, sent in zip(store, sents):
+        words = sent.split()
+        if len(words) == 0:
+            assert len(mat) == 0
+        else:
+            np.testing.assert_array_equal(mat, extract(FakeElmoEmbedder().embed_sentence(words)))
+
+
+def test_run_embeds_every_shard(tmpdir):
+    job = Job(write_input(str(tmpdir.join("corpus.txt"))), str(tmpdir.join("corpus.store")), job_args())
+    pool = InProcessPool()
+    run([job], pool, 4096)
+    assert pool.embedded == ["shard-00000.store", "shard-00001.store", "shard-00002.store"]
+    assert_embeds(job.output)
+    assert not os.path.exists(job.work_dir)
+
+
+def test_interrupted_run_resumes_from_finished_shards(tmpdir):
+    input_file = write_input(str(tmpdir.join("corpus.txt")))
+    output = str(tmpdir.join("corpus.store"))
+    first = InProcessPool(limit=2)
+    with pytest.raises(Interrupted):
+        run([Job(input_file, output, job_args())], first, 4096)
+    assert not store_exists(output)
+    second = InProcessPool()
+    run([Job(input_file, output, job_args())], second, 4096)
+    assert second.embedded == ["shard-00002.store"]
+    assert_embeds(output)
+
+
+def test_resume_needs_the_same_contents_and_settings(tmpdir):
+    input_file = write_input(str(tmpdir.join("corpus.txt")))
+    output = str(tmpdir.join("corpus.store"))
+    with pytest.raises(Interrupted):
+        run([Job(input_file, output, job_args())], InProcessPool(limit=2), 4096)
+
+    # another copy of the same input continues the shards
+    copy = str(tmpdir.join("copy.txt"))
+    shutil.copyfile(input_file, copy)
+    assert Job(copy, output, job_args()).prepare() == [2]
+
+    # other settings start over
+    assert Job(input_file, output, job_args(shard_sents=2)).prepare() == [0, 1, 2, 3]
+    assert not store_exists(shard_file(output+".job", 0))
+
+    # so does an input with other contents
+    with pytest.raises(Interrupted):
+        run([Job(input_file, output, job_args())], InProcessPool(limit=1), 4096)
+    changed = write_input(str(tmpdir.join("changed.txt")), SENTS[::-1])
+    pool = InProcessPool()
+    run([Job(changed, output, job_args())], pool, 4096)
+    assert len(pool.embedded) == 3
+    assert_embeds(output, SENTS[::-1])
+
+
+def dead_pid():
+    process = subprocess.Popen(["true"])
+    process.wait()
+    return process.pid
+
+
+def write_lock(path, pid, host=None, age=0):
+    with open(path, "w") as fh:
+        json.dump({"pid": pid, "host": host or socket.gethostname(), "started": time.time()}, fh)
+    os.utime(path, (time.time()-age, time.time()-age))
+
+
+def test_lock_of_a_dead_owner_on_this_host_is_broken(tmpdir):
+    path = str(tmpdir.join("corpus.store.lock"))
+    write_lock(path, dead_pid())
+    lock = JobLock(path, stale_after=600)
+    assert lock.try_acquire()
+    with open(path) as fh:
+        assert json.load(fh)["pid"] == os.getpid()
+    lock.release()
+    assert not os.path.exists(path)
+    assert not [name for name in os.listdir(str(tmpdir)) if ".stale." in name]
+
+
+def test_lock_of_a_live_owner_is_kept(tmpdir):
+    path = str(tmpdir.join("corpus.store.lock"))
+    write_lock(path, os.getpid(), age=10)
+    assert not JobLock(path, stale_after=600).try_acquire()
+    # a live owner on another host shows itself only by refreshing the lock
+    write_lock(path, dead_pid(), host="elsewhere", age=10)
+    assert not JobLock(path, stale_after=600).try_acquire()
+
+
+def test_lock_that_is_not_refreshed_is_broken(tmpdir):
+    path = str(tmpdir.join("corpus.store.lock"))
+    write_lock(path, os.getpid(), host="elsewhere", age=60)
+    lock = JobLock(path, stale_after=30)
+    assert lock.try_acquire()
+    lock.release()
+
+
+def test_lock_that_is_being_written_is_not_broken(tmpdir):
+    path = str(tmpdir.join("corpus.store.lock"))
+    open(path, "w").close()
+    assert not JobLock(path, stale_after=600).try_acquire()
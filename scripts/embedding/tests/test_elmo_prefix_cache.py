@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from elmo_fake import FakeElmoEmbedder, FakeForwardLM
+from elmo_prefix_cache import PrefixCache
+
+SENTS = [
+    "the cat sat on the mat".split(),
+    "the cat sat on a hat".split(),
+    "the cat".split(),
+    [],
+    "a dog barked".split(),
+    "the cat sat on the mat".split(),
+]
+
+
+def whole_sentences(sents):
+    return FakeElmoEmbedder().embed_batch(sents)
+
+
+def assert_same(ress, sents):
+    assert len(ress) == len(sents)
+    for res, expected in zip(ress, whole_sentences(sents)):
+        assert res.shape == expected.shape
+        np.testing.assert_array_equal(res, expected)
+
+
+def test_prefix_cache_matches_whole_sentences():
+    cache = PrefixCache(FakeForwardLM(FakeElmoEmbedder()), max_mb=100)
+    assert_same(cache.embed_batch(SENTS), SENTS)
+    # "the cat sat on" is computed once for the first three sentences and the repeated sentence is reused
+    assert cache.computed_tokens == 6+2+3
+    assert cache.reused_tokens == 4+2+6
+
+
+def test_prefix_cache_reuses_earlier_batches():
+    cache = PrefixCache(FakeForwardLM(FakeElmoEmbedder()), max_mb=100)
+    cache.embed_batch(SENTS[:1])
+    computed = cache.computed_tokens
+    assert_same(cache.embed_batch(SENTS[1:3]), SENTS[1:3])
+    assert cache.computed_tokens-computed == 2
+
+
+def test_prefix_cache_with_eviction_matches_whole_sentences():
+    lm = FakeForwardLM(FakeElmoEmbedder())
+    # room for four nodes
+    cache = PrefixCache(lm, max_mb=4.5*(lm.state_bytes+4*lm.layers*lm.dim+400)/1024.0/1024)
+    for sent in SENTS:
+        assert_same(cache.embed_batch([sent]), [sent])
+        assert len(cache) <= 4
+    assert cache.evicted > 0
+
+
+class FailingLM(FakeForwardLM):
+
+    def __init__(self, embedder):
+        FakeForwardLM.__init__(self, embedder)
+        self.fail = True
+
+    def step(self, states, words, inputs):
+        if self.fail:
+            raise RuntimeError("out of memory")
+        return FakeForwardLM.step(self, states, words, inputs)
+
+
+def test_prefix_cache_forgets_nodes_of_a_failed_batch():
+    lm = FailingLM(FakeElmoEmbedder())
+    cache = PrefixCache(lm, max_mb=100)
+    with pytest.raises(RuntimeError):
+        cache.embed_batch(SENTS[:2])
+    assert len(cache) == 0
+    lm.fail = False
+    assert_same(cache.embed_batch(SENTS[:2]), SENTS[:2])
+
+
+def test_forward_lm_advance_matches_whole_sentences():
+    lm = FakeForwardLM(FakeElmoEmbedder())
+    sent = SENTS[0]
+    state = lm.start()
+    parts = []
+    for i in range(0, len(sent), 4):
+        state, activations = lm.advance(state, sent[i:i+4])
+        parts.append(activations)
+    forward = np.concatenate(parts, axis=1)
+    np.testing.assert_array_equal(forward, whole_sentences([sent])[0][:, :, :lm.dim])
@@ -0,0 +1,106 @@
+import os
+import struct
+import numpy as np
+import pytest
+
+from elmo_store import DTYPES, HEADER_FORMAT, HEADER_SIZE, MAGIC, EmbeddingStore, EmbeddingStoreWriter, index_file, store_exists
+
+# stores written by this module are read by the Scala tests (ELMoEmbeddingStoreTest) ; regenerate them with
+#   PYTHONPATH=scripts/embedding python3 scripts/embedding/tests/test_elmo_store.py
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "src", "test", "resources", "elmo_store")
+
+
+def fixture_sents():
+    # halves of integers up to 63.5 with 63.5 in every row are exact in all dtypes: float16 has enough mantissa
+    # and the int8 scale of every row is 63.5/127 = 0.5
+    rs = np.random.RandomState(0)
+    sents = []
+    for rows in [2, 0, 3]:
+        mat = rs.randint(-127, 128, size=(rows, 4)).astype(np.float32)/2
+        mat[:, 0] = 63.5
+        sents.append(mat)
+    return sents
+
+
+def write_fixtures(out_dir):
+    for dtype in DTYPES:
+        writer = EmbeddingStoreWriter(os.path.join(out_dir, "%s.store" % dtype), "forward-top", dtype)
+        for mat in fixture_sents():
+            writer.add(mat)
+        writer.close()
+
+
+def read(path):
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+@pytest.mark.parametrize("dtype", sorted(DTYPES))
+def test_fixture_is_what_the_writer_writes(tmpdir, dtype):
+    write_fixtures(str(tmpdir))
+    for name in ["%s.store" % dtype, "%s.store.idx" % dtype]:
+        assert read(str(tmpdir.join(name))) == read(os.path.join(FIXTURE_DIR, name)), "regenerate %s" % name
+
+
+@pytest.mark.parametrize("dtype", sorted(DTYPES))
+def test_layout(tmpdir, dtype):
+    write_fixtures(str(tmpdir))
+    path = str(tmpdir.join("%s.store" % dtype))
+    data = read(path)
+    magic, code, dim, emb_type = struct.unpack(HEADER_FORMAT, data[:HEADER_SIZE])
+    assert (magic, code, dim, emb_type.rstrip(b"\0")) == (MAGIC, DTYPES[dtype], 4, b"forward-top")
+    assert np.fromfile(index_file(path), dtype="<i8").tolist() == [0, 2, 2, 5]
+    row_bytes = {"float32": 16, "float16": 8, "int8": 8}[dtype]
+    assert len(data) == HEADER_SIZE + 5*row_bytes
+    if dtype == "int8":
+        # the scale comes before the values of every row
+        assert struct.unpack_from("<fb", data, HEADER_SIZE) == (0.5, 127)
+
+
+@pytest.mark.parametrize("dtype", sorted(DTYPES))
+def test_round_trip(tmpdir, dtype):
+    write_fixtures(str(tmpdir))
+    store = EmbeddingStore(str(tmpdir.join("%s.store" % dtype)))
+    assert (len(store), store.dim, store.dtype, store.emb_type) == (3, 4, dtype, "forward-top")
+    for mat, expected in zip(store, fixture_sents()):
+        np.testing.assert_array_equal(mat, expected)
+
+
+@pytest.mark.parametrize("dtype,tolerance", [("float32", 0), ("float16", 1e-3), ("int8", 0.5/127)])
+def test_precision(tmpdir, dtype, tolerance):
+    mat = np.random.RandomState(1).uniform(-1, 1, size=(7, 1024)).astype(np.float32)
+    path = str(tmpdir.join("random.store"))
+    writer = EmbeddingStoreWriter(path, "all", dtype)
+    writer.add(mat)
+    writer.close()
+    # relative to the largest absolute value of the row
+    error = np.abs(EmbeddingStore(path)[0]-mat)/np.abs(mat).max(axis=1, keepdims=True)
+    assert error.max() <= tolerance + 1e-7
+
+
+def test_append_copies_without_decoding(tmpdir):
+    write_fixtures(str(tmpdir))
+    path = str(tmpdir.join("twice.store"))
+    writer = EmbeddingStoreWriter(path, "forward-top", "int8")
+    writer.append(EmbeddingStore(str(tmpdir.join("int8.store"))))
+    writer.append(EmbeddingStore(str(tmpdir.join("int8.store"))))
+    writer.close()
+    store = EmbeddingStore(path)
+    assert store.offsets.tolist() == [0, 2, 2, 5, 7, 7, 10]
+    for mat, expected in zip(store, fixture_sents()*2):
+        np.testing.assert_array_equal(mat, expected)
+
+
+def test_rewrite_removes_the_index_first(tmpdir):
+    path = str(tmpdir.join("rewritten.store"))
+    writer = EmbeddingStoreWriter(path, "forward-top")
+    writer.close()
+    assert store_exists(path)
+    writer = EmbeddingStoreWriter(path, "forward-top")
+    assert not store_exists(path)
+    writer.close()
+    assert store_exists(path)
+
+
+if __name__ == "__main__":
+    write_fixtures(FIXTURE_DIR)
@@ -1,20 +1,203 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 
-import sys
+## taken from Nematus
+
+# streaming preprocessing of MT corpora:
+# the input is read in large blocks, cut into chunks of lines that are cleaned by a pool of processes
+# and, with --tokenize, tokenized by a pool of long-running tokenizer.perl processes ; the output keeps the input order
+#
+# modes:
+#   strip      removes the SGML tags and drops the lines that end up empty (the original behaviour)
+#   segs       like strip but only for the <seg id=...> lines (dev and test sets of IWSLT)
+#   tag-lines  drops the lines that are a tag as a whole and keeps the rest, including empty lines (train sets of IWSLT)
+#   plain      keeps every line as it is (only tokenizes)
+
+import argparse
+import collections
+import concurrent.futures
+import functools
+import multiprocessing
+import os
+import queue
 import re
+import subprocess
+import sys
+import threading
 
-## taken from Nematus
+TAG = re.compile('<[^<]+>')
+TAG_LINE = re.compile('^<.*>$')
+SEG_MARK = "<seg id="
 
-def main():
-    fin = sys.stdin
-    fout = sys.stdout
-    for l in fin:
-        line = l.strip()
-        text = re.sub('<[^<]+>', "", line).strip()
-        if len(text) == 0:
+MODES = ["strip", "segs", "tag-lines", "plain"]
+
+BLOCK_SIZE = 1<<22
+
+# lc of perl on undecoded input, which is what the corpora were lowercased with before, changes only ASCII letters
+ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# bytes that aren't valid UTF-8 pass through unchanged as they did in the byte pipeline of python 2
+ERRORS = "surrogateescape"
+
+# the byte pipeline of python 2 stripped only ASCII whitespace ; str.strip() would also eat U+00A0, U+3000 etc.
+WHITESPACE = " \t\n\r\f\v"
+
+
+def clean_chunk(mode, chunk):
+    lines = chunk.decode("utf-8", ERRORS).split("\n")
+    res = []
+    for line in lines:
+        line = line.strip(WHITESPACE)
+        if mode == "plain":
+            res.append(line)
+        elif mode == "tag-lines":
+            if not TAG_LINE.match(line):
+                res.append(line)
+        else:
+            if mode == "segs" and SEG_MARK not in line:
+                continue
+            text = TAG.sub("", line).strip(WHITESPACE)
+            if len(text) > 0:
+                res.append(text)
+    return res
+
+
+def read_chunks(fin, chunk_lines):
+    """
+    yields byte strings of about chunk_lines whole lines (without the trailing newline)
+    """
+    rest = b""
+    pending = []
+    pending_lines = 0
+    while True:
+        block = fin.read(BLOCK_SIZE)
+        if len(block) == 0:
+            break
+        block = rest + block
+        cut = block.rfind(b"\n")
+        if cut < 0:
+            rest = block
             continue
-        print >>fout, text
+        rest = block[cut+1:]
+        pending.append(block[:cut])
+        pending_lines += block.count(b"\n", 0, cut)+1
+        if pending_lines >= chunk_lines:
+            yield b"\n".join(pending)
+            pending = []
+            pending_lines = 0
+    if len(rest) > 0:
+        pending.append(rest)
+    if len(pending) > 0:
+        yield b"\n".join(pending)
+
+
+def ordered_map(executor, fn, items, window):
+    """
+    like executor.map but with at most window items in flight so that the input isn't read ahead all at once
+    """
+    in_flight = collections.deque()
+    for item in items:
+        in_flight.append(executor.submit(fn, item))
+        if len(in_flight) >= window:
+            yield in_flight.popleft().result()
+    while len(in_flight) > 0:
+        yield in_flight.popleft().result()
+
+
+class TokenizerPool:
+
+    """
+    long-running tokenizer.perl processes ; tokenizer.perl writes exactly one line for every line it reads
+    and -b makes it flush after each line so a chunk can be written and its lines read back
+    """
+
+    def __init__(self, language, workers, tokenizer, tokenizer_args):
+        self._idle = queue.Queue()
+        self._processes = []
+        for _ in range(workers):
+            process = subprocess.Popen(
+                ["perl", tokenizer, "-b", "-q", "-l", language] + tokenizer_args,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            self._processes.append(process)
+            self._idle.put(process)
+        self.executor = concurrent.futures.ThreadPoolExecutor(workers)
+
+    def tokenize(self, lines):
+        process = self._idle.get()
+        try:
+            data = "".join(line+"\n" for line in lines).encode("utf-8", ERRORS)
+            # written from another thread because the pipes would fill up if the whole chunk was written first
+            writer = threading.Thread(target=self._write, args=(process, data))
+            writer.start()
+            res = []
+            for _ in lines:
+                line = process.stdout.readline()
+                if len(line) == 0:
+                    raise Exception("tokenizer exited with code %s" % process.wait())
+                res.append(line.decode("utf-8", ERRORS).rstrip("\n"))
+            writer.join()
+            return res
+        finally:
+            self._idle.put(process)
+
+    def _write(self, process, data):
+        process.stdin.write(data)
+        process.stdin.flush()
+
+    def close(self):
+        self.executor.shutdown()
+        for process in self._processes:
+            process.stdin.close()
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", default=None, help="input file (default stdin)")
+    parser.add_argument("--output", default=None, help="output file (default stdout)")
+    parser.add_argument("--mode", default="strip", choices=MODES)
+    parser.add_argument("--workers", type=int, default=1, help="number of cleaning processes and of tokenizer processes")
+    parser.add_argument("--chunk-lines", type=int, default=10000, help="lines per chunk handed to a worker")
+    parser.add_argument("--tokenize", default=None, metavar="LANG", help="tokenize with tokenizer.perl for this language")
+    parser.add_argument("--tokenizer", default=os.path.join(SCRIPT_DIR, "tokenizer.perl"))
+    parser.add_argument("--tokenizer-args", default="-penn", help="extra arguments of tokenizer.perl")
+    parser.add_argument("--lowercase", action="store_true", help="lowercase the ASCII letters of the output")
+    args = parser.parse_args()
+
+    fin = open(args.input, "rb") if args.input is not None else sys.stdin.buffer
+    fout = open(args.output, "w", encoding="utf-8", errors=ERRORS) if args.output is not None else open(sys.stdout.fileno(), "w", encoding="utf-8", errors=ERRORS, closefd=False)
+    window = 2*args.workers
+
+    # spawned and not forked so that the cleaning processes don't hold the pipes of the tokenizers open
+    cleaner = concurrent.futures.ProcessPoolExecutor(args.workers, mp_context=multiprocessing.get_context("spawn")) if args.workers > 1 else None
+
+    clean = functools.partial(clean_chunk, args.mode)
+    chunks = read_chunks(fin, args.chunk_lines)
+    if cleaner is None:
+        cleaned = map(clean, chunks)
+    else:
+        cleaned = ordered_map(cleaner, clean, chunks, window)
+
+    tokenizers = None
+    if args.tokenize is not None:
+        tokenizers = TokenizerPool(args.tokenize, args.workers, args.tokenizer, args.tokenizer_args.split())
+        cleaned = ordered_map(tokenizers.executor, tokenizers.tokenize, cleaned, window)
+
+    for lines in cleaned:
+        for line in lines:
+            if args.lowercase:
+                line = line.translate(ASCII_LOWER)
+            fout.write(line)
+            fout.write("\n")
+
+    fout.close()
+    if tokenizers is not None:
+        tokenizers.close()
+    if cleaner is not None:
+        cleaner.shutdown()
+
 
 if __name__ == "__main__":
     main()
-
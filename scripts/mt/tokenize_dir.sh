@@ -1,10 +1,12 @@
 #!/bin/bash
 SCRIPT_DIR=$(dirname $0)
 CORP_NAME=$1
-THREADS=1
+# THREADS is the number of cleaning processes and of tokenizer.perl processes of strip_sgml.py ;
+# every tokenizer.perl runs single threaded (it doesn't get -threads any more) so the parallelism is the same
+THREADS=${THREADS:-1}
 
 for X in $CORP_NAME/*/*.sents ; do
     L=$(basename $X | sed "s/\..*//")
-    perl $SCRIPT_DIR/tokenizer.perl -penn -threads $THREADS -l $L < $X | perl -ne 'print lc' > ${X}.tok
+    $SCRIPT_DIR/strip_sgml.py --mode plain --tokenize $L --lowercase --workers $THREADS --input $X --output ${X}.tok
     mv ${X}.tok $X
 done
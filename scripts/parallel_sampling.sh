@@ -7,6 +7,9 @@ SAMPLES_PER_CORE=33
 SENTS_FILE="test.words"
 ALPHA=1.0
 
+# all cores share a single ELMo server instead of loading a model each
+export ELMO_DAEMON=1
+
 for I in `seq 1 ${CORES}`; do
     CORE_DIR=${OUT_DIR}/core_${I}
     mkdir -p ${CORE_DIR}
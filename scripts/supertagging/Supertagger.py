@@ -3,22 +3,68 @@
 # sudo pip install cython
 # sudo pip install jnius
 
-JAVA_MEMORY_MB=109
-DYNET_MEMORY_MB=309
-PROJECT_LOCATION = "/home/milos/Projects/CCG-translator"
+#
+# a JVM can be started only once per process and its options can't be changed afterwards
+# so the memory and the classpath have to be set (here, through the environment or with start_jvm) before the first tagger is made
+#
+# SupertaggerPool runs several taggers, each in a worker process with its own JVM,
+# because the DyNet models of one JVM can't be used from many threads
 
+import collections
+import concurrent.futures
+import multiprocessing
+import multiprocessing.connection
+import os
+import threading
 from glob import glob
-import jnius_config
-jnius_config.add_options('-Xrs', "-Xmx%dM"%JAVA_MEMORY_MB)
-main_jar = glob(PROJECT_LOCATION+'/target/scala-*/*.jar')[0]
-dep_jars = glob(PROJECT_LOCATION+'/lib/*.jar')
-jnius_config.set_classpath('.', main_jar, *dep_jars)
-from jnius import autoclass
+import numpy as np
 
-class Supertagger:
+JAVA_MEMORY_MB = int(os.environ.get("SUPERTAGGER_JAVA_MEMORY_MB", 109))
+DYNET_MEMORY_MB = int(os.environ.get("SUPERTAGGER_DYNET_MEMORY_MB", 309))
+PROJECT_LOCATION = os.environ.get("SUPERTAGGER_PROJECT_LOCATION", "/home/milos/Projects/CCG-translator")
+
+autoclass = None
+ArrayList = None
+
+
+def default_classpath(project_location=PROJECT_LOCATION):
+    main_jar = glob(project_location+'/target/scala-*/*.jar')[0]
+    dep_jars = glob(project_location+'/lib/*.jar')
+    return ['.', main_jar] + dep_jars
+
+
+def start_jvm(java_memory_mb=JAVA_MEMORY_MB, classpath=None):
+    """
+    does nothing if the JVM of this process is already running
+    """
+    global autoclass, ArrayList
+    if autoclass is not None:
+        return
+    import jnius_config
+    jnius_config.add_options('-Xrs', "-Xmx%dM"%java_memory_mb)
+    jnius_config.set_classpath(*(classpath or default_classpath()))
+    from jnius import autoclass
+    ArrayList = autoclass("java.util.ArrayList")
+
+
+class _TagIds:
+
+    # ids of the tags returned by bestK_batch
+
+    def _init_tag_ids(self):
+        self.tags = []
+        self.tag_ids = {}
+
+    def _tag_id(self, tag):
+        if tag not in self.tag_ids:
+            self.tag_ids[tag] = len(self.tags)
+            self.tags.append(tag)
+        return self.tag_ids[tag]
+
+
+class Supertagger(_TagIds):
 
     def _to_java_list(self, ls):
-        ArrayList = autoclass("java.util.ArrayList")
         jl = ArrayList()
         for l in ls :
             jl.add(l)
@@ -34,13 +80,15 @@ class Supertagger:
                 pl.append(x)
         return pl
 
-    def __init__(self, model_dirs):
+    def __init__(self, model_dirs, dynet_memory_mb=DYNET_MEMORY_MB):
+        start_jvm()
         modelClass = autoclass("edin.supertagger.Interactive")
-        if(isinstance(model_dirs, basestring)):
+        if(isinstance(model_dirs, str)):
             real_model_dirs = [model_dirs]
         else:
             real_model_dirs = model_dirs
-        self.tagger = modelClass(self._to_java_list(real_model_dirs), DYNET_MEMORY_MB)
+        self.tagger = modelClass(self._to_java_list(real_model_dirs), dynet_memory_mb)
+        self._init_tag_ids()
 
     def bestK(self, words, aux_tags, k):
         result = self.tagger.bestK(self._to_java_list(words),self._to_java_list(aux_tags), k)
@@ -50,6 +98,217 @@ class Supertagger:
                 x[1] = float(x[1])
         return resultPy
 
+    def _best_k_rows(self, result):
+        # the result is a list over words of k [tag, score] pairs ; toArray brings a whole list over at once
+        return [[pair.toArray() for pair in word.toArray()] for word in result.toArray()]
+
+    def bestK_batch(self, sents, aux_tags, k, as_strings=False):
+        """
+        tags many sentences and returns flat arrays instead of nested lists:
+          tags    [words x k] int32 ids into self.tags (object array of tag strings with as_strings)
+          scores  [words x k] float32
+          offsets [sentences+1] int64 ; the rows of sentence i are offsets[i]:offsets[i+1]
+        words with less than k candidates are padded with tag -1 (None) and score -inf
+        """
+        offsets = np.zeros(len(sents)+1, dtype=np.int64)
+        rows = []
+        for i, (words, aux) in enumerate(zip(sents, aux_tags)):
+            sent_rows = self._best_k_rows(self.tagger.bestK(self._to_java_list(words), self._to_java_list(aux), k))
+            rows.extend(sent_rows)
+            offsets[i+1] = offsets[i]+len(sent_rows)
+
+        scores = np.full((len(rows), k), -np.inf, dtype=np.float32)
+        if as_strings:
+            tags = np.full((len(rows), k), None, dtype=object)
+        else:
+            tags = np.full((len(rows), k), -1, dtype=np.int32)
+        for r, row in enumerate(rows):
+            if len(row) == 0:
+                continue
+            row_tags, row_scores = zip(*row)
+            scores[r, :len(row)] = row_scores
+            tags[r, :len(row)] = row_tags if as_strings else [self._tag_id(tag) for tag in row_tags]
+        return tags, scores, offsets
+
+
+def _worker(model_dirs, java_memory_mb, dynet_memory_mb, classpath, conn):
+    try:
+        start_jvm(java_memory_mb, classpath)
+        tagger = Supertagger(model_dirs, dynet_memory_mb)
+        error = None
+    except Exception as e:
+        tagger = None
+        error = e
+    for task_id, method, args in iter(conn.recv, None):
+        try:
+            if error is not None:
+                raise error
+            conn.send((task_id, True, getattr(tagger, method)(*args)))
+        except Exception as e:
+            # Java exceptions don't survive pickling
+            conn.send((task_id, False, RuntimeError("%s: %s" % (type(e).__name__, e))))
+
+
+class SupertaggerPool(_TagIds):
+
+    """
+    taggers in worker processes that are each given a sentence as soon as they are idle so that a busy worker never holds back the rest ;
+    all methods can be called from many threads at once
+    """
+
+    def __init__(self, model_dirs, workers=4, java_memory_mb=JAVA_MEMORY_MB, dynet_memory_mb=DYNET_MEMORY_MB, classpath=None):
+        # spawned and not forked so that the workers don't inherit the JVM of a process that already has one
+        ctx = multiprocessing.get_context("spawn")
+        self._pending = collections.deque()
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._closed = False
+        self._init_tag_ids()
+        # each worker has its own pipe so that the pool knows which task it holds when it dies
+        self._workers = []
+        self._conns = []
+        for _ in range(workers):
+            conn, child_conn = ctx.Pipe()
+            worker = ctx.Process(target=_worker, args=(model_dirs, java_memory_mb, dynet_memory_mb, classpath, child_conn))
+            worker.daemon = True
+            worker.start()
+            child_conn.close()
+            self._workers.append(worker)
+            self._conns.append(conn)
+        self._idle = list(range(workers))
+        self._running = {}
+        self._alive = set(range(workers))
+        self._collector = threading.Thread(target=self._collect)
+        self._collector.daemon = True
+        self._collector.start()
+
+    def _submit(self, method, *args):
+        future = concurrent.futures.Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("the pool is closed")
+            if not self._alive:
+                raise RuntimeError("all supertagger workers died")
+            task_id = self._next_id
+            self._next_id += 1
+            self._futures[task_id] = future
+            self._pending.append((task_id, method, args))
+            self._dispatch()
+        return future
+
+    def _dispatch(self):
+        # called with the lock held ; once the pool is closed the idle workers are stopped when nothing is left to do
+        while self._idle and self._pending:
+            w = self._idle.pop()
+            task = self._pending.popleft()
+            try:
+                self._conns[w].send(task)
+            except OSError:
+                # it died and the collector will find out ; the task goes to another worker
+                self._pending.appendleft(task)
+                continue
+            self._running[w] = task[0]
+        if self._closed and not self._pending:
+            for w in self._idle:
+                try:
+                    self._conns[w].send(None)
+                except OSError:
+                    pass
+            self._idle = []
+
+    def _collect(self):
+        sentinels = {worker.sentinel: w for w, worker in enumerate(self._workers)}
+        conns = {conn: w for w, conn in enumerate(self._conns)}
+        while sentinels:
+            for ready in multiprocessing.connection.wait(list(conns)+list(sentinels)):
+                if ready in conns:
+                    self._receive(conns[ready])
+                elif ready in sentinels:
+                    w = sentinels.pop(ready)
+                    # the results it sent before it exited are still in the pipe
+                    while self._conns[w].poll():
+                        if not self._receive(w):
+                            break
+                    del conns[self._conns[w]]
+                    self._worker_exited(w)
+
+    def _receive(self, w):
+        try:
+            task_id, ok, value = self._conns[w].recv()
+        except (EOFError, OSError):
+            return False
+        with self._lock:
+            del self._running[w]
+            self._idle.append(w)
+            future = self._futures.pop(task_id)
+            self._dispatch()
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+        return True
+
+    def _worker_exited(self, w):
+        with self._lock:
+            self._alive.discard(w)
+            if w in self._idle:
+                self._idle.remove(w)
+            failed = [self._futures.pop(self._running.pop(w))] if w in self._running else []
+            if not self._alive:
+                # nobody is left to take the waiting tasks
+                failed.extend(self._futures.pop(task_id) for task_id, _, _ in self._pending)
+                self._pending.clear()
+            alive = len(self._alive)
+        for future in failed:
+            future.set_exception(RuntimeError("a supertagger worker died (%d left)" % alive))
+
+    def submit(self, words, aux_tags, k):
+        """
+        returns a concurrent.futures.Future of the bestK result
+        """
+        return self._submit("bestK", words, aux_tags, k)
+
+    def bestK(self, words, aux_tags, k):
+        return self.submit(words, aux_tags, k).result()
+
+    def bestK_batch(self, sents, aux_tags, k, as_strings=False, chunk_size=16):
+        """
+        same result as Supertagger.bestK_batch ; the sentences are split into chunks that are tagged by all workers in parallel
+        """
+        futures = [self._submit("bestK_batch", sents[i:i+chunk_size], aux_tags[i:i+chunk_size], k, True)
+                   for i in range(0, len(sents), chunk_size)]
+        parts = [future.result() for future in futures]
+        tags = np.concatenate([part[0] for part in parts]) if parts else np.full((0, k), None, dtype=object)
+        scores = np.concatenate([part[1] for part in parts]) if parts else np.zeros((0, k), dtype=np.float32)
+        offsets = [np.zeros(1, dtype=np.int64)]
+        start = 0
+        for _, _, part_offsets in parts:
+            offsets.append(part_offsets[1:]+start)
+            start += part_offsets[-1]
+        offsets = np.concatenate(offsets)
+        if not as_strings:
+            with self._lock:
+                tags = np.array([[-1 if tag is None else self._tag_id(tag) for tag in row] for row in tags], dtype=np.int32).reshape(tags.shape)
+        return tags, scores, offsets
+
+    def close(self):
+        """
+        waits for the submitted tasks and stops the workers
+        """
+        with self._lock:
+            self._closed = True
+            self._dispatch()
+        self._collector.join()
+        for worker in self._workers:
+            worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
 
 
 if __name__ == "__main__":
@@ -57,4 +316,5 @@ if __name__ == "__main__":
     tagger = Supertagger(PROJECT_LOCATION+"/tmp/models/aux_tagging")
     from pprint import pprint
     pprint(tagger.bestK(["w2", "rerf"], ["asdf", "dlkajsd"], 5))
+    pprint(tagger.bestK_batch([["w2", "rerf"], ["w3"]], [["asdf", "dlkajsd"], ["asdf"]], 5))
 
@@ -0,0 +1,73 @@
+package edin.ccg
+
+import edin.nn.embedder.SequenceEmbedderELMo
+
+import scala.util.Random
+
+/**
+  * measures SequenceEmbedderELMo.embed_sents on synthetic sentences ; used by scripts/embedding/elmo_benchmark.py
+  * which reads the JSON line printed at the end (with ELMO_MODEL=fake no weights are needed)
+  */
+object MainBenchmarkELMo {
+
+  // ranges of sentence lengths in tokens ; the same table is in elmo_benchmark.py
+  private val LENGTHS = Map(
+    "short"  -> ( 3, 12),
+    "medium" -> (12, 35),
+    "long"   -> (35, 80)
+  )
+
+  private val VOCABULARY_SIZE = 5000
+
+  case class CMDargs(
+                      emb_type   : String = "forward-top",
+                      batch_size : Int    =   16,
+                      lengths    : String = "medium",
+                      requests   : Int    =   50,
+                      seed       : Int    =    1
+                    )
+
+  def main(args:Array[String]) : Unit = {
+    val parser = new scopt.OptionParser[CMDargs](PROGRAM_NAME) {
+      head(PROGRAM_NAME, PROGRAM_VERSION.toString)
+      opt[ String ]( "emb_type"   ).action((x,c) => c.copy( emb_type   = x ))
+      opt[ Int    ]( "batch_size" ).action((x,c) => c.copy( batch_size = x ))
+      opt[ String ]( "lengths"    ).action((x,c) => c.copy( lengths    = x )).text(LENGTHS.keys.mkString("|"))
+      opt[ Int    ]( "requests"   ).action((x,c) => c.copy( requests   = x ))
+      opt[ Int    ]( "seed"       ).action((x,c) => c.copy( seed       = x ))
+      help("help").text("prints this usage text")
+    }
+
+    parser.parse(args, CMDargs()) match {
+      case Some(cmd_args) =>
+        val (low, high) = LENGTHS(cmd_args.lengths)
+        val random = new Random(cmd_args.seed)
+        val batches = List.fill(cmd_args.requests){
+          List.fill(cmd_args.batch_size){
+            List.fill(low + random.nextInt(high-low+1)){ s"w${random.nextInt(VOCABULARY_SIZE)}" }
+          }
+        }
+
+        // starts the server and warms up the connection
+        SequenceEmbedderELMo.embed_sents(cmd_args.emb_type, batches.head)
+
+        val start = System.nanoTime()
+        val latencies = batches.map{ batch =>
+          val requestStart = System.nanoTime()
+          SequenceEmbedderELMo.embed_sents(cmd_args.emb_type, batch)
+          (System.nanoTime()-requestStart)/1e6
+        }.sorted.toArray
+        val elapsed = (System.nanoTime()-start)/1e9
+        SequenceEmbedderELMo.endServer()
+
+        def percentile(q:Double) : Double = latencies(math.min(latencies.length-1, (q*latencies.length).toInt))
+        val sents = cmd_args.requests*cmd_args.batch_size
+        val tokens = batches.map(_.map(_.size).sum).sum
+        println(s"""{"sents_per_sec": ${sents/elapsed}, "tokens_per_sec": ${tokens/elapsed}, "p50_ms": ${percentile(0.5)}, "p99_ms": ${percentile(0.99)}}""")
+      case None =>
+        System.err.println("You didn't specify all the required arguments")
+        System.exit(-1)
+    }
+  }
+
+}
@@ -0,0 +1,42 @@
+package edin.ccg
+
+import edin.ccg.parsing.RevealingModel
+import edin.nn.DynetSetup
+
+/**
+  * exports the compressor of the ELMo embedder of a trained model as a projection directory
+  * that elmo_embed_server.py applies before sending the vectors (MainParse --elmo_projections)
+  */
+object MainExportELMoProjection {
+
+  case class CMDargs(
+                      model_dir  : String = null,
+                      output_dir : String = null,
+                      dynet_mem  : String = null
+                    )
+
+  def main(args:Array[String]) : Unit = {
+    val parser = new scopt.OptionParser[CMDargs](PROGRAM_NAME) {
+      head(PROGRAM_NAME, PROGRAM_VERSION.toString)
+      opt[ String ]( "model_dir"  ).action((x,c) => c.copy( model_dir  = x )).required()
+      opt[ String ]( "output_dir" ).action((x,c) => c.copy( output_dir = x )).required()
+      opt[ String ]( "dynet-mem"  ).action((x,c) => c.copy( dynet_mem  = x ))
+      help("help").text("prints this usage text")
+    }
+
+    parser.parse(args, CMDargs()) match {
+      case Some(cmd_args) =>
+        DynetSetup.init_dynet(cmd_args.dynet_mem, 0f, 0, List())
+        val model = new RevealingModel()
+        model.loadFromModelDir(cmd_args.model_dir)
+        if(model.elmoEmbedder == null)
+          throw new Exception(s"model ${cmd_args.model_dir} doesn't use ELMo")
+        model.elmoEmbedder.exportProjection(cmd_args.output_dir)
+        System.err.println(s"projection written to ${cmd_args.output_dir}")
+      case None =>
+        System.err.println("You didn't specify all the required arguments")
+        System.exit(-1)
+    }
+  }
+
+}
@@ -23,6 +23,10 @@ object MainParse {
                       wordBeamSize      : Int            =    0,
                       fastTrackBeamSize : Int            =    0,
 
+                      prefetchSize      : Int            =    0,
+                      elmoProjections   : List[String]   = Nil,
+                      incrementalEmbeddings : Boolean    = false,
+
                       dynet_mem             : String     = null,
                       dynet_weight_decay    : Float      = 0.0f,
                       dynet_autobatch       : Int        =    0,
@@ -41,6 +45,10 @@ object MainParse {
       opt[ Int         ]( "beam-word"          ).action((x,c) => c.copy( wordBeamSize         = x        )).text("k_wd")
       opt[ Int         ]( "beam-fasttrack"     ).action((x,c) => c.copy( fastTrackBeamSize    = x        )).text("k_ft")
 
+      opt[ Int         ]( "prefetch"           ).action((x,c) => c.copy( prefetchSize         = x        )).text("number of following sentences whose embeddings are computed in the background")
+      opt[ Seq[String] ]( "elmo_projections"   ).action((x,c) => c.copy( elmoProjections      = x.toList )).text("one projection directory per model, applied by the ELMo server instead of the compressor (from MainExportELMoProjection)")
+      opt[ Unit        ]( "incremental_embeddings" ).action((_,c) => c.copy( incrementalEmbeddings = true )).text("embed every word when the parser reaches it instead of the whole sentence first (ELMo only for forward-top and local)")
+
       opt[ Int         ]( "dynet-autobatch"    ).action((x,c) => c.copy( dynet_autobatch      = x        ))
       opt[ String      ]( "dynet-mem"          ).action((x,c) => c.copy( dynet_mem            = x        ))
       opt[ Seq[Int]    ]( "dynet-gpus"         ).action((x,c) => c.copy( dynet_gpus           = x.toList ))
@@ -60,21 +68,43 @@ object MainParse {
 
         val ft = new SimpleDateFormat ("HH:mm dd.MM.yyyy")
 
+        if(cmd_args.prefetchSize > 0)
+          SequenceEmbedderELMo.enablePrefetch()
+
         System.err.println(s"model loading started at ${ft.format(new Date())}")
-        val models = cmd_args.model_dirs.map { modelDir =>
+        if(cmd_args.elmoProjections.nonEmpty && cmd_args.elmoProjections.size != cmd_args.model_dirs.size)
+          throw new Exception("--elmo_projections needs one projection for every model")
+        if(cmd_args.incrementalEmbeddings && cmd_args.prefetchSize > 0)
+          throw new Exception("--prefetch computes whole sentences so it can't be used with --incremental_embeddings")
+        val models = cmd_args.model_dirs.zipWithIndex.map { case (modelDir, i) =>
           val model = new RevealingModel()
           model.loadFromModelDir(modelDir)
+          if(cmd_args.elmoProjections.nonEmpty && model.elmoEmbedder != null)
+            model.elmoEmbedder.useProjection(cmd_args.elmoProjections(i))
+          if(cmd_args.incrementalEmbeddings){
+            if(! model.canEmbedIncrementally)
+              throw new Exception(s"the embeddings of $modelDir depend on the whole sentence so they can't be computed incrementally")
+            model.incrementalEmbeddings = true
+          }
           model
         }
         System.err.println(s"parsing started at ${ft.format(new Date())}")
 
         val pw = new PrintWriter(cmd_args.output_file_words)
 
-        for((line, i) <- Source.fromFile(cmd_args.input_file_words).getLines().zipWithIndex){
+        val sents = Source.fromFile(cmd_args.input_file_words).getLines().map(_.split(" +").toList).toIndexedSeq
+
+        def prefetch(from:Int, until:Int) : Unit =
+          if(cmd_args.prefetchSize > 0 && from < sents.size)
+            models.foreach(_.sequenceEmbedder.prefetchEmbeddings(sents.slice(from, until)))
+
+        prefetch(1, cmd_args.prefetchSize+1)
+        for((words, i) <- sents.zipWithIndex){
           DynetSetup.cg_renew()
           if(i%1 == 0)
             System.err.println(s"processing $i")
-          val words = line.split(" +").toList
+          // keeps the next prefetchSize sentences in flight while this one is parsed
+          prefetch(i+cmd_args.prefetchSize+1, i+cmd_args.prefetchSize+2)
           val searcher = Parser.searcherForModel(
             model = models.head,
             sent = words,
@@ -91,6 +121,7 @@ object MainParse {
           pw.flush()
         }
         pw.close()
+        SequenceEmbedderELMo.serverStats().foreach(stats => System.err.println(s"ELMo server stats: $stats"))
         SequenceEmbedderELMo.endServer()
         System.err.println(s"parsing finished at ${ft.format(new Date())}")
       case None =>
@@ -1,6 +1,7 @@
 package edin
 
 import edin.ccg.representation.tree.TreeNode
+import edin.nn.embedder.{ELMoCompactEmbedding, ELMoEmbeddingRef}
 
 
 package object ccg {
@@ -8,9 +9,13 @@ package object ccg {
   val PROGRAM_NAME = "RotatingCCG"
   val PROGRAM_VERSION = 0.1
 
-  type SentEmbedding = List[Array[Float]]
+  // decoded only when the embedder uses it
+  type SentEmbedding = ELMoCompactEmbedding
 
-  case class Inst(tree:TreeNode, emb:SentEmbedding)
+  case class Inst(tree:TreeNode, embRef:ELMoEmbeddingRef){
+    // reads the store again on every call (and encodes a view of an "all" store again) so callers bind it once
+    def loadEmb() : SentEmbedding = if(embRef == null) null else embRef.loadCompact()
+  }
 
   type TrainInstance = Inst
 
@@ -73,7 +73,7 @@ object Parser{
       ),
       aConstrainedInfo = Some(ConstrainedInfo(
         wordsLeftover = words,
-        embsLeftover  = model.sequenceEmbedder.transduce(words),
+        embsLeftover  = model.embedWords(words),
       )),
       generativeInfo  = if (model.isDiscriminative) {
         None
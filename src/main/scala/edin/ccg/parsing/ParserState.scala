@@ -6,7 +6,8 @@ import edin.nn.DyFunctions._
 import edin.search.PredictionState
 import edu.cmu.dynet.Expression
 
-sealed case class ConstrainedInfo(wordsLeftover:List[String], embsLeftover:List[Expression]){
+// embsLeftover is lazy so that with incremental embeddings a word is embedded only when the parser reaches it
+sealed case class ConstrainedInfo(wordsLeftover:List[String], embsLeftover:Stream[Expression]){
   val isFinished : Boolean = wordsLeftover.isEmpty
   def headWord : String = wordsLeftover.head
   def headEmb  : Expression = embsLeftover.head
@@ -12,7 +12,7 @@ import edin.ccg.representation.combinators.{Combinator, TypeChangeUnary}
 import edin.ccg.representation.tree._
 import edin.general._
 import edin.nn.DynetSetup
-import edin.nn.embedder.{EmbedderStandard, SequenceEmbedderELMo, SequenceEmbedderGeneral, SequenceEmbedderGeneralConfig}
+import edin.nn.embedder.{ELMoEmbeddingRef, ELMoEmbeddingStore, EmbedderStandard, IncrementalEmbedderState, SequenceEmbedderELMo, SequenceEmbedderGeneral, SequenceEmbedderGeneralConfig, SequenceEmbedderIncremental}
 import edin.nn.layers.{VocLogSoftmax, VocLogSoftmaxConfig}
 import edu.cmu.dynet.{Expression, ParameterCollection}
 
@@ -39,6 +39,33 @@ class RevealingModel(
 
   private val elmoPointer = new Pointer[SequenceEmbedderELMo]
 
+  // null if the model doesn't use ELMo
+  def elmoEmbedder : SequenceEmbedderELMo = elmoPointer()
+
+  // with incremental embeddings (MainParse --incremental_embeddings) a word is embedded when the parser reaches it
+  // instead of the whole sentence before parsing starts ; ELMo does it through a server session
+  var incrementalEmbeddings : Boolean = false
+
+  def canEmbedIncrementally : Boolean = sequenceEmbedder match {
+    case embedder:SequenceEmbedderELMo    => embedder.isIncremental
+    case _:SequenceEmbedderIncremental[_] => true
+    case _                                => false
+  }
+
+  def embedWords(words:List[String]) : Stream[Expression] = sequenceEmbedder match {
+    case embedder:SequenceEmbedderIncremental[String @unchecked] if incrementalEmbeddings =>
+      def embed(state:IncrementalEmbedderState[String], rest:List[String]) : Stream[Expression] = rest match {
+        case word :: tail =>
+          val (nextState, emb) = state.nextStateAndEmbed(word)
+          emb #:: embed(nextState, tail)
+        case Nil =>
+          Stream.empty
+      }
+      embed(embedder.initState(), words)
+    case embedder =>
+      embedder.transduce(words).toStream
+  }
+
   override protected def hyperParamTransformPermanently(hyperParam: YamlConfig): YamlConfig = {
     val dim = if(embeddingsFile != null){
       EmbedderStandard.pretrainedEmb_loadDim(embeddingsFile)
@@ -97,7 +124,7 @@ class RevealingModel(
       if(i%100==0 && i>0)
         System.err.println(s"validation $i")
 
-      setEmbedding(inst.tree.words, inst.emb)
+      setEmbedding(inst)
       DynetSetup.cg_renew()
 
       val words = inst.tree.words
@@ -126,10 +153,11 @@ class RevealingModel(
     (evaluator.mainScore, evaluator.exposedScores.toMap++logProbAggregator.exposedScores.toMap)
   }
 
-  private def setEmbedding(sent:List[String], emb:SentEmbedding) : Unit = {
-    if(emb != null && elmoPointer() != null){
-      // turn on precomputed
-      elmoPointer().cachedEmbeddings(sent) = emb
+  private def setEmbedding(inst:TrainInstance) : Unit = {
+    val sent = inst.tree.words
+    // turn on precomputed ; the store is read only if precomputeChunk didn't load the sentence already this epoch
+    if(inst.embRef != null && elmoPointer() != null && !elmoPointer().cachedEmbeddings.contains(sent)){
+      elmoPointer().cachedEmbeddings(sent) = inst.loadEmb()
     }
   }
 
@@ -145,7 +173,7 @@ class RevealingModel(
 
     // System.err.println(s"proc ${instance.index} ${instance.instance.tree.words.mkString(" ")}")
 
-    setEmbedding(instance.instance.tree.words, instance.instance.emb)
+    setEmbedding(instance.instance)
     val loss = Parser.loss(instance.instance.tree)(this)
     unsetEmbedding(instance.instance.tree.words)
 
@@ -156,16 +184,28 @@ class RevealingModel(
     val instances = representation.DerivationsLoader.fromFile(file)
     val useElmo = hyperParams("sequence-embedder").deepSearch("ELMo").nonEmpty
     val precomputeEmbs = hyperParams("trainer").getOrElse("precomputation-all-ELMo-embeddings", default= false)
+    if(useElmo && prefetchEnabled)
+      SequenceEmbedderELMo.enablePrefetch()
     if(useElmo && precomputeEmbs){
       System.err.println(s"Loading precomputed ELMo embeddings for $file")
       val embeddingType = hyperParams("sequence-embedder").deepSearch("ELMo-type").head.str
+      val precision = hyperParams("sequence-embedder").deepSearch("ELMo-precision").headOption.map(_.str).getOrElse("float32")
       val r : String => Iterator[List[String]] = f => DerivationsLoader.fromFile(f).map{_.words}
-      SequenceEmbedderELMo.precomputeEmbsSafe(file, r, embeddingType)
-      val embs = new ObjectIteratorFromFile[List[Array[Float]]](s"$file.elmo.$embeddingType")
+      // a store of all views (elmo_embed_corpus.py --emb_type all) serves every embedding type without recomputation
+      val allStoreFile = SequenceEmbedderELMo.storeFile(file, ELMoEmbeddingStore.ALL)
+      val storeFile = if(ELMoEmbeddingStore.exists(allStoreFile)){
+        allStoreFile
+      }else{
+        SequenceEmbedderELMo.precomputeEmbsSafe(file, r, embeddingType, precision)
+        SequenceEmbedderELMo.storeFile(file, embeddingType)
+      }
+      if(prefetchEnabled)
+        System.err.println(s"prefetch-embeddings doesn't apply to the sentences of $storeFile ; they are read from the store in precomputeChunk")
+      val embs = (0 until ELMoEmbeddingStore.open(storeFile).size).iterator.map(ELMoEmbeddingRef(storeFile, _, embeddingType))
       Zipper.zip2(instances, embs).map{case (x, y) => Inst(x, y)}
     }else{
-      Zipper.zip2(instances, Stream.from(0).map(_=>null.asInstanceOf[SentEmbedding]).iterator).map{
-        case (x:TreeNode, y:SentEmbedding) => Inst(x, y)
+      Zipper.zip2(instances, Stream.from(0).map(_=>null.asInstanceOf[ELMoEmbeddingRef]).iterator).map{
+        case (x:TreeNode, y:ELMoEmbeddingRef) => Inst(x, y)
         case (x:TreeNode, null) => Inst(x, null)
       }
     }
@@ -190,15 +230,26 @@ class RevealingModel(
   override def precomputeChunk(chunk: Iterable[IndexedInstance[TrainInstance]]): Unit = {
     if(hyperParams("main-vars")("precompute-embeddings").bool){
       sequenceEmbedder.cleanPrecomputedCache()
-      chunk.filter(_.instance.emb != null).foreach{inst =>
-        val sent = inst.instance.tree.words
-        if(elmoPointer() != null)
-          elmoPointer().cachedEmbeddings(sent) = inst.instance.emb
+      if(elmoPointer() != null){
+        chunk.filter(_.instance.embRef != null).foreach{inst =>
+          elmoPointer().cachedEmbeddings(inst.instance.tree.words) = inst.instance.loadEmb()
+        }
       }
       sequenceEmbedder.precomputeEmbeddings(chunk.map{_.instance.tree.leafs.map{_.word}}.toList)
     }
   }
 
+  // main-vars prefetch-embeddings (default true) computes the next chunk on the server while the current one is trained ;
+  // it does nothing for sentences with a precomputed store (precomputation-all-ELMo-embeddings) which are read in precomputeChunk
+  private def prefetchEnabled : Boolean =
+    hyperParams("main-vars")("precompute-embeddings").bool && hyperParams("main-vars").getOrElse("prefetch-embeddings", default = true)
+
+  override def prefetchChunk(chunk: Iterable[IndexedInstance[TrainInstance]]): Unit = {
+    if(prefetchEnabled){
+      sequenceEmbedder.prefetchEmbeddings(chunk.filter(_.instance.embRef == null).map{_.instance.tree.leafs.map{_.word}}.toList)
+    }
+  }
+
   override def prepareForMiniBatch(miniBatch: List[IndexedInstance[TrainInstance]]): Unit = {
     if(!isDiscriminative){
       val miniBatchWords: Set[String] = miniBatch.flatMap(_.instance.tree.words).toSet
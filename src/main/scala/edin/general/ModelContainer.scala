@@ -90,6 +90,10 @@ trait ModelContainer[I]{
   // DOC called for precomputation
   def precomputeChunk(chunk:Iterable[IndexedInstance[I]]) : Unit = {}
 
+  // called order 8 (right after precomputeChunk)
+  // DOC gets the next chunk so that its precomputation can run in the background while the current one is trained
+  def prefetchChunk(chunk:Iterable[IndexedInstance[I]]) : Unit = {}
+
   // called order 9
   // DOC called before minibatch starts (useful for better softmaxes)
   def prepareForMiniBatch(miniBatch:List[IndexedInstance[I]]) : Unit = {}
@@ -245,8 +245,11 @@ class TrainingController[I](
         modelContainer.prepareForEpoch(trainData, epoch)
         updatesInInstancesSinceLastEpoch = 0
 
-        for(precomputationChunk <- makeChunks(trainData, precomputationChunkSize)){
+        val precomputationChunks = makeChunks(trainData, precomputationChunkSize).buffered
+        for(precomputationChunk <- precomputationChunks){
           modelContainer.precomputeChunk(precomputationChunk)
+          if(precomputationChunks.hasNext)
+            modelContainer.prefetchChunk(precomputationChunks.head)
           for(batch <- makeChunks(precomputationChunk, miniBatchSize)){
             modelContainer.prepareForMiniBatch(batch)
             enableAllDropout()
@@ -0,0 +1,246 @@
+package edin.nn.embedder
+
+import java.io.{File, RandomAccessFile}
+import java.nio.channels.FileChannel.MapMode
+import java.nio.{ByteBuffer, ByteOrder, MappedByteBuffer}
+
+import scala.collection.mutable.{Map => MutMap}
+
+/**
+  * On-disk store of precomputed sentence embeddings, shared with scripts/embedding/elmo_store.py
+  *
+  * data file:
+  *   64 byte header (little-endian): 8 bytes magic "ELMOSTR1", int32 dtype code (0 float32, 1 float16, 2 int8),
+  *   int32 dim, 48 bytes emb_type padded with zeros ; followed by the rows of all sentences in row-major order
+  *   encoded as in embed_sents_packed (an int8 row is a float32 scale followed by dim int8 values)
+  * index file (data file + ".idx"):
+  *   int64 row offsets, one per sentence plus the final row count
+  * the writer (elmo_store.py) removes the index before it writes the data file and writes the index last, to a temporary
+  * file that it renames, so a store whose index exists is complete ; projection directories do the same with meta.json
+  */
+object ELMoEmbeddingStore{
+
+  val MAGIC         : String = "ELMOSTR1"
+  val HEADER_SIZE   : Int    = 64
+  val DTYPE_FLOAT32 : Int    = 0
+  val DTYPE_FLOAT16 : Int    = 1
+  val DTYPE_INT8    : Int    = 2
+
+  val DTYPES : Map[String, Int] = Map("float32" -> DTYPE_FLOAT32, "float16" -> DTYPE_FLOAT16, "int8" -> DTYPE_INT8)
+
+  def dtypeCode(dtype:String) : Int = DTYPES.getOrElse(dtype, throw new Exception(s"unknown dtype $dtype"))
+
+  def rowBytes(dtype:Int, dim:Int) : Int = dtype match {
+    case DTYPE_FLOAT32 => 4*dim
+    case DTYPE_FLOAT16 => 2*dim
+    case DTYPE_INT8    => 4+dim
+    case _             => throw new Exception(s"unknown dtype code $dtype")
+  }
+
+  private val EMB_TYPE_SIZE = 48
+
+  // segments overlap by the size of the largest sentence so every sentence is inside one mapping
+  private val SEGMENT_SIZE : Long = 1L << 30
+
+  // store type holding the top layer followed by the forward half of the local layer ; every other emb_type is derived from it
+  val ALL : String = "all"
+
+  private val half_dimension = 512
+
+  def deriveView(all:Array[Float], embType:String) : Array[Float] = embType match {
+    case "forward-top"  => all.slice(0, half_dimension)
+    case "backward-top" => all.slice(half_dimension, 2*half_dimension)
+    case "concat-top"   => all.slice(0, 2*half_dimension)
+    case "average-top"  => Array.tabulate(half_dimension)(i => (all(i)+all(half_dimension+i))/2)
+    case "local"        => all.slice(2*half_dimension, 3*half_dimension)
+    case ALL            => all
+    case _              => throw new Exception(s"unknown emb_type $embType")
+  }
+
+  def indexFile(storeFile:String) : String = s"$storeFile.idx"
+
+  def exists(storeFile:String) : Boolean = new File(indexFile(storeFile)).exists()
+
+  private val openStores = MutMap[String, ELMoEmbeddingStore]()
+
+  def open(storeFile:String) : ELMoEmbeddingStore = openStores.synchronized{
+    openStores.getOrElseUpdate(storeFile, new ELMoEmbeddingStore(storeFile))
+  }
+
+  def halfToFloat(h:Short) : Float = {
+    val bits = h & 0xffff
+    val sign = (bits & 0x8000) << 16
+    val exp  = (bits >>> 10) & 0x1f
+    val mant = bits & 0x03ff
+    if(exp == 0x1f){
+      java.lang.Float.intBitsToFloat(sign | 0x7f800000 | (mant << 13))
+    }else if(exp == 0){
+      val f = mant * math.pow(2, -24).toFloat
+      if(sign == 0) f else -f
+    }else{
+      java.lang.Float.intBitsToFloat(sign | ((exp + 112) << 23) | (mant << 13))
+    }
+  }
+
+  /**
+    * dequantizes rows rows of dimension dim starting at the position of the (little-endian) buffer
+    */
+  def decodeRows(buf:ByteBuffer, dtype:Int, rows:Int, dim:Int) : List[Array[Float]] = dtype match {
+    case DTYPE_FLOAT32 =>
+      val floats = buf.asFloatBuffer()
+      List.fill(rows){
+        val row = new Array[Float](dim)
+        floats.get(row)
+        row
+      }
+    case DTYPE_FLOAT16 =>
+      val shorts = buf.asShortBuffer()
+      List.fill(rows){
+        Array.fill(dim)(halfToFloat(shorts.get()))
+      }
+    case DTYPE_INT8 =>
+      List.fill(rows){
+        val scale = buf.getFloat()
+        Array.fill(dim)(buf.get() * scale)
+      }
+    case _ =>
+      throw new Exception(s"unknown dtype code $dtype")
+  }
+
+  // the float32 encoding ; the reduced precision encodings are produced only by the python side
+  def encodeRows(emb:List[Array[Float]]) : ELMoCompactEmbedding = {
+    val dim = if(emb.isEmpty) 0 else emb.head.length
+    val buf = ByteBuffer.allocate(emb.size * dim * 4).order(ByteOrder.LITTLE_ENDIAN)
+    for(row <- emb){
+      assert(row.length == dim, s"expected dimension $dim but got ${row.length}")
+      buf.asFloatBuffer().put(row)
+      buf.position(buf.position() + row.length*4)
+    }
+    ELMoCompactEmbedding(DTYPE_FLOAT32, emb.size, dim, buf.array())
+  }
+
+}
+
+/**
+  * embedding of a sentence kept in the encoding in which it was stored or received (see embed_sents_packed) ;
+  * with float16 or int8 it takes a half or a quarter of the memory of the decoded vectors
+  */
+case class ELMoCompactEmbedding(dtype:Int, rows:Int, dim:Int, data:Array[Byte]){
+
+  def decode() : List[Array[Float]] = ELMoEmbeddingStore.decodeRows(ByteBuffer.wrap(data).order(ByteOrder.LITTLE_ENDIAN), dtype, rows, dim)
+
+  def size : Int = rows
+
+}
+
+/**
+  * reference to one sentence of a store ; it is small and serializable so it can be kept in training instances
+  * instead of the embeddings themselves
+  */
+case class ELMoEmbeddingRef(storeFile:String, sentId:Int, embType:String){
+
+  def load() : List[Array[Float]] = ELMoEmbeddingStore.open(storeFile)(sentId, embType)
+
+  def loadCompact() : ELMoCompactEmbedding = ELMoEmbeddingStore.open(storeFile).compact(sentId, embType)
+
+}
+
+class ELMoEmbeddingStore(val storeFile:String){
+
+  import ELMoEmbeddingStore._
+
+  private val (dtype:Int, dim:Int, embType:String) = {
+    val raf = new RandomAccessFile(storeFile, "r")
+    val header = ByteBuffer.allocate(HEADER_SIZE).order(ByteOrder.LITTLE_ENDIAN)
+    raf.getChannel.read(header, 0)
+    raf.close()
+    header.flip()
+    val magic = new Array[Byte](MAGIC.length)
+    header.get(magic)
+    if(new String(magic, "ASCII") != MAGIC)
+      throw new Exception(s"$storeFile is not an embedding store")
+    val dtype = header.getInt()
+    val dim = header.getInt()
+    val embTypeBytes = new Array[Byte](EMB_TYPE_SIZE)
+    header.get(embTypeBytes)
+    (dtype, dim, new String(embTypeBytes, "ASCII").takeWhile(_ != '\u0000'))
+  }
+
+  if(! DTYPES.values.exists(_ == dtype))
+    throw new Exception(s"unknown dtype code $dtype in $storeFile")
+
+  private val offsets : Array[Long] = {
+    val raf = new RandomAccessFile(indexFile(storeFile), "r")
+    val channel = raf.getChannel
+    val buf = channel.map(MapMode.READ_ONLY, 0, channel.size()).order(ByteOrder.LITTLE_ENDIAN).asLongBuffer()
+    val res = new Array[Long](buf.remaining())
+    buf.get(res)
+    raf.close()
+    res
+  }
+
+  private val sentRowBytes : Long = rowBytes(dtype, dim).toLong
+
+  private val segments : Array[MappedByteBuffer] = {
+    val raf = new RandomAccessFile(storeFile, "r")
+    val channel = raf.getChannel
+    val dataSize = channel.size() - HEADER_SIZE
+    val maxSentBytes = if(size == 0) 0L else (0 until size).map(i => offsets(i+1)-offsets(i)).max * sentRowBytes
+    val segs = (0L until math.max(dataSize, 1L) by SEGMENT_SIZE).map{ start =>
+      val len = math.min(SEGMENT_SIZE + maxSentBytes, dataSize - start)
+      channel.map(MapMode.READ_ONLY, HEADER_SIZE + start, len)
+    }.toArray
+    raf.close()
+    segs
+  }
+
+  def size : Int = offsets.length - 1
+
+  def embeddingType : String = embType
+
+  def dimension : Int = dim
+
+  private def sentBuffer(sentId:Int) : (ByteBuffer, Int) = {
+    val start = offsets(sentId) * sentRowBytes
+    val rows = (offsets(sentId+1) - offsets(sentId)).toInt
+    val buf = segments((start / SEGMENT_SIZE).toInt).duplicate().order(ByteOrder.LITTLE_ENDIAN)
+    buf.position((start % SEGMENT_SIZE).toInt)
+    (buf, rows)
+  }
+
+  // dequantizes on read
+  def apply(sentId:Int) : List[Array[Float]] = {
+    val (buf, rows) = sentBuffer(sentId)
+    if(rows == 0)
+      Nil
+    else
+      decodeRows(buf, dtype, rows, dim)
+  }
+
+  // copies the rows without decoding them
+  def compact(sentId:Int) : ELMoCompactEmbedding = {
+    val (buf, rows) = sentBuffer(sentId)
+    val data = new Array[Byte](rows * sentRowBytes.toInt)
+    if(rows > 0)
+      buf.get(data)
+    ELMoCompactEmbedding(dtype, rows, dim, data)
+  }
+
+  // only the stored emb_type stays compact, derived views are decoded and encoded again as float32
+  def compact(sentId:Int, viewType:String) : ELMoCompactEmbedding =
+    if(viewType == embType)
+      compact(sentId)
+    else
+      encodeRows(apply(sentId, viewType))
+
+  def apply(sentId:Int, viewType:String) : List[Array[Float]] =
+    if(viewType == embType)
+      apply(sentId)
+    else if(embType == ALL)
+      apply(sentId).map(deriveView(_, viewType))
+    else
+      throw new Exception(s"store of $embType can't provide $viewType")
+
+  def iterator : Iterator[List[Array[Float]]] = (0 until size).iterator.map(i => apply(i))
+
+}
@@ -0,0 +1,77 @@
+package edin.nn.embedder
+
+import java.io.File
+import java.nio.file.Files
+import java.nio.{ByteBuffer, ByteOrder}
+
+import spray.json._
+
+import scala.io.Source
+
+/**
+  * a projection directory of scripts/embedding/elmo_projection.py applied on the JVM ; the server applies it to the
+  * vectors it sends and this applies it to the full ELMo vectors of precomputed stores so that both are in the same space
+  */
+class ELMoProjection(dir:String){
+
+  private val meta = Source.fromFile(s"$dir/meta.json").mkString.parseJson.asJsObject.fields
+
+  private val normalize = meta.get("normalize").contains(JsTrue)
+
+  private val (outDim, inDim, weights) = ELMoProjection.readNpy(s"$dir/W.npy")
+
+  private val bias : Array[Float] = if(new File(s"$dir/b.npy").exists()) ELMoProjection.readNpy(s"$dir/b.npy")._3 else null
+
+  def apply(x:Array[Float]) : Array[Float] = {
+    assert(x.length == inDim, s"projection $dir expects dimension $inDim but got ${x.length}")
+    // the projection is linear so the rows are normalized after the product
+    val scale = if(normalize) 1f/(math.sqrt(x.map(v => v*v).sum).toFloat+1e-10f) else 1f
+    val res = if(bias == null) new Array[Float](outDim) else bias.clone()
+    for(i <- 0 until outDim){
+      val offset = i*inDim
+      var sum = 0f
+      var j = 0
+      while(j < inDim){
+        sum += weights(offset+j)*x(j)
+        j += 1
+      }
+      res(i) += sum*scale
+    }
+    res
+  }
+
+}
+
+object ELMoProjection{
+
+  /**
+    * reads a float32 .npy file of one or two dimensions as (rows, cols, values in row-major order)
+    */
+  def readNpy(file:String) : (Int, Int, Array[Float]) = {
+    val buf = ByteBuffer.wrap(Files.readAllBytes(new File(file).toPath)).order(ByteOrder.LITTLE_ENDIAN)
+    val magic = new Array[Byte](6)
+    buf.get(magic)
+    assert(magic(0) == 0x93.toByte && new String(magic, 1, 5, "ASCII") == "NUMPY", s"$file is not a .npy file")
+    val major = buf.get()
+    buf.get()
+    val headerLength = if(major == 1) buf.getShort() & 0xffff else buf.getInt()
+    val headerBytes = new Array[Byte](headerLength)
+    buf.get(headerBytes)
+    val header = new String(headerBytes, "ASCII")
+    assert(header.contains("'descr': '<f4'"), s"$file must be little-endian float32 but its header is $header")
+    val fortranOrder = header.contains("'fortran_order': True")
+    val shape = "'shape': \\(([^)]*)\\)".r.findFirstMatchIn(header).get.group(1).split(",").map(_.trim).filter(_.nonEmpty).map(_.toInt)
+    val (rows, cols) = shape match {
+      case Array(n)    => (n, 1)
+      case Array(r, c) => (r, c)
+      case _           => throw new Exception(s"$file has shape ${shape.mkString("x")} but only one or two dimensions are supported")
+    }
+    val values = new Array[Float](rows*cols)
+    buf.asFloatBuffer().get(values)
+    if(fortranOrder && cols > 1)
+      (rows, cols, Array.tabulate(rows*cols)(k => values((k%cols)*rows + k/cols)))
+    else
+      (rows, cols, values)
+  }
+
+}
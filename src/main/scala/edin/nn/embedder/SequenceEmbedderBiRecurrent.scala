@@ -41,6 +41,8 @@ class SequenceEmbedderBiRecurrent[T](config: SequenceEmbedderBiRecurrentConfig[T
 
   override def precomputeEmbeddings(sents: Iterable[List[T]]): Unit = subEmbedder.precomputeEmbeddings(sents)
 
+  override def prefetchEmbeddings(sents: Iterable[List[T]]): Unit = subEmbedder.prefetchEmbeddings(sents)
+
   override def cleanPrecomputedCache(): Unit = subEmbedder.cleanPrecomputedCache()
 }
 
@@ -1,7 +1,10 @@
 package edin.nn.embedder
 
 import java.io._
-import java.net.ServerSocket
+import java.nio.channels.FileChannel.MapMode
+import java.nio.file.{Files, Paths, StandardCopyOption}
+import java.nio.{ByteBuffer, ByteOrder, MappedByteBuffer}
+import java.util.concurrent.Executors
 
 import edin.algorithms.Pointer
 import edin.general.{Global, YamlConfig}
@@ -9,11 +12,14 @@ import edin.nn.DyFunctions._
 import edin.nn.layers.{Layer, SingleLayer}
 import edu.cmu.dynet.{Expression, ParameterCollection}
 
-import scala.collection.mutable.{Map => MutMap}
+import scala.collection.mutable.{ArrayBuffer, Map => MutMap}
 import scala.collection.JavaConverters._
 import org.apache.thrift.transport.TSocket
 import org.apache.thrift.protocol.TBinaryProtocol
 
+import scala.concurrent.{Await, ExecutionContext, Future, Promise}
+import scala.concurrent.duration._
+import scala.io.Source
 import scala.util.{Failure, Success, Try}
 
 
@@ -23,6 +29,8 @@ case class SequenceEmbedderELMoConfig(
                                        normalize               : Boolean,
                                        dropout                 : Float,
                                        outDim                  : Int,
+                                       precision               : String,
+                                       projection              : String,
                                        elmoPointer             : Pointer[SequenceEmbedderELMo]
                                      ) extends SequenceEmbedderGeneralConfig[String]{
   override def construct()(implicit model: ParameterCollection): SequenceEmbedderGeneral[String] = new SequenceEmbedderELMo(this)
@@ -35,12 +43,19 @@ object SequenceEmbedderELMoConfig{
     assert(Set("average-top", "concat-top", "forward-top", "backward-top", "local") contains embType)
     val outDim = origConf("out-dim").int
     val withoutCompression = origConf.getOrElse("withoutCompression", false)
+    // float16 and int8 keep the embeddings (cached, precomputed and received from the server) in reduced precision
+    val precision = origConf.getOrElse("ELMo-precision", "float32")
+    assert(ELMoEmbeddingStore.DTYPES contains precision)
+    // directory of a fixed projection (scripts/embedding/elmo_projection.py) applied by the server in place of the compressor
+    val projection = origConf.getOrElse[String]("ELMo-projection", null)
     SequenceEmbedderELMoConfig(
       embeddingType      = embType,
       withoutCompression = withoutCompression,
       normalize          = origConf.getOrElse("normalize", false),
       dropout            = origConf.getOrElse("dropout", 0f),
       outDim             = outDim,
+      precision          = precision,
+      projection         = projection,
       elmoPointer        = origConf.getOrElse("elmo-pointer", new Pointer[SequenceEmbedderELMo])
     )
   }
@@ -55,115 +70,430 @@ object SequenceEmbedderELMo{
     *               where each sentence is a list of words
     *               this is useful in case line is not a normal sequenc of words but for example a penn tree
     */
-  def precomputeEmbsSafe(sentsFile:String, reader:String => Iterator[List[String]], elmoType:String) : Unit = {
-    val lockFile = new File(s"$sentsFile.elmo.$elmoType.lock")
-
-    if(lockFile.exists()){
-      var i = 0
-      while(lockFile.exists()){
-        if(i%30==0)
-          System.err.println("waiting for embeddings ; 5 minute check")
-        Thread.sleep(10*1000)
-        i+=1
-      }
+  def storeFile(sentsFile:String, elmoType:String) : String = s"$sentsFile.elmo.$elmoType.store"
+
+  /**
+    * embeds the sentences of sentsFile into storeFile(sentsFile, elmoType) with scripts/embedding/elmo_embed_job.py
+    * which uses its own worker processes ($ELMO_JOB_WORKERS), resumes an interrupted run from the shards it finished
+    * and makes concurrent callers wait for the one doing the work (or take over if that one died)
+    */
+  def precomputeEmbsSafe(sentsFile:String, reader:String => Iterator[List[String]], elmoType:String, precision:String = "float32") : Unit = {
+    val store = storeFile(sentsFile, elmoType)
+    if(ELMoEmbeddingStore.exists(store))
+      return
+
+    // the job reads one tokenized sentence per line ; every process writes a file of its own so that no process
+    // changes or removes the file that the job of another one is reading (the job matches them by their contents)
+    val storeDir = new File(store).getAbsoluteFile.getParentFile
+    val sentsText = File.createTempFile(new File(store).getName+".", ".sents", storeDir)
+    sentsText.deleteOnExit()
+    try{
+      val pw = new PrintWriter(sentsText, "UTF-8")
+      reader(sentsFile).foreach(sent => pw.println(sent.mkString(" ")))
+      pw.close()
+
+      val script = Global.projectDir+"/scripts/embedding/elmo_embed_job.py"
+      val command = List(script, "--emb_type", elmoType, "--store_dtype", precision, "--output", store, sentsText.getPath)
+      val exitCode = new ProcessBuilder(command.asJava).inheritIO().start().waitFor()
+      if(exitCode != 0 || ! ELMoEmbeddingStore.exists(store))
+        throw new Exception(s"embedding $sentsFile failed (exit code $exitCode) ; running the same command again resumes it")
+    }finally{
+      sentsText.delete()
+    }
+  }
+
+  /**
+    * @param projection
+    *               directory of a projection that the server applies to every vector (see elmo_projection.py) ; null for none
+    */
+  def embed_sents(
+             emb_type     : String,
+             sents        : List[List[String]],
+             projection   : String = null
+           ) : List[List[Array[Float]]] = embed_sents(elmo_service, emb_type, sents, projection)
+
+  private def embed_sents(
+             service      : SequenceEmbedderELMo_Service.Client,
+             emb_type     : String,
+             sents        : List[List[String]],
+             projection   : String
+           ) : List[List[Array[Float]]] = {
+    if(sents.isEmpty){
+      return Nil
+    }
+    val java_sents = sents.map{_.asJava}.asJava
+    if(sents.map(_.size).sum >= SHM_MIN_TOKENS){
+      val fromShm = Try(readShmDescriptor(service.embed_sents_shm(java_sents, emb_type, projection))).toOption.flatten
+      if(fromShm.isDefined)
+        return fromShm.get
+    }
+    val embs = service.embed_sents_packed(java_sents, emb_type, "float32", projection)
+    embs.asScala.toList.map(unpackMatrix)
+  }
+
+  /**
+    * like embed_sents but the embeddings stay in the encoding of dtype (float32, float16 or int8) until they are decoded ;
+    * the reduced precision is applied by the server
+    */
+  def embed_sents_compact(
+             emb_type     : String,
+             sents        : List[List[String]],
+             dtype        : String,
+             projection   : String = null
+           ) : List[ELMoCompactEmbedding] = embed_sents_compact(elmo_service, emb_type, sents, dtype, projection)
+
+  private def embed_sents_compact(
+             service      : SequenceEmbedderELMo_Service.Client,
+             emb_type     : String,
+             sents        : List[List[String]],
+             dtype        : String,
+             projection   : String
+           ) : List[ELMoCompactEmbedding] =
+    if(dtype == "float32" || unsupportedDtypes(dtype)){
+      // keeps the shared-memory transfer of large batches
+      embed_sents(service, emb_type, sents, projection).map(ELMoEmbeddingStore.encodeRows)
+    }else if(sents.isEmpty){
+      Nil
     }else{
-      if(! new File(s"$sentsFile.elmo.$elmoType").exists()){
-        lockFile.createNewFile()
-        precomputeEmbs(sentsFile, reader, elmoType)
-        lockFile.delete()
-        Thread.sleep( 1*1000)
+      try{
+        val embs = service.embed_sents_packed(sents.map{_.asJava}.asJava, emb_type, dtype, projection)
+        embs.asScala.toList.map(unpackCompact(_, ELMoEmbeddingStore.dtypeCode(dtype)))
+      }catch{
+        case e:SequenceEmbedderELMo_BadArgument =>
+          System.err.println(s"ELMo server doesn't support dtype $dtype (${e.message}) so float32 is used instead")
+          unsupportedDtypes += dtype
+          embed_sents_compact(service, emb_type, sents, dtype, projection)
       }
     }
+
+  // dtypes the server refused ; their embeddings come as float32 instead
+  @volatile private var unsupportedDtypes = Set[String]()
+
+  // the prefetch connection needs a second worker of a server started by this process so it is asked for
+  // before the server starts ; the daemon serves any number of connections
+  @volatile private var prefetchRequested = false
+  private var prefetchAvailable = false
+
+  def enablePrefetch() : Unit = prefetchRequested = true
+
+  def canPrefetch : Boolean = synchronized{
+    elmo_service
+    prefetchAvailable
   }
 
-  private def precomputeEmbs(sentsFile:String, reader:String => Iterator[List[String]], elmoType:String) : Unit = {
-    val pw = new ObjectOutputStream(
-      new BufferedOutputStream(
-        new FileOutputStream(s"$sentsFile.elmo.$elmoType")))
+  /**
+    * embeds the sentences on a background thread while the caller continues with other work ;
+    * the background thread has its own connection so its requests run in a different server worker
+    * than the requests of the main thread (only if canPrefetch)
+    */
+  def prefetch(
+             emb_type     : String,
+             sents        : List[List[String]],
+             dtype        : String,
+             projection   : String
+           ) : Future[List[ELMoCompactEmbedding]] = Future{
+    embed_sents_compact(prefetch_service, emb_type, sents, dtype, projection)
+  }(prefetchContext)
+
+  // a single thread so that prefetches are served in the order in which they were issued
+  lazy val prefetchContext : ExecutionContext = ExecutionContext.fromExecutorService(
+    Executors.newSingleThreadExecutor{ r : Runnable =>
+      val thread = new Thread(r, "elmo-prefetch")
+      thread.setDaemon(true)
+      thread
+    }
+  )
 
-    val batchSize = 64
+  /**
+    * a server session that embeds a sentence word by word (emb_type forward-top or local, see open_session in the
+    * thrift file) ; it uses the main connection because the server keeps the session in the worker serving it
+    */
+  def openSession(emb_type:String, projection:String = null) : ELMoSession = new ELMoSession(elmo_service, emb_type, projection)
+
+  // batches with at least this many words are transferred through the shared-memory ring of the server
+  private val SHM_MIN_TOKENS = 1000
 
-    var lastPrinted = 0
-    var processed = 0
+  private val shmMappings = MutMap[String, MappedByteBuffer]()
 
-    reader(sentsFile).sliding(batchSize, batchSize).foreach{ batch =>
-      val embs = SequenceEmbedderELMo.embed_sents(elmoType, batch.toList)
-      for(emb <- embs){
-        pw.writeObject(emb)
+  /**
+    * None if the file is gone because the ring grew (see elmo_shm.py) ; rings are named <prefix><worker pid>-<generation>
+    * so a new generation replaces the mapping of the older ones of the same worker
+    */
+  private def shmMapping(path:String) : Option[MappedByteBuffer] = shmMappings.synchronized{
+    if(!shmMappings.contains(path)){
+      val file = try{
+        Some(new RandomAccessFile(path, "r"))
+      }catch{
+        case _:FileNotFoundException => None
       }
-      processed += batch.size
-      if(processed - lastPrinted > 100){
-        lastPrinted = processed
-        System.err.println(s"processed $processed")
+      for(raf <- file){
+        val buf = try{
+          raf.getChannel.map(MapMode.READ_ONLY, 0, raf.length())
+        }finally{
+          raf.close()
+        }
+        val worker = path.substring(0, path.lastIndexOf('-')+1)
+        shmMappings.keys.filter(_.startsWith(worker)).toList.foreach(shmMappings.remove)
+        shmMappings(path) = buf
       }
     }
+    shmMappings.get(path)
+  }
 
-    pw.close()
+  /**
+    * reads the embeddings that embed_sents_shm placed in the ring of the server (format is in the thrift file) ;
+    * None means that the server overwrote the entry before it was copied and the caller should use embed_sents_packed
+    */
+  private def readShmDescriptor(descriptor:ByteBuffer) : Option[List[List[Array[Float]]]] = {
+    val desc = descriptor.duplicate().order(ByteOrder.LITTLE_ENDIAN)
+    val seq = desc.getLong()
+    val entryOffset = desc.getLong()
+    val pathBytes = new Array[Byte](desc.getInt())
+    desc.get(pathBytes)
+    val mapping = shmMapping(new String(pathBytes, "UTF-8"))
+    if(mapping.isEmpty)
+      return None
+    val ring = mapping.get.duplicate().order(ByteOrder.LITTLE_ENDIAN)
+    if(ring.getLong(entryOffset.toInt) != seq)
+      return None
+    val embs = List.fill(desc.getInt()){
+      val offset = desc.getLong()
+      val rows = desc.getInt()
+      val cols = desc.getInt()
+      ring.position(offset.toInt)
+      val floats = ring.asFloatBuffer()
+      List.fill(rows){
+        val row = new Array[Float](cols)
+        floats.get(row)
+        row
+      }
+    }
+    if(ring.getLong(entryOffset.toInt) != seq)
+      None
+    else
+      Some(embs)
+  }
+
+  /**
+    * decodes the packed format of embed_sents_packed with dtype float32:
+    * int32 rows, int32 cols (little-endian) followed by rows*cols float32 values in row-major order
+    */
+  private[embedder] def unpackMatrix(blob:ByteBuffer) : List[Array[Float]] = {
+    val buf = blob.duplicate().order(ByteOrder.LITTLE_ENDIAN)
+    val rows = buf.getInt()
+    val cols = buf.getInt()
+    ELMoEmbeddingStore.decodeRows(buf, ELMoEmbeddingStore.DTYPE_FLOAT32, rows, cols)
+  }
+
+  // keeps the rows of a packed blob as they are ; they are encoded the same way as the rows of a store
+  private def unpackCompact(blob:ByteBuffer, dtype:Int) : ELMoCompactEmbedding = {
+    val buf = blob.duplicate().order(ByteOrder.LITTLE_ENDIAN)
+    val rows = buf.getInt()
+    val cols = buf.getInt()
+    val data = new Array[Byte](buf.remaining())
+    buf.get(data)
+    ELMoCompactEmbedding(dtype, rows, cols, data)
+  }
 
-    SequenceEmbedderELMo.endServer()
+  /**
+    * writes a float32 matrix given in column-major order (the order of DyNet tensors) as a .npy file
+    */
+  def writeNpy(file:String, rows:Int, cols:Int, columnMajor:Seq[Float]) : Unit = {
+    assert(columnMajor.size == rows*cols)
+    val dict = s"{'descr': '<f4', 'fortran_order': True, 'shape': ($rows, $cols), }"
+    // magic, version, header length and header are padded to a multiple of 64 bytes ; the header ends with a newline
+    val header = dict + " "*((64 - (10 + dict.length + 1) % 64) % 64) + "\n"
+    val buf = ByteBuffer.allocate(10 + header.length + 4*rows*cols).order(ByteOrder.LITTLE_ENDIAN)
+    buf.put(0x93.toByte)
+    buf.put("NUMPY".getBytes("ASCII"))
+    buf.put(1.toByte)
+    buf.put(0.toByte)
+    buf.putShort(header.length.toShort)
+    buf.put(header.getBytes("ASCII"))
+    columnMajor.foreach(buf.putFloat)
+    val out = new FileOutputStream(file)
+    out.write(buf.array())
+    out.close()
   }
 
-  private def findFreePort(start:Int, end:Int) : Int = {
-    for(i <- start to end){
-      Try(new ServerSocket(i)) match {
-        case Success(socket) =>
-          socket.close()
-          return i
-        case Failure(_) =>
+  // the first run downloads the model so starting can take a while
+  private val SERVER_START_TIMEOUT : Duration = 30.minutes
+  private val CONNECT_ATTEMPTS = 10
+  private val STDERR_TAIL_SIZE = 50
+
+  /**
+    * with ELMO_DAEMON=1 all processes of a host share one long-lived server ;
+    * it is found through the port file ELMO_DAEMON_FILE, started by the first client that doesn't find it
+    * and it exits on its own some time after the last client detached ; it is the threaded server that batches the
+    * requests of all clients (--batching) so it isn't limited to a number of connections
+    */
+  private val daemonMode : Boolean = sys.env.get("ELMO_DAEMON").exists(v => v == "1" || v == "true")
+
+  private def daemonFile : String = sys.env.getOrElse(
+    "ELMO_DAEMON_FILE",
+    s"${System.getProperty("java.io.tmpdir")}/elmo-daemon-${System.getProperty("user.name")}-${sys.env.getOrElse("ELMO_MODEL", "original")}.port"
+  )
+
+  private var _memo_elmo_service : SequenceEmbedderELMo_Service.Client = _
+  private var _tsocket : TSocket = _
+  def elmo_service : SequenceEmbedderELMo_Service.Client = synchronized{
+    if(_memo_elmo_service == null){
+      if(daemonMode){
+        System.err.println("\nAttaching to ELMo daemon START")
+        _tsocket = attachToDaemon()
+        _memo_elmo_service = new SequenceEmbedderELMo_Service.Client(new TBinaryProtocol(_tsocket))
+        _memo_elmo_service.attach_client()
+        prefetchAvailable = true
+        sys.addShutdownHook(endServer())
+        System.err.println("Attaching to ELMo daemon DONE")
+      }else{
+        System.err.println("\nStarting ELMo server START")
+        val requestedWorkers = sys.env.get("ELMO_SERVER_WORKERS").map(_.toInt).getOrElse(1)
+        val workers = if(prefetchRequested) math.max(2, requestedWorkers) else requestedWorkers
+        prefetchAvailable = workers >= 2
+        val port = startServer("--workers" :: workers.toString :: Nil)
+        System.err.println(s"using port $port for ELMo")
+
+        _tsocket = connect(port, CONNECT_ATTEMPTS)
+        _memo_elmo_service = new SequenceEmbedderELMo_Service.Client(new TBinaryProtocol(_tsocket))
+        _memo_elmo_service.start_elmo()
+        System.err.println("Starting ELMo server DONE")
       }
     }
-    throw new Exception("couldn't find a free port")
+    _memo_elmo_service
   }
 
+  private var _prefetch_service : SequenceEmbedderELMo_Service.Client = _
+  private var _prefetch_tsocket : TSocket = _
+  private def prefetch_service : SequenceEmbedderELMo_Service.Client = synchronized{
+    if(_prefetch_service == null){
+      val port = { elmo_service ; _tsocket.getSocket.getPort }
+      _prefetch_tsocket = connect(port, CONNECT_ATTEMPTS)
+      _prefetch_service = new SequenceEmbedderELMo_Service.Client(new TBinaryProtocol(_prefetch_tsocket))
+    }
+    _prefetch_service
+  }
 
-  def embed_sents(
-             emb_type     : String,
-             sents        : List[List[String]]
-           ) : List[List[Array[Float]]] = {
-    if(sents.isEmpty){
-      return Nil
+  private def attachToDaemon() : TSocket = {
+    // the lock makes sure that clients starting at the same time don't start a daemon each
+    val lockChannel = new RandomAccessFile(s"$daemonFile.lock", "rw").getChannel
+    val lock = lockChannel.lock()
+    try{
+      val existing = Try(Source.fromFile(daemonFile).mkString.trim.toInt).toOption.flatMap{ port =>
+        Try(connect(port, 1)).toOption
+      }
+      existing match {
+        case Some(socket) =>
+          System.err.println(s"using running ELMo daemon from $daemonFile")
+          socket
+        case None =>
+          val port = startServer(List("--daemon", "--ready-file", daemonFile))
+          System.err.println(s"started ELMo daemon on port $port")
+          connect(port, CONNECT_ATTEMPTS)
+      }
+    }finally{
+      lock.release()
+      lockChannel.close()
     }
-    val java_sents = sents.map{_.asJava}.asJava
-    val embs = elmo_service.embed_sents(java_sents, emb_type)
-    val scala_embs = embs.asScala.toList.map{ sent_embs =>
-      sent_embs.asScala.toList.map{ emb =>
-        emb.asScala.map{_.toFloat}.toArray
+  }
+
+  /**
+    * starts the server on a port of its own choosing and waits until it reports "READY port" on stdout
+    * which happens only after the model is loaded ; stderr of the server is forwarded and its tail is
+    * reported if the server dies or doesn't become ready in time
+    */
+  private def startServer(extraArgs:List[String]) : Int = {
+    val script = Global.projectDir+"/scripts/embedding/elmo_embed_server.py"
+    val process = new ProcessBuilder((script :: "0" :: extraArgs).asJava).start()
+
+    val stderrTail = scala.collection.mutable.Queue[String]()
+    val stderrReader = new Thread(() => {
+      for(line <- Source.fromInputStream(process.getErrorStream).getLines()){
+        System.err.println(line)
+        stderrTail.synchronized{
+          stderrTail.enqueue(line)
+          if(stderrTail.size > STDERR_TAIL_SIZE)
+            stderrTail.dequeue()
+        }
       }
+    })
+    stderrReader.setDaemon(true)
+    stderrReader.start()
+
+    val ready = Promise[Int]()
+    val stdoutReader = new Thread(() => {
+      for(line <- Source.fromInputStream(process.getInputStream).getLines()){
+        if(line startsWith "READY ")
+          ready.trySuccess(line.stripPrefix("READY ").trim.toInt)
+        else
+          System.err.println(line)
+      }
+      ready.tryFailure(new Exception("ELMo server exited before it was ready"))
+    })
+    stdoutReader.setDaemon(true)
+    stdoutReader.start()
+
+    Try(Await.result(ready.future, SERVER_START_TIMEOUT)) match {
+      case Success(port) =>
+        port
+      case Failure(e) =>
+        process.destroy()
+        stderrReader.join(1000)
+        val tail = stderrTail.synchronized{ stderrTail.mkString("\n") }
+        throw new Exception(s"ELMo server failed to start: ${e.getMessage}\n$tail", e)
     }
-    scala_embs
   }
 
-  private var _memo_elmo_service : SequenceEmbedderELMo_Service.Client = _
-  private var _tsocket : TSocket = _
-  def elmo_service : SequenceEmbedderELMo_Service.Client = {
-    if(_memo_elmo_service == null){
-      System.err.println("\nStarting ELMo server START")
-      val port = findFreePort(9000, 9100)
-      System.err.println(s"using port $port for ELMo")
-
-      val script = Global.projectDir+"/scripts/embedding/elmo_embed_server.py"
-      val cmd = s"$script $port"
-      Runtime.getRuntime.exec(Array("/bin/sh", "-c", cmd))
-      Thread.sleep(1000) // to give server enough time to start ; just in case
-
-      _tsocket = new TSocket("localhost", port)
-      _tsocket.open()
-      _memo_elmo_service = new SequenceEmbedderELMo_Service.Client(new TBinaryProtocol(_tsocket))
-      _memo_elmo_service.start_elmo()
-      System.err.println("Starting ELMo server DONE")
+  private def connect(port:Int, attempts:Int) : TSocket = {
+    var attempt = 1
+    while(true){
+      val socket = new TSocket("localhost", port)
+      Try(socket.open()) match {
+        case Success(_) =>
+          return socket
+        case Failure(e) if attempt < attempts =>
+          System.err.println(s"connecting to ELMo server failed (attempt $attempt): ${e.getMessage}")
+          Thread.sleep(100*attempt)
+          attempt += 1
+        case Failure(e) =>
+          throw e
+      }
     }
-    _memo_elmo_service
+    null
   }
 
-  def endServer() : Unit = {
+  /**
+    * JSON with the counters and latency histograms of the server (see get_stats in the thrift file) ;
+    * None if this process didn't use the server
+    */
+  def serverStats() : Option[String] = synchronized{
+    if(_memo_elmo_service == null)
+      None
+    else
+      Try(_memo_elmo_service.get_stats()).toOption
+  }
+
+  def endServer() : Unit = synchronized{
+    if(_prefetch_tsocket != null){
+      _prefetch_tsocket.close()
+      _prefetch_tsocket = null
+      _prefetch_service = null
+    }
     if(_memo_elmo_service != null){
-      _memo_elmo_service.quit()
+      if(daemonMode)
+        Try(_memo_elmo_service.detach_client())
+      else
+        _memo_elmo_service.quit()
       _memo_elmo_service = null
     }
     if(_tsocket != null){
       _tsocket.close()
       _tsocket = null
     }
+    // a server started later has other rings
+    shmMappings.synchronized{
+      shmMappings.clear()
+    }
   }
 
   override def finalize(): Unit = {
@@ -172,7 +502,40 @@ object SequenceEmbedderELMo{
 
 }
 
-class SequenceEmbedderELMo(config: SequenceEmbedderELMoConfig)(implicit model: ParameterCollection) extends SequenceEmbedderGeneral[String] {
+/**
+  * the vectors of the words pushed so far are kept so that the vector of any position can be asked for again
+  */
+class ELMoSession private[embedder] (service:SequenceEmbedderELMo_Service.Client, emb_type:String, projection:String) {
+
+  private val id = service.open_session(emb_type, projection)
+
+  private val words = ArrayBuffer[String]()
+  private val vectors = ArrayBuffer[Array[Float]]()
+
+  def push(newWords:List[String]) : List[Array[Float]] = {
+    val res = SequenceEmbedderELMo.unpackMatrix(service.push_tokens(id, newWords.asJava, "float32"))
+    words ++= newWords
+    vectors ++= res
+    res
+  }
+
+  def size : Int = words.size
+
+  /**
+    * the vector of the word at position ; the next position pushes the word
+    */
+  def vector(position:Int, word:String) : Array[Float] = {
+    if(position == words.size)
+      push(List(word))
+    assert(position < words.size && words(position) == word, s"ELMo session has ${words.mkString(" ")} but got $word at position $position")
+    vectors(position)
+  }
+
+  def close() : Unit = Try(service.close_session(id))
+
+}
+
+class SequenceEmbedderELMo(config: SequenceEmbedderELMoConfig)(implicit model: ParameterCollection) extends SequenceEmbedderIncremental[String] {
 
   config.elmoPointer.content = this
 
@@ -180,9 +543,19 @@ class SequenceEmbedderELMo(config: SequenceEmbedderELMoConfig)(implicit model: P
 
   private val outDim = config.outDim
   private val embeddingType = config.embeddingType
+  private val precision = config.precision
 
+  // absolute because the server may run in another directory
+  private var projection : String = if(config.projection == null) null else new File(config.projection).getAbsolutePath
+
+  assert(projection == null || outDim != ELMoDim, "projecting to the ELMo dimension saves nothing")
+
+  // the vectors of precomputed stores are full ELMo vectors ; they get the projection of the server when they are decoded
+  private var storeProjection : ELMoProjection = if(projection == null) null else new ELMoProjection(projection)
+
+  // without compression and with a projection the model is trained on the projected vectors
   private val compressor : Layer = if(config.withoutCompression){
-    assert(outDim == ELMoDim)
+    assert(outDim == ELMoDim || projection != null)
     null
   }else{
     SingleLayer.compressor(ELMoDim, outDim)
@@ -190,23 +563,79 @@ class SequenceEmbedderELMo(config: SequenceEmbedderELMoConfig)(implicit model: P
 
   private def compress(x:Expression) :Expression = if(compressor == null) x else compressor(x)
 
-  var cachedEmbeddings : MutMap[List[String], List[Array[Float]]] = MutMap()
+  /**
+    * from now on the server projects the vectors (see elmo_projection.py) and the compressor is skipped ;
+    * for a model trained without a projection it should be the one exported from its compressor
+    */
+  def useProjection(dir:String) : Unit = {
+    projection = new File(dir).getAbsolutePath
+    assert(outDim != ELMoDim, "projecting to the ELMo dimension saves nothing")
+    storeProjection = new ELMoProjection(projection)
+    prefetched.clear()
+    lastKCache = Nil
+  }
+
+  /**
+    * writes the compressor as a projection directory for elmo_embed_server.py
+    */
+  def exportProjection(dir:String) : Unit = {
+    if(compressor == null)
+      throw new Exception("this ELMo embedder has no compressor to export")
+    // meta.json is removed first and written last (see ELMoEmbeddingStore)
+    new File(dir).mkdirs()
+    new File(s"$dir/meta.json").delete()
+    val W = compressor.asInstanceOf[SingleLayer].weights.values()
+    SequenceEmbedderELMo.writeNpy(s"$dir/W.npy", outDim, ELMoDim, W.toSeq)
+    val pw = new PrintWriter(s"$dir/meta.json.tmp")
+    pw.println(s"""{"emb_type": "$embeddingType", "in_dim": $ELMoDim, "out_dim": $outDim, "normalize": ${config.normalize}, "source": "model"}""")
+    pw.close()
+    Files.move(Paths.get(s"$dir/meta.json.tmp"), Paths.get(s"$dir/meta.json"), StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE)
+  }
+
+  // kept encoded in the configured precision and decoded only in transduce
+  var cachedEmbeddings : MutMap[List[String], ELMoCompactEmbedding] = MutMap()
 
   // override def precomputeEmbeddings(sents:Iterable[List[String]]) : Unit = {}
   override def precomputeEmbeddings(sents:Iterable[List[String]]) : Unit =
     for((sent, emb) <- sents zip embedSents(sents))
       cachedEmbeddings(sent) = emb
 
+  // embeddings that were requested in the background and were not used yet
+  private val prefetched = MutMap[List[String], Future[ELMoCompactEmbedding]]()
+
+  override def prefetchEmbeddings(sents:Iterable[List[String]]) : Unit = {
+    val toFetch = sents.filterNot(sent => cachedEmbeddings.contains(sent) || prefetched.contains(sent)).toList.distinct
+    if(toFetch.nonEmpty && SequenceEmbedderELMo.canPrefetch){
+      val batch = SequenceEmbedderELMo.prefetch(embeddingType, toFetch, precision, projection).map(_.toVector)(SequenceEmbedderELMo.prefetchContext)
+      for((sent, i) <- toFetch.zipWithIndex)
+        prefetched(sent) = batch.map(_(i))(SequenceEmbedderELMo.prefetchContext)
+    }
+  }
+
+  // waits for the prefetch of the sentence if there is one ; a failed prefetch is embedded again synchronously
+  private def takePrefetched(sent:List[String]) : Option[ELMoCompactEmbedding] =
+    prefetched.remove(sent).flatMap{ pending =>
+      Try(Await.result(pending, Duration.Inf)).toOption
+    }
+
+  private def decode(emb:ELMoCompactEmbedding) : List[Array[Float]] = {
+    val vectors = emb.decode().map(EmbedderStandard.fixEmbedding)
+    if(storeProjection != null && emb.dim == ELMoDim)
+      vectors.map(storeProjection(_))
+    else
+      vectors
+  }
+
   private var lastKCache = List[(List[String], List[Array[Float]])]()
   private val lastKToCache = 3
 
   override def transduce(xs: List[String]): List[Expression] = {
     val vectors = if(cachedEmbeddings contains xs) {
-      cachedEmbeddings(xs)
+      decode(cachedEmbeddings(xs))
     }else if(lastKCache.exists(_._1 == xs)){
       lastKCache.find(_._1 == xs).get._2
     }else{
-      embedSent(xs)
+      decode(takePrefetched(xs).getOrElse(embedSent(xs)))
     }
     if(lastKToCache>0){
       val rest = if(lastKCache.size >= lastKToCache){
@@ -216,11 +645,46 @@ class SequenceEmbedderELMo(config: SequenceEmbedderELMoConfig)(implicit model: P
       }
       lastKCache = (xs, vectors) :: rest
     }
-    vectors.map{x =>
+    vectors.map(toExpression)
+  }
+
+  private def toExpression(x:Array[Float]) : Expression =
+    if(x.length == ELMoDim && (compressor != null || ELMoDim == outDim)){
       val xExp = vector(x)
       val xNormalized = if(config.normalize) xExp/(Expression.l2Norm(xExp)+1e-10) else xExp
       compress(dropout(xNormalized, config.dropout))
+    }else if(projection != null && x.length == outDim){
+      // normalized and compressed by the server
+      dropout(vector(x), config.dropout)
+    }else{
+      throw new Exception(s"ELMo vector of dimension ${x.length} can't be used with ELMoDim $ELMoDim, outDim $outDim and projection $projection")
     }
+
+  private var session : ELMoSession = _
+
+  // forward-top and local don't depend on the words that follow
+  def isIncremental : Boolean = embeddingType == "forward-top" || embeddingType == "local"
+
+  /**
+    * embeds a sentence word by word through a server session so that a word can be parsed as soon as it arrives ;
+    * only for forward-top and local which don't depend on the words that follow ; all states of a sentence share
+    * the session so a beam can continue from any of them (RevealingModel.embedWords)
+    */
+  override def initState() : IncrementalEmbedderState[String] = {
+    assert(isIncremental, s"ELMo $embeddingType can't be computed incrementally")
+    if(session != null)
+      session.close()
+    session = SequenceEmbedderELMo.openSession(embeddingType, projection)
+    new SessionState(session, 0)
+  }
+
+  private class SessionState(session:ELMoSession, position:Int) extends IncrementalEmbedderState[String]{
+
+    override def nextStateAndEmbed(x: String): (IncrementalEmbedderState[String], Expression) = {
+      val vector = EmbedderStandard.fixEmbedding(session.vector(position, x))
+      (new SessionState(session, position+1), toExpression(vector))
+    }
+
   }
 
   override def zeros: Expression = Expression.zeros(outDim)
@@ -234,20 +698,22 @@ class SequenceEmbedderELMo(config: SequenceEmbedderELMoConfig)(implicit model: P
     cachedEmbeddings = MutMap()
   }
 
-  private def embedSent(sent:List[String]) : List[Array[Float]] = {
+  private def embedSent(sent:List[String]) : ELMoCompactEmbedding = {
     embedSents(List(sent)).head
   }
 
-  private def embedSents(sents:Iterable[List[String]]) : Iterable[List[Array[Float]]] = {
+  private def embedSents(sents:Iterable[List[String]]) : Iterable[ELMoCompactEmbedding] = {
+    for(sent <- sents; emb <- takePrefetched(sent))
+      cachedEmbeddings(sent) = emb
     val (processed, toProcess) = sents.zipWithIndex.partition{case (sent, _) => cachedEmbeddings.contains(sent)}
     val toProcessSents = toProcess.map(_._1).toList
-    val allEmbs = SequenceEmbedderELMo.embed_sents(embeddingType, toProcessSents)
+    val allEmbs = SequenceEmbedderELMo.embed_sents_compact(embeddingType, toProcessSents, precision, projection)
     val toProcessResult = (toProcess zip allEmbs).map{case ((_, i), emb) => (emb, i)}
     val processedResult = processed.map{case (sent, i) => (cachedEmbeddings(sent), i)}
     val result = (toProcessResult ++ processedResult).
       toList.
       sortBy(_._2).
-      map( _._1.map(EmbedderStandard.fixEmbedding) )
+      map( _._1 )
     if(! (sents zip result).forall(x => x._1.size == x._2.size)){
       throw new Exception("number of words and the number of precomputed embeddings doesn't match ; need to recompute them?")
     }
@@ -16,8 +16,24 @@ public class SequenceEmbedderELMo_Service {
 
     public java.util.List<java.util.List<java.util.List<java.lang.Double>>> embed_sents(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type) throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException;
 
+    public java.util.List<java.nio.ByteBuffer> embed_sents_packed(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String dtype, java.lang.String projection) throws SequenceEmbedderELMo_UnknownEmbType, SequenceEmbedderELMo_BadArgument, org.apache.thrift.TException;
+
+    public java.nio.ByteBuffer embed_sents_shm(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String projection) throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException;
+
+    public java.lang.String open_session(java.lang.String emb_type, java.lang.String projection) throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException;
+
+    public java.nio.ByteBuffer push_tokens(java.lang.String session, java.util.List<java.lang.String> tokens, java.lang.String dtype) throws SequenceEmbedderELMo_UnknownSession, SequenceEmbedderELMo_BadArgument, org.apache.thrift.TException;
+
+    public void close_session(java.lang.String session) throws org.apache.thrift.TException;
+
     public void quit() throws org.apache.thrift.TException;
 
+    public void attach_client() throws org.apache.thrift.TException;
+
+    public void detach_client() throws org.apache.thrift.TException;
+
+    public java.lang.String get_stats() throws org.apache.thrift.TException;
+
   }
 
   public interface AsyncIface {
@@ -26,8 +42,24 @@ public class SequenceEmbedderELMo_Service {
 
     public void embed_sents(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<java.util.List<java.lang.Double>>>> resultHandler) throws org.apache.thrift.TException;
 
+    public void embed_sents_packed(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String dtype, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.nio.ByteBuffer>> resultHandler) throws org.apache.thrift.TException;
+
+    public void embed_sents_shm(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler) throws org.apache.thrift.TException;
+
+    public void open_session(java.lang.String emb_type, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException;
+
+    public void push_tokens(java.lang.String session, java.util.List<java.lang.String> tokens, java.lang.String dtype, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler) throws org.apache.thrift.TException;
+
+    public void close_session(java.lang.String session, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException;
+
     public void quit(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException;
 
+    public void attach_client(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException;
+
+    public void detach_client(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException;
+
+    public void get_stats(org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException;
+
   }
 
   public static class Client extends org.apache.thrift.TServiceClient implements Iface {
@@ -96,6 +128,144 @@ public class SequenceEmbedderELMo_Service {
       throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "embed_sents failed: unknown result");
     }
 
+    public java.util.List<java.nio.ByteBuffer> embed_sents_packed(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String dtype, java.lang.String projection) throws SequenceEmbedderELMo_UnknownEmbType, SequenceEmbedderELMo_BadArgument, org.apache.thrift.TException
+    {
+      send_embed_sents_packed(sents, emb_type, dtype, projection);
+      return recv_embed_sents_packed();
+    }
+
+    public void send_embed_sents_packed(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String dtype, java.lang.String projection) throws org.apache.thrift.TException
+    {
+      embed_sents_packed_args args = new embed_sents_packed_args();
+      args.setSents(sents);
+      args.setEmb_type(emb_type);
+      args.setDtype(dtype);
+      args.setProjection(projection);
+      sendBase("embed_sents_packed", args);
+    }
+
+    public java.util.List<java.nio.ByteBuffer> recv_embed_sents_packed() throws SequenceEmbedderELMo_UnknownEmbType, SequenceEmbedderELMo_BadArgument, org.apache.thrift.TException
+    {
+      embed_sents_packed_result result = new embed_sents_packed_result();
+      receiveBase(result, "embed_sents_packed");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.e != null) {
+        throw result.e;
+      }
+      if (result.b != null) {
+        throw result.b;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "embed_sents_packed failed: unknown result");
+    }
+
+    public java.nio.ByteBuffer embed_sents_shm(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String projection) throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException
+    {
+      send_embed_sents_shm(sents, emb_type, projection);
+      return recv_embed_sents_shm();
+    }
+
+    public void send_embed_sents_shm(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String projection) throws org.apache.thrift.TException
+    {
+      embed_sents_shm_args args = new embed_sents_shm_args();
+      args.setSents(sents);
+      args.setEmb_type(emb_type);
+      args.setProjection(projection);
+      sendBase("embed_sents_shm", args);
+    }
+
+    public java.nio.ByteBuffer recv_embed_sents_shm() throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException
+    {
+      embed_sents_shm_result result = new embed_sents_shm_result();
+      receiveBase(result, "embed_sents_shm");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.e != null) {
+        throw result.e;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "embed_sents_shm failed: unknown result");
+    }
+
+    public java.lang.String open_session(java.lang.String emb_type, java.lang.String projection) throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException
+    {
+      send_open_session(emb_type, projection);
+      return recv_open_session();
+    }
+
+    public void send_open_session(java.lang.String emb_type, java.lang.String projection) throws org.apache.thrift.TException
+    {
+      open_session_args args = new open_session_args();
+      args.setEmb_type(emb_type);
+      args.setProjection(projection);
+      sendBase("open_session", args);
+    }
+
+    public java.lang.String recv_open_session() throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException
+    {
+      open_session_result result = new open_session_result();
+      receiveBase(result, "open_session");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.e != null) {
+        throw result.e;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "open_session failed: unknown result");
+    }
+
+    public java.nio.ByteBuffer push_tokens(java.lang.String session, java.util.List<java.lang.String> tokens, java.lang.String dtype) throws SequenceEmbedderELMo_UnknownSession, SequenceEmbedderELMo_BadArgument, org.apache.thrift.TException
+    {
+      send_push_tokens(session, tokens, dtype);
+      return recv_push_tokens();
+    }
+
+    public void send_push_tokens(java.lang.String session, java.util.List<java.lang.String> tokens, java.lang.String dtype) throws org.apache.thrift.TException
+    {
+      push_tokens_args args = new push_tokens_args();
+      args.setSession(session);
+      args.setTokens(tokens);
+      args.setDtype(dtype);
+      sendBase("push_tokens", args);
+    }
+
+    public java.nio.ByteBuffer recv_push_tokens() throws SequenceEmbedderELMo_UnknownSession, SequenceEmbedderELMo_BadArgument, org.apache.thrift.TException
+    {
+      push_tokens_result result = new push_tokens_result();
+      receiveBase(result, "push_tokens");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.e != null) {
+        throw result.e;
+      }
+      if (result.b != null) {
+        throw result.b;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "push_tokens failed: unknown result");
+    }
+
+    public void close_session(java.lang.String session) throws org.apache.thrift.TException
+    {
+      send_close_session(session);
+      recv_close_session();
+    }
+
+    public void send_close_session(java.lang.String session) throws org.apache.thrift.TException
+    {
+      close_session_args args = new close_session_args();
+      args.setSession(session);
+      sendBase("close_session", args);
+    }
+
+    public void recv_close_session() throws org.apache.thrift.TException
+    {
+      close_session_result result = new close_session_result();
+      receiveBase(result, "close_session");
+      return;
+    }
+
     public void quit() throws org.apache.thrift.TException
     {
       send_quit();
@@ -115,6 +285,66 @@ public class SequenceEmbedderELMo_Service {
       return;
     }
 
+    public void attach_client() throws org.apache.thrift.TException
+    {
+      send_attach_client();
+      recv_attach_client();
+    }
+
+    public void send_attach_client() throws org.apache.thrift.TException
+    {
+      attach_client_args args = new attach_client_args();
+      sendBase("attach_client", args);
+    }
+
+    public void recv_attach_client() throws org.apache.thrift.TException
+    {
+      attach_client_result result = new attach_client_result();
+      receiveBase(result, "attach_client");
+      return;
+    }
+
+    public void detach_client() throws org.apache.thrift.TException
+    {
+      send_detach_client();
+      recv_detach_client();
+    }
+
+    public void send_detach_client() throws org.apache.thrift.TException
+    {
+      detach_client_args args = new detach_client_args();
+      sendBase("detach_client", args);
+    }
+
+    public void recv_detach_client() throws org.apache.thrift.TException
+    {
+      detach_client_result result = new detach_client_result();
+      receiveBase(result, "detach_client");
+      return;
+    }
+
+    public java.lang.String get_stats() throws org.apache.thrift.TException
+    {
+      send_get_stats();
+      return recv_get_stats();
+    }
+
+    public void send_get_stats() throws org.apache.thrift.TException
+    {
+      get_stats_args args = new get_stats_args();
+      sendBase("get_stats", args);
+    }
+
+    public java.lang.String recv_get_stats() throws org.apache.thrift.TException
+    {
+      get_stats_result result = new get_stats_result();
+      receiveBase(result, "get_stats");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "get_stats failed: unknown result");
+    }
+
   }
   public static class AsyncClient extends org.apache.thrift.async.TAsyncClient implements AsyncIface {
     public static class Factory implements org.apache.thrift.async.TAsyncClientFactory<AsyncClient> {
@@ -197,153 +427,334 @@ public class SequenceEmbedderELMo_Service {
       }
     }
 
-    public void quit(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+    public void embed_sents_packed(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String dtype, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.nio.ByteBuffer>> resultHandler) throws org.apache.thrift.TException {
       checkReady();
-      quit_call method_call = new quit_call(resultHandler, this, ___protocolFactory, ___transport);
+      embed_sents_packed_call method_call = new embed_sents_packed_call(sents, emb_type, dtype, projection, resultHandler, this, ___protocolFactory, ___transport);
       this.___currentMethod = method_call;
       ___manager.call(method_call);
     }
 
-    public static class quit_call extends org.apache.thrift.async.TAsyncMethodCall<Void> {
-      public quit_call(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+    public static class embed_sents_packed_call extends org.apache.thrift.async.TAsyncMethodCall<java.util.List<java.nio.ByteBuffer>> {
+      private java.util.List<java.util.List<java.lang.String>> sents;
+      private java.lang.String emb_type;
+      private java.lang.String dtype;
+      private java.lang.String projection;
+      public embed_sents_packed_call(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String dtype, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.nio.ByteBuffer>> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
         super(client, protocolFactory, transport, resultHandler, false);
+        this.sents = sents;
+        this.emb_type = emb_type;
+        this.dtype = dtype;
+        this.projection = projection;
       }
 
       public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
-        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("quit", org.apache.thrift.protocol.TMessageType.CALL, 0));
-        quit_args args = new quit_args();
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("embed_sents_packed", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        embed_sents_packed_args args = new embed_sents_packed_args();
+        args.setSents(sents);
+        args.setEmb_type(emb_type);
+        args.setDtype(dtype);
+        args.setProjection(projection);
         args.write(prot);
         prot.writeMessageEnd();
       }
 
-      public Void getResult() throws org.apache.thrift.TException {
+      public java.util.List<java.nio.ByteBuffer> getResult() throws SequenceEmbedderELMo_UnknownEmbType, SequenceEmbedderELMo_BadArgument, org.apache.thrift.TException {
         if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
           throw new java.lang.IllegalStateException("Method call not finished!");
         }
         org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
         org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
-        return null;
+        return (new Client(prot)).recv_embed_sents_packed();
       }
     }
 
-  }
-
-  public static class Processor<I extends Iface> extends org.apache.thrift.TBaseProcessor<I> implements org.apache.thrift.TProcessor {
-    private static final org.slf4j.Logger _LOGGER = org.slf4j.LoggerFactory.getLogger(Processor.class.getName());
-    public Processor(I iface) {
-      super(iface, getProcessMap(new java.util.HashMap<java.lang.String, org.apache.thrift.ProcessFunction<I, ? extends org.apache.thrift.TBase>>()));
-    }
-
-    protected Processor(I iface, java.util.Map<java.lang.String, org.apache.thrift.ProcessFunction<I, ? extends org.apache.thrift.TBase>> processMap) {
-      super(iface, getProcessMap(processMap));
-    }
-
-    private static <I extends Iface> java.util.Map<java.lang.String,  org.apache.thrift.ProcessFunction<I, ? extends org.apache.thrift.TBase>> getProcessMap(java.util.Map<java.lang.String, org.apache.thrift.ProcessFunction<I, ? extends  org.apache.thrift.TBase>> processMap) {
-      processMap.put("start_elmo", new start_elmo());
-      processMap.put("embed_sents", new embed_sents());
-      processMap.put("quit", new quit());
-      return processMap;
+    public void embed_sents_shm(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      embed_sents_shm_call method_call = new embed_sents_shm_call(sents, emb_type, projection, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
     }
 
-    public static class start_elmo<I extends Iface> extends org.apache.thrift.ProcessFunction<I, start_elmo_args> {
-      public start_elmo() {
-        super("start_elmo");
+    public static class embed_sents_shm_call extends org.apache.thrift.async.TAsyncMethodCall<java.nio.ByteBuffer> {
+      private java.util.List<java.util.List<java.lang.String>> sents;
+      private java.lang.String emb_type;
+      private java.lang.String projection;
+      public embed_sents_shm_call(java.util.List<java.util.List<java.lang.String>> sents, java.lang.String emb_type, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.sents = sents;
+        this.emb_type = emb_type;
+        this.projection = projection;
       }
 
-      public start_elmo_args getEmptyArgsInstance() {
-        return new start_elmo_args();
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("embed_sents_shm", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        embed_sents_shm_args args = new embed_sents_shm_args();
+        args.setSents(sents);
+        args.setEmb_type(emb_type);
+        args.setProjection(projection);
+        args.write(prot);
+        prot.writeMessageEnd();
       }
 
-      protected boolean isOneway() {
-        return false;
+      public java.nio.ByteBuffer getResult() throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_embed_sents_shm();
       }
+    }
 
-      @Override
-      protected boolean handleRuntimeExceptions() {
-        return false;
-      }
+    public void open_session(java.lang.String emb_type, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      open_session_call method_call = new open_session_call(emb_type, projection, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
 
-      public start_elmo_result getResult(I iface, start_elmo_args args) throws org.apache.thrift.TException {
-        start_elmo_result result = new start_elmo_result();
-        iface.start_elmo();
-        return result;
+    public static class open_session_call extends org.apache.thrift.async.TAsyncMethodCall<java.lang.String> {
+      private java.lang.String emb_type;
+      private java.lang.String projection;
+      public open_session_call(java.lang.String emb_type, java.lang.String projection, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.emb_type = emb_type;
+        this.projection = projection;
       }
-    }
 
-    public static class embed_sents<I extends Iface> extends org.apache.thrift.ProcessFunction<I, embed_sents_args> {
-      public embed_sents() {
-        super("embed_sents");
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("open_session", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        open_session_args args = new open_session_args();
+        args.setEmb_type(emb_type);
+        args.setProjection(projection);
+        args.write(prot);
+        prot.writeMessageEnd();
       }
 
-      public embed_sents_args getEmptyArgsInstance() {
-        return new embed_sents_args();
+      public java.lang.String getResult() throws SequenceEmbedderELMo_UnknownEmbType, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_open_session();
       }
+    }
 
-      protected boolean isOneway() {
-        return false;
+    public void push_tokens(java.lang.String session, java.util.List<java.lang.String> tokens, java.lang.String dtype, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      push_tokens_call method_call = new push_tokens_call(session, tokens, dtype, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class push_tokens_call extends org.apache.thrift.async.TAsyncMethodCall<java.nio.ByteBuffer> {
+      private java.lang.String session;
+      private java.util.List<java.lang.String> tokens;
+      private java.lang.String dtype;
+      public push_tokens_call(java.lang.String session, java.util.List<java.lang.String> tokens, java.lang.String dtype, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.session = session;
+        this.tokens = tokens;
+        this.dtype = dtype;
       }
 
-      @Override
-      protected boolean handleRuntimeExceptions() {
-        return false;
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("push_tokens", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        push_tokens_args args = new push_tokens_args();
+        args.setSession(session);
+        args.setTokens(tokens);
+        args.setDtype(dtype);
+        args.write(prot);
+        prot.writeMessageEnd();
       }
 
-      public embed_sents_result getResult(I iface, embed_sents_args args) throws org.apache.thrift.TException {
-        embed_sents_result result = new embed_sents_result();
-        try {
-          result.success = iface.embed_sents(args.sents, args.emb_type);
-        } catch (SequenceEmbedderELMo_UnknownEmbType e) {
-          result.e = e;
+      public java.nio.ByteBuffer getResult() throws SequenceEmbedderELMo_UnknownSession, SequenceEmbedderELMo_BadArgument, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
         }
-        return result;
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_push_tokens();
       }
     }
 
-    public static class quit<I extends Iface> extends org.apache.thrift.ProcessFunction<I, quit_args> {
-      public quit() {
-        super("quit");
-      }
+    public void close_session(java.lang.String session, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      close_session_call method_call = new close_session_call(session, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
 
-      public quit_args getEmptyArgsInstance() {
-        return new quit_args();
+    public static class close_session_call extends org.apache.thrift.async.TAsyncMethodCall<Void> {
+      private java.lang.String session;
+      public close_session_call(java.lang.String session, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.session = session;
       }
 
-      protected boolean isOneway() {
-        return false;
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("close_session", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        close_session_args args = new close_session_args();
+        args.setSession(session);
+        args.write(prot);
+        prot.writeMessageEnd();
       }
 
-      @Override
-      protected boolean handleRuntimeExceptions() {
-        return false;
+      public Void getResult() throws org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return null;
       }
+    }
 
-      public quit_result getResult(I iface, quit_args args) throws org.apache.thrift.TException {
-        quit_result result = new quit_result();
-        iface.quit();
-        return result;
+    public void quit(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      quit_call method_call = new quit_call(resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class quit_call extends org.apache.thrift.async.TAsyncMethodCall<Void> {
+      public quit_call(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("quit", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        quit_args args = new quit_args();
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public Void getResult() throws org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return null;
+      }
+    }
+
+    public void attach_client(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      attach_client_call method_call = new attach_client_call(resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class attach_client_call extends org.apache.thrift.async.TAsyncMethodCall<Void> {
+      public attach_client_call(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("attach_client", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        attach_client_args args = new attach_client_args();
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public Void getResult() throws org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return null;
+      }
+    }
+
+    public void detach_client(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      detach_client_call method_call = new detach_client_call(resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class detach_client_call extends org.apache.thrift.async.TAsyncMethodCall<Void> {
+      public detach_client_call(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("detach_client", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        detach_client_args args = new detach_client_args();
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public Void getResult() throws org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return null;
+      }
+    }
+
+    public void get_stats(org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      get_stats_call method_call = new get_stats_call(resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class get_stats_call extends org.apache.thrift.async.TAsyncMethodCall<java.lang.String> {
+      public get_stats_call(org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("get_stats", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        get_stats_args args = new get_stats_args();
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public java.lang.String getResult() throws org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_get_stats();
       }
     }
 
   }
 
-  public static class AsyncProcessor<I extends AsyncIface> extends org.apache.thrift.TBaseAsyncProcessor<I> {
-    private static final org.slf4j.Logger _LOGGER = org.slf4j.LoggerFactory.getLogger(AsyncProcessor.class.getName());
-    public AsyncProcessor(I iface) {
-      super(iface, getProcessMap(new java.util.HashMap<java.lang.String, org.apache.thrift.AsyncProcessFunction<I, ? extends org.apache.thrift.TBase, ?>>()));
+  public static class Processor<I extends Iface> extends org.apache.thrift.TBaseProcessor<I> implements org.apache.thrift.TProcessor {
+    private static final org.slf4j.Logger _LOGGER = org.slf4j.LoggerFactory.getLogger(Processor.class.getName());
+    public Processor(I iface) {
+      super(iface, getProcessMap(new java.util.HashMap<java.lang.String, org.apache.thrift.ProcessFunction<I, ? extends org.apache.thrift.TBase>>()));
     }
 
-    protected AsyncProcessor(I iface, java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase, ?>> processMap) {
+    protected Processor(I iface, java.util.Map<java.lang.String, org.apache.thrift.ProcessFunction<I, ? extends org.apache.thrift.TBase>> processMap) {
       super(iface, getProcessMap(processMap));
     }
 
-    private static <I extends AsyncIface> java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase,?>> getProcessMap(java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase, ?>> processMap) {
+    private static <I extends Iface> java.util.Map<java.lang.String,  org.apache.thrift.ProcessFunction<I, ? extends org.apache.thrift.TBase>> getProcessMap(java.util.Map<java.lang.String, org.apache.thrift.ProcessFunction<I, ? extends  org.apache.thrift.TBase>> processMap) {
       processMap.put("start_elmo", new start_elmo());
       processMap.put("embed_sents", new embed_sents());
+      processMap.put("embed_sents_packed", new embed_sents_packed());
+      processMap.put("embed_sents_shm", new embed_sents_shm());
+      processMap.put("open_session", new open_session());
+      processMap.put("push_tokens", new push_tokens());
+      processMap.put("close_session", new close_session());
       processMap.put("quit", new quit());
+      processMap.put("attach_client", new attach_client());
+      processMap.put("detach_client", new detach_client());
+      processMap.put("get_stats", new get_stats());
       return processMap;
     }
 
-    public static class start_elmo<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, start_elmo_args, Void> {
+    public static class start_elmo<I extends Iface> extends org.apache.thrift.ProcessFunction<I, start_elmo_args> {
       public start_elmo() {
         super("start_elmo");
       }
@@ -352,58 +763,23 @@ public class SequenceEmbedderELMo_Service {
         return new start_elmo_args();
       }
 
-      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
-        final org.apache.thrift.AsyncProcessFunction fcall = this;
-        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
-          public void onComplete(Void o) {
-            start_elmo_result result = new start_elmo_result();
-            try {
-              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
-            } catch (org.apache.thrift.transport.TTransportException e) {
-              _LOGGER.error("TTransportException writing to internal frame buffer", e);
-              fb.close();
-            } catch (java.lang.Exception e) {
-              _LOGGER.error("Exception writing to internal frame buffer", e);
-              onError(e);
-            }
-          }
-          public void onError(java.lang.Exception e) {
-            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
-            org.apache.thrift.TSerializable msg;
-            start_elmo_result result = new start_elmo_result();
-            if (e instanceof org.apache.thrift.transport.TTransportException) {
-              _LOGGER.error("TTransportException inside handler", e);
-              fb.close();
-              return;
-            } else if (e instanceof org.apache.thrift.TApplicationException) {
-              _LOGGER.error("TApplicationException inside handler", e);
-              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
-              msg = (org.apache.thrift.TApplicationException)e;
-            } else {
-              _LOGGER.error("Exception inside handler", e);
-              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
-              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
-            }
-            try {
-              fcall.sendResponse(fb,msg,msgType,seqid);
-            } catch (java.lang.Exception ex) {
-              _LOGGER.error("Exception writing to internal frame buffer", ex);
-              fb.close();
-            }
-          }
-        };
+      protected boolean isOneway() {
+        return false;
       }
 
-      protected boolean isOneway() {
+      @Override
+      protected boolean handleRuntimeExceptions() {
         return false;
       }
 
-      public void start(I iface, start_elmo_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
-        iface.start_elmo(resultHandler);
+      public start_elmo_result getResult(I iface, start_elmo_args args) throws org.apache.thrift.TException {
+        start_elmo_result result = new start_elmo_result();
+        iface.start_elmo();
+        return result;
       }
     }
 
-    public static class embed_sents<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, embed_sents_args, java.util.List<java.util.List<java.util.List<java.lang.Double>>>> {
+    public static class embed_sents<I extends Iface> extends org.apache.thrift.ProcessFunction<I, embed_sents_args> {
       public embed_sents() {
         super("embed_sents");
       }
@@ -412,90 +788,326 @@ public class SequenceEmbedderELMo_Service {
         return new embed_sents_args();
       }
 
-      public org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<java.util.List<java.lang.Double>>>> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
-        final org.apache.thrift.AsyncProcessFunction fcall = this;
-        return new org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<java.util.List<java.lang.Double>>>>() { 
-          public void onComplete(java.util.List<java.util.List<java.util.List<java.lang.Double>>> o) {
-            embed_sents_result result = new embed_sents_result();
-            result.success = o;
-            try {
-              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
-            } catch (org.apache.thrift.transport.TTransportException e) {
-              _LOGGER.error("TTransportException writing to internal frame buffer", e);
-              fb.close();
-            } catch (java.lang.Exception e) {
-              _LOGGER.error("Exception writing to internal frame buffer", e);
-              onError(e);
-            }
-          }
-          public void onError(java.lang.Exception e) {
-            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
-            org.apache.thrift.TSerializable msg;
-            embed_sents_result result = new embed_sents_result();
-            if (e instanceof SequenceEmbedderELMo_UnknownEmbType) {
-              result.e = (SequenceEmbedderELMo_UnknownEmbType) e;
-              result.setEIsSet(true);
-              msg = result;
-            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
-              _LOGGER.error("TTransportException inside handler", e);
-              fb.close();
-              return;
-            } else if (e instanceof org.apache.thrift.TApplicationException) {
-              _LOGGER.error("TApplicationException inside handler", e);
-              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
-              msg = (org.apache.thrift.TApplicationException)e;
-            } else {
-              _LOGGER.error("Exception inside handler", e);
-              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
-              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
-            }
-            try {
-              fcall.sendResponse(fb,msg,msgType,seqid);
-            } catch (java.lang.Exception ex) {
-              _LOGGER.error("Exception writing to internal frame buffer", ex);
-              fb.close();
-            }
-          }
-        };
+      protected boolean isOneway() {
+        return false;
       }
 
-      protected boolean isOneway() {
+      @Override
+      protected boolean handleRuntimeExceptions() {
         return false;
       }
 
-      public void start(I iface, embed_sents_args args, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<java.util.List<java.lang.Double>>>> resultHandler) throws org.apache.thrift.TException {
-        iface.embed_sents(args.sents, args.emb_type,resultHandler);
+      public embed_sents_result getResult(I iface, embed_sents_args args) throws org.apache.thrift.TException {
+        embed_sents_result result = new embed_sents_result();
+        try {
+          result.success = iface.embed_sents(args.sents, args.emb_type);
+        } catch (SequenceEmbedderELMo_UnknownEmbType e) {
+          result.e = e;
+        }
+        return result;
       }
     }
 
-    public static class quit<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, quit_args, Void> {
-      public quit() {
-        super("quit");
+    public static class embed_sents_packed<I extends Iface> extends org.apache.thrift.ProcessFunction<I, embed_sents_packed_args> {
+      public embed_sents_packed() {
+        super("embed_sents_packed");
       }
 
-      public quit_args getEmptyArgsInstance() {
-        return new quit_args();
+      public embed_sents_packed_args getEmptyArgsInstance() {
+        return new embed_sents_packed_args();
       }
 
-      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
-        final org.apache.thrift.AsyncProcessFunction fcall = this;
-        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
-          public void onComplete(Void o) {
-            quit_result result = new quit_result();
-            try {
-              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
-            } catch (org.apache.thrift.transport.TTransportException e) {
-              _LOGGER.error("TTransportException writing to internal frame buffer", e);
-              fb.close();
-            } catch (java.lang.Exception e) {
-              _LOGGER.error("Exception writing to internal frame buffer", e);
-              onError(e);
-            }
-          }
-          public void onError(java.lang.Exception e) {
-            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
-            org.apache.thrift.TSerializable msg;
-            quit_result result = new quit_result();
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public embed_sents_packed_result getResult(I iface, embed_sents_packed_args args) throws org.apache.thrift.TException {
+        embed_sents_packed_result result = new embed_sents_packed_result();
+        try {
+          result.success = iface.embed_sents_packed(args.sents, args.emb_type, args.dtype, args.projection);
+        } catch (SequenceEmbedderELMo_UnknownEmbType e) {
+          result.e = e;
+        } catch (SequenceEmbedderELMo_BadArgument b) {
+          result.b = b;
+        }
+        return result;
+      }
+    }
+
+    public static class embed_sents_shm<I extends Iface> extends org.apache.thrift.ProcessFunction<I, embed_sents_shm_args> {
+      public embed_sents_shm() {
+        super("embed_sents_shm");
+      }
+
+      public embed_sents_shm_args getEmptyArgsInstance() {
+        return new embed_sents_shm_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public embed_sents_shm_result getResult(I iface, embed_sents_shm_args args) throws org.apache.thrift.TException {
+        embed_sents_shm_result result = new embed_sents_shm_result();
+        try {
+          result.success = iface.embed_sents_shm(args.sents, args.emb_type, args.projection);
+        } catch (SequenceEmbedderELMo_UnknownEmbType e) {
+          result.e = e;
+        }
+        return result;
+      }
+    }
+
+    public static class open_session<I extends Iface> extends org.apache.thrift.ProcessFunction<I, open_session_args> {
+      public open_session() {
+        super("open_session");
+      }
+
+      public open_session_args getEmptyArgsInstance() {
+        return new open_session_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public open_session_result getResult(I iface, open_session_args args) throws org.apache.thrift.TException {
+        open_session_result result = new open_session_result();
+        try {
+          result.success = iface.open_session(args.emb_type, args.projection);
+        } catch (SequenceEmbedderELMo_UnknownEmbType e) {
+          result.e = e;
+        }
+        return result;
+      }
+    }
+
+    public static class push_tokens<I extends Iface> extends org.apache.thrift.ProcessFunction<I, push_tokens_args> {
+      public push_tokens() {
+        super("push_tokens");
+      }
+
+      public push_tokens_args getEmptyArgsInstance() {
+        return new push_tokens_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public push_tokens_result getResult(I iface, push_tokens_args args) throws org.apache.thrift.TException {
+        push_tokens_result result = new push_tokens_result();
+        try {
+          result.success = iface.push_tokens(args.session, args.tokens, args.dtype);
+        } catch (SequenceEmbedderELMo_UnknownSession e) {
+          result.e = e;
+        } catch (SequenceEmbedderELMo_BadArgument b) {
+          result.b = b;
+        }
+        return result;
+      }
+    }
+
+    public static class close_session<I extends Iface> extends org.apache.thrift.ProcessFunction<I, close_session_args> {
+      public close_session() {
+        super("close_session");
+      }
+
+      public close_session_args getEmptyArgsInstance() {
+        return new close_session_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public close_session_result getResult(I iface, close_session_args args) throws org.apache.thrift.TException {
+        close_session_result result = new close_session_result();
+        iface.close_session(args.session);
+        return result;
+      }
+    }
+
+    public static class quit<I extends Iface> extends org.apache.thrift.ProcessFunction<I, quit_args> {
+      public quit() {
+        super("quit");
+      }
+
+      public quit_args getEmptyArgsInstance() {
+        return new quit_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public quit_result getResult(I iface, quit_args args) throws org.apache.thrift.TException {
+        quit_result result = new quit_result();
+        iface.quit();
+        return result;
+      }
+    }
+
+    public static class attach_client<I extends Iface> extends org.apache.thrift.ProcessFunction<I, attach_client_args> {
+      public attach_client() {
+        super("attach_client");
+      }
+
+      public attach_client_args getEmptyArgsInstance() {
+        return new attach_client_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public attach_client_result getResult(I iface, attach_client_args args) throws org.apache.thrift.TException {
+        attach_client_result result = new attach_client_result();
+        iface.attach_client();
+        return result;
+      }
+    }
+
+    public static class detach_client<I extends Iface> extends org.apache.thrift.ProcessFunction<I, detach_client_args> {
+      public detach_client() {
+        super("detach_client");
+      }
+
+      public detach_client_args getEmptyArgsInstance() {
+        return new detach_client_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public detach_client_result getResult(I iface, detach_client_args args) throws org.apache.thrift.TException {
+        detach_client_result result = new detach_client_result();
+        iface.detach_client();
+        return result;
+      }
+    }
+
+    public static class get_stats<I extends Iface> extends org.apache.thrift.ProcessFunction<I, get_stats_args> {
+      public get_stats() {
+        super("get_stats");
+      }
+
+      public get_stats_args getEmptyArgsInstance() {
+        return new get_stats_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public get_stats_result getResult(I iface, get_stats_args args) throws org.apache.thrift.TException {
+        get_stats_result result = new get_stats_result();
+        result.success = iface.get_stats();
+        return result;
+      }
+    }
+
+  }
+
+  public static class AsyncProcessor<I extends AsyncIface> extends org.apache.thrift.TBaseAsyncProcessor<I> {
+    private static final org.slf4j.Logger _LOGGER = org.slf4j.LoggerFactory.getLogger(AsyncProcessor.class.getName());
+    public AsyncProcessor(I iface) {
+      super(iface, getProcessMap(new java.util.HashMap<java.lang.String, org.apache.thrift.AsyncProcessFunction<I, ? extends org.apache.thrift.TBase, ?>>()));
+    }
+
+    protected AsyncProcessor(I iface, java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase, ?>> processMap) {
+      super(iface, getProcessMap(processMap));
+    }
+
+    private static <I extends AsyncIface> java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase,?>> getProcessMap(java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase, ?>> processMap) {
+      processMap.put("start_elmo", new start_elmo());
+      processMap.put("embed_sents", new embed_sents());
+      processMap.put("embed_sents_packed", new embed_sents_packed());
+      processMap.put("embed_sents_shm", new embed_sents_shm());
+      processMap.put("open_session", new open_session());
+      processMap.put("push_tokens", new push_tokens());
+      processMap.put("close_session", new close_session());
+      processMap.put("quit", new quit());
+      processMap.put("attach_client", new attach_client());
+      processMap.put("detach_client", new detach_client());
+      processMap.put("get_stats", new get_stats());
+      return processMap;
+    }
+
+    public static class start_elmo<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, start_elmo_args, Void> {
+      public start_elmo() {
+        super("start_elmo");
+      }
+
+      public start_elmo_args getEmptyArgsInstance() {
+        return new start_elmo_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
+          public void onComplete(Void o) {
+            start_elmo_result result = new start_elmo_result();
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            start_elmo_result result = new start_elmo_result();
             if (e instanceof org.apache.thrift.transport.TTransportException) {
               _LOGGER.error("TTransportException inside handler", e);
               fb.close();
@@ -523,19 +1135,8070 @@ public class SequenceEmbedderELMo_Service {
         return false;
       }
 
-      public void start(I iface, quit_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
-        iface.quit(resultHandler);
+      public void start(I iface, start_elmo_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+        iface.start_elmo(resultHandler);
+      }
+    }
+
+    public static class embed_sents<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, embed_sents_args, java.util.List<java.util.List<java.util.List<java.lang.Double>>>> {
+      public embed_sents() {
+        super("embed_sents");
+      }
+
+      public embed_sents_args getEmptyArgsInstance() {
+        return new embed_sents_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<java.util.List<java.lang.Double>>>> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<java.util.List<java.lang.Double>>>>() { 
+          public void onComplete(java.util.List<java.util.List<java.util.List<java.lang.Double>>> o) {
+            embed_sents_result result = new embed_sents_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            embed_sents_result result = new embed_sents_result();
+            if (e instanceof SequenceEmbedderELMo_UnknownEmbType) {
+              result.e = (SequenceEmbedderELMo_UnknownEmbType) e;
+              result.setEIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, embed_sents_args args, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<java.util.List<java.lang.Double>>>> resultHandler) throws org.apache.thrift.TException {
+        iface.embed_sents(args.sents, args.emb_type,resultHandler);
+      }
+    }
+
+    public static class embed_sents_packed<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, embed_sents_packed_args, java.util.List<java.nio.ByteBuffer>> {
+      public embed_sents_packed() {
+        super("embed_sents_packed");
+      }
+
+      public embed_sents_packed_args getEmptyArgsInstance() {
+        return new embed_sents_packed_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.nio.ByteBuffer>> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.nio.ByteBuffer>>() { 
+          public void onComplete(java.util.List<java.nio.ByteBuffer> o) {
+            embed_sents_packed_result result = new embed_sents_packed_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            embed_sents_packed_result result = new embed_sents_packed_result();
+            if (e instanceof SequenceEmbedderELMo_UnknownEmbType) {
+              result.e = (SequenceEmbedderELMo_UnknownEmbType) e;
+              result.setEIsSet(true);
+              msg = result;
+            } else if (e instanceof SequenceEmbedderELMo_BadArgument) {
+              result.b = (SequenceEmbedderELMo_BadArgument) e;
+              result.setBIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, embed_sents_packed_args args, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.nio.ByteBuffer>> resultHandler) throws org.apache.thrift.TException {
+        iface.embed_sents_packed(args.sents, args.emb_type, args.dtype, args.projection,resultHandler);
+      }
+    }
+
+    public static class embed_sents_shm<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, embed_sents_shm_args, java.nio.ByteBuffer> {
+      public embed_sents_shm() {
+        super("embed_sents_shm");
+      }
+
+      public embed_sents_shm_args getEmptyArgsInstance() {
+        return new embed_sents_shm_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer>() { 
+          public void onComplete(java.nio.ByteBuffer o) {
+            embed_sents_shm_result result = new embed_sents_shm_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            embed_sents_shm_result result = new embed_sents_shm_result();
+            if (e instanceof SequenceEmbedderELMo_UnknownEmbType) {
+              result.e = (SequenceEmbedderELMo_UnknownEmbType) e;
+              result.setEIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, embed_sents_shm_args args, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler) throws org.apache.thrift.TException {
+        iface.embed_sents_shm(args.sents, args.emb_type, args.projection,resultHandler);
+      }
+    }
+
+    public static class open_session<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, open_session_args, java.lang.String> {
+      public open_session() {
+        super("open_session");
+      }
+
+      public open_session_args getEmptyArgsInstance() {
+        return new open_session_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<java.lang.String> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.lang.String>() { 
+          public void onComplete(java.lang.String o) {
+            open_session_result result = new open_session_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            open_session_result result = new open_session_result();
+            if (e instanceof SequenceEmbedderELMo_UnknownEmbType) {
+              result.e = (SequenceEmbedderELMo_UnknownEmbType) e;
+              result.setEIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, open_session_args args, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException {
+        iface.open_session(args.emb_type, args.projection,resultHandler);
+      }
+    }
+
+    public static class push_tokens<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, push_tokens_args, java.nio.ByteBuffer> {
+      public push_tokens() {
+        super("push_tokens");
+      }
+
+      public push_tokens_args getEmptyArgsInstance() {
+        return new push_tokens_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer>() { 
+          public void onComplete(java.nio.ByteBuffer o) {
+            push_tokens_result result = new push_tokens_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            push_tokens_result result = new push_tokens_result();
+            if (e instanceof SequenceEmbedderELMo_UnknownSession) {
+              result.e = (SequenceEmbedderELMo_UnknownSession) e;
+              result.setEIsSet(true);
+              msg = result;
+            } else if (e instanceof SequenceEmbedderELMo_BadArgument) {
+              result.b = (SequenceEmbedderELMo_BadArgument) e;
+              result.setBIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, push_tokens_args args, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler) throws org.apache.thrift.TException {
+        iface.push_tokens(args.session, args.tokens, args.dtype,resultHandler);
+      }
+    }
+
+    public static class close_session<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, close_session_args, Void> {
+      public close_session() {
+        super("close_session");
+      }
+
+      public close_session_args getEmptyArgsInstance() {
+        return new close_session_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
+          public void onComplete(Void o) {
+            close_session_result result = new close_session_result();
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            close_session_result result = new close_session_result();
+            if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, close_session_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+        iface.close_session(args.session,resultHandler);
+      }
+    }
+
+    public static class quit<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, quit_args, Void> {
+      public quit() {
+        super("quit");
+      }
+
+      public quit_args getEmptyArgsInstance() {
+        return new quit_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
+          public void onComplete(Void o) {
+            quit_result result = new quit_result();
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            quit_result result = new quit_result();
+            if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, quit_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+        iface.quit(resultHandler);
+      }
+    }
+
+    public static class attach_client<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, attach_client_args, Void> {
+      public attach_client() {
+        super("attach_client");
+      }
+
+      public attach_client_args getEmptyArgsInstance() {
+        return new attach_client_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
+          public void onComplete(Void o) {
+            attach_client_result result = new attach_client_result();
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            attach_client_result result = new attach_client_result();
+            if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, attach_client_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+        iface.attach_client(resultHandler);
+      }
+    }
+
+    public static class detach_client<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, detach_client_args, Void> {
+      public detach_client() {
+        super("detach_client");
+      }
+
+      public detach_client_args getEmptyArgsInstance() {
+        return new detach_client_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
+          public void onComplete(Void o) {
+            detach_client_result result = new detach_client_result();
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            detach_client_result result = new detach_client_result();
+            if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, detach_client_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+        iface.detach_client(resultHandler);
+      }
+    }
+
+    public static class get_stats<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, get_stats_args, java.lang.String> {
+      public get_stats() {
+        super("get_stats");
+      }
+
+      public get_stats_args getEmptyArgsInstance() {
+        return new get_stats_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<java.lang.String> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.lang.String>() { 
+          public void onComplete(java.lang.String o) {
+            get_stats_result result = new get_stats_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            get_stats_result result = new get_stats_result();
+            if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, get_stats_args args, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException {
+        iface.get_stats(resultHandler);
+      }
+    }
+
+  }
+
+  public static class start_elmo_args implements org.apache.thrift.TBase<start_elmo_args, start_elmo_args._Fields>, java.io.Serializable, Cloneable, Comparable<start_elmo_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("start_elmo_args");
+
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new start_elmo_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new start_elmo_argsTupleSchemeFactory();
+
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+;
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(start_elmo_args.class, metaDataMap);
+    }
+
+    public start_elmo_args() {
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public start_elmo_args(start_elmo_args other) {
+    }
+
+    public start_elmo_args deepCopy() {
+      return new start_elmo_args(this);
+    }
+
+    @Override
+    public void clear() {
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof start_elmo_args)
+        return this.equals((start_elmo_args)that);
+      return false;
+    }
+
+    public boolean equals(start_elmo_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(start_elmo_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("start_elmo_args(");
+      boolean first = true;
+
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class start_elmo_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public start_elmo_argsStandardScheme getScheme() {
+        return new start_elmo_argsStandardScheme();
+      }
+    }
+
+    private static class start_elmo_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<start_elmo_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, start_elmo_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, start_elmo_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class start_elmo_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public start_elmo_argsTupleScheme getScheme() {
+        return new start_elmo_argsTupleScheme();
+      }
+    }
+
+    private static class start_elmo_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<start_elmo_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, start_elmo_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, start_elmo_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class start_elmo_result implements org.apache.thrift.TBase<start_elmo_result, start_elmo_result._Fields>, java.io.Serializable, Cloneable, Comparable<start_elmo_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("start_elmo_result");
+
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new start_elmo_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new start_elmo_resultTupleSchemeFactory();
+
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+;
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(start_elmo_result.class, metaDataMap);
+    }
+
+    public start_elmo_result() {
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public start_elmo_result(start_elmo_result other) {
+    }
+
+    public start_elmo_result deepCopy() {
+      return new start_elmo_result(this);
+    }
+
+    @Override
+    public void clear() {
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof start_elmo_result)
+        return this.equals((start_elmo_result)that);
+      return false;
+    }
+
+    public boolean equals(start_elmo_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(start_elmo_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("start_elmo_result(");
+      boolean first = true;
+
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class start_elmo_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public start_elmo_resultStandardScheme getScheme() {
+        return new start_elmo_resultStandardScheme();
+      }
+    }
+
+    private static class start_elmo_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<start_elmo_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, start_elmo_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, start_elmo_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class start_elmo_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public start_elmo_resultTupleScheme getScheme() {
+        return new start_elmo_resultTupleScheme();
+      }
+    }
+
+    private static class start_elmo_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<start_elmo_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, start_elmo_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, start_elmo_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class embed_sents_args implements org.apache.thrift.TBase<embed_sents_args, embed_sents_args._Fields>, java.io.Serializable, Cloneable, Comparable<embed_sents_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("embed_sents_args");
+
+    private static final org.apache.thrift.protocol.TField SENTS_FIELD_DESC = new org.apache.thrift.protocol.TField("sents", org.apache.thrift.protocol.TType.LIST, (short)1);
+    private static final org.apache.thrift.protocol.TField EMB_TYPE_FIELD_DESC = new org.apache.thrift.protocol.TField("emb_type", org.apache.thrift.protocol.TType.STRING, (short)2);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new embed_sents_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new embed_sents_argsTupleSchemeFactory();
+
+    public java.util.List<java.util.List<java.lang.String>> sents; // required
+    public java.lang.String emb_type; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SENTS((short)1, "sents"),
+      EMB_TYPE((short)2, "emb_type");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // SENTS
+            return SENTS;
+          case 2: // EMB_TYPE
+            return EMB_TYPE;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SENTS, new org.apache.thrift.meta_data.FieldMetaData("sents", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+              new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+                  new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)))));
+      tmpMap.put(_Fields.EMB_TYPE, new org.apache.thrift.meta_data.FieldMetaData("emb_type", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(embed_sents_args.class, metaDataMap);
+    }
+
+    public embed_sents_args() {
+    }
+
+    public embed_sents_args(
+      java.util.List<java.util.List<java.lang.String>> sents,
+      java.lang.String emb_type)
+    {
+      this();
+      this.sents = sents;
+      this.emb_type = emb_type;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public embed_sents_args(embed_sents_args other) {
+      if (other.isSetSents()) {
+        java.util.List<java.util.List<java.lang.String>> __this__sents = new java.util.ArrayList<java.util.List<java.lang.String>>(other.sents.size());
+        for (java.util.List<java.lang.String> other_element : other.sents) {
+          java.util.List<java.lang.String> __this__sents_copy = new java.util.ArrayList<java.lang.String>(other_element);
+          __this__sents.add(__this__sents_copy);
+        }
+        this.sents = __this__sents;
+      }
+      if (other.isSetEmb_type()) {
+        this.emb_type = other.emb_type;
+      }
+    }
+
+    public embed_sents_args deepCopy() {
+      return new embed_sents_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.sents = null;
+      this.emb_type = null;
+    }
+
+    public int getSentsSize() {
+      return (this.sents == null) ? 0 : this.sents.size();
+    }
+
+    public java.util.Iterator<java.util.List<java.lang.String>> getSentsIterator() {
+      return (this.sents == null) ? null : this.sents.iterator();
+    }
+
+    public void addToSents(java.util.List<java.lang.String> elem) {
+      if (this.sents == null) {
+        this.sents = new java.util.ArrayList<java.util.List<java.lang.String>>();
+      }
+      this.sents.add(elem);
+    }
+
+    public java.util.List<java.util.List<java.lang.String>> getSents() {
+      return this.sents;
+    }
+
+    public embed_sents_args setSents(java.util.List<java.util.List<java.lang.String>> sents) {
+      this.sents = sents;
+      return this;
+    }
+
+    public void unsetSents() {
+      this.sents = null;
+    }
+
+    /** Returns true if field sents is set (has been assigned a value) and false otherwise */
+    public boolean isSetSents() {
+      return this.sents != null;
+    }
+
+    public void setSentsIsSet(boolean value) {
+      if (!value) {
+        this.sents = null;
+      }
+    }
+
+    public java.lang.String getEmb_type() {
+      return this.emb_type;
+    }
+
+    public embed_sents_args setEmb_type(java.lang.String emb_type) {
+      this.emb_type = emb_type;
+      return this;
+    }
+
+    public void unsetEmb_type() {
+      this.emb_type = null;
+    }
+
+    /** Returns true if field emb_type is set (has been assigned a value) and false otherwise */
+    public boolean isSetEmb_type() {
+      return this.emb_type != null;
+    }
+
+    public void setEmb_typeIsSet(boolean value) {
+      if (!value) {
+        this.emb_type = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SENTS:
+        if (value == null) {
+          unsetSents();
+        } else {
+          setSents((java.util.List<java.util.List<java.lang.String>>)value);
+        }
+        break;
+
+      case EMB_TYPE:
+        if (value == null) {
+          unsetEmb_type();
+        } else {
+          setEmb_type((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SENTS:
+        return getSents();
+
+      case EMB_TYPE:
+        return getEmb_type();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SENTS:
+        return isSetSents();
+      case EMB_TYPE:
+        return isSetEmb_type();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof embed_sents_args)
+        return this.equals((embed_sents_args)that);
+      return false;
+    }
+
+    public boolean equals(embed_sents_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_sents = true && this.isSetSents();
+      boolean that_present_sents = true && that.isSetSents();
+      if (this_present_sents || that_present_sents) {
+        if (!(this_present_sents && that_present_sents))
+          return false;
+        if (!this.sents.equals(that.sents))
+          return false;
+      }
+
+      boolean this_present_emb_type = true && this.isSetEmb_type();
+      boolean that_present_emb_type = true && that.isSetEmb_type();
+      if (this_present_emb_type || that_present_emb_type) {
+        if (!(this_present_emb_type && that_present_emb_type))
+          return false;
+        if (!this.emb_type.equals(that.emb_type))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSents()) ? 131071 : 524287);
+      if (isSetSents())
+        hashCode = hashCode * 8191 + sents.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetEmb_type()) ? 131071 : 524287);
+      if (isSetEmb_type())
+        hashCode = hashCode * 8191 + emb_type.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(embed_sents_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSents()).compareTo(other.isSetSents());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSents()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.sents, other.sents);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetEmb_type()).compareTo(other.isSetEmb_type());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetEmb_type()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.emb_type, other.emb_type);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("embed_sents_args(");
+      boolean first = true;
+
+      sb.append("sents:");
+      if (this.sents == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.sents);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("emb_type:");
+      if (this.emb_type == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.emb_type);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class embed_sents_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_argsStandardScheme getScheme() {
+        return new embed_sents_argsStandardScheme();
+      }
+    }
+
+    private static class embed_sents_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<embed_sents_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, embed_sents_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // SENTS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list0 = iprot.readListBegin();
+                  struct.sents = new java.util.ArrayList<java.util.List<java.lang.String>>(_list0.size);
+                  java.util.List<java.lang.String> _elem1;
+                  for (int _i2 = 0; _i2 < _list0.size; ++_i2)
+                  {
+                    {
+                      org.apache.thrift.protocol.TList _list3 = iprot.readListBegin();
+                      _elem1 = new java.util.ArrayList<java.lang.String>(_list3.size);
+                      java.lang.String _elem4;
+                      for (int _i5 = 0; _i5 < _list3.size; ++_i5)
+                      {
+                        _elem4 = iprot.readString();
+                        _elem1.add(_elem4);
+                      }
+                      iprot.readListEnd();
+                    }
+                    struct.sents.add(_elem1);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSentsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // EMB_TYPE
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.emb_type = iprot.readString();
+                struct.setEmb_typeIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, embed_sents_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.sents != null) {
+          oprot.writeFieldBegin(SENTS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, struct.sents.size()));
+            for (java.util.List<java.lang.String> _iter6 : struct.sents)
+            {
+              {
+                oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, _iter6.size()));
+                for (java.lang.String _iter7 : _iter6)
+                {
+                  oprot.writeString(_iter7);
+                }
+                oprot.writeListEnd();
+              }
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.emb_type != null) {
+          oprot.writeFieldBegin(EMB_TYPE_FIELD_DESC);
+          oprot.writeString(struct.emb_type);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class embed_sents_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_argsTupleScheme getScheme() {
+        return new embed_sents_argsTupleScheme();
+      }
+    }
+
+    private static class embed_sents_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<embed_sents_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, embed_sents_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSents()) {
+          optionals.set(0);
+        }
+        if (struct.isSetEmb_type()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSents()) {
+          {
+            oprot.writeI32(struct.sents.size());
+            for (java.util.List<java.lang.String> _iter8 : struct.sents)
+            {
+              {
+                oprot.writeI32(_iter8.size());
+                for (java.lang.String _iter9 : _iter8)
+                {
+                  oprot.writeString(_iter9);
+                }
+              }
+            }
+          }
+        }
+        if (struct.isSetEmb_type()) {
+          oprot.writeString(struct.emb_type);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, embed_sents_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list10 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
+            struct.sents = new java.util.ArrayList<java.util.List<java.lang.String>>(_list10.size);
+            java.util.List<java.lang.String> _elem11;
+            for (int _i12 = 0; _i12 < _list10.size; ++_i12)
+            {
+              {
+                org.apache.thrift.protocol.TList _list13 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, iprot.readI32());
+                _elem11 = new java.util.ArrayList<java.lang.String>(_list13.size);
+                java.lang.String _elem14;
+                for (int _i15 = 0; _i15 < _list13.size; ++_i15)
+                {
+                  _elem14 = iprot.readString();
+                  _elem11.add(_elem14);
+                }
+              }
+              struct.sents.add(_elem11);
+            }
+          }
+          struct.setSentsIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.emb_type = iprot.readString();
+          struct.setEmb_typeIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class embed_sents_result implements org.apache.thrift.TBase<embed_sents_result, embed_sents_result._Fields>, java.io.Serializable, Cloneable, Comparable<embed_sents_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("embed_sents_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
+    private static final org.apache.thrift.protocol.TField E_FIELD_DESC = new org.apache.thrift.protocol.TField("e", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new embed_sents_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new embed_sents_resultTupleSchemeFactory();
+
+    public java.util.List<java.util.List<java.util.List<java.lang.Double>>> success; // required
+    public SequenceEmbedderELMo_UnknownEmbType e; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      E((short)1, "e");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // E
+            return E;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+              new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+                  new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+                      new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE))))));
+      tmpMap.put(_Fields.E, new org.apache.thrift.meta_data.FieldMetaData("e", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, SequenceEmbedderELMo_UnknownEmbType.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(embed_sents_result.class, metaDataMap);
+    }
+
+    public embed_sents_result() {
+    }
+
+    public embed_sents_result(
+      java.util.List<java.util.List<java.util.List<java.lang.Double>>> success,
+      SequenceEmbedderELMo_UnknownEmbType e)
+    {
+      this();
+      this.success = success;
+      this.e = e;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public embed_sents_result(embed_sents_result other) {
+      if (other.isSetSuccess()) {
+        java.util.List<java.util.List<java.util.List<java.lang.Double>>> __this__success = new java.util.ArrayList<java.util.List<java.util.List<java.lang.Double>>>(other.success.size());
+        for (java.util.List<java.util.List<java.lang.Double>> other_element : other.success) {
+          java.util.List<java.util.List<java.lang.Double>> __this__success_copy = new java.util.ArrayList<java.util.List<java.lang.Double>>(other_element.size());
+          for (java.util.List<java.lang.Double> other_element_element : other_element) {
+            java.util.List<java.lang.Double> __this__success_copy_copy = new java.util.ArrayList<java.lang.Double>(other_element_element);
+            __this__success_copy.add(__this__success_copy_copy);
+          }
+          __this__success.add(__this__success_copy);
+        }
+        this.success = __this__success;
+      }
+      if (other.isSetE()) {
+        this.e = new SequenceEmbedderELMo_UnknownEmbType(other.e);
+      }
+    }
+
+    public embed_sents_result deepCopy() {
+      return new embed_sents_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.e = null;
+    }
+
+    public int getSuccessSize() {
+      return (this.success == null) ? 0 : this.success.size();
+    }
+
+    public java.util.Iterator<java.util.List<java.util.List<java.lang.Double>>> getSuccessIterator() {
+      return (this.success == null) ? null : this.success.iterator();
+    }
+
+    public void addToSuccess(java.util.List<java.util.List<java.lang.Double>> elem) {
+      if (this.success == null) {
+        this.success = new java.util.ArrayList<java.util.List<java.util.List<java.lang.Double>>>();
+      }
+      this.success.add(elem);
+    }
+
+    public java.util.List<java.util.List<java.util.List<java.lang.Double>>> getSuccess() {
+      return this.success;
+    }
+
+    public embed_sents_result setSuccess(java.util.List<java.util.List<java.util.List<java.lang.Double>>> success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public SequenceEmbedderELMo_UnknownEmbType getE() {
+      return this.e;
+    }
+
+    public embed_sents_result setE(SequenceEmbedderELMo_UnknownEmbType e) {
+      this.e = e;
+      return this;
+    }
+
+    public void unsetE() {
+      this.e = null;
+    }
+
+    /** Returns true if field e is set (has been assigned a value) and false otherwise */
+    public boolean isSetE() {
+      return this.e != null;
+    }
+
+    public void setEIsSet(boolean value) {
+      if (!value) {
+        this.e = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.util.List<java.util.List<java.util.List<java.lang.Double>>>)value);
+        }
+        break;
+
+      case E:
+        if (value == null) {
+          unsetE();
+        } else {
+          setE((SequenceEmbedderELMo_UnknownEmbType)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case E:
+        return getE();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case E:
+        return isSetE();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof embed_sents_result)
+        return this.equals((embed_sents_result)that);
+      return false;
+    }
+
+    public boolean equals(embed_sents_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_e = true && this.isSetE();
+      boolean that_present_e = true && that.isSetE();
+      if (this_present_e || that_present_e) {
+        if (!(this_present_e && that_present_e))
+          return false;
+        if (!this.e.equals(that.e))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetE()) ? 131071 : 524287);
+      if (isSetE())
+        hashCode = hashCode * 8191 + e.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(embed_sents_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetE()).compareTo(other.isSetE());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetE()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.e, other.e);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("embed_sents_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("e:");
+      if (this.e == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.e);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class embed_sents_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_resultStandardScheme getScheme() {
+        return new embed_sents_resultStandardScheme();
+      }
+    }
+
+    private static class embed_sents_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<embed_sents_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, embed_sents_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list16 = iprot.readListBegin();
+                  struct.success = new java.util.ArrayList<java.util.List<java.util.List<java.lang.Double>>>(_list16.size);
+                  java.util.List<java.util.List<java.lang.Double>> _elem17;
+                  for (int _i18 = 0; _i18 < _list16.size; ++_i18)
+                  {
+                    {
+                      org.apache.thrift.protocol.TList _list19 = iprot.readListBegin();
+                      _elem17 = new java.util.ArrayList<java.util.List<java.lang.Double>>(_list19.size);
+                      java.util.List<java.lang.Double> _elem20;
+                      for (int _i21 = 0; _i21 < _list19.size; ++_i21)
+                      {
+                        {
+                          org.apache.thrift.protocol.TList _list22 = iprot.readListBegin();
+                          _elem20 = new java.util.ArrayList<java.lang.Double>(_list22.size);
+                          double _elem23;
+                          for (int _i24 = 0; _i24 < _list22.size; ++_i24)
+                          {
+                            _elem23 = iprot.readDouble();
+                            _elem20.add(_elem23);
+                          }
+                          iprot.readListEnd();
+                        }
+                        _elem17.add(_elem20);
+                      }
+                      iprot.readListEnd();
+                    }
+                    struct.success.add(_elem17);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // E
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.e = new SequenceEmbedderELMo_UnknownEmbType();
+                struct.e.read(iprot);
+                struct.setEIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, embed_sents_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, struct.success.size()));
+            for (java.util.List<java.util.List<java.lang.Double>> _iter25 : struct.success)
+            {
+              {
+                oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, _iter25.size()));
+                for (java.util.List<java.lang.Double> _iter26 : _iter25)
+                {
+                  {
+                    oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.DOUBLE, _iter26.size()));
+                    for (double _iter27 : _iter26)
+                    {
+                      oprot.writeDouble(_iter27);
+                    }
+                    oprot.writeListEnd();
+                  }
+                }
+                oprot.writeListEnd();
+              }
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.e != null) {
+          oprot.writeFieldBegin(E_FIELD_DESC);
+          struct.e.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class embed_sents_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_resultTupleScheme getScheme() {
+        return new embed_sents_resultTupleScheme();
+      }
+    }
+
+    private static class embed_sents_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<embed_sents_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, embed_sents_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetE()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSuccess()) {
+          {
+            oprot.writeI32(struct.success.size());
+            for (java.util.List<java.util.List<java.lang.Double>> _iter28 : struct.success)
+            {
+              {
+                oprot.writeI32(_iter28.size());
+                for (java.util.List<java.lang.Double> _iter29 : _iter28)
+                {
+                  {
+                    oprot.writeI32(_iter29.size());
+                    for (double _iter30 : _iter29)
+                    {
+                      oprot.writeDouble(_iter30);
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+        if (struct.isSetE()) {
+          struct.e.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, embed_sents_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list31 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
+            struct.success = new java.util.ArrayList<java.util.List<java.util.List<java.lang.Double>>>(_list31.size);
+            java.util.List<java.util.List<java.lang.Double>> _elem32;
+            for (int _i33 = 0; _i33 < _list31.size; ++_i33)
+            {
+              {
+                org.apache.thrift.protocol.TList _list34 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
+                _elem32 = new java.util.ArrayList<java.util.List<java.lang.Double>>(_list34.size);
+                java.util.List<java.lang.Double> _elem35;
+                for (int _i36 = 0; _i36 < _list34.size; ++_i36)
+                {
+                  {
+                    org.apache.thrift.protocol.TList _list37 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.DOUBLE, iprot.readI32());
+                    _elem35 = new java.util.ArrayList<java.lang.Double>(_list37.size);
+                    double _elem38;
+                    for (int _i39 = 0; _i39 < _list37.size; ++_i39)
+                    {
+                      _elem38 = iprot.readDouble();
+                      _elem35.add(_elem38);
+                    }
+                  }
+                  _elem32.add(_elem35);
+                }
+              }
+              struct.success.add(_elem32);
+            }
+          }
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.e = new SequenceEmbedderELMo_UnknownEmbType();
+          struct.e.read(iprot);
+          struct.setEIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class embed_sents_packed_args implements org.apache.thrift.TBase<embed_sents_packed_args, embed_sents_packed_args._Fields>, java.io.Serializable, Cloneable, Comparable<embed_sents_packed_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("embed_sents_packed_args");
+
+    private static final org.apache.thrift.protocol.TField SENTS_FIELD_DESC = new org.apache.thrift.protocol.TField("sents", org.apache.thrift.protocol.TType.LIST, (short)1);
+    private static final org.apache.thrift.protocol.TField EMB_TYPE_FIELD_DESC = new org.apache.thrift.protocol.TField("emb_type", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField DTYPE_FIELD_DESC = new org.apache.thrift.protocol.TField("dtype", org.apache.thrift.protocol.TType.STRING, (short)3);
+    private static final org.apache.thrift.protocol.TField PROJECTION_FIELD_DESC = new org.apache.thrift.protocol.TField("projection", org.apache.thrift.protocol.TType.STRING, (short)4);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new embed_sents_packed_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new embed_sents_packed_argsTupleSchemeFactory();
+
+    public java.util.List<java.util.List<java.lang.String>> sents; // required
+    public java.lang.String emb_type; // required
+    public java.lang.String dtype; // required
+    public java.lang.String projection; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SENTS((short)1, "sents"),
+      EMB_TYPE((short)2, "emb_type"),
+      DTYPE((short)3, "dtype"),
+      PROJECTION((short)4, "projection");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // SENTS
+            return SENTS;
+          case 2: // EMB_TYPE
+            return EMB_TYPE;
+          case 3: // DTYPE
+            return DTYPE;
+          case 4: // PROJECTION
+            return PROJECTION;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SENTS, new org.apache.thrift.meta_data.FieldMetaData("sents", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+              new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+                  new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)))));
+      tmpMap.put(_Fields.EMB_TYPE, new org.apache.thrift.meta_data.FieldMetaData("emb_type", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.DTYPE, new org.apache.thrift.meta_data.FieldMetaData("dtype", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.PROJECTION, new org.apache.thrift.meta_data.FieldMetaData("projection", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(embed_sents_packed_args.class, metaDataMap);
+    }
+
+    public embed_sents_packed_args() {
+    }
+
+    public embed_sents_packed_args(
+      java.util.List<java.util.List<java.lang.String>> sents,
+      java.lang.String emb_type,
+      java.lang.String dtype,
+      java.lang.String projection)
+    {
+      this();
+      this.sents = sents;
+      this.emb_type = emb_type;
+      this.dtype = dtype;
+      this.projection = projection;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public embed_sents_packed_args(embed_sents_packed_args other) {
+      if (other.isSetSents()) {
+        java.util.List<java.util.List<java.lang.String>> __this__sents = new java.util.ArrayList<java.util.List<java.lang.String>>(other.sents.size());
+        for (java.util.List<java.lang.String> other_element : other.sents) {
+          java.util.List<java.lang.String> __this__sents_copy = new java.util.ArrayList<java.lang.String>(other_element);
+          __this__sents.add(__this__sents_copy);
+        }
+        this.sents = __this__sents;
+      }
+      if (other.isSetEmb_type()) {
+        this.emb_type = other.emb_type;
+      }
+      if (other.isSetDtype()) {
+        this.dtype = other.dtype;
+      }
+      if (other.isSetProjection()) {
+        this.projection = other.projection;
+      }
+    }
+
+    public embed_sents_packed_args deepCopy() {
+      return new embed_sents_packed_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.sents = null;
+      this.emb_type = null;
+      this.dtype = null;
+      this.projection = null;
+    }
+
+    public int getSentsSize() {
+      return (this.sents == null) ? 0 : this.sents.size();
+    }
+
+    public java.util.Iterator<java.util.List<java.lang.String>> getSentsIterator() {
+      return (this.sents == null) ? null : this.sents.iterator();
+    }
+
+    public void addToSents(java.util.List<java.lang.String> elem) {
+      if (this.sents == null) {
+        this.sents = new java.util.ArrayList<java.util.List<java.lang.String>>();
+      }
+      this.sents.add(elem);
+    }
+
+    public java.util.List<java.util.List<java.lang.String>> getSents() {
+      return this.sents;
+    }
+
+    public embed_sents_packed_args setSents(java.util.List<java.util.List<java.lang.String>> sents) {
+      this.sents = sents;
+      return this;
+    }
+
+    public void unsetSents() {
+      this.sents = null;
+    }
+
+    /** Returns true if field sents is set (has been assigned a value) and false otherwise */
+    public boolean isSetSents() {
+      return this.sents != null;
+    }
+
+    public void setSentsIsSet(boolean value) {
+      if (!value) {
+        this.sents = null;
+      }
+    }
+
+    public java.lang.String getEmb_type() {
+      return this.emb_type;
+    }
+
+    public embed_sents_packed_args setEmb_type(java.lang.String emb_type) {
+      this.emb_type = emb_type;
+      return this;
+    }
+
+    public void unsetEmb_type() {
+      this.emb_type = null;
+    }
+
+    /** Returns true if field emb_type is set (has been assigned a value) and false otherwise */
+    public boolean isSetEmb_type() {
+      return this.emb_type != null;
+    }
+
+    public void setEmb_typeIsSet(boolean value) {
+      if (!value) {
+        this.emb_type = null;
+      }
+    }
+
+    public java.lang.String getDtype() {
+      return this.dtype;
+    }
+
+    public embed_sents_packed_args setDtype(java.lang.String dtype) {
+      this.dtype = dtype;
+      return this;
+    }
+
+    public void unsetDtype() {
+      this.dtype = null;
+    }
+
+    /** Returns true if field dtype is set (has been assigned a value) and false otherwise */
+    public boolean isSetDtype() {
+      return this.dtype != null;
+    }
+
+    public void setDtypeIsSet(boolean value) {
+      if (!value) {
+        this.dtype = null;
+      }
+    }
+
+    public java.lang.String getProjection() {
+      return this.projection;
+    }
+
+    public embed_sents_packed_args setProjection(java.lang.String projection) {
+      this.projection = projection;
+      return this;
+    }
+
+    public void unsetProjection() {
+      this.projection = null;
+    }
+
+    /** Returns true if field projection is set (has been assigned a value) and false otherwise */
+    public boolean isSetProjection() {
+      return this.projection != null;
+    }
+
+    public void setProjectionIsSet(boolean value) {
+      if (!value) {
+        this.projection = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SENTS:
+        if (value == null) {
+          unsetSents();
+        } else {
+          setSents((java.util.List<java.util.List<java.lang.String>>)value);
+        }
+        break;
+
+      case EMB_TYPE:
+        if (value == null) {
+          unsetEmb_type();
+        } else {
+          setEmb_type((java.lang.String)value);
+        }
+        break;
+
+      case DTYPE:
+        if (value == null) {
+          unsetDtype();
+        } else {
+          setDtype((java.lang.String)value);
+        }
+        break;
+
+      case PROJECTION:
+        if (value == null) {
+          unsetProjection();
+        } else {
+          setProjection((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SENTS:
+        return getSents();
+
+      case EMB_TYPE:
+        return getEmb_type();
+
+      case DTYPE:
+        return getDtype();
+
+      case PROJECTION:
+        return getProjection();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SENTS:
+        return isSetSents();
+      case EMB_TYPE:
+        return isSetEmb_type();
+      case DTYPE:
+        return isSetDtype();
+      case PROJECTION:
+        return isSetProjection();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof embed_sents_packed_args)
+        return this.equals((embed_sents_packed_args)that);
+      return false;
+    }
+
+    public boolean equals(embed_sents_packed_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_sents = true && this.isSetSents();
+      boolean that_present_sents = true && that.isSetSents();
+      if (this_present_sents || that_present_sents) {
+        if (!(this_present_sents && that_present_sents))
+          return false;
+        if (!this.sents.equals(that.sents))
+          return false;
+      }
+
+      boolean this_present_emb_type = true && this.isSetEmb_type();
+      boolean that_present_emb_type = true && that.isSetEmb_type();
+      if (this_present_emb_type || that_present_emb_type) {
+        if (!(this_present_emb_type && that_present_emb_type))
+          return false;
+        if (!this.emb_type.equals(that.emb_type))
+          return false;
+      }
+
+      boolean this_present_dtype = true && this.isSetDtype();
+      boolean that_present_dtype = true && that.isSetDtype();
+      if (this_present_dtype || that_present_dtype) {
+        if (!(this_present_dtype && that_present_dtype))
+          return false;
+        if (!this.dtype.equals(that.dtype))
+          return false;
+      }
+
+      boolean this_present_projection = true && this.isSetProjection();
+      boolean that_present_projection = true && that.isSetProjection();
+      if (this_present_projection || that_present_projection) {
+        if (!(this_present_projection && that_present_projection))
+          return false;
+        if (!this.projection.equals(that.projection))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSents()) ? 131071 : 524287);
+      if (isSetSents())
+        hashCode = hashCode * 8191 + sents.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetEmb_type()) ? 131071 : 524287);
+      if (isSetEmb_type())
+        hashCode = hashCode * 8191 + emb_type.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetDtype()) ? 131071 : 524287);
+      if (isSetDtype())
+        hashCode = hashCode * 8191 + dtype.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetProjection()) ? 131071 : 524287);
+      if (isSetProjection())
+        hashCode = hashCode * 8191 + projection.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(embed_sents_packed_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSents()).compareTo(other.isSetSents());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSents()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.sents, other.sents);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetEmb_type()).compareTo(other.isSetEmb_type());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetEmb_type()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.emb_type, other.emb_type);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetDtype()).compareTo(other.isSetDtype());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetDtype()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.dtype, other.dtype);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetProjection()).compareTo(other.isSetProjection());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetProjection()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.projection, other.projection);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("embed_sents_packed_args(");
+      boolean first = true;
+
+      sb.append("sents:");
+      if (this.sents == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.sents);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("emb_type:");
+      if (this.emb_type == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.emb_type);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("dtype:");
+      if (this.dtype == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.dtype);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("projection:");
+      if (this.projection == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.projection);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class embed_sents_packed_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_packed_argsStandardScheme getScheme() {
+        return new embed_sents_packed_argsStandardScheme();
+      }
+    }
+
+    private static class embed_sents_packed_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<embed_sents_packed_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, embed_sents_packed_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // SENTS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list40 = iprot.readListBegin();
+                  struct.sents = new java.util.ArrayList<java.util.List<java.lang.String>>(_list40.size);
+                  java.util.List<java.lang.String> _elem41;
+                  for (int _i42 = 0; _i42 < _list40.size; ++_i42)
+                  {
+                    {
+                      org.apache.thrift.protocol.TList _list43 = iprot.readListBegin();
+                      _elem41 = new java.util.ArrayList<java.lang.String>(_list43.size);
+                      java.lang.String _elem44;
+                      for (int _i45 = 0; _i45 < _list43.size; ++_i45)
+                      {
+                        _elem44 = iprot.readString();
+                        _elem41.add(_elem44);
+                      }
+                      iprot.readListEnd();
+                    }
+                    struct.sents.add(_elem41);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSentsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // EMB_TYPE
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.emb_type = iprot.readString();
+                struct.setEmb_typeIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // DTYPE
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.dtype = iprot.readString();
+                struct.setDtypeIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 4: // PROJECTION
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.projection = iprot.readString();
+                struct.setProjectionIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, embed_sents_packed_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.sents != null) {
+          oprot.writeFieldBegin(SENTS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, struct.sents.size()));
+            for (java.util.List<java.lang.String> _iter46 : struct.sents)
+            {
+              {
+                oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, _iter46.size()));
+                for (java.lang.String _iter47 : _iter46)
+                {
+                  oprot.writeString(_iter47);
+                }
+                oprot.writeListEnd();
+              }
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.emb_type != null) {
+          oprot.writeFieldBegin(EMB_TYPE_FIELD_DESC);
+          oprot.writeString(struct.emb_type);
+          oprot.writeFieldEnd();
+        }
+        if (struct.dtype != null) {
+          oprot.writeFieldBegin(DTYPE_FIELD_DESC);
+          oprot.writeString(struct.dtype);
+          oprot.writeFieldEnd();
+        }
+        if (struct.projection != null) {
+          oprot.writeFieldBegin(PROJECTION_FIELD_DESC);
+          oprot.writeString(struct.projection);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class embed_sents_packed_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_packed_argsTupleScheme getScheme() {
+        return new embed_sents_packed_argsTupleScheme();
+      }
+    }
+
+    private static class embed_sents_packed_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<embed_sents_packed_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, embed_sents_packed_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSents()) {
+          optionals.set(0);
+        }
+        if (struct.isSetEmb_type()) {
+          optionals.set(1);
+        }
+        if (struct.isSetDtype()) {
+          optionals.set(2);
+        }
+        if (struct.isSetProjection()) {
+          optionals.set(3);
+        }
+        oprot.writeBitSet(optionals, 4);
+        if (struct.isSetSents()) {
+          {
+            oprot.writeI32(struct.sents.size());
+            for (java.util.List<java.lang.String> _iter48 : struct.sents)
+            {
+              {
+                oprot.writeI32(_iter48.size());
+                for (java.lang.String _iter49 : _iter48)
+                {
+                  oprot.writeString(_iter49);
+                }
+              }
+            }
+          }
+        }
+        if (struct.isSetEmb_type()) {
+          oprot.writeString(struct.emb_type);
+        }
+        if (struct.isSetDtype()) {
+          oprot.writeString(struct.dtype);
+        }
+        if (struct.isSetProjection()) {
+          oprot.writeString(struct.projection);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, embed_sents_packed_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(4);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list50 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
+            struct.sents = new java.util.ArrayList<java.util.List<java.lang.String>>(_list50.size);
+            java.util.List<java.lang.String> _elem51;
+            for (int _i52 = 0; _i52 < _list50.size; ++_i52)
+            {
+              {
+                org.apache.thrift.protocol.TList _list53 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, iprot.readI32());
+                _elem51 = new java.util.ArrayList<java.lang.String>(_list53.size);
+                java.lang.String _elem54;
+                for (int _i55 = 0; _i55 < _list53.size; ++_i55)
+                {
+                  _elem54 = iprot.readString();
+                  _elem51.add(_elem54);
+                }
+              }
+              struct.sents.add(_elem51);
+            }
+          }
+          struct.setSentsIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.emb_type = iprot.readString();
+          struct.setEmb_typeIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.dtype = iprot.readString();
+          struct.setDtypeIsSet(true);
+        }
+        if (incoming.get(3)) {
+          struct.projection = iprot.readString();
+          struct.setProjectionIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class embed_sents_packed_result implements org.apache.thrift.TBase<embed_sents_packed_result, embed_sents_packed_result._Fields>, java.io.Serializable, Cloneable, Comparable<embed_sents_packed_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("embed_sents_packed_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
+    private static final org.apache.thrift.protocol.TField E_FIELD_DESC = new org.apache.thrift.protocol.TField("e", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+    private static final org.apache.thrift.protocol.TField B_FIELD_DESC = new org.apache.thrift.protocol.TField("b", org.apache.thrift.protocol.TType.STRUCT, (short)2);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new embed_sents_packed_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new embed_sents_packed_resultTupleSchemeFactory();
+
+    public java.util.List<java.nio.ByteBuffer> success; // required
+    public SequenceEmbedderELMo_UnknownEmbType e; // required
+    public SequenceEmbedderELMo_BadArgument b; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      E((short)1, "e"),
+      B((short)2, "b");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // E
+            return E;
+          case 2: // B
+            return B;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+              new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING        , true))));
+      tmpMap.put(_Fields.E, new org.apache.thrift.meta_data.FieldMetaData("e", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, SequenceEmbedderELMo_UnknownEmbType.class)));
+      tmpMap.put(_Fields.B, new org.apache.thrift.meta_data.FieldMetaData("b", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, SequenceEmbedderELMo_BadArgument.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(embed_sents_packed_result.class, metaDataMap);
+    }
+
+    public embed_sents_packed_result() {
+    }
+
+    public embed_sents_packed_result(
+      java.util.List<java.nio.ByteBuffer> success,
+      SequenceEmbedderELMo_UnknownEmbType e,
+      SequenceEmbedderELMo_BadArgument b)
+    {
+      this();
+      this.success = success;
+      this.e = e;
+      this.b = b;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public embed_sents_packed_result(embed_sents_packed_result other) {
+      if (other.isSetSuccess()) {
+        java.util.List<java.nio.ByteBuffer> __this__success = new java.util.ArrayList<java.nio.ByteBuffer>(other.success);
+        this.success = __this__success;
+      }
+      if (other.isSetE()) {
+        this.e = new SequenceEmbedderELMo_UnknownEmbType(other.e);
+      }
+      if (other.isSetB()) {
+        this.b = new SequenceEmbedderELMo_BadArgument(other.b);
+      }
+    }
+
+    public embed_sents_packed_result deepCopy() {
+      return new embed_sents_packed_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.e = null;
+      this.b = null;
+    }
+
+    public int getSuccessSize() {
+      return (this.success == null) ? 0 : this.success.size();
+    }
+
+    public java.util.Iterator<java.nio.ByteBuffer> getSuccessIterator() {
+      return (this.success == null) ? null : this.success.iterator();
+    }
+
+    public void addToSuccess(java.nio.ByteBuffer elem) {
+      if (this.success == null) {
+        this.success = new java.util.ArrayList<java.nio.ByteBuffer>();
+      }
+      this.success.add(elem);
+    }
+
+    public java.util.List<java.nio.ByteBuffer> getSuccess() {
+      return this.success;
+    }
+
+    public embed_sents_packed_result setSuccess(java.util.List<java.nio.ByteBuffer> success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public SequenceEmbedderELMo_UnknownEmbType getE() {
+      return this.e;
+    }
+
+    public embed_sents_packed_result setE(SequenceEmbedderELMo_UnknownEmbType e) {
+      this.e = e;
+      return this;
+    }
+
+    public void unsetE() {
+      this.e = null;
+    }
+
+    /** Returns true if field e is set (has been assigned a value) and false otherwise */
+    public boolean isSetE() {
+      return this.e != null;
+    }
+
+    public void setEIsSet(boolean value) {
+      if (!value) {
+        this.e = null;
+      }
+    }
+
+    public SequenceEmbedderELMo_BadArgument getB() {
+      return this.b;
+    }
+
+    public embed_sents_packed_result setB(SequenceEmbedderELMo_BadArgument b) {
+      this.b = b;
+      return this;
+    }
+
+    public void unsetB() {
+      this.b = null;
+    }
+
+    /** Returns true if field b is set (has been assigned a value) and false otherwise */
+    public boolean isSetB() {
+      return this.b != null;
+    }
+
+    public void setBIsSet(boolean value) {
+      if (!value) {
+        this.b = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.util.List<java.nio.ByteBuffer>)value);
+        }
+        break;
+
+      case E:
+        if (value == null) {
+          unsetE();
+        } else {
+          setE((SequenceEmbedderELMo_UnknownEmbType)value);
+        }
+        break;
+
+      case B:
+        if (value == null) {
+          unsetB();
+        } else {
+          setB((SequenceEmbedderELMo_BadArgument)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case E:
+        return getE();
+
+      case B:
+        return getB();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case E:
+        return isSetE();
+      case B:
+        return isSetB();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof embed_sents_packed_result)
+        return this.equals((embed_sents_packed_result)that);
+      return false;
+    }
+
+    public boolean equals(embed_sents_packed_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_e = true && this.isSetE();
+      boolean that_present_e = true && that.isSetE();
+      if (this_present_e || that_present_e) {
+        if (!(this_present_e && that_present_e))
+          return false;
+        if (!this.e.equals(that.e))
+          return false;
+      }
+
+      boolean this_present_b = true && this.isSetB();
+      boolean that_present_b = true && that.isSetB();
+      if (this_present_b || that_present_b) {
+        if (!(this_present_b && that_present_b))
+          return false;
+        if (!this.b.equals(that.b))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetE()) ? 131071 : 524287);
+      if (isSetE())
+        hashCode = hashCode * 8191 + e.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetB()) ? 131071 : 524287);
+      if (isSetB())
+        hashCode = hashCode * 8191 + b.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(embed_sents_packed_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetE()).compareTo(other.isSetE());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetE()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.e, other.e);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetB()).compareTo(other.isSetB());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetB()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.b, other.b);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("embed_sents_packed_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("e:");
+      if (this.e == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.e);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("b:");
+      if (this.b == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.b);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class embed_sents_packed_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_packed_resultStandardScheme getScheme() {
+        return new embed_sents_packed_resultStandardScheme();
+      }
+    }
+
+    private static class embed_sents_packed_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<embed_sents_packed_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, embed_sents_packed_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list56 = iprot.readListBegin();
+                  struct.success = new java.util.ArrayList<java.nio.ByteBuffer>(_list56.size);
+                  java.nio.ByteBuffer _elem57;
+                  for (int _i58 = 0; _i58 < _list56.size; ++_i58)
+                  {
+                    _elem57 = iprot.readBinary();
+                    struct.success.add(_elem57);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // E
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.e = new SequenceEmbedderELMo_UnknownEmbType();
+                struct.e.read(iprot);
+                struct.setEIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // B
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.b = new SequenceEmbedderELMo_BadArgument();
+                struct.b.read(iprot);
+                struct.setBIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, embed_sents_packed_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, struct.success.size()));
+            for (java.nio.ByteBuffer _iter59 : struct.success)
+            {
+              oprot.writeBinary(_iter59);
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.e != null) {
+          oprot.writeFieldBegin(E_FIELD_DESC);
+          struct.e.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.b != null) {
+          oprot.writeFieldBegin(B_FIELD_DESC);
+          struct.b.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class embed_sents_packed_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_packed_resultTupleScheme getScheme() {
+        return new embed_sents_packed_resultTupleScheme();
+      }
+    }
+
+    private static class embed_sents_packed_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<embed_sents_packed_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, embed_sents_packed_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetE()) {
+          optionals.set(1);
+        }
+        if (struct.isSetB()) {
+          optionals.set(2);
+        }
+        oprot.writeBitSet(optionals, 3);
+        if (struct.isSetSuccess()) {
+          {
+            oprot.writeI32(struct.success.size());
+            for (java.nio.ByteBuffer _iter60 : struct.success)
+            {
+              oprot.writeBinary(_iter60);
+            }
+          }
+        }
+        if (struct.isSetE()) {
+          struct.e.write(oprot);
+        }
+        if (struct.isSetB()) {
+          struct.b.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, embed_sents_packed_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(3);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list61 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, iprot.readI32());
+            struct.success = new java.util.ArrayList<java.nio.ByteBuffer>(_list61.size);
+            java.nio.ByteBuffer _elem62;
+            for (int _i63 = 0; _i63 < _list61.size; ++_i63)
+            {
+              _elem62 = iprot.readBinary();
+              struct.success.add(_elem62);
+            }
+          }
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.e = new SequenceEmbedderELMo_UnknownEmbType();
+          struct.e.read(iprot);
+          struct.setEIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.b = new SequenceEmbedderELMo_BadArgument();
+          struct.b.read(iprot);
+          struct.setBIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class embed_sents_shm_args implements org.apache.thrift.TBase<embed_sents_shm_args, embed_sents_shm_args._Fields>, java.io.Serializable, Cloneable, Comparable<embed_sents_shm_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("embed_sents_shm_args");
+
+    private static final org.apache.thrift.protocol.TField SENTS_FIELD_DESC = new org.apache.thrift.protocol.TField("sents", org.apache.thrift.protocol.TType.LIST, (short)1);
+    private static final org.apache.thrift.protocol.TField EMB_TYPE_FIELD_DESC = new org.apache.thrift.protocol.TField("emb_type", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField PROJECTION_FIELD_DESC = new org.apache.thrift.protocol.TField("projection", org.apache.thrift.protocol.TType.STRING, (short)3);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new embed_sents_shm_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new embed_sents_shm_argsTupleSchemeFactory();
+
+    public java.util.List<java.util.List<java.lang.String>> sents; // required
+    public java.lang.String emb_type; // required
+    public java.lang.String projection; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SENTS((short)1, "sents"),
+      EMB_TYPE((short)2, "emb_type"),
+      PROJECTION((short)3, "projection");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // SENTS
+            return SENTS;
+          case 2: // EMB_TYPE
+            return EMB_TYPE;
+          case 3: // PROJECTION
+            return PROJECTION;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SENTS, new org.apache.thrift.meta_data.FieldMetaData("sents", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+              new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+                  new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)))));
+      tmpMap.put(_Fields.EMB_TYPE, new org.apache.thrift.meta_data.FieldMetaData("emb_type", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.PROJECTION, new org.apache.thrift.meta_data.FieldMetaData("projection", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(embed_sents_shm_args.class, metaDataMap);
+    }
+
+    public embed_sents_shm_args() {
+    }
+
+    public embed_sents_shm_args(
+      java.util.List<java.util.List<java.lang.String>> sents,
+      java.lang.String emb_type,
+      java.lang.String projection)
+    {
+      this();
+      this.sents = sents;
+      this.emb_type = emb_type;
+      this.projection = projection;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public embed_sents_shm_args(embed_sents_shm_args other) {
+      if (other.isSetSents()) {
+        java.util.List<java.util.List<java.lang.String>> __this__sents = new java.util.ArrayList<java.util.List<java.lang.String>>(other.sents.size());
+        for (java.util.List<java.lang.String> other_element : other.sents) {
+          java.util.List<java.lang.String> __this__sents_copy = new java.util.ArrayList<java.lang.String>(other_element);
+          __this__sents.add(__this__sents_copy);
+        }
+        this.sents = __this__sents;
+      }
+      if (other.isSetEmb_type()) {
+        this.emb_type = other.emb_type;
+      }
+      if (other.isSetProjection()) {
+        this.projection = other.projection;
+      }
+    }
+
+    public embed_sents_shm_args deepCopy() {
+      return new embed_sents_shm_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.sents = null;
+      this.emb_type = null;
+      this.projection = null;
+    }
+
+    public int getSentsSize() {
+      return (this.sents == null) ? 0 : this.sents.size();
+    }
+
+    public java.util.Iterator<java.util.List<java.lang.String>> getSentsIterator() {
+      return (this.sents == null) ? null : this.sents.iterator();
+    }
+
+    public void addToSents(java.util.List<java.lang.String> elem) {
+      if (this.sents == null) {
+        this.sents = new java.util.ArrayList<java.util.List<java.lang.String>>();
+      }
+      this.sents.add(elem);
+    }
+
+    public java.util.List<java.util.List<java.lang.String>> getSents() {
+      return this.sents;
+    }
+
+    public embed_sents_shm_args setSents(java.util.List<java.util.List<java.lang.String>> sents) {
+      this.sents = sents;
+      return this;
+    }
+
+    public void unsetSents() {
+      this.sents = null;
+    }
+
+    /** Returns true if field sents is set (has been assigned a value) and false otherwise */
+    public boolean isSetSents() {
+      return this.sents != null;
+    }
+
+    public void setSentsIsSet(boolean value) {
+      if (!value) {
+        this.sents = null;
+      }
+    }
+
+    public java.lang.String getEmb_type() {
+      return this.emb_type;
+    }
+
+    public embed_sents_shm_args setEmb_type(java.lang.String emb_type) {
+      this.emb_type = emb_type;
+      return this;
+    }
+
+    public void unsetEmb_type() {
+      this.emb_type = null;
+    }
+
+    /** Returns true if field emb_type is set (has been assigned a value) and false otherwise */
+    public boolean isSetEmb_type() {
+      return this.emb_type != null;
+    }
+
+    public void setEmb_typeIsSet(boolean value) {
+      if (!value) {
+        this.emb_type = null;
+      }
+    }
+
+    public java.lang.String getProjection() {
+      return this.projection;
+    }
+
+    public embed_sents_shm_args setProjection(java.lang.String projection) {
+      this.projection = projection;
+      return this;
+    }
+
+    public void unsetProjection() {
+      this.projection = null;
+    }
+
+    /** Returns true if field projection is set (has been assigned a value) and false otherwise */
+    public boolean isSetProjection() {
+      return this.projection != null;
+    }
+
+    public void setProjectionIsSet(boolean value) {
+      if (!value) {
+        this.projection = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SENTS:
+        if (value == null) {
+          unsetSents();
+        } else {
+          setSents((java.util.List<java.util.List<java.lang.String>>)value);
+        }
+        break;
+
+      case EMB_TYPE:
+        if (value == null) {
+          unsetEmb_type();
+        } else {
+          setEmb_type((java.lang.String)value);
+        }
+        break;
+
+      case PROJECTION:
+        if (value == null) {
+          unsetProjection();
+        } else {
+          setProjection((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SENTS:
+        return getSents();
+
+      case EMB_TYPE:
+        return getEmb_type();
+
+      case PROJECTION:
+        return getProjection();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SENTS:
+        return isSetSents();
+      case EMB_TYPE:
+        return isSetEmb_type();
+      case PROJECTION:
+        return isSetProjection();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof embed_sents_shm_args)
+        return this.equals((embed_sents_shm_args)that);
+      return false;
+    }
+
+    public boolean equals(embed_sents_shm_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_sents = true && this.isSetSents();
+      boolean that_present_sents = true && that.isSetSents();
+      if (this_present_sents || that_present_sents) {
+        if (!(this_present_sents && that_present_sents))
+          return false;
+        if (!this.sents.equals(that.sents))
+          return false;
+      }
+
+      boolean this_present_emb_type = true && this.isSetEmb_type();
+      boolean that_present_emb_type = true && that.isSetEmb_type();
+      if (this_present_emb_type || that_present_emb_type) {
+        if (!(this_present_emb_type && that_present_emb_type))
+          return false;
+        if (!this.emb_type.equals(that.emb_type))
+          return false;
+      }
+
+      boolean this_present_projection = true && this.isSetProjection();
+      boolean that_present_projection = true && that.isSetProjection();
+      if (this_present_projection || that_present_projection) {
+        if (!(this_present_projection && that_present_projection))
+          return false;
+        if (!this.projection.equals(that.projection))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSents()) ? 131071 : 524287);
+      if (isSetSents())
+        hashCode = hashCode * 8191 + sents.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetEmb_type()) ? 131071 : 524287);
+      if (isSetEmb_type())
+        hashCode = hashCode * 8191 + emb_type.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetProjection()) ? 131071 : 524287);
+      if (isSetProjection())
+        hashCode = hashCode * 8191 + projection.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(embed_sents_shm_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSents()).compareTo(other.isSetSents());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSents()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.sents, other.sents);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetEmb_type()).compareTo(other.isSetEmb_type());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetEmb_type()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.emb_type, other.emb_type);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetProjection()).compareTo(other.isSetProjection());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetProjection()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.projection, other.projection);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("embed_sents_shm_args(");
+      boolean first = true;
+
+      sb.append("sents:");
+      if (this.sents == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.sents);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("emb_type:");
+      if (this.emb_type == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.emb_type);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("projection:");
+      if (this.projection == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.projection);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class embed_sents_shm_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_shm_argsStandardScheme getScheme() {
+        return new embed_sents_shm_argsStandardScheme();
+      }
+    }
+
+    private static class embed_sents_shm_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<embed_sents_shm_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, embed_sents_shm_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // SENTS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list64 = iprot.readListBegin();
+                  struct.sents = new java.util.ArrayList<java.util.List<java.lang.String>>(_list64.size);
+                  java.util.List<java.lang.String> _elem65;
+                  for (int _i66 = 0; _i66 < _list64.size; ++_i66)
+                  {
+                    {
+                      org.apache.thrift.protocol.TList _list67 = iprot.readListBegin();
+                      _elem65 = new java.util.ArrayList<java.lang.String>(_list67.size);
+                      java.lang.String _elem68;
+                      for (int _i69 = 0; _i69 < _list67.size; ++_i69)
+                      {
+                        _elem68 = iprot.readString();
+                        _elem65.add(_elem68);
+                      }
+                      iprot.readListEnd();
+                    }
+                    struct.sents.add(_elem65);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSentsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // EMB_TYPE
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.emb_type = iprot.readString();
+                struct.setEmb_typeIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // PROJECTION
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.projection = iprot.readString();
+                struct.setProjectionIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, embed_sents_shm_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.sents != null) {
+          oprot.writeFieldBegin(SENTS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, struct.sents.size()));
+            for (java.util.List<java.lang.String> _iter70 : struct.sents)
+            {
+              {
+                oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, _iter70.size()));
+                for (java.lang.String _iter71 : _iter70)
+                {
+                  oprot.writeString(_iter71);
+                }
+                oprot.writeListEnd();
+              }
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.emb_type != null) {
+          oprot.writeFieldBegin(EMB_TYPE_FIELD_DESC);
+          oprot.writeString(struct.emb_type);
+          oprot.writeFieldEnd();
+        }
+        if (struct.projection != null) {
+          oprot.writeFieldBegin(PROJECTION_FIELD_DESC);
+          oprot.writeString(struct.projection);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class embed_sents_shm_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_shm_argsTupleScheme getScheme() {
+        return new embed_sents_shm_argsTupleScheme();
+      }
+    }
+
+    private static class embed_sents_shm_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<embed_sents_shm_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, embed_sents_shm_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSents()) {
+          optionals.set(0);
+        }
+        if (struct.isSetEmb_type()) {
+          optionals.set(1);
+        }
+        if (struct.isSetProjection()) {
+          optionals.set(2);
+        }
+        oprot.writeBitSet(optionals, 3);
+        if (struct.isSetSents()) {
+          {
+            oprot.writeI32(struct.sents.size());
+            for (java.util.List<java.lang.String> _iter72 : struct.sents)
+            {
+              {
+                oprot.writeI32(_iter72.size());
+                for (java.lang.String _iter73 : _iter72)
+                {
+                  oprot.writeString(_iter73);
+                }
+              }
+            }
+          }
+        }
+        if (struct.isSetEmb_type()) {
+          oprot.writeString(struct.emb_type);
+        }
+        if (struct.isSetProjection()) {
+          oprot.writeString(struct.projection);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, embed_sents_shm_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(3);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list74 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
+            struct.sents = new java.util.ArrayList<java.util.List<java.lang.String>>(_list74.size);
+            java.util.List<java.lang.String> _elem75;
+            for (int _i76 = 0; _i76 < _list74.size; ++_i76)
+            {
+              {
+                org.apache.thrift.protocol.TList _list77 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, iprot.readI32());
+                _elem75 = new java.util.ArrayList<java.lang.String>(_list77.size);
+                java.lang.String _elem78;
+                for (int _i79 = 0; _i79 < _list77.size; ++_i79)
+                {
+                  _elem78 = iprot.readString();
+                  _elem75.add(_elem78);
+                }
+              }
+              struct.sents.add(_elem75);
+            }
+          }
+          struct.setSentsIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.emb_type = iprot.readString();
+          struct.setEmb_typeIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.projection = iprot.readString();
+          struct.setProjectionIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class embed_sents_shm_result implements org.apache.thrift.TBase<embed_sents_shm_result, embed_sents_shm_result._Fields>, java.io.Serializable, Cloneable, Comparable<embed_sents_shm_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("embed_sents_shm_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRING, (short)0);
+    private static final org.apache.thrift.protocol.TField E_FIELD_DESC = new org.apache.thrift.protocol.TField("e", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new embed_sents_shm_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new embed_sents_shm_resultTupleSchemeFactory();
+
+    public java.nio.ByteBuffer success; // required
+    public SequenceEmbedderELMo_UnknownEmbType e; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      E((short)1, "e");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // E
+            return E;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING        , true)));
+      tmpMap.put(_Fields.E, new org.apache.thrift.meta_data.FieldMetaData("e", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, SequenceEmbedderELMo_UnknownEmbType.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(embed_sents_shm_result.class, metaDataMap);
+    }
+
+    public embed_sents_shm_result() {
+    }
+
+    public embed_sents_shm_result(
+      java.nio.ByteBuffer success,
+      SequenceEmbedderELMo_UnknownEmbType e)
+    {
+      this();
+      this.success = org.apache.thrift.TBaseHelper.copyBinary(success);
+      this.e = e;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public embed_sents_shm_result(embed_sents_shm_result other) {
+      if (other.isSetSuccess()) {
+        this.success = org.apache.thrift.TBaseHelper.copyBinary(other.success);
+      }
+      if (other.isSetE()) {
+        this.e = new SequenceEmbedderELMo_UnknownEmbType(other.e);
+      }
+    }
+
+    public embed_sents_shm_result deepCopy() {
+      return new embed_sents_shm_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.e = null;
+    }
+
+    public byte[] getSuccess() {
+      setSuccess(org.apache.thrift.TBaseHelper.rightSize(success));
+      return success == null ? null : success.array();
+    }
+
+    public java.nio.ByteBuffer bufferForSuccess() {
+      return org.apache.thrift.TBaseHelper.copyBinary(success);
+    }
+
+    public embed_sents_shm_result setSuccess(byte[] success) {
+      this.success = success == null ? (java.nio.ByteBuffer)null : java.nio.ByteBuffer.wrap(success.clone());
+      return this;
+    }
+
+    public embed_sents_shm_result setSuccess(java.nio.ByteBuffer success) {
+      this.success = org.apache.thrift.TBaseHelper.copyBinary(success);
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public SequenceEmbedderELMo_UnknownEmbType getE() {
+      return this.e;
+    }
+
+    public embed_sents_shm_result setE(SequenceEmbedderELMo_UnknownEmbType e) {
+      this.e = e;
+      return this;
+    }
+
+    public void unsetE() {
+      this.e = null;
+    }
+
+    /** Returns true if field e is set (has been assigned a value) and false otherwise */
+    public boolean isSetE() {
+      return this.e != null;
+    }
+
+    public void setEIsSet(boolean value) {
+      if (!value) {
+        this.e = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          if (value instanceof byte[]) {
+            setSuccess((byte[])value);
+          } else {
+            setSuccess((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      case E:
+        if (value == null) {
+          unsetE();
+        } else {
+          setE((SequenceEmbedderELMo_UnknownEmbType)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case E:
+        return getE();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case E:
+        return isSetE();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof embed_sents_shm_result)
+        return this.equals((embed_sents_shm_result)that);
+      return false;
+    }
+
+    public boolean equals(embed_sents_shm_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_e = true && this.isSetE();
+      boolean that_present_e = true && that.isSetE();
+      if (this_present_e || that_present_e) {
+        if (!(this_present_e && that_present_e))
+          return false;
+        if (!this.e.equals(that.e))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetE()) ? 131071 : 524287);
+      if (isSetE())
+        hashCode = hashCode * 8191 + e.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(embed_sents_shm_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetE()).compareTo(other.isSetE());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetE()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.e, other.e);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("embed_sents_shm_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.success, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("e:");
+      if (this.e == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.e);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class embed_sents_shm_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_shm_resultStandardScheme getScheme() {
+        return new embed_sents_shm_resultStandardScheme();
+      }
+    }
+
+    private static class embed_sents_shm_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<embed_sents_shm_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, embed_sents_shm_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.success = iprot.readBinary();
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // E
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.e = new SequenceEmbedderELMo_UnknownEmbType();
+                struct.e.read(iprot);
+                struct.setEIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, embed_sents_shm_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          oprot.writeBinary(struct.success);
+          oprot.writeFieldEnd();
+        }
+        if (struct.e != null) {
+          oprot.writeFieldBegin(E_FIELD_DESC);
+          struct.e.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class embed_sents_shm_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public embed_sents_shm_resultTupleScheme getScheme() {
+        return new embed_sents_shm_resultTupleScheme();
+      }
+    }
+
+    private static class embed_sents_shm_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<embed_sents_shm_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, embed_sents_shm_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetE()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSuccess()) {
+          oprot.writeBinary(struct.success);
+        }
+        if (struct.isSetE()) {
+          struct.e.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, embed_sents_shm_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          struct.success = iprot.readBinary();
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.e = new SequenceEmbedderELMo_UnknownEmbType();
+          struct.e.read(iprot);
+          struct.setEIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class open_session_args implements org.apache.thrift.TBase<open_session_args, open_session_args._Fields>, java.io.Serializable, Cloneable, Comparable<open_session_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("open_session_args");
+
+    private static final org.apache.thrift.protocol.TField EMB_TYPE_FIELD_DESC = new org.apache.thrift.protocol.TField("emb_type", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField PROJECTION_FIELD_DESC = new org.apache.thrift.protocol.TField("projection", org.apache.thrift.protocol.TType.STRING, (short)2);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new open_session_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new open_session_argsTupleSchemeFactory();
+
+    public java.lang.String emb_type; // required
+    public java.lang.String projection; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      EMB_TYPE((short)1, "emb_type"),
+      PROJECTION((short)2, "projection");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // EMB_TYPE
+            return EMB_TYPE;
+          case 2: // PROJECTION
+            return PROJECTION;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.EMB_TYPE, new org.apache.thrift.meta_data.FieldMetaData("emb_type", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.PROJECTION, new org.apache.thrift.meta_data.FieldMetaData("projection", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(open_session_args.class, metaDataMap);
+    }
+
+    public open_session_args() {
+    }
+
+    public open_session_args(
+      java.lang.String emb_type,
+      java.lang.String projection)
+    {
+      this();
+      this.emb_type = emb_type;
+      this.projection = projection;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public open_session_args(open_session_args other) {
+      if (other.isSetEmb_type()) {
+        this.emb_type = other.emb_type;
+      }
+      if (other.isSetProjection()) {
+        this.projection = other.projection;
+      }
+    }
+
+    public open_session_args deepCopy() {
+      return new open_session_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.emb_type = null;
+      this.projection = null;
+    }
+
+    public java.lang.String getEmb_type() {
+      return this.emb_type;
+    }
+
+    public open_session_args setEmb_type(java.lang.String emb_type) {
+      this.emb_type = emb_type;
+      return this;
+    }
+
+    public void unsetEmb_type() {
+      this.emb_type = null;
+    }
+
+    /** Returns true if field emb_type is set (has been assigned a value) and false otherwise */
+    public boolean isSetEmb_type() {
+      return this.emb_type != null;
+    }
+
+    public void setEmb_typeIsSet(boolean value) {
+      if (!value) {
+        this.emb_type = null;
+      }
+    }
+
+    public java.lang.String getProjection() {
+      return this.projection;
+    }
+
+    public open_session_args setProjection(java.lang.String projection) {
+      this.projection = projection;
+      return this;
+    }
+
+    public void unsetProjection() {
+      this.projection = null;
+    }
+
+    /** Returns true if field projection is set (has been assigned a value) and false otherwise */
+    public boolean isSetProjection() {
+      return this.projection != null;
+    }
+
+    public void setProjectionIsSet(boolean value) {
+      if (!value) {
+        this.projection = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case EMB_TYPE:
+        if (value == null) {
+          unsetEmb_type();
+        } else {
+          setEmb_type((java.lang.String)value);
+        }
+        break;
+
+      case PROJECTION:
+        if (value == null) {
+          unsetProjection();
+        } else {
+          setProjection((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case EMB_TYPE:
+        return getEmb_type();
+
+      case PROJECTION:
+        return getProjection();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case EMB_TYPE:
+        return isSetEmb_type();
+      case PROJECTION:
+        return isSetProjection();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof open_session_args)
+        return this.equals((open_session_args)that);
+      return false;
+    }
+
+    public boolean equals(open_session_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_emb_type = true && this.isSetEmb_type();
+      boolean that_present_emb_type = true && that.isSetEmb_type();
+      if (this_present_emb_type || that_present_emb_type) {
+        if (!(this_present_emb_type && that_present_emb_type))
+          return false;
+        if (!this.emb_type.equals(that.emb_type))
+          return false;
+      }
+
+      boolean this_present_projection = true && this.isSetProjection();
+      boolean that_present_projection = true && that.isSetProjection();
+      if (this_present_projection || that_present_projection) {
+        if (!(this_present_projection && that_present_projection))
+          return false;
+        if (!this.projection.equals(that.projection))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetEmb_type()) ? 131071 : 524287);
+      if (isSetEmb_type())
+        hashCode = hashCode * 8191 + emb_type.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetProjection()) ? 131071 : 524287);
+      if (isSetProjection())
+        hashCode = hashCode * 8191 + projection.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(open_session_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetEmb_type()).compareTo(other.isSetEmb_type());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetEmb_type()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.emb_type, other.emb_type);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetProjection()).compareTo(other.isSetProjection());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetProjection()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.projection, other.projection);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("open_session_args(");
+      boolean first = true;
+
+      sb.append("emb_type:");
+      if (this.emb_type == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.emb_type);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("projection:");
+      if (this.projection == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.projection);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class open_session_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public open_session_argsStandardScheme getScheme() {
+        return new open_session_argsStandardScheme();
+      }
+    }
+
+    private static class open_session_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<open_session_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, open_session_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // EMB_TYPE
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.emb_type = iprot.readString();
+                struct.setEmb_typeIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // PROJECTION
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.projection = iprot.readString();
+                struct.setProjectionIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, open_session_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.emb_type != null) {
+          oprot.writeFieldBegin(EMB_TYPE_FIELD_DESC);
+          oprot.writeString(struct.emb_type);
+          oprot.writeFieldEnd();
+        }
+        if (struct.projection != null) {
+          oprot.writeFieldBegin(PROJECTION_FIELD_DESC);
+          oprot.writeString(struct.projection);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class open_session_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public open_session_argsTupleScheme getScheme() {
+        return new open_session_argsTupleScheme();
+      }
+    }
+
+    private static class open_session_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<open_session_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, open_session_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetEmb_type()) {
+          optionals.set(0);
+        }
+        if (struct.isSetProjection()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetEmb_type()) {
+          oprot.writeString(struct.emb_type);
+        }
+        if (struct.isSetProjection()) {
+          oprot.writeString(struct.projection);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, open_session_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          struct.emb_type = iprot.readString();
+          struct.setEmb_typeIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.projection = iprot.readString();
+          struct.setProjectionIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class open_session_result implements org.apache.thrift.TBase<open_session_result, open_session_result._Fields>, java.io.Serializable, Cloneable, Comparable<open_session_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("open_session_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRING, (short)0);
+    private static final org.apache.thrift.protocol.TField E_FIELD_DESC = new org.apache.thrift.protocol.TField("e", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new open_session_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new open_session_resultTupleSchemeFactory();
+
+    public java.lang.String success; // required
+    public SequenceEmbedderELMo_UnknownEmbType e; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      E((short)1, "e");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // E
+            return E;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.E, new org.apache.thrift.meta_data.FieldMetaData("e", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, SequenceEmbedderELMo_UnknownEmbType.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(open_session_result.class, metaDataMap);
+    }
+
+    public open_session_result() {
+    }
+
+    public open_session_result(
+      java.lang.String success,
+      SequenceEmbedderELMo_UnknownEmbType e)
+    {
+      this();
+      this.success = success;
+      this.e = e;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public open_session_result(open_session_result other) {
+      if (other.isSetSuccess()) {
+        this.success = other.success;
+      }
+      if (other.isSetE()) {
+        this.e = new SequenceEmbedderELMo_UnknownEmbType(other.e);
+      }
+    }
+
+    public open_session_result deepCopy() {
+      return new open_session_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.e = null;
+    }
+
+    public java.lang.String getSuccess() {
+      return this.success;
+    }
+
+    public open_session_result setSuccess(java.lang.String success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public SequenceEmbedderELMo_UnknownEmbType getE() {
+      return this.e;
+    }
+
+    public open_session_result setE(SequenceEmbedderELMo_UnknownEmbType e) {
+      this.e = e;
+      return this;
+    }
+
+    public void unsetE() {
+      this.e = null;
+    }
+
+    /** Returns true if field e is set (has been assigned a value) and false otherwise */
+    public boolean isSetE() {
+      return this.e != null;
+    }
+
+    public void setEIsSet(boolean value) {
+      if (!value) {
+        this.e = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.lang.String)value);
+        }
+        break;
+
+      case E:
+        if (value == null) {
+          unsetE();
+        } else {
+          setE((SequenceEmbedderELMo_UnknownEmbType)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case E:
+        return getE();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case E:
+        return isSetE();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof open_session_result)
+        return this.equals((open_session_result)that);
+      return false;
+    }
+
+    public boolean equals(open_session_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_e = true && this.isSetE();
+      boolean that_present_e = true && that.isSetE();
+      if (this_present_e || that_present_e) {
+        if (!(this_present_e && that_present_e))
+          return false;
+        if (!this.e.equals(that.e))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetE()) ? 131071 : 524287);
+      if (isSetE())
+        hashCode = hashCode * 8191 + e.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(open_session_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetE()).compareTo(other.isSetE());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetE()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.e, other.e);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("open_session_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("e:");
+      if (this.e == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.e);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class open_session_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public open_session_resultStandardScheme getScheme() {
+        return new open_session_resultStandardScheme();
+      }
+    }
+
+    private static class open_session_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<open_session_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, open_session_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.success = iprot.readString();
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // E
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.e = new SequenceEmbedderELMo_UnknownEmbType();
+                struct.e.read(iprot);
+                struct.setEIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, open_session_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          oprot.writeString(struct.success);
+          oprot.writeFieldEnd();
+        }
+        if (struct.e != null) {
+          oprot.writeFieldBegin(E_FIELD_DESC);
+          struct.e.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class open_session_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public open_session_resultTupleScheme getScheme() {
+        return new open_session_resultTupleScheme();
+      }
+    }
+
+    private static class open_session_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<open_session_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, open_session_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetE()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSuccess()) {
+          oprot.writeString(struct.success);
+        }
+        if (struct.isSetE()) {
+          struct.e.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, open_session_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          struct.success = iprot.readString();
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.e = new SequenceEmbedderELMo_UnknownEmbType();
+          struct.e.read(iprot);
+          struct.setEIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class push_tokens_args implements org.apache.thrift.TBase<push_tokens_args, push_tokens_args._Fields>, java.io.Serializable, Cloneable, Comparable<push_tokens_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("push_tokens_args");
+
+    private static final org.apache.thrift.protocol.TField SESSION_FIELD_DESC = new org.apache.thrift.protocol.TField("session", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField TOKENS_FIELD_DESC = new org.apache.thrift.protocol.TField("tokens", org.apache.thrift.protocol.TType.LIST, (short)2);
+    private static final org.apache.thrift.protocol.TField DTYPE_FIELD_DESC = new org.apache.thrift.protocol.TField("dtype", org.apache.thrift.protocol.TType.STRING, (short)3);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new push_tokens_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new push_tokens_argsTupleSchemeFactory();
+
+    public java.lang.String session; // required
+    public java.util.List<java.lang.String> tokens; // required
+    public java.lang.String dtype; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SESSION((short)1, "session"),
+      TOKENS((short)2, "tokens"),
+      DTYPE((short)3, "dtype");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // SESSION
+            return SESSION;
+          case 2: // TOKENS
+            return TOKENS;
+          case 3: // DTYPE
+            return DTYPE;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SESSION, new org.apache.thrift.meta_data.FieldMetaData("session", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.TOKENS, new org.apache.thrift.meta_data.FieldMetaData("tokens", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+              new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING))));
+      tmpMap.put(_Fields.DTYPE, new org.apache.thrift.meta_data.FieldMetaData("dtype", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(push_tokens_args.class, metaDataMap);
+    }
+
+    public push_tokens_args() {
+    }
+
+    public push_tokens_args(
+      java.lang.String session,
+      java.util.List<java.lang.String> tokens,
+      java.lang.String dtype)
+    {
+      this();
+      this.session = session;
+      this.tokens = tokens;
+      this.dtype = dtype;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public push_tokens_args(push_tokens_args other) {
+      if (other.isSetSession()) {
+        this.session = other.session;
+      }
+      if (other.isSetTokens()) {
+        java.util.List<java.lang.String> __this__tokens = new java.util.ArrayList<java.lang.String>(other.tokens);
+        this.tokens = __this__tokens;
+      }
+      if (other.isSetDtype()) {
+        this.dtype = other.dtype;
+      }
+    }
+
+    public push_tokens_args deepCopy() {
+      return new push_tokens_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.session = null;
+      this.tokens = null;
+      this.dtype = null;
+    }
+
+    public java.lang.String getSession() {
+      return this.session;
+    }
+
+    public push_tokens_args setSession(java.lang.String session) {
+      this.session = session;
+      return this;
+    }
+
+    public void unsetSession() {
+      this.session = null;
+    }
+
+    /** Returns true if field session is set (has been assigned a value) and false otherwise */
+    public boolean isSetSession() {
+      return this.session != null;
+    }
+
+    public void setSessionIsSet(boolean value) {
+      if (!value) {
+        this.session = null;
+      }
+    }
+
+    public int getTokensSize() {
+      return (this.tokens == null) ? 0 : this.tokens.size();
+    }
+
+    public java.util.Iterator<java.lang.String> getTokensIterator() {
+      return (this.tokens == null) ? null : this.tokens.iterator();
+    }
+
+    public void addToTokens(java.lang.String elem) {
+      if (this.tokens == null) {
+        this.tokens = new java.util.ArrayList<java.lang.String>();
+      }
+      this.tokens.add(elem);
+    }
+
+    public java.util.List<java.lang.String> getTokens() {
+      return this.tokens;
+    }
+
+    public push_tokens_args setTokens(java.util.List<java.lang.String> tokens) {
+      this.tokens = tokens;
+      return this;
+    }
+
+    public void unsetTokens() {
+      this.tokens = null;
+    }
+
+    /** Returns true if field tokens is set (has been assigned a value) and false otherwise */
+    public boolean isSetTokens() {
+      return this.tokens != null;
+    }
+
+    public void setTokensIsSet(boolean value) {
+      if (!value) {
+        this.tokens = null;
+      }
+    }
+
+    public java.lang.String getDtype() {
+      return this.dtype;
+    }
+
+    public push_tokens_args setDtype(java.lang.String dtype) {
+      this.dtype = dtype;
+      return this;
+    }
+
+    public void unsetDtype() {
+      this.dtype = null;
+    }
+
+    /** Returns true if field dtype is set (has been assigned a value) and false otherwise */
+    public boolean isSetDtype() {
+      return this.dtype != null;
+    }
+
+    public void setDtypeIsSet(boolean value) {
+      if (!value) {
+        this.dtype = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SESSION:
+        if (value == null) {
+          unsetSession();
+        } else {
+          setSession((java.lang.String)value);
+        }
+        break;
+
+      case TOKENS:
+        if (value == null) {
+          unsetTokens();
+        } else {
+          setTokens((java.util.List<java.lang.String>)value);
+        }
+        break;
+
+      case DTYPE:
+        if (value == null) {
+          unsetDtype();
+        } else {
+          setDtype((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SESSION:
+        return getSession();
+
+      case TOKENS:
+        return getTokens();
+
+      case DTYPE:
+        return getDtype();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SESSION:
+        return isSetSession();
+      case TOKENS:
+        return isSetTokens();
+      case DTYPE:
+        return isSetDtype();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof push_tokens_args)
+        return this.equals((push_tokens_args)that);
+      return false;
+    }
+
+    public boolean equals(push_tokens_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_session = true && this.isSetSession();
+      boolean that_present_session = true && that.isSetSession();
+      if (this_present_session || that_present_session) {
+        if (!(this_present_session && that_present_session))
+          return false;
+        if (!this.session.equals(that.session))
+          return false;
+      }
+
+      boolean this_present_tokens = true && this.isSetTokens();
+      boolean that_present_tokens = true && that.isSetTokens();
+      if (this_present_tokens || that_present_tokens) {
+        if (!(this_present_tokens && that_present_tokens))
+          return false;
+        if (!this.tokens.equals(that.tokens))
+          return false;
+      }
+
+      boolean this_present_dtype = true && this.isSetDtype();
+      boolean that_present_dtype = true && that.isSetDtype();
+      if (this_present_dtype || that_present_dtype) {
+        if (!(this_present_dtype && that_present_dtype))
+          return false;
+        if (!this.dtype.equals(that.dtype))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSession()) ? 131071 : 524287);
+      if (isSetSession())
+        hashCode = hashCode * 8191 + session.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetTokens()) ? 131071 : 524287);
+      if (isSetTokens())
+        hashCode = hashCode * 8191 + tokens.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetDtype()) ? 131071 : 524287);
+      if (isSetDtype())
+        hashCode = hashCode * 8191 + dtype.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(push_tokens_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSession()).compareTo(other.isSetSession());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSession()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.session, other.session);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetTokens()).compareTo(other.isSetTokens());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetTokens()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.tokens, other.tokens);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetDtype()).compareTo(other.isSetDtype());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetDtype()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.dtype, other.dtype);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("push_tokens_args(");
+      boolean first = true;
+
+      sb.append("session:");
+      if (this.session == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.session);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("tokens:");
+      if (this.tokens == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.tokens);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("dtype:");
+      if (this.dtype == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.dtype);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class push_tokens_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public push_tokens_argsStandardScheme getScheme() {
+        return new push_tokens_argsStandardScheme();
+      }
+    }
+
+    private static class push_tokens_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<push_tokens_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, push_tokens_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // SESSION
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.session = iprot.readString();
+                struct.setSessionIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // TOKENS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list80 = iprot.readListBegin();
+                  struct.tokens = new java.util.ArrayList<java.lang.String>(_list80.size);
+                  java.lang.String _elem81;
+                  for (int _i82 = 0; _i82 < _list80.size; ++_i82)
+                  {
+                    _elem81 = iprot.readString();
+                    struct.tokens.add(_elem81);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setTokensIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // DTYPE
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.dtype = iprot.readString();
+                struct.setDtypeIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, push_tokens_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.session != null) {
+          oprot.writeFieldBegin(SESSION_FIELD_DESC);
+          oprot.writeString(struct.session);
+          oprot.writeFieldEnd();
+        }
+        if (struct.tokens != null) {
+          oprot.writeFieldBegin(TOKENS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, struct.tokens.size()));
+            for (java.lang.String _iter83 : struct.tokens)
+            {
+              oprot.writeString(_iter83);
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.dtype != null) {
+          oprot.writeFieldBegin(DTYPE_FIELD_DESC);
+          oprot.writeString(struct.dtype);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class push_tokens_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public push_tokens_argsTupleScheme getScheme() {
+        return new push_tokens_argsTupleScheme();
+      }
+    }
+
+    private static class push_tokens_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<push_tokens_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, push_tokens_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSession()) {
+          optionals.set(0);
+        }
+        if (struct.isSetTokens()) {
+          optionals.set(1);
+        }
+        if (struct.isSetDtype()) {
+          optionals.set(2);
+        }
+        oprot.writeBitSet(optionals, 3);
+        if (struct.isSetSession()) {
+          oprot.writeString(struct.session);
+        }
+        if (struct.isSetTokens()) {
+          {
+            oprot.writeI32(struct.tokens.size());
+            for (java.lang.String _iter84 : struct.tokens)
+            {
+              oprot.writeString(_iter84);
+            }
+          }
+        }
+        if (struct.isSetDtype()) {
+          oprot.writeString(struct.dtype);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, push_tokens_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(3);
+        if (incoming.get(0)) {
+          struct.session = iprot.readString();
+          struct.setSessionIsSet(true);
+        }
+        if (incoming.get(1)) {
+          {
+            org.apache.thrift.protocol.TList _list85 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, iprot.readI32());
+            struct.tokens = new java.util.ArrayList<java.lang.String>(_list85.size);
+            java.lang.String _elem86;
+            for (int _i87 = 0; _i87 < _list85.size; ++_i87)
+            {
+              _elem86 = iprot.readString();
+              struct.tokens.add(_elem86);
+            }
+          }
+          struct.setTokensIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.dtype = iprot.readString();
+          struct.setDtypeIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class push_tokens_result implements org.apache.thrift.TBase<push_tokens_result, push_tokens_result._Fields>, java.io.Serializable, Cloneable, Comparable<push_tokens_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("push_tokens_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRING, (short)0);
+    private static final org.apache.thrift.protocol.TField E_FIELD_DESC = new org.apache.thrift.protocol.TField("e", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+    private static final org.apache.thrift.protocol.TField B_FIELD_DESC = new org.apache.thrift.protocol.TField("b", org.apache.thrift.protocol.TType.STRUCT, (short)2);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new push_tokens_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new push_tokens_resultTupleSchemeFactory();
+
+    public java.nio.ByteBuffer success; // required
+    public SequenceEmbedderELMo_UnknownSession e; // required
+    public SequenceEmbedderELMo_BadArgument b; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      E((short)1, "e"),
+      B((short)2, "b");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // E
+            return E;
+          case 2: // B
+            return B;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING        , true)));
+      tmpMap.put(_Fields.E, new org.apache.thrift.meta_data.FieldMetaData("e", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, SequenceEmbedderELMo_UnknownSession.class)));
+      tmpMap.put(_Fields.B, new org.apache.thrift.meta_data.FieldMetaData("b", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, SequenceEmbedderELMo_BadArgument.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(push_tokens_result.class, metaDataMap);
+    }
+
+    public push_tokens_result() {
+    }
+
+    public push_tokens_result(
+      java.nio.ByteBuffer success,
+      SequenceEmbedderELMo_UnknownSession e,
+      SequenceEmbedderELMo_BadArgument b)
+    {
+      this();
+      this.success = org.apache.thrift.TBaseHelper.copyBinary(success);
+      this.e = e;
+      this.b = b;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public push_tokens_result(push_tokens_result other) {
+      if (other.isSetSuccess()) {
+        this.success = org.apache.thrift.TBaseHelper.copyBinary(other.success);
+      }
+      if (other.isSetE()) {
+        this.e = new SequenceEmbedderELMo_UnknownSession(other.e);
+      }
+      if (other.isSetB()) {
+        this.b = new SequenceEmbedderELMo_BadArgument(other.b);
+      }
+    }
+
+    public push_tokens_result deepCopy() {
+      return new push_tokens_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.e = null;
+      this.b = null;
+    }
+
+    public byte[] getSuccess() {
+      setSuccess(org.apache.thrift.TBaseHelper.rightSize(success));
+      return success == null ? null : success.array();
+    }
+
+    public java.nio.ByteBuffer bufferForSuccess() {
+      return org.apache.thrift.TBaseHelper.copyBinary(success);
+    }
+
+    public push_tokens_result setSuccess(byte[] success) {
+      this.success = success == null ? (java.nio.ByteBuffer)null : java.nio.ByteBuffer.wrap(success.clone());
+      return this;
+    }
+
+    public push_tokens_result setSuccess(java.nio.ByteBuffer success) {
+      this.success = org.apache.thrift.TBaseHelper.copyBinary(success);
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public SequenceEmbedderELMo_UnknownSession getE() {
+      return this.e;
+    }
+
+    public push_tokens_result setE(SequenceEmbedderELMo_UnknownSession e) {
+      this.e = e;
+      return this;
+    }
+
+    public void unsetE() {
+      this.e = null;
+    }
+
+    /** Returns true if field e is set (has been assigned a value) and false otherwise */
+    public boolean isSetE() {
+      return this.e != null;
+    }
+
+    public void setEIsSet(boolean value) {
+      if (!value) {
+        this.e = null;
+      }
+    }
+
+    public SequenceEmbedderELMo_BadArgument getB() {
+      return this.b;
+    }
+
+    public push_tokens_result setB(SequenceEmbedderELMo_BadArgument b) {
+      this.b = b;
+      return this;
+    }
+
+    public void unsetB() {
+      this.b = null;
+    }
+
+    /** Returns true if field b is set (has been assigned a value) and false otherwise */
+    public boolean isSetB() {
+      return this.b != null;
+    }
+
+    public void setBIsSet(boolean value) {
+      if (!value) {
+        this.b = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          if (value instanceof byte[]) {
+            setSuccess((byte[])value);
+          } else {
+            setSuccess((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      case E:
+        if (value == null) {
+          unsetE();
+        } else {
+          setE((SequenceEmbedderELMo_UnknownSession)value);
+        }
+        break;
+
+      case B:
+        if (value == null) {
+          unsetB();
+        } else {
+          setB((SequenceEmbedderELMo_BadArgument)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case E:
+        return getE();
+
+      case B:
+        return getB();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case E:
+        return isSetE();
+      case B:
+        return isSetB();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof push_tokens_result)
+        return this.equals((push_tokens_result)that);
+      return false;
+    }
+
+    public boolean equals(push_tokens_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_e = true && this.isSetE();
+      boolean that_present_e = true && that.isSetE();
+      if (this_present_e || that_present_e) {
+        if (!(this_present_e && that_present_e))
+          return false;
+        if (!this.e.equals(that.e))
+          return false;
+      }
+
+      boolean this_present_b = true && this.isSetB();
+      boolean that_present_b = true && that.isSetB();
+      if (this_present_b || that_present_b) {
+        if (!(this_present_b && that_present_b))
+          return false;
+        if (!this.b.equals(that.b))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetE()) ? 131071 : 524287);
+      if (isSetE())
+        hashCode = hashCode * 8191 + e.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetB()) ? 131071 : 524287);
+      if (isSetB())
+        hashCode = hashCode * 8191 + b.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(push_tokens_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetE()).compareTo(other.isSetE());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetE()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.e, other.e);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetB()).compareTo(other.isSetB());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetB()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.b, other.b);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("push_tokens_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.success, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("e:");
+      if (this.e == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.e);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("b:");
+      if (this.b == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.b);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class push_tokens_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public push_tokens_resultStandardScheme getScheme() {
+        return new push_tokens_resultStandardScheme();
+      }
+    }
+
+    private static class push_tokens_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<push_tokens_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, push_tokens_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.success = iprot.readBinary();
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // E
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.e = new SequenceEmbedderELMo_UnknownSession();
+                struct.e.read(iprot);
+                struct.setEIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // B
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.b = new SequenceEmbedderELMo_BadArgument();
+                struct.b.read(iprot);
+                struct.setBIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, push_tokens_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          oprot.writeBinary(struct.success);
+          oprot.writeFieldEnd();
+        }
+        if (struct.e != null) {
+          oprot.writeFieldBegin(E_FIELD_DESC);
+          struct.e.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.b != null) {
+          oprot.writeFieldBegin(B_FIELD_DESC);
+          struct.b.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class push_tokens_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public push_tokens_resultTupleScheme getScheme() {
+        return new push_tokens_resultTupleScheme();
+      }
+    }
+
+    private static class push_tokens_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<push_tokens_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, push_tokens_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetE()) {
+          optionals.set(1);
+        }
+        if (struct.isSetB()) {
+          optionals.set(2);
+        }
+        oprot.writeBitSet(optionals, 3);
+        if (struct.isSetSuccess()) {
+          oprot.writeBinary(struct.success);
+        }
+        if (struct.isSetE()) {
+          struct.e.write(oprot);
+        }
+        if (struct.isSetB()) {
+          struct.b.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, push_tokens_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(3);
+        if (incoming.get(0)) {
+          struct.success = iprot.readBinary();
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.e = new SequenceEmbedderELMo_UnknownSession();
+          struct.e.read(iprot);
+          struct.setEIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.b = new SequenceEmbedderELMo_BadArgument();
+          struct.b.read(iprot);
+          struct.setBIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class close_session_args implements org.apache.thrift.TBase<close_session_args, close_session_args._Fields>, java.io.Serializable, Cloneable, Comparable<close_session_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("close_session_args");
+
+    private static final org.apache.thrift.protocol.TField SESSION_FIELD_DESC = new org.apache.thrift.protocol.TField("session", org.apache.thrift.protocol.TType.STRING, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new close_session_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new close_session_argsTupleSchemeFactory();
+
+    public java.lang.String session; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SESSION((short)1, "session");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // SESSION
+            return SESSION;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SESSION, new org.apache.thrift.meta_data.FieldMetaData("session", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(close_session_args.class, metaDataMap);
+    }
+
+    public close_session_args() {
+    }
+
+    public close_session_args(
+      java.lang.String session)
+    {
+      this();
+      this.session = session;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public close_session_args(close_session_args other) {
+      if (other.isSetSession()) {
+        this.session = other.session;
+      }
+    }
+
+    public close_session_args deepCopy() {
+      return new close_session_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.session = null;
+    }
+
+    public java.lang.String getSession() {
+      return this.session;
+    }
+
+    public close_session_args setSession(java.lang.String session) {
+      this.session = session;
+      return this;
+    }
+
+    public void unsetSession() {
+      this.session = null;
+    }
+
+    /** Returns true if field session is set (has been assigned a value) and false otherwise */
+    public boolean isSetSession() {
+      return this.session != null;
+    }
+
+    public void setSessionIsSet(boolean value) {
+      if (!value) {
+        this.session = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SESSION:
+        if (value == null) {
+          unsetSession();
+        } else {
+          setSession((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SESSION:
+        return getSession();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SESSION:
+        return isSetSession();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof close_session_args)
+        return this.equals((close_session_args)that);
+      return false;
+    }
+
+    public boolean equals(close_session_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_session = true && this.isSetSession();
+      boolean that_present_session = true && that.isSetSession();
+      if (this_present_session || that_present_session) {
+        if (!(this_present_session && that_present_session))
+          return false;
+        if (!this.session.equals(that.session))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSession()) ? 131071 : 524287);
+      if (isSetSession())
+        hashCode = hashCode * 8191 + session.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(close_session_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSession()).compareTo(other.isSetSession());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSession()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.session, other.session);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("close_session_args(");
+      boolean first = true;
+
+      sb.append("session:");
+      if (this.session == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.session);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class close_session_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public close_session_argsStandardScheme getScheme() {
+        return new close_session_argsStandardScheme();
+      }
+    }
+
+    private static class close_session_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<close_session_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, close_session_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // SESSION
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.session = iprot.readString();
+                struct.setSessionIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, close_session_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.session != null) {
+          oprot.writeFieldBegin(SESSION_FIELD_DESC);
+          oprot.writeString(struct.session);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class close_session_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public close_session_argsTupleScheme getScheme() {
+        return new close_session_argsTupleScheme();
+      }
+    }
+
+    private static class close_session_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<close_session_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, close_session_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSession()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetSession()) {
+          oprot.writeString(struct.session);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, close_session_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.session = iprot.readString();
+          struct.setSessionIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class close_session_result implements org.apache.thrift.TBase<close_session_result, close_session_result._Fields>, java.io.Serializable, Cloneable, Comparable<close_session_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("close_session_result");
+
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new close_session_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new close_session_resultTupleSchemeFactory();
+
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+;
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(close_session_result.class, metaDataMap);
+    }
+
+    public close_session_result() {
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public close_session_result(close_session_result other) {
+    }
+
+    public close_session_result deepCopy() {
+      return new close_session_result(this);
+    }
+
+    @Override
+    public void clear() {
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof close_session_result)
+        return this.equals((close_session_result)that);
+      return false;
+    }
+
+    public boolean equals(close_session_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(close_session_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("close_session_result(");
+      boolean first = true;
+
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class close_session_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public close_session_resultStandardScheme getScheme() {
+        return new close_session_resultStandardScheme();
+      }
+    }
+
+    private static class close_session_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<close_session_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, close_session_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, close_session_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class close_session_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public close_session_resultTupleScheme getScheme() {
+        return new close_session_resultTupleScheme();
+      }
+    }
+
+    private static class close_session_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<close_session_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, close_session_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, close_session_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class quit_args implements org.apache.thrift.TBase<quit_args, quit_args._Fields>, java.io.Serializable, Cloneable, Comparable<quit_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("quit_args");
+
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new quit_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new quit_argsTupleSchemeFactory();
+
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+;
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(quit_args.class, metaDataMap);
+    }
+
+    public quit_args() {
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public quit_args(quit_args other) {
+    }
+
+    public quit_args deepCopy() {
+      return new quit_args(this);
+    }
+
+    @Override
+    public void clear() {
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof quit_args)
+        return this.equals((quit_args)that);
+      return false;
+    }
+
+    public boolean equals(quit_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(quit_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("quit_args(");
+      boolean first = true;
+
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class quit_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public quit_argsStandardScheme getScheme() {
+        return new quit_argsStandardScheme();
+      }
+    }
+
+    private static class quit_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<quit_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, quit_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, quit_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class quit_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public quit_argsTupleScheme getScheme() {
+        return new quit_argsTupleScheme();
+      }
+    }
+
+    private static class quit_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<quit_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, quit_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, quit_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class quit_result implements org.apache.thrift.TBase<quit_result, quit_result._Fields>, java.io.Serializable, Cloneable, Comparable<quit_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("quit_result");
+
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new quit_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new quit_resultTupleSchemeFactory();
+
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+;
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(quit_result.class, metaDataMap);
+    }
+
+    public quit_result() {
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public quit_result(quit_result other) {
+    }
+
+    public quit_result deepCopy() {
+      return new quit_result(this);
+    }
+
+    @Override
+    public void clear() {
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof quit_result)
+        return this.equals((quit_result)that);
+      return false;
+    }
+
+    public boolean equals(quit_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(quit_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("quit_result(");
+      boolean first = true;
+
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class quit_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public quit_resultStandardScheme getScheme() {
+        return new quit_resultStandardScheme();
+      }
+    }
+
+    private static class quit_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<quit_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, quit_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, quit_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class quit_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public quit_resultTupleScheme getScheme() {
+        return new quit_resultTupleScheme();
+      }
+    }
+
+    private static class quit_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<quit_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, quit_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, quit_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
       }
     }
 
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
   }
 
-  public static class start_elmo_args implements org.apache.thrift.TBase<start_elmo_args, start_elmo_args._Fields>, java.io.Serializable, Cloneable, Comparable<start_elmo_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("start_elmo_args");
+  public static class attach_client_args implements org.apache.thrift.TBase<attach_client_args, attach_client_args._Fields>, java.io.Serializable, Cloneable, Comparable<attach_client_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("attach_client_args");
 
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new start_elmo_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new start_elmo_argsTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new attach_client_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new attach_client_argsTupleSchemeFactory();
 
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
@@ -597,20 +9260,20 @@ public class SequenceEmbedderELMo_Service {
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(start_elmo_args.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(attach_client_args.class, metaDataMap);
     }
 
-    public start_elmo_args() {
+    public attach_client_args() {
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public start_elmo_args(start_elmo_args other) {
+    public attach_client_args(attach_client_args other) {
     }
 
-    public start_elmo_args deepCopy() {
-      return new start_elmo_args(this);
+    public attach_client_args deepCopy() {
+      return new attach_client_args(this);
     }
 
     @Override
@@ -643,12 +9306,12 @@ public class SequenceEmbedderELMo_Service {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof start_elmo_args)
-        return this.equals((start_elmo_args)that);
+      if (that instanceof attach_client_args)
+        return this.equals((attach_client_args)that);
       return false;
     }
 
-    public boolean equals(start_elmo_args that) {
+    public boolean equals(attach_client_args that) {
       if (that == null)
         return false;
       if (this == that)
@@ -665,7 +9328,7 @@ public class SequenceEmbedderELMo_Service {
     }
 
     @Override
-    public int compareTo(start_elmo_args other) {
+    public int compareTo(attach_client_args other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
@@ -689,7 +9352,7 @@ public class SequenceEmbedderELMo_Service {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("start_elmo_args(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("attach_client_args(");
       boolean first = true;
 
       sb.append(")");
@@ -717,15 +9380,15 @@ public class SequenceEmbedderELMo_Service {
       }
     }
 
-    private static class start_elmo_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public start_elmo_argsStandardScheme getScheme() {
-        return new start_elmo_argsStandardScheme();
+    private static class attach_client_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public attach_client_argsStandardScheme getScheme() {
+        return new attach_client_argsStandardScheme();
       }
     }
 
-    private static class start_elmo_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<start_elmo_args> {
+    private static class attach_client_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<attach_client_args> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, start_elmo_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, attach_client_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -746,7 +9409,7 @@ public class SequenceEmbedderELMo_Service {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, start_elmo_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, attach_client_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
@@ -756,21 +9419,21 @@ public class SequenceEmbedderELMo_Service {
 
     }
 
-    private static class start_elmo_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public start_elmo_argsTupleScheme getScheme() {
-        return new start_elmo_argsTupleScheme();
+    private static class attach_client_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public attach_client_argsTupleScheme getScheme() {
+        return new attach_client_argsTupleScheme();
       }
     }
 
-    private static class start_elmo_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<start_elmo_args> {
+    private static class attach_client_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<attach_client_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, start_elmo_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, attach_client_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, start_elmo_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, attach_client_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
       }
     }
@@ -780,12 +9443,12 @@ public class SequenceEmbedderELMo_Service {
     }
   }
 
-  public static class start_elmo_result implements org.apache.thrift.TBase<start_elmo_result, start_elmo_result._Fields>, java.io.Serializable, Cloneable, Comparable<start_elmo_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("start_elmo_result");
+  public static class attach_client_result implements org.apache.thrift.TBase<attach_client_result, attach_client_result._Fields>, java.io.Serializable, Cloneable, Comparable<attach_client_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("attach_client_result");
 
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new start_elmo_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new start_elmo_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new attach_client_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new attach_client_resultTupleSchemeFactory();
 
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
@@ -847,20 +9510,20 @@ public class SequenceEmbedderELMo_Service {
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(start_elmo_result.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(attach_client_result.class, metaDataMap);
     }
 
-    public start_elmo_result() {
+    public attach_client_result() {
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public start_elmo_result(start_elmo_result other) {
+    public attach_client_result(attach_client_result other) {
     }
 
-    public start_elmo_result deepCopy() {
-      return new start_elmo_result(this);
+    public attach_client_result deepCopy() {
+      return new attach_client_result(this);
     }
 
     @Override
@@ -893,12 +9556,12 @@ public class SequenceEmbedderELMo_Service {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof start_elmo_result)
-        return this.equals((start_elmo_result)that);
+      if (that instanceof attach_client_result)
+        return this.equals((attach_client_result)that);
       return false;
     }
 
-    public boolean equals(start_elmo_result that) {
+    public boolean equals(attach_client_result that) {
       if (that == null)
         return false;
       if (this == that)
@@ -915,7 +9578,7 @@ public class SequenceEmbedderELMo_Service {
     }
 
     @Override
-    public int compareTo(start_elmo_result other) {
+    public int compareTo(attach_client_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
@@ -939,7 +9602,7 @@ public class SequenceEmbedderELMo_Service {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("start_elmo_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("attach_client_result(");
       boolean first = true;
 
       sb.append(")");
@@ -967,15 +9630,15 @@ public class SequenceEmbedderELMo_Service {
       }
     }
 
-    private static class start_elmo_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public start_elmo_resultStandardScheme getScheme() {
-        return new start_elmo_resultStandardScheme();
+    private static class attach_client_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public attach_client_resultStandardScheme getScheme() {
+        return new attach_client_resultStandardScheme();
       }
     }
 
-    private static class start_elmo_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<start_elmo_result> {
+    private static class attach_client_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<attach_client_result> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, start_elmo_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, attach_client_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -996,7 +9659,7 @@ public class SequenceEmbedderELMo_Service {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, start_elmo_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, attach_client_result struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
@@ -1006,21 +9669,21 @@ public class SequenceEmbedderELMo_Service {
 
     }
 
-    private static class start_elmo_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public start_elmo_resultTupleScheme getScheme() {
-        return new start_elmo_resultTupleScheme();
+    private static class attach_client_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public attach_client_resultTupleScheme getScheme() {
+        return new attach_client_resultTupleScheme();
       }
     }
 
-    private static class start_elmo_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<start_elmo_result> {
+    private static class attach_client_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<attach_client_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, start_elmo_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, attach_client_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, start_elmo_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, attach_client_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
       }
     }
@@ -1030,22 +9693,17 @@ public class SequenceEmbedderELMo_Service {
     }
   }
 
-  public static class embed_sents_args implements org.apache.thrift.TBase<embed_sents_args, embed_sents_args._Fields>, java.io.Serializable, Cloneable, Comparable<embed_sents_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("embed_sents_args");
+  public static class detach_client_args implements org.apache.thrift.TBase<detach_client_args, detach_client_args._Fields>, java.io.Serializable, Cloneable, Comparable<detach_client_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("detach_client_args");
 
-    private static final org.apache.thrift.protocol.TField SENTS_FIELD_DESC = new org.apache.thrift.protocol.TField("sents", org.apache.thrift.protocol.TType.LIST, (short)1);
-    private static final org.apache.thrift.protocol.TField EMB_TYPE_FIELD_DESC = new org.apache.thrift.protocol.TField("emb_type", org.apache.thrift.protocol.TType.STRING, (short)2);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new embed_sents_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new embed_sents_argsTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new detach_client_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new detach_client_argsTupleSchemeFactory();
 
-    public java.util.List<java.util.List<java.lang.String>> sents; // required
-    public java.lang.String emb_type; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      SENTS((short)1, "sents"),
-      EMB_TYPE((short)2, "emb_type");
+;
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -1060,10 +9718,6 @@ public class SequenceEmbedderELMo_Service {
        */
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
-          case 1: // SENTS
-            return SENTS;
-          case 2: // EMB_TYPE
-            return EMB_TYPE;
           default:
             return null;
         }
@@ -1102,152 +9756,37 @@ public class SequenceEmbedderELMo_Service {
         return _fieldName;
       }
     }
-
-    // isset id assignments
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
-      tmpMap.put(_Fields.SENTS, new org.apache.thrift.meta_data.FieldMetaData("sents", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
-              new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
-                  new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)))));
-      tmpMap.put(_Fields.EMB_TYPE, new org.apache.thrift.meta_data.FieldMetaData("emb_type", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(embed_sents_args.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(detach_client_args.class, metaDataMap);
     }
 
-    public embed_sents_args() {
-    }
-
-    public embed_sents_args(
-      java.util.List<java.util.List<java.lang.String>> sents,
-      java.lang.String emb_type)
-    {
-      this();
-      this.sents = sents;
-      this.emb_type = emb_type;
+    public detach_client_args() {
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public embed_sents_args(embed_sents_args other) {
-      if (other.isSetSents()) {
-        java.util.List<java.util.List<java.lang.String>> __this__sents = new java.util.ArrayList<java.util.List<java.lang.String>>(other.sents.size());
-        for (java.util.List<java.lang.String> other_element : other.sents) {
-          java.util.List<java.lang.String> __this__sents_copy = new java.util.ArrayList<java.lang.String>(other_element);
-          __this__sents.add(__this__sents_copy);
-        }
-        this.sents = __this__sents;
-      }
-      if (other.isSetEmb_type()) {
-        this.emb_type = other.emb_type;
-      }
+    public detach_client_args(detach_client_args other) {
     }
 
-    public embed_sents_args deepCopy() {
-      return new embed_sents_args(this);
+    public detach_client_args deepCopy() {
+      return new detach_client_args(this);
     }
 
     @Override
     public void clear() {
-      this.sents = null;
-      this.emb_type = null;
-    }
-
-    public int getSentsSize() {
-      return (this.sents == null) ? 0 : this.sents.size();
-    }
-
-    public java.util.Iterator<java.util.List<java.lang.String>> getSentsIterator() {
-      return (this.sents == null) ? null : this.sents.iterator();
-    }
-
-    public void addToSents(java.util.List<java.lang.String> elem) {
-      if (this.sents == null) {
-        this.sents = new java.util.ArrayList<java.util.List<java.lang.String>>();
-      }
-      this.sents.add(elem);
-    }
-
-    public java.util.List<java.util.List<java.lang.String>> getSents() {
-      return this.sents;
-    }
-
-    public embed_sents_args setSents(java.util.List<java.util.List<java.lang.String>> sents) {
-      this.sents = sents;
-      return this;
-    }
-
-    public void unsetSents() {
-      this.sents = null;
-    }
-
-    /** Returns true if field sents is set (has been assigned a value) and false otherwise */
-    public boolean isSetSents() {
-      return this.sents != null;
-    }
-
-    public void setSentsIsSet(boolean value) {
-      if (!value) {
-        this.sents = null;
-      }
-    }
-
-    public java.lang.String getEmb_type() {
-      return this.emb_type;
-    }
-
-    public embed_sents_args setEmb_type(java.lang.String emb_type) {
-      this.emb_type = emb_type;
-      return this;
-    }
-
-    public void unsetEmb_type() {
-      this.emb_type = null;
-    }
-
-    /** Returns true if field emb_type is set (has been assigned a value) and false otherwise */
-    public boolean isSetEmb_type() {
-      return this.emb_type != null;
-    }
-
-    public void setEmb_typeIsSet(boolean value) {
-      if (!value) {
-        this.emb_type = null;
-      }
     }
 
     public void setFieldValue(_Fields field, java.lang.Object value) {
       switch (field) {
-      case SENTS:
-        if (value == null) {
-          unsetSents();
-        } else {
-          setSents((java.util.List<java.util.List<java.lang.String>>)value);
-        }
-        break;
-
-      case EMB_TYPE:
-        if (value == null) {
-          unsetEmb_type();
-        } else {
-          setEmb_type((java.lang.String)value);
-        }
-        break;
-
       }
     }
 
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
-      case SENTS:
-        return getSents();
-
-      case EMB_TYPE:
-        return getEmb_type();
-
       }
       throw new java.lang.IllegalStateException();
     }
@@ -1259,10 +9798,6 @@ public class SequenceEmbedderELMo_Service {
       }
 
       switch (field) {
-      case SENTS:
-        return isSetSents();
-      case EMB_TYPE:
-        return isSetEmb_type();
       }
       throw new java.lang.IllegalStateException();
     }
@@ -1271,35 +9806,17 @@ public class SequenceEmbedderELMo_Service {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof embed_sents_args)
-        return this.equals((embed_sents_args)that);
+      if (that instanceof detach_client_args)
+        return this.equals((detach_client_args)that);
       return false;
     }
 
-    public boolean equals(embed_sents_args that) {
+    public boolean equals(detach_client_args that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_sents = true && this.isSetSents();
-      boolean that_present_sents = true && that.isSetSents();
-      if (this_present_sents || that_present_sents) {
-        if (!(this_present_sents && that_present_sents))
-          return false;
-        if (!this.sents.equals(that.sents))
-          return false;
-      }
-
-      boolean this_present_emb_type = true && this.isSetEmb_type();
-      boolean that_present_emb_type = true && that.isSetEmb_type();
-      if (this_present_emb_type || that_present_emb_type) {
-        if (!(this_present_emb_type && that_present_emb_type))
-          return false;
-        if (!this.emb_type.equals(that.emb_type))
-          return false;
-      }
-
       return true;
     }
 
@@ -1307,45 +9824,17 @@ public class SequenceEmbedderELMo_Service {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + ((isSetSents()) ? 131071 : 524287);
-      if (isSetSents())
-        hashCode = hashCode * 8191 + sents.hashCode();
-
-      hashCode = hashCode * 8191 + ((isSetEmb_type()) ? 131071 : 524287);
-      if (isSetEmb_type())
-        hashCode = hashCode * 8191 + emb_type.hashCode();
-
       return hashCode;
     }
 
     @Override
-    public int compareTo(embed_sents_args other) {
+    public int compareTo(detach_client_args other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
-
-      int lastComparison = 0;
-
-      lastComparison = java.lang.Boolean.valueOf(isSetSents()).compareTo(other.isSetSents());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      if (isSetSents()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.sents, other.sents);
-        if (lastComparison != 0) {
-          return lastComparison;
-        }
-      }
-      lastComparison = java.lang.Boolean.valueOf(isSetEmb_type()).compareTo(other.isSetEmb_type());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      if (isSetEmb_type()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.emb_type, other.emb_type);
-        if (lastComparison != 0) {
-          return lastComparison;
-        }
-      }
+
+      int lastComparison = 0;
+
       return 0;
     }
 
@@ -1363,24 +9852,9 @@ public class SequenceEmbedderELMo_Service {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("embed_sents_args(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("detach_client_args(");
       boolean first = true;
 
-      sb.append("sents:");
-      if (this.sents == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.sents);
-      }
-      first = false;
-      if (!first) sb.append(", ");
-      sb.append("emb_type:");
-      if (this.emb_type == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.emb_type);
-      }
-      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -1406,15 +9880,15 @@ public class SequenceEmbedderELMo_Service {
       }
     }
 
-    private static class embed_sents_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public embed_sents_argsStandardScheme getScheme() {
-        return new embed_sents_argsStandardScheme();
+    private static class detach_client_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public detach_client_argsStandardScheme getScheme() {
+        return new detach_client_argsStandardScheme();
       }
     }
 
-    private static class embed_sents_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<embed_sents_args> {
+    private static class detach_client_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<detach_client_args> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, embed_sents_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, detach_client_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -1424,42 +9898,6 @@ public class SequenceEmbedderELMo_Service {
             break;
           }
           switch (schemeField.id) {
-            case 1: // SENTS
-              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
-                {
-                  org.apache.thrift.protocol.TList _list0 = iprot.readListBegin();
-                  struct.sents = new java.util.ArrayList<java.util.List<java.lang.String>>(_list0.size);
-                  java.util.List<java.lang.String> _elem1;
-                  for (int _i2 = 0; _i2 < _list0.size; ++_i2)
-                  {
-                    {
-                      org.apache.thrift.protocol.TList _list3 = iprot.readListBegin();
-                      _elem1 = new java.util.ArrayList<java.lang.String>(_list3.size);
-                      java.lang.String _elem4;
-                      for (int _i5 = 0; _i5 < _list3.size; ++_i5)
-                      {
-                        _elem4 = iprot.readString();
-                        _elem1.add(_elem4);
-                      }
-                      iprot.readListEnd();
-                    }
-                    struct.sents.add(_elem1);
-                  }
-                  iprot.readListEnd();
-                }
-                struct.setSentsIsSet(true);
-              } else { 
-                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-              }
-              break;
-            case 2: // EMB_TYPE
-              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
-                struct.emb_type = iprot.readString();
-                struct.setEmb_typeIsSet(true);
-              } else { 
-                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-              }
-              break;
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -1471,109 +9909,32 @@ public class SequenceEmbedderELMo_Service {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, embed_sents_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, detach_client_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        if (struct.sents != null) {
-          oprot.writeFieldBegin(SENTS_FIELD_DESC);
-          {
-            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, struct.sents.size()));
-            for (java.util.List<java.lang.String> _iter6 : struct.sents)
-            {
-              {
-                oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, _iter6.size()));
-                for (java.lang.String _iter7 : _iter6)
-                {
-                  oprot.writeString(_iter7);
-                }
-                oprot.writeListEnd();
-              }
-            }
-            oprot.writeListEnd();
-          }
-          oprot.writeFieldEnd();
-        }
-        if (struct.emb_type != null) {
-          oprot.writeFieldBegin(EMB_TYPE_FIELD_DESC);
-          oprot.writeString(struct.emb_type);
-          oprot.writeFieldEnd();
-        }
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class embed_sents_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public embed_sents_argsTupleScheme getScheme() {
-        return new embed_sents_argsTupleScheme();
+    private static class detach_client_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public detach_client_argsTupleScheme getScheme() {
+        return new detach_client_argsTupleScheme();
       }
     }
 
-    private static class embed_sents_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<embed_sents_args> {
+    private static class detach_client_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<detach_client_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, embed_sents_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, detach_client_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet optionals = new java.util.BitSet();
-        if (struct.isSetSents()) {
-          optionals.set(0);
-        }
-        if (struct.isSetEmb_type()) {
-          optionals.set(1);
-        }
-        oprot.writeBitSet(optionals, 2);
-        if (struct.isSetSents()) {
-          {
-            oprot.writeI32(struct.sents.size());
-            for (java.util.List<java.lang.String> _iter8 : struct.sents)
-            {
-              {
-                oprot.writeI32(_iter8.size());
-                for (java.lang.String _iter9 : _iter8)
-                {
-                  oprot.writeString(_iter9);
-                }
-              }
-            }
-          }
-        }
-        if (struct.isSetEmb_type()) {
-          oprot.writeString(struct.emb_type);
-        }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, embed_sents_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, detach_client_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet incoming = iprot.readBitSet(2);
-        if (incoming.get(0)) {
-          {
-            org.apache.thrift.protocol.TList _list10 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
-            struct.sents = new java.util.ArrayList<java.util.List<java.lang.String>>(_list10.size);
-            java.util.List<java.lang.String> _elem11;
-            for (int _i12 = 0; _i12 < _list10.size; ++_i12)
-            {
-              {
-                org.apache.thrift.protocol.TList _list13 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, iprot.readI32());
-                _elem11 = new java.util.ArrayList<java.lang.String>(_list13.size);
-                java.lang.String _elem14;
-                for (int _i15 = 0; _i15 < _list13.size; ++_i15)
-                {
-                  _elem14 = iprot.readString();
-                  _elem11.add(_elem14);
-                }
-              }
-              struct.sents.add(_elem11);
-            }
-          }
-          struct.setSentsIsSet(true);
-        }
-        if (incoming.get(1)) {
-          struct.emb_type = iprot.readString();
-          struct.setEmb_typeIsSet(true);
-        }
       }
     }
 
@@ -1582,22 +9943,17 @@ public class SequenceEmbedderELMo_Service {
     }
   }
 
-  public static class embed_sents_result implements org.apache.thrift.TBase<embed_sents_result, embed_sents_result._Fields>, java.io.Serializable, Cloneable, Comparable<embed_sents_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("embed_sents_result");
+  public static class detach_client_result implements org.apache.thrift.TBase<detach_client_result, detach_client_result._Fields>, java.io.Serializable, Cloneable, Comparable<detach_client_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("detach_client_result");
 
-    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
-    private static final org.apache.thrift.protocol.TField E_FIELD_DESC = new org.apache.thrift.protocol.TField("e", org.apache.thrift.protocol.TType.STRUCT, (short)1);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new embed_sents_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new embed_sents_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new detach_client_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new detach_client_resultTupleSchemeFactory();
 
-    public java.util.List<java.util.List<java.util.List<java.lang.Double>>> success; // required
-    public SequenceEmbedderELMo_UnknownEmbType e; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      SUCCESS((short)0, "success"),
-      E((short)1, "e");
+;
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -1612,10 +9968,6 @@ public class SequenceEmbedderELMo_Service {
        */
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
-          case 0: // SUCCESS
-            return SUCCESS;
-          case 1: // E
-            return E;
           default:
             return null;
         }
@@ -1627,184 +9979,64 @@ public class SequenceEmbedderELMo_Service {
        */
       public static _Fields findByThriftIdOrThrow(int fieldId) {
         _Fields fields = findByThriftId(fieldId);
-        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
-        return fields;
-      }
-
-      /**
-       * Find the _Fields constant that matches name, or null if its not found.
-       */
-      public static _Fields findByName(java.lang.String name) {
-        return byName.get(name);
-      }
-
-      private final short _thriftId;
-      private final java.lang.String _fieldName;
-
-      _Fields(short thriftId, java.lang.String fieldName) {
-        _thriftId = thriftId;
-        _fieldName = fieldName;
-      }
-
-      public short getThriftFieldId() {
-        return _thriftId;
-      }
-
-      public java.lang.String getFieldName() {
-        return _fieldName;
-      }
-    }
-
-    // isset id assignments
-    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
-    static {
-      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
-      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
-              new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
-                  new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
-                      new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE))))));
-      tmpMap.put(_Fields.E, new org.apache.thrift.meta_data.FieldMetaData("e", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, SequenceEmbedderELMo_UnknownEmbType.class)));
-      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(embed_sents_result.class, metaDataMap);
-    }
-
-    public embed_sents_result() {
-    }
-
-    public embed_sents_result(
-      java.util.List<java.util.List<java.util.List<java.lang.Double>>> success,
-      SequenceEmbedderELMo_UnknownEmbType e)
-    {
-      this();
-      this.success = success;
-      this.e = e;
-    }
-
-    /**
-     * Performs a deep copy on <i>other</i>.
-     */
-    public embed_sents_result(embed_sents_result other) {
-      if (other.isSetSuccess()) {
-        java.util.List<java.util.List<java.util.List<java.lang.Double>>> __this__success = new java.util.ArrayList<java.util.List<java.util.List<java.lang.Double>>>(other.success.size());
-        for (java.util.List<java.util.List<java.lang.Double>> other_element : other.success) {
-          java.util.List<java.util.List<java.lang.Double>> __this__success_copy = new java.util.ArrayList<java.util.List<java.lang.Double>>(other_element.size());
-          for (java.util.List<java.lang.Double> other_element_element : other_element) {
-            java.util.List<java.lang.Double> __this__success_copy_copy = new java.util.ArrayList<java.lang.Double>(other_element_element);
-            __this__success_copy.add(__this__success_copy_copy);
-          }
-          __this__success.add(__this__success_copy);
-        }
-        this.success = __this__success;
-      }
-      if (other.isSetE()) {
-        this.e = new SequenceEmbedderELMo_UnknownEmbType(other.e);
-      }
-    }
-
-    public embed_sents_result deepCopy() {
-      return new embed_sents_result(this);
-    }
-
-    @Override
-    public void clear() {
-      this.success = null;
-      this.e = null;
-    }
-
-    public int getSuccessSize() {
-      return (this.success == null) ? 0 : this.success.size();
-    }
-
-    public java.util.Iterator<java.util.List<java.util.List<java.lang.Double>>> getSuccessIterator() {
-      return (this.success == null) ? null : this.success.iterator();
-    }
-
-    public void addToSuccess(java.util.List<java.util.List<java.lang.Double>> elem) {
-      if (this.success == null) {
-        this.success = new java.util.ArrayList<java.util.List<java.util.List<java.lang.Double>>>();
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
       }
-      this.success.add(elem);
-    }
 
-    public java.util.List<java.util.List<java.util.List<java.lang.Double>>> getSuccess() {
-      return this.success;
-    }
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
 
-    public embed_sents_result setSuccess(java.util.List<java.util.List<java.util.List<java.lang.Double>>> success) {
-      this.success = success;
-      return this;
-    }
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
 
-    public void unsetSuccess() {
-      this.success = null;
-    }
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
 
-    /** Returns true if field success is set (has been assigned a value) and false otherwise */
-    public boolean isSetSuccess() {
-      return this.success != null;
-    }
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
 
-    public void setSuccessIsSet(boolean value) {
-      if (!value) {
-        this.success = null;
+      public java.lang.String getFieldName() {
+        return _fieldName;
       }
     }
-
-    public SequenceEmbedderELMo_UnknownEmbType getE() {
-      return this.e;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(detach_client_result.class, metaDataMap);
     }
 
-    public embed_sents_result setE(SequenceEmbedderELMo_UnknownEmbType e) {
-      this.e = e;
-      return this;
+    public detach_client_result() {
     }
 
-    public void unsetE() {
-      this.e = null;
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public detach_client_result(detach_client_result other) {
     }
 
-    /** Returns true if field e is set (has been assigned a value) and false otherwise */
-    public boolean isSetE() {
-      return this.e != null;
+    public detach_client_result deepCopy() {
+      return new detach_client_result(this);
     }
 
-    public void setEIsSet(boolean value) {
-      if (!value) {
-        this.e = null;
-      }
+    @Override
+    public void clear() {
     }
 
     public void setFieldValue(_Fields field, java.lang.Object value) {
       switch (field) {
-      case SUCCESS:
-        if (value == null) {
-          unsetSuccess();
-        } else {
-          setSuccess((java.util.List<java.util.List<java.util.List<java.lang.Double>>>)value);
-        }
-        break;
-
-      case E:
-        if (value == null) {
-          unsetE();
-        } else {
-          setE((SequenceEmbedderELMo_UnknownEmbType)value);
-        }
-        break;
-
       }
     }
 
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
-      case SUCCESS:
-        return getSuccess();
-
-      case E:
-        return getE();
-
       }
       throw new java.lang.IllegalStateException();
     }
@@ -1816,10 +10048,6 @@ public class SequenceEmbedderELMo_Service {
       }
 
       switch (field) {
-      case SUCCESS:
-        return isSetSuccess();
-      case E:
-        return isSetE();
       }
       throw new java.lang.IllegalStateException();
     }
@@ -1828,35 +10056,17 @@ public class SequenceEmbedderELMo_Service {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof embed_sents_result)
-        return this.equals((embed_sents_result)that);
+      if (that instanceof detach_client_result)
+        return this.equals((detach_client_result)that);
       return false;
     }
 
-    public boolean equals(embed_sents_result that) {
+    public boolean equals(detach_client_result that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_success = true && this.isSetSuccess();
-      boolean that_present_success = true && that.isSetSuccess();
-      if (this_present_success || that_present_success) {
-        if (!(this_present_success && that_present_success))
-          return false;
-        if (!this.success.equals(that.success))
-          return false;
-      }
-
-      boolean this_present_e = true && this.isSetE();
-      boolean that_present_e = true && that.isSetE();
-      if (this_present_e || that_present_e) {
-        if (!(this_present_e && that_present_e))
-          return false;
-        if (!this.e.equals(that.e))
-          return false;
-      }
-
       return true;
     }
 
@@ -1864,45 +10074,17 @@ public class SequenceEmbedderELMo_Service {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
-      if (isSetSuccess())
-        hashCode = hashCode * 8191 + success.hashCode();
-
-      hashCode = hashCode * 8191 + ((isSetE()) ? 131071 : 524287);
-      if (isSetE())
-        hashCode = hashCode * 8191 + e.hashCode();
-
       return hashCode;
     }
 
     @Override
-    public int compareTo(embed_sents_result other) {
+    public int compareTo(detach_client_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
-      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      if (isSetSuccess()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
-        if (lastComparison != 0) {
-          return lastComparison;
-        }
-      }
-      lastComparison = java.lang.Boolean.valueOf(isSetE()).compareTo(other.isSetE());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      if (isSetE()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.e, other.e);
-        if (lastComparison != 0) {
-          return lastComparison;
-        }
-      }
       return 0;
     }
 
@@ -1920,24 +10102,9 @@ public class SequenceEmbedderELMo_Service {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("embed_sents_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("detach_client_result(");
       boolean first = true;
 
-      sb.append("success:");
-      if (this.success == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.success);
-      }
-      first = false;
-      if (!first) sb.append(", ");
-      sb.append("e:");
-      if (this.e == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.e);
-      }
-      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -1963,208 +10130,61 @@ public class SequenceEmbedderELMo_Service {
       }
     }
 
-    private static class embed_sents_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public embed_sents_resultStandardScheme getScheme() {
-        return new embed_sents_resultStandardScheme();
-      }
-    }
-
-    private static class embed_sents_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<embed_sents_result> {
-
-      public void read(org.apache.thrift.protocol.TProtocol iprot, embed_sents_result struct) throws org.apache.thrift.TException {
-        org.apache.thrift.protocol.TField schemeField;
-        iprot.readStructBegin();
-        while (true)
-        {
-          schemeField = iprot.readFieldBegin();
-          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
-            break;
-          }
-          switch (schemeField.id) {
-            case 0: // SUCCESS
-              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
-                {
-                  org.apache.thrift.protocol.TList _list16 = iprot.readListBegin();
-                  struct.success = new java.util.ArrayList<java.util.List<java.util.List<java.lang.Double>>>(_list16.size);
-                  java.util.List<java.util.List<java.lang.Double>> _elem17;
-                  for (int _i18 = 0; _i18 < _list16.size; ++_i18)
-                  {
-                    {
-                      org.apache.thrift.protocol.TList _list19 = iprot.readListBegin();
-                      _elem17 = new java.util.ArrayList<java.util.List<java.lang.Double>>(_list19.size);
-                      java.util.List<java.lang.Double> _elem20;
-                      for (int _i21 = 0; _i21 < _list19.size; ++_i21)
-                      {
-                        {
-                          org.apache.thrift.protocol.TList _list22 = iprot.readListBegin();
-                          _elem20 = new java.util.ArrayList<java.lang.Double>(_list22.size);
-                          double _elem23;
-                          for (int _i24 = 0; _i24 < _list22.size; ++_i24)
-                          {
-                            _elem23 = iprot.readDouble();
-                            _elem20.add(_elem23);
-                          }
-                          iprot.readListEnd();
-                        }
-                        _elem17.add(_elem20);
-                      }
-                      iprot.readListEnd();
-                    }
-                    struct.success.add(_elem17);
-                  }
-                  iprot.readListEnd();
-                }
-                struct.setSuccessIsSet(true);
-              } else { 
-                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-              }
-              break;
-            case 1: // E
-              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
-                struct.e = new SequenceEmbedderELMo_UnknownEmbType();
-                struct.e.read(iprot);
-                struct.setEIsSet(true);
-              } else { 
-                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-              }
-              break;
-            default:
-              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-          }
-          iprot.readFieldEnd();
-        }
-        iprot.readStructEnd();
-
-        // check for required fields of primitive type, which can't be checked in the validate method
-        struct.validate();
+    private static class detach_client_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public detach_client_resultStandardScheme getScheme() {
+        return new detach_client_resultStandardScheme();
       }
-
-      public void write(org.apache.thrift.protocol.TProtocol oprot, embed_sents_result struct) throws org.apache.thrift.TException {
-        struct.validate();
-
-        oprot.writeStructBegin(STRUCT_DESC);
-        if (struct.success != null) {
-          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
-          {
-            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, struct.success.size()));
-            for (java.util.List<java.util.List<java.lang.Double>> _iter25 : struct.success)
-            {
-              {
-                oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, _iter25.size()));
-                for (java.util.List<java.lang.Double> _iter26 : _iter25)
-                {
-                  {
-                    oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.DOUBLE, _iter26.size()));
-                    for (double _iter27 : _iter26)
-                    {
-                      oprot.writeDouble(_iter27);
-                    }
-                    oprot.writeListEnd();
-                  }
-                }
-                oprot.writeListEnd();
-              }
-            }
-            oprot.writeListEnd();
+    }
+
+    private static class detach_client_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<detach_client_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, detach_client_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
           }
-          oprot.writeFieldEnd();
-        }
-        if (struct.e != null) {
-          oprot.writeFieldBegin(E_FIELD_DESC);
-          struct.e.write(oprot);
-          oprot.writeFieldEnd();
+          switch (schemeField.id) {
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
         }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, detach_client_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class embed_sents_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public embed_sents_resultTupleScheme getScheme() {
-        return new embed_sents_resultTupleScheme();
+    private static class detach_client_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public detach_client_resultTupleScheme getScheme() {
+        return new detach_client_resultTupleScheme();
       }
     }
 
-    private static class embed_sents_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<embed_sents_result> {
+    private static class detach_client_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<detach_client_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, embed_sents_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, detach_client_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet optionals = new java.util.BitSet();
-        if (struct.isSetSuccess()) {
-          optionals.set(0);
-        }
-        if (struct.isSetE()) {
-          optionals.set(1);
-        }
-        oprot.writeBitSet(optionals, 2);
-        if (struct.isSetSuccess()) {
-          {
-            oprot.writeI32(struct.success.size());
-            for (java.util.List<java.util.List<java.lang.Double>> _iter28 : struct.success)
-            {
-              {
-                oprot.writeI32(_iter28.size());
-                for (java.util.List<java.lang.Double> _iter29 : _iter28)
-                {
-                  {
-                    oprot.writeI32(_iter29.size());
-                    for (double _iter30 : _iter29)
-                    {
-                      oprot.writeDouble(_iter30);
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        if (struct.isSetE()) {
-          struct.e.write(oprot);
-        }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, embed_sents_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, detach_client_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet incoming = iprot.readBitSet(2);
-        if (incoming.get(0)) {
-          {
-            org.apache.thrift.protocol.TList _list31 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
-            struct.success = new java.util.ArrayList<java.util.List<java.util.List<java.lang.Double>>>(_list31.size);
-            java.util.List<java.util.List<java.lang.Double>> _elem32;
-            for (int _i33 = 0; _i33 < _list31.size; ++_i33)
-            {
-              {
-                org.apache.thrift.protocol.TList _list34 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
-                _elem32 = new java.util.ArrayList<java.util.List<java.lang.Double>>(_list34.size);
-                java.util.List<java.lang.Double> _elem35;
-                for (int _i36 = 0; _i36 < _list34.size; ++_i36)
-                {
-                  {
-                    org.apache.thrift.protocol.TList _list37 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.DOUBLE, iprot.readI32());
-                    _elem35 = new java.util.ArrayList<java.lang.Double>(_list37.size);
-                    double _elem38;
-                    for (int _i39 = 0; _i39 < _list37.size; ++_i39)
-                    {
-                      _elem38 = iprot.readDouble();
-                      _elem35.add(_elem38);
-                    }
-                  }
-                  _elem32.add(_elem35);
-                }
-              }
-              struct.success.add(_elem32);
-            }
-          }
-          struct.setSuccessIsSet(true);
-        }
-        if (incoming.get(1)) {
-          struct.e = new SequenceEmbedderELMo_UnknownEmbType();
-          struct.e.read(iprot);
-          struct.setEIsSet(true);
-        }
       }
     }
 
@@ -2173,12 +10193,12 @@ public class SequenceEmbedderELMo_Service {
     }
   }
 
-  public static class quit_args implements org.apache.thrift.TBase<quit_args, quit_args._Fields>, java.io.Serializable, Cloneable, Comparable<quit_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("quit_args");
+  public static class get_stats_args implements org.apache.thrift.TBase<get_stats_args, get_stats_args._Fields>, java.io.Serializable, Cloneable, Comparable<get_stats_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("get_stats_args");
 
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new quit_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new quit_argsTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new get_stats_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new get_stats_argsTupleSchemeFactory();
 
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
@@ -2240,20 +10260,20 @@ public class SequenceEmbedderELMo_Service {
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(quit_args.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(get_stats_args.class, metaDataMap);
     }
 
-    public quit_args() {
+    public get_stats_args() {
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public quit_args(quit_args other) {
+    public get_stats_args(get_stats_args other) {
     }
 
-    public quit_args deepCopy() {
-      return new quit_args(this);
+    public get_stats_args deepCopy() {
+      return new get_stats_args(this);
     }
 
     @Override
@@ -2286,12 +10306,12 @@ public class SequenceEmbedderELMo_Service {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof quit_args)
-        return this.equals((quit_args)that);
+      if (that instanceof get_stats_args)
+        return this.equals((get_stats_args)that);
       return false;
     }
 
-    public boolean equals(quit_args that) {
+    public boolean equals(get_stats_args that) {
       if (that == null)
         return false;
       if (this == that)
@@ -2308,7 +10328,7 @@ public class SequenceEmbedderELMo_Service {
     }
 
     @Override
-    public int compareTo(quit_args other) {
+    public int compareTo(get_stats_args other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
@@ -2332,7 +10352,7 @@ public class SequenceEmbedderELMo_Service {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("quit_args(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("get_stats_args(");
       boolean first = true;
 
       sb.append(")");
@@ -2360,15 +10380,15 @@ public class SequenceEmbedderELMo_Service {
       }
     }
 
-    private static class quit_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public quit_argsStandardScheme getScheme() {
-        return new quit_argsStandardScheme();
+    private static class get_stats_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public get_stats_argsStandardScheme getScheme() {
+        return new get_stats_argsStandardScheme();
       }
     }
 
-    private static class quit_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<quit_args> {
+    private static class get_stats_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<get_stats_args> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, quit_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, get_stats_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -2389,7 +10409,7 @@ public class SequenceEmbedderELMo_Service {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, quit_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, get_stats_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
@@ -2399,21 +10419,21 @@ public class SequenceEmbedderELMo_Service {
 
     }
 
-    private static class quit_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public quit_argsTupleScheme getScheme() {
-        return new quit_argsTupleScheme();
+    private static class get_stats_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public get_stats_argsTupleScheme getScheme() {
+        return new get_stats_argsTupleScheme();
       }
     }
 
-    private static class quit_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<quit_args> {
+    private static class get_stats_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<get_stats_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, quit_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, get_stats_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, quit_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, get_stats_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
       }
     }
@@ -2423,17 +10443,19 @@ public class SequenceEmbedderELMo_Service {
     }
   }
 
-  public static class quit_result implements org.apache.thrift.TBase<quit_result, quit_result._Fields>, java.io.Serializable, Cloneable, Comparable<quit_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("quit_result");
+  public static class get_stats_result implements org.apache.thrift.TBase<get_stats_result, get_stats_result._Fields>, java.io.Serializable, Cloneable, Comparable<get_stats_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("get_stats_result");
 
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRING, (short)0);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new quit_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new quit_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new get_stats_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new get_stats_resultTupleSchemeFactory();
 
+    public java.lang.String success; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-;
+      SUCCESS((short)0, "success");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -2448,6 +10470,8 @@ public class SequenceEmbedderELMo_Service {
        */
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
           default:
             return null;
         }
@@ -2486,37 +10510,87 @@ public class SequenceEmbedderELMo_Service {
         return _fieldName;
       }
     }
+
+    // isset id assignments
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(quit_result.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(get_stats_result.class, metaDataMap);
     }
 
-    public quit_result() {
+    public get_stats_result() {
+    }
+
+    public get_stats_result(
+      java.lang.String success)
+    {
+      this();
+      this.success = success;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public quit_result(quit_result other) {
+    public get_stats_result(get_stats_result other) {
+      if (other.isSetSuccess()) {
+        this.success = other.success;
+      }
     }
 
-    public quit_result deepCopy() {
-      return new quit_result(this);
+    public get_stats_result deepCopy() {
+      return new get_stats_result(this);
     }
 
     @Override
     public void clear() {
+      this.success = null;
+    }
+
+    public java.lang.String getSuccess() {
+      return this.success;
+    }
+
+    public get_stats_result setSuccess(java.lang.String success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
     }
 
     public void setFieldValue(_Fields field, java.lang.Object value) {
       switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.lang.String)value);
+        }
+        break;
+
       }
     }
 
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
       }
       throw new java.lang.IllegalStateException();
     }
@@ -2528,6 +10602,8 @@ public class SequenceEmbedderELMo_Service {
       }
 
       switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
       }
       throw new java.lang.IllegalStateException();
     }
@@ -2536,17 +10612,26 @@ public class SequenceEmbedderELMo_Service {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof quit_result)
-        return this.equals((quit_result)that);
+      if (that instanceof get_stats_result)
+        return this.equals((get_stats_result)that);
       return false;
     }
 
-    public boolean equals(quit_result that) {
+    public boolean equals(get_stats_result that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
       return true;
     }
 
@@ -2554,17 +10639,31 @@ public class SequenceEmbedderELMo_Service {
     public int hashCode() {
       int hashCode = 1;
 
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
       return hashCode;
     }
 
     @Override
-    public int compareTo(quit_result other) {
+    public int compareTo(get_stats_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
       return 0;
     }
 
@@ -2582,9 +10681,16 @@ public class SequenceEmbedderELMo_Service {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("quit_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("get_stats_result(");
       boolean first = true;
 
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -2610,15 +10716,15 @@ public class SequenceEmbedderELMo_Service {
       }
     }
 
-    private static class quit_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public quit_resultStandardScheme getScheme() {
-        return new quit_resultStandardScheme();
+    private static class get_stats_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public get_stats_resultStandardScheme getScheme() {
+        return new get_stats_resultStandardScheme();
       }
     }
 
-    private static class quit_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<quit_result> {
+    private static class get_stats_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<get_stats_result> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, quit_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, get_stats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -2628,6 +10734,14 @@ public class SequenceEmbedderELMo_Service {
             break;
           }
           switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.success = iprot.readString();
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -2639,32 +10753,50 @@ public class SequenceEmbedderELMo_Service {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, quit_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, get_stats_result struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          oprot.writeString(struct.success);
+          oprot.writeFieldEnd();
+        }
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class quit_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public quit_resultTupleScheme getScheme() {
-        return new quit_resultTupleScheme();
+    private static class get_stats_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public get_stats_resultTupleScheme getScheme() {
+        return new get_stats_resultTupleScheme();
       }
     }
 
-    private static class quit_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<quit_result> {
+    private static class get_stats_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<get_stats_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, quit_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, get_stats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetSuccess()) {
+          oprot.writeString(struct.success);
+        }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, quit_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, get_stats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.success = iprot.readString();
+          struct.setSuccessIsSet(true);
+        }
       }
     }
 
@@ -6,12 +6,56 @@ exception SequenceEmbedderELMo_UnknownEmbType{
   1: string message
 }
 
+exception SequenceEmbedderELMo_UnknownSession{
+  1: string message
+}
+
+// an argument other than emb_type or session that the server doesn't support, such as an unknown dtype
+exception SequenceEmbedderELMo_BadArgument{
+  1: string message
+}
+
 service SequenceEmbedderELMo_Service {
 
   void start_elmo()
 
   list<list<list<double>>> embed_sents(1:list<list<string>> sents, 2:string emb_type) throws(1:SequenceEmbedderELMo_UnknownEmbType e)
 
+  // same as embed_sents but each sentence comes back as a single blob:
+  // int32 rows, int32 cols (little-endian) followed by the rows in row-major order encoded according to dtype:
+  //   "float32" (also when dtype is not set)  cols float32 values per row
+  //   "float16"                               cols float16 values per row
+  //   "int8"                                  float32 scale followed by cols int8 values per row ; a value is int8*scale
+  // with projection (a directory of scripts/embedding/elmo_projection.py) the server projects every vector before it is sent
+  // and cols is the out_dim of the projection
+  list<binary> embed_sents_packed(1:list<list<string>> sents, 2:string emb_type, 3:string dtype, 4:string projection) throws(1:SequenceEmbedderELMo_UnknownEmbType e, 2:SequenceEmbedderELMo_BadArgument b)
+
+  // embeddings are written to a shared-memory ring of the server and only their location is returned:
+  // int64 seq, int64 entry offset, int32 path length, path (utf-8), int32 sentences,
+  // then for every sentence int64 offset, int32 rows, int32 cols (all little-endian)
+  // the data is valid while the int64 at the entry offset still equals seq
+  // projection is the same as in embed_sents_packed
+  binary embed_sents_shm(1:list<list<string>> sents, 2:string emb_type, 3:string projection) throws(1:SequenceEmbedderELMo_UnknownEmbType e)
+
+  // word by word embedding with the forward direction of the biLM: the vectors of pushed tokens depend only on the tokens
+  // pushed before them so a sentence can be embedded while it is being read ; emb_type is "forward-top" or "local"
+  // a session lives in the server process that serves the connection that opened it so it must be used through that
+  // connection ; the server closes sessions that were idle for a while ; projection is the same as in embed_sents_packed
+  string open_session(1:string emb_type, 2:string projection) throws(1:SequenceEmbedderELMo_UnknownEmbType e)
+
+  // the vectors of the tokens in the packed format of embed_sents_packed
+  binary push_tokens(1:string session, 2:list<string> tokens, 3:string dtype) throws(1:SequenceEmbedderELMo_UnknownSession e, 2:SequenceEmbedderELMo_BadArgument b)
+
+  void close_session(1:string session)
+
   void quit()
 
+  // reference counting of clients sharing a daemon server ; the daemon exits some time after the last client detaches
+  void attach_client()
+
+  void detach_client()
+
+  // JSON with the counters, latency histograms (queue, forward pass, serialization), batch sizes and memory of all workers
+  string get_stats()
+
 }
@@ -29,6 +29,9 @@ trait SequenceEmbedderGeneral[T] {
 
   def precomputeEmbeddings(sents:Iterable[List[T]]) : Unit
 
+  // starts computing the embeddings of sentences that will be needed soon without waiting for them
+  def prefetchEmbeddings(sents:Iterable[List[T]]) : Unit = {}
+
   def cleanPrecomputedCache() : Unit
 
   def fakeIncrementalEmbedder(xs: List[T]) : IncrementalEmbedderState[T] =
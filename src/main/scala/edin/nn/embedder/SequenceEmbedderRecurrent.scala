@@ -37,6 +37,8 @@ class SequenceEmbedderRecurrent[T](config: SequenceEmbedderRecurrentConfig[T])(i
 
   override def precomputeEmbeddings(sents:Iterable[List[T]]) : Unit = embedder.precomputeEmbeddings(sents)
 
+  override def prefetchEmbeddings(sents:Iterable[List[T]]) : Unit = embedder.prefetchEmbeddings(sents)
+
   override def zeros : Expression = DyFunctions.zeros(config.multRNNconf.outDim)
 
   override def initState(): IncrementalEmbedderState[T] = new SequenceEmbedderRecurrentState[T](rnn.initState(), embedder.initState())
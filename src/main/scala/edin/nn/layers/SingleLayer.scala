@@ -50,6 +50,8 @@ class SingleLayer(config:SingleLayerConfig)(implicit model:ParameterCollection)
 
   System.err.println("creating "+this)
 
+  def weights : Parameter = param_W
+
   override def toString: String = s"Layer(${inDim.toString}, ${outDim.toString})"
 
   private def myLayerNorm(x:Expression, g:Expression, b:Expression) : Expression = {
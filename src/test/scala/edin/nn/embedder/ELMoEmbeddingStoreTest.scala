@@ -0,0 +1,71 @@
+package edin.nn.embedder
+
+import org.scalatest.{FlatSpec, Matchers}
+
+/**
+  * the stores in src/test/resources/elmo_store are written by the python writer (scripts/embedding/tests/test_elmo_store.py)
+  * and hold values that are exact in every dtype
+  */
+class ELMoEmbeddingStoreTest extends FlatSpec with Matchers {
+
+  import ELMoEmbeddingStore._
+
+  private val expected = List(
+    List(List(63.5f, -40.0f, -5.0f, 32.5f), List(63.5f, 62.0f, 34.0f, -12.0f)),
+    Nil,
+    List(List(63.5f, 42.0f, -53.0f, 57.5f), List(63.5f, -20.0f, -28.5f, 44.5f), List(63.5f, 6.5f, -34.5f, 33.0f))
+  )
+
+  // not through ELMoEmbeddingStore.open so that every test maps the files itself
+  private def fixture(dtype:String) : ELMoEmbeddingStore = new ELMoEmbeddingStore(getClass.getResource(s"/elmo_store/$dtype.store").getPath)
+
+  "ELMoEmbeddingStore" should "read the header and the index of the python writer" in {
+    for(dtype <- DTYPES.keys){
+      val store = fixture(dtype)
+      store.size shouldBe 3
+      store.dimension shouldBe 4
+      store.embeddingType shouldBe "forward-top"
+    }
+  }
+
+  it should "decode the rows of every dtype" in {
+    for(dtype <- DTYPES.keys){
+      val store = fixture(dtype)
+      for(i <- expected.indices)
+        withClue(s"$dtype sentence $i: "){
+          store(i).map(_.toList) shouldBe expected(i)
+        }
+    }
+  }
+
+  it should "keep the stored encoding in compact embeddings" in {
+    for((dtype, code) <- DTYPES){
+      val emb = fixture(dtype).compact(2)
+      emb.dtype shouldBe code
+      emb.rows shouldBe 3
+      emb.data.length shouldBe 3*rowBytes(code, 4)
+      emb.decode().map(_.toList) shouldBe expected(2)
+    }
+  }
+
+  "halfToFloat" should "decode IEEE 754 half precision" in {
+    val cases = List(
+      0x0000 -> 0f,
+      0x3c00 -> 1f,
+      0xc000 -> -2f,
+      0x3555 -> 0.33325195f,
+      0x7bff -> 65504f,
+      0x0400 -> math.pow(2, -14).toFloat,
+      0x0001 -> math.pow(2, -24).toFloat,
+      0x8001 -> -math.pow(2, -24).toFloat,
+      0x7c00 -> Float.PositiveInfinity,
+      0xfc00 -> Float.NegativeInfinity
+    )
+    for((bits, value) <- cases)
+      withClue(f"0x$bits%04x: "){
+        halfToFloat(bits.toShort) shouldBe value
+      }
+    halfToFloat(0x7e00.toShort).isNaN shouldBe true
+  }
+
+}